@@ -61,9 +61,55 @@ RECON_SAMPLE_SIZE = int(os.getenv("RECON_SAMPLE_SIZE", "100"))
 # Ensure reconciliation storage exists
 RECON_STORAGE_PATH.mkdir(exist_ok=True, parents=True)
 
+# In-process (hash join) reconciliation settings for cross-server rulesets
+RECON_FETCH_BATCH_SIZE = int(os.getenv("RECON_FETCH_BATCH_SIZE", "10000"))  # Rows per fetchmany()
+RECON_HASH_JOIN_PARTITIONS = int(os.getenv("RECON_HASH_JOIN_PARTITIONS", "64"))
+RECON_HASH_JOIN_MEMORY_ROWS = int(os.getenv("RECON_HASH_JOIN_MEMORY_ROWS", "2000000"))  # Rows buffered before spilling
+RECON_HASH_JOIN_SPILL_DIR = os.getenv("RECON_HASH_JOIN_SPILL_DIR", "")  # Empty = system temp dir
+RECON_MAX_WORKERS = int(os.getenv("RECON_MAX_WORKERS", "4"))  # Worker pool size for parallel rule execution
+RECON_MAX_CONNECTIONS_PER_DB = int(os.getenv("RECON_MAX_CONNECTIONS_PER_DB", "4"))  # Max rules querying one database at once
+RECON_RESULTS_DIR = Path(os.getenv("RECON_RESULTS_DIR", "results"))  # Reconciliation result files
+RECON_RESULT_COMPRESSION = os.getenv("RECON_RESULT_COMPRESSION", "none")  # none, gzip or zstd
+RECON_SNAPSHOT_PATH = DATA_DIR / os.getenv("RECON_SNAPSHOT_PATH", "reconciliation_snapshots")  # Incremental key-state snapshots
+RECON_INCREMENTAL_KEY_BATCH = int(os.getenv("RECON_INCREMENTAL_KEY_BATCH", "500"))  # Keys per recount query
+RECON_SNAPSHOT_LOCK_TIMEOUT_SECONDS = float(os.getenv("RECON_SNAPSHOT_LOCK_TIMEOUT_SECONDS", "600"))  # Wait for a concurrent run of the same rule
+RECON_CHECKSUM_INITIAL_BUCKET_CHARS = int(os.getenv("RECON_CHECKSUM_INITIAL_BUCKET_CHARS", "2"))  # 16^n first-level buckets
+RECON_CHECKSUM_MAX_BUCKET_CHARS = int(os.getenv("RECON_CHECKSUM_MAX_BUCKET_CHARS", "6"))  # Deepest drill-down level
+RECON_CHECKSUM_LEAF_ROWS = int(os.getenv("RECON_CHECKSUM_LEAF_ROWS", "1000"))  # Buckets this small are compared row by row
+RECON_PLAN_CACHE_SIZE = int(os.getenv("RECON_PLAN_CACHE_SIZE", "128"))  # Compiled ruleset plans kept in memory
+RECON_CATALOG_TTL_SECONDS = float(os.getenv("RECON_CATALOG_TTL_SECONDS", "300"))  # Lifetime of cached table metadata
+
+# Cost model of the adaptive (execution_mode=auto) planner; estimates are wall-time milliseconds
+RECON_PLANNER_QUERY_FIXED_MS = float(os.getenv("RECON_PLANNER_QUERY_FIXED_MS", "50"))  # Round trip + planning per query
+RECON_PLANNER_SQL_ROW_COST_US = float(os.getenv("RECON_PLANNER_SQL_ROW_COST_US", "0.5"))  # Server-side join, per row
+RECON_PLANNER_FETCH_ROW_COST_US = float(os.getenv("RECON_PLANNER_FETCH_ROW_COST_US", "3"))  # Hash join transfer + probe, per row
+RECON_PLANNER_SPILL_ROW_COST_US = float(os.getenv("RECON_PLANNER_SPILL_ROW_COST_US", "6"))  # Extra per row beyond RECON_HASH_JOIN_MEMORY_ROWS
+RECON_PLANNER_LANDING_ROW_COST_US = float(os.getenv("RECON_PLANNER_LANDING_ROW_COST_US", "5"))  # Extract + bulk load + join, per row
+RECON_PLANNER_LANDING_FIXED_MS = float(os.getenv("RECON_PLANNER_LANDING_FIXED_MS", "5000"))  # Staging tables, indexes, KPIs
+RECON_PLANNER_DEFAULT_ROWS = int(os.getenv("RECON_PLANNER_DEFAULT_ROWS", "1000000"))  # Assumed when statistics are missing
+# Source server can reach tables of a different target connection (e.g. another database on the same
+# instance); only then is a target table found in the source catalog treated as co-located
+RECON_PLANNER_CROSS_DATABASE = os.getenv("RECON_PLANNER_CROSS_DATABASE", "false").lower() == "true"
+
 # JDBC settings for rule validation
 JDBC_DRIVERS_PATH = os.getenv("JDBC_DRIVERS_PATH", str(BASE_DIR / "jdbc_drivers"))
 
+# Shared JDBC connection pool (one pool per database and user)
+JDBC_POOL_ENABLED = os.getenv("JDBC_POOL_ENABLED", "true").lower() == "true"
+JDBC_POOL_MIN_SIZE = int(os.getenv("JDBC_POOL_MIN_SIZE", "0"))  # Idle connections kept open
+JDBC_POOL_MAX_SIZE = int(os.getenv("JDBC_POOL_MAX_SIZE", "16"))  # Open connections per database
+JDBC_POOL_IDLE_TIMEOUT_SECONDS = float(os.getenv("JDBC_POOL_IDLE_TIMEOUT_SECONDS", "300"))  # Idle connections above min are closed after this
+JDBC_POOL_EVICTION_INTERVAL_SECONDS = float(os.getenv("JDBC_POOL_EVICTION_INTERVAL_SECONDS", "60"))  # Background sweep for expired idle connections (0 disables)
+JDBC_POOL_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv("JDBC_POOL_ACQUIRE_TIMEOUT_SECONDS", "30"))  # Wait for a free connection
+JDBC_POOL_VALIDATION_TIMEOUT_SECONDS = int(os.getenv("JDBC_POOL_VALIDATION_TIMEOUT_SECONDS", "5"))  # isValid() on borrow
+JDBC_FETCH_SIZE = int(os.getenv("JDBC_FETCH_SIZE", "10000"))  # Rows per driver round trip / columnar fetch batch
+JDBC_COLUMNAR_FETCH = os.getenv("JDBC_COLUMNAR_FETCH", "true").lower() == "true"  # Typed per-column ResultSet reads
+RESULT_STREAM_MAX_ROWS = int(os.getenv("RESULT_STREAM_MAX_ROWS", "100000"))  # Rows one query result may materialize (0: unlimited)
+
+# Out-of-process JDBC gateway (python -m kg_builder.services.jdbc_gateway) owning the JVM and the pools
+JDBC_GATEWAY_ENABLED = os.getenv("JDBC_GATEWAY_ENABLED", "false").lower() == "true"  # Route connections through the gateway
+JDBC_GATEWAY_SOCKET = os.getenv("JDBC_GATEWAY_SOCKET", "/tmp/kg_builder_jdbc_gateway.sock")  # Unix socket of the gateway
+
 # Database connection settings for reconciliation
 # Source Database Configuration
 SOURCE_DB_TYPE = os.getenv("SOURCE_DB_TYPE", "oracle")
@@ -106,9 +152,9 @@ MONGODB_RESULTS_COLLECTION = os.getenv("MONGODB_RESULTS_COLLECTION", "reconcilia
 
 # Landing Database Configuration (for multi-database reconciliation)
 LANDING_DB_ENABLED = os.getenv("LANDING_DB_ENABLED", "false").lower() == "true"
-LANDING_DB_TYPE = os.getenv("LANDING_DB_TYPE", "mysql")
+LANDING_DB_TYPE = os.getenv("LANDING_DB_TYPE", "mysql")  # mysql, postgresql or sqlite (embedded, no server)
 LANDING_DB_HOST = os.getenv("LANDING_DB_HOST", "localhost")
-LANDING_DB_PORT = int(os.getenv("LANDING_DB_PORT", "3306"))
+LANDING_DB_PORT = int(os.getenv("LANDING_DB_PORT", "5432" if LANDING_DB_TYPE.lower() in ("postgresql", "postgres") else "3306"))
 LANDING_DB_DATABASE = os.getenv("LANDING_DB_DATABASE", "reconciliation_landing")
 LANDING_DB_USERNAME = os.getenv("LANDING_DB_USERNAME", "")
 LANDING_DB_PASSWORD = os.getenv("LANDING_DB_PASSWORD", "")
@@ -117,6 +163,25 @@ LANDING_KEEP_STAGING = os.getenv("LANDING_KEEP_STAGING", "true").lower() == "tru
 LANDING_STAGING_TTL_HOURS = int(os.getenv("LANDING_STAGING_TTL_HOURS", "24"))  # Auto-cleanup after 24 hours
 LANDING_BATCH_SIZE = int(os.getenv("LANDING_BATCH_SIZE", "10000"))  # Rows per batch
 LANDING_USE_BULK_COPY = os.getenv("LANDING_USE_BULK_COPY", "true").lower() == "true"  # Use LOAD DATA INFILE
+LANDING_EXTRACT_MAX_WORKERS = int(os.getenv("LANDING_EXTRACT_MAX_WORKERS", "4"))  # Tables extracted concurrently
+LANDING_EXTRACT_MAX_CONNECTIONS_PER_DB = int(os.getenv("LANDING_EXTRACT_MAX_CONNECTIONS_PER_DB", "2"))  # Concurrent source connections per source/target database (partition readers included)
+LANDING_PIPELINE_QUEUE_DEPTH = int(os.getenv("LANDING_PIPELINE_QUEUE_DEPTH", "4"))  # Batches buffered between fetch, convert and load (backpressure)
+LANDING_PARTITION_MIN_ROWS = int(os.getenv("LANDING_PARTITION_MIN_ROWS", "1000000"))  # Tables this large are read as parallel key ranges (0 disables)
+LANDING_PARTITIONS = int(os.getenv("LANDING_PARTITIONS", "4"))  # Key ranges per partitioned table (read on up to this many connections within the per-database cap)
+LANDING_SNAPSHOT_REUSE = os.getenv("LANDING_SNAPSHOT_REUSE", "true").lower() == "true"  # Reuse staging tables whose source is unchanged (count, change-tracking column and row checksum)
+LANDING_SNAPSHOT_UPDATED_AT_COLUMNS = os.getenv("LANDING_SNAPSHOT_UPDATED_AT_COLUMNS", "updated_at,last_updated,modified_at,last_modified,update_ts")  # Change-tracking columns used in fingerprints
+LANDING_SNAPSHOT_SWEEP_INTERVAL_SECONDS = int(os.getenv("LANDING_SNAPSHOT_SWEEP_INTERVAL_SECONDS", "900"))  # Background sweep of unreferenced staging tables (0 disables)
+LANDING_EXTRACTION_MODE = os.getenv("LANDING_EXTRACTION_MODE", "full")  # full: every column; key_only: join columns + row hash
+LANDING_MATCH_STRATEGY = os.getenv("LANDING_MATCH_STRATEGY", "independent")  # independent: every rule sees every row; waterfall: rules in order on residual rows
+LANDING_DRILLDOWN_KEYS_PER_QUERY = int(os.getenv("LANDING_DRILLDOWN_KEYS_PER_QUERY", "500"))  # Keys per source query when fetching full rows
+LANDING_KEY_VARCHAR_MAX = int(os.getenv("LANDING_KEY_VARCHAR_MAX", "768"))  # Widest VARCHAR for join columns (fully indexable in utf8mb4)
+LANDING_TYPE_SAMPLE_ROWS = int(os.getenv("LANDING_TYPE_SAMPLE_ROWS", "10000"))  # Rows sampled for max lengths of wide join columns (0 disables)
+LANDING_INDEX_PREFIX_LENGTH = int(os.getenv("LANDING_INDEX_PREFIX_LENGTH", "255"))  # Prefix length for indexes on TEXT/BLOB join columns
+LANDING_INDEX_BUILD_WORKERS = int(os.getenv("LANDING_INDEX_BUILD_WORKERS", "4"))  # Staging indexes built concurrently (PostgreSQL: one connection each)
+LANDING_PG_UNLOGGED = os.getenv("LANDING_PG_UNLOGGED", "true").lower() == "true"  # PostgreSQL staging tables skip the WAL (lost on crash, rebuilt by re-extraction)
+LANDING_SQLITE_DIR = os.getenv("LANDING_SQLITE_DIR", "data/landing")  # Embedded landing: one database file per execution, deleted on completion
+LANDING_SQLITE_CACHE_MB = int(os.getenv("LANDING_SQLITE_CACHE_MB", "256"))  # Embedded landing page cache and mmap size
+LANDING_SQLITE_BUSY_TIMEOUT_SECONDS = float(os.getenv("LANDING_SQLITE_BUSY_TIMEOUT_SECONDS", "300"))  # Concurrent table loads wait for the single writer
 
 
 def get_source_db_config():
@@ -193,7 +258,8 @@ def get_landing_db_config():
     Returns:
         DatabaseConnectionInfo if credentials are configured, None otherwise
     """
-    if not LANDING_DB_ENABLED or not LANDING_DB_USERNAME or not LANDING_DB_PASSWORD:
+    embedded = LANDING_DB_TYPE.lower() == "sqlite"  # Local files, no credentials
+    if not LANDING_DB_ENABLED or (not embedded and (not LANDING_DB_USERNAME or not LANDING_DB_PASSWORD)):
         return None
 
     from kg_builder.models import DatabaseConnectionInfo
@@ -1,7 +1,7 @@
 """
 Pydantic models for request/response validation.
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 from enum import Enum
@@ -258,6 +258,10 @@ class HealthCheckResponse(BaseModel):
     status: str
     falkordb_connected: bool
     graphiti_available: bool
+    jdbc_pools: List[Dict[str, Any]] = Field(
+        default=[],
+        description="Shared JDBC connection pool statistics: [{pool, open, idle, in_use, borrowed, created, ...}, ...]"
+    )
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
@@ -317,6 +321,35 @@ class ReconciliationRule(BaseModel):
         description="Columns to select from each table. Format: {'table_name': ['col1', 'col2'], ...}. If None, selects all columns."
     )
 
+    # ===== Incremental reconciliation support =====
+    watermark_column: Optional[str] = Field(
+        default=None,
+        description="Source column that increases on every insert/update (e.g. updated_at, rowversion). Enables incremental execution."
+    )
+    target_watermark_column: Optional[str] = Field(
+        default=None,
+        description="Target watermark column. If None, uses watermark_column."
+    )
+
+    # ===== Attribute-level (checksum) comparison =====
+    compare_source_columns: Optional[List[str]] = Field(
+        default=None,
+        description="Source columns compared between matched rows (checksum diff)"
+    )
+    compare_target_columns: Optional[List[str]] = Field(
+        default=None,
+        description="Target columns paired positionally with compare_source_columns. If None, uses the same names."
+    )
+
+    def get_compare_columns(self) -> Tuple[List[str], List[str]]:
+        """Get the (source, target) column pairs compared by the checksum diff."""
+        source_columns = self.compare_source_columns or []
+        return source_columns, self.compare_target_columns or list(source_columns)
+
+    def get_target_watermark_column(self) -> Optional[str]:
+        """Get the watermark column of the target table."""
+        return self.target_watermark_column or self.watermark_column
+
     def is_multi_table(self) -> bool:
         """Check if this is a multi-table rule."""
         return self.join_tables is not None and len(self.join_tables) > 2
@@ -543,6 +576,11 @@ class DatabaseConnectionInfo(BaseModel):
     service_name: Optional[str] = Field(default=None, description="Oracle service name (if applicable)")
     schema: Optional[str] = Field(default=None, description="Database schema (for PostgreSQL/MySQL landing DB)")
 
+    def connection_key(self) -> str:
+        """Stable identity of the target server/database (used to key concurrency limits)."""
+        database = self.service_name or self.database
+        return f"{self.db_type.lower()}://{self.username}@{self.host}:{self.port}/{database}"
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -557,10 +595,31 @@ class DatabaseConnectionInfo(BaseModel):
         }
 
 
+class ReconciliationExecutionMode(str, Enum):
+    """How reconciliation queries are executed."""
+    STANDARD = "standard"        # SQL JOIN / NOT EXISTS on the source connection
+    HASH_JOIN = "hash_join"      # Stream keys from both connections, join in-process
+    SINGLE_PASS = "single_pass"  # One FULL OUTER JOIN per rule that classifies every row
+    INCREMENTAL = "incremental"  # Re-evaluate only keys changed since the last run (needs watermark_column)
+    LANDING = "landing"          # Extract both sides into the landing database and join there
+    AUTO = "auto"                # Let the execution planner pick standard, hash_join or landing per rule
+
+
 class RuleExecutionRequest(BaseModel):
     """Request model for executing reconciliation rules."""
     ruleset_id: str
-    limit: int = Field(default=100, description="Maximum number of records to process")
+    limit: int = Field(
+        default=100,
+        description="Maximum number of sample records returned per category (counts are always exact)"
+    )
+    execution_mode: ReconciliationExecutionMode = Field(
+        default=ReconciliationExecutionMode.STANDARD,
+        description=(
+            "standard (single-server SQL), hash_join (cross-server, reconciled in-process), "
+            "single_pass (one classification query per rule), incremental (changed keys only), "
+            "landing (staged in the landing database) or auto (cheapest strategy per rule)"
+        )
+    )
     source_db_config: Optional['DatabaseConnectionInfo'] = Field(
         default=None,
         description="Source database connection (optional - for direct execution)"
@@ -571,6 +630,39 @@ class RuleExecutionRequest(BaseModel):
     )
     include_matched: bool = Field(default=True, description="Include matched records in results")
     include_unmatched: bool = Field(default=True, description="Include unmatched records in results")
+    parallel: bool = Field(default=False, description="Execute rules concurrently on a bounded worker pool")
+    max_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Worker pool size for parallel execution (default: RECON_MAX_WORKERS)"
+    )
+
+
+class ChecksumDiffRequest(BaseModel):
+    """Request model for a checksum-bucket (attribute-level) diff of a ruleset."""
+    ruleset_id: str
+    rule_ids: Optional[List[str]] = Field(
+        default=None,
+        description="Rules to diff (default: every rule with compare_source_columns)"
+    )
+    source_db_config: 'DatabaseConnectionInfo'
+    target_db_config: 'DatabaseConnectionInfo'
+    limit: int = Field(default=100, ge=1, description="Maximum sample keys returned per category")
+
+
+class ChecksumDiffResponse(BaseModel):
+    """Response model for a checksum-bucket diff."""
+    success: bool
+    ruleset_id: str
+    identical: bool = Field(..., description="True if no rule found a missing or differing row")
+    mismatched_count: int = Field(default=0, description="Keys present on both sides with differing compared values")
+    source_only_count: int = 0
+    target_only_count: int = 0
+    rules: List[Dict[str, Any]] = Field(
+        default=[],
+        description="Per-rule results: counts, samples with column differences, drill-down levels and SQL"
+    )
+    execution_time_ms: float
 
 
 class MatchedRecord(BaseModel):
@@ -602,7 +694,11 @@ class RuleExecutionResponse(BaseModel):
     )
     result_file_path: Optional[str] = Field(
         default=None,
-        description="Path to the saved JSON file containing full execution results (e.g., results/reconciliation_result_RECON_ABC123_20251025_120530.json)"
+        description="Path to the saved NDJSON result file with all records (e.g., results/reconciliation_result_RECON_ABC123_20251025_120530.ndjson); page it via /reconciliation/result-files/{filename}"
+    )
+    execution_plan: List[Dict[str, Any]] = Field(
+        default=[],
+        description="execution_mode=auto only: per-rule strategy with its row estimates, estimated cost of each candidate strategy and actual time: [{rule_id, strategy, executed_strategy, reason, source_rows, target_rows, co_located, estimated_costs_ms, estimated_ms, actual_ms}, ...]"
     )
 
 
@@ -736,6 +832,35 @@ class LandingExecutionRequest(BaseModel):
     include_unmatched: bool = Field(default=True, description="Include unmatched records")
     store_in_mongodb: bool = Field(default=True, description="Store results in MongoDB")
     keep_staging: bool = Field(default=True, description="Keep staging tables for audit (24h TTL)")
+    extraction_mode: Optional[str] = Field(
+        default=None,
+        description="'full' copies every column; 'key_only' copies join columns plus a source-side row hash "
+                    "(full rows are fetched on drill-down). Default: LANDING_EXTRACTION_MODE"
+    )
+    rule_ids: Optional[List[str]] = Field(
+        default=None,
+        description="Only reconcile these rules of the ruleset (default: all rules)"
+    )
+    match_strategy: Optional[str] = Field(
+        default=None,
+        description="'independent' matches every rule against every row; 'waterfall' matches the rules in "
+                    "ruleset order on the rows no earlier rule matched. Default: LANDING_MATCH_STRATEGY"
+    )
+
+
+class LandingUnmatchedRowsRequest(BaseModel):
+    """Request for the full rows of unmatched records of a landing run (key-only drill-down)."""
+    ruleset_id: str = Field(..., description="Ruleset the landing run executed")
+    source_db_config: DatabaseConnectionInfo = Field(..., description="Source database connection")
+    target_db_config: DatabaseConnectionInfo = Field(..., description="Target database connection")
+    source_staging_table: str = Field(..., description="Source staging table of the run (see staging_tables)")
+    target_staging_table: str = Field(..., description="Target staging table of the run")
+    side: str = Field(default="source", description="'source' or 'target': which unmatched records to fetch")
+    rule_ids: Optional[List[str]] = Field(
+        default=None,
+        description="Rules joining the two staging tables (default: every rule on the first rule's table pair)"
+    )
+    limit: int = Field(default=100, ge=1, description="Maximum records to return")
 
 
 class StagingTableInfo(BaseModel):
@@ -763,10 +888,26 @@ class LandingExecutionResponse(BaseModel):
     dqcs: float = Field(..., description="Data Quality Confidence Score")
     dqcs_status: str = Field(..., description="GOOD, ACCEPTABLE, or POOR")
     rei: float = Field(..., description="Reconciliation Efficiency Index")
+    rule_kpis: List[Dict[str, Any]] = Field(
+        default=[],
+        description="Per-rule breakdown: [{rule_id, rule_name, confidence, matched_source_count, "
+                    "matched_target_count, unmatched_source_count, rcr}, ...]; the waterfall strategy adds "
+                    "residual_source_count and residual_target_count (rows left after the rule)"
+    )
+    match_strategy: str = Field(default="independent", description="'independent' or 'waterfall'")
 
-    # Staging table information
+    # Staging table information (first source/target table)
     source_staging: StagingTableInfo
     target_staging: StagingTableInfo
+    staging_tables: List[StagingTableInfo] = Field(
+        default=[],
+        description="One staging table per source/target table referenced by the ruleset"
+    )
+    table_extractions: List[Dict[str, Any]] = Field(
+        default=[],
+        description="Per-table extraction timings: [{source_or_target, schema, table, staging_table, row_count, "
+                    "extract_time_ms, load_time_ms, extraction_time_ms}, ...]"
+    )
 
     # Execution metrics
     extraction_time_ms: float
@@ -987,6 +1128,10 @@ class NLQueryResultItem(BaseModel):
     error: Optional[str] = Field(None, description="Error message if any")
     source_table: Optional[str] = Field(None, description="Resolved source table name")
     target_table: Optional[str] = Field(None, description="Resolved target table name")
+    truncated: bool = Field(
+        default=False,
+        description="Records stop at RESULT_STREAM_MAX_ROWS (record_count is the returned rows, not the total)"
+    )
 
 
 class NLQueryExecutionResponse(BaseModel):
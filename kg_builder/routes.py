@@ -2,6 +2,7 @@
 FastAPI routes for knowledge graph operations.
 """
 import logging
+import os
 import time
 from fastapi import APIRouter, HTTPException, UploadFile, File, Query
 from typing import List, Optional
@@ -15,7 +16,7 @@ from kg_builder.models import (
     ValidationResult, RuleExecutionRequest, RuleExecutionResponse,
     NLRelationshipRequest, NLRelationshipResponse, KnowledgeGraph,
     KPICalculationRequest, KPICalculationResponse,
-    LandingExecutionRequest, LandingExecutionResponse,
+    LandingExecutionRequest, LandingExecutionResponse, LandingUnmatchedRowsRequest,
     KPICreateRequest, KPIResultResponse, KPIEvidenceDrillDownRequest,
     KPIEvidenceDrillDownResponse, KPIDefinitionRequest, KPIUpdateRequest,
     KPIExecutionRequest, BatchExecutionRequest, EvidenceRequest,
@@ -24,7 +25,8 @@ from kg_builder.models import (
     NLQueryExecutionRequest, NLQueryExecutionResponse,
     KPIDefinition, KPIUpdateRequest as KPIUpdateRequestNew,
     KPIExecutionResult, DrilldownRequest, DrilldownResponse,
-    KPICacheFlagsRequest, KPIClearCacheRequest
+    KPICacheFlagsRequest, KPIClearCacheRequest,
+    ChecksumDiffRequest, ChecksumDiffResponse
 )
 from kg_builder.services.schema_parser import SchemaParser
 from kg_builder.services.falkordb_backend import get_falkordb_backend
@@ -41,74 +43,22 @@ router = APIRouter()
 
 def get_source_database_connection():
     """
-    Get JDBC connection to source database.
+    Borrow a JDBC connection to the source database from the shared pool.
 
     Returns:
-        Database connection object or None if not configured
+        Pooled database connection (close() returns it to the pool) or None if not configured
     """
     try:
-        import jaydebeapi
-        import glob
-        import os
-        from kg_builder.config import get_source_db_config, JDBC_DRIVERS_PATH
+        from kg_builder.config import get_source_db_config
+        from kg_builder.services.jdbc_connection_pool import get_connection_manager
 
         db_config = get_source_db_config()
         if not db_config:
             logger.warning("Source database is not configured")
             return None
 
-        # Build JDBC URL
-        db_type = db_config.db_type.lower()
-        if db_type == "oracle":
-            if db_config.service_name:
-                jdbc_url = f"jdbc:oracle:thin:@{db_config.host}:{db_config.port}/{db_config.service_name}"
-            else:
-                jdbc_url = f"jdbc:oracle:thin:@{db_config.host}:{db_config.port}:{db_config.database}"
-        elif db_type == "sqlserver":
-            jdbc_url = f"jdbc:sqlserver://{db_config.host}:{db_config.port};databaseName={db_config.database};encrypt=true;trustServerCertificate=true"
-        elif db_type == "mysql":
-            jdbc_url = f"jdbc:mysql://{db_config.host}:{db_config.port}/{db_config.database}"
-        elif db_type == "postgresql":
-            jdbc_url = f"jdbc:postgresql://{db_config.host}:{db_config.port}/{db_config.database}"
-        else:
-            logger.error(f"Unsupported database type: {db_type}")
-            return None
-
-        # Get driver class
-        drivers = {
-            "oracle": "oracle.jdbc.OracleDriver",
-            "sqlserver": "com.microsoft.sqlserver.jdbc.SQLServerDriver",
-            "mysql": "com.mysql.cj.jdbc.Driver",
-            "postgresql": "org.postgresql.Driver"
-        }
-        driver_class = drivers.get(db_type)
-
-        # Get driver JAR
-        jar_patterns = {
-            "oracle": "ojdbc*.jar",
-            "sqlserver": "mssql-jdbc*.jar",
-            "mysql": "mysql-connector-j*.jar",
-            "postgresql": "postgresql-*.jar"
-        }
-        pattern = os.path.join(JDBC_DRIVERS_PATH, jar_patterns.get(db_type, "*.jar"))
-        jars = glob.glob(pattern)
-
-        if not jars:
-            logger.error(f"No JDBC driver found for {db_type} at {pattern}")
-            return None
-
-        driver_jar = jars[0]
-
-        logger.info(f"Connecting to source database: {db_type} at {db_config.host}:{db_config.port}/{db_config.database}")
-
-        # Connect
-        conn = jaydebeapi.connect(
-            driver_class,
-            jdbc_url,
-            [db_config.username, db_config.password],
-            driver_jar
-        )
-
+        logger.info(f"Connecting to source database: {db_config.db_type} at {db_config.host}:{db_config.port}/{db_config.database}")
+        conn = get_connection_manager().connect(db_config)
         logger.info("Successfully connected to source database")
         return conn
 
@@ -119,14 +69,17 @@ def get_source_database_connection():
 
 @router.get("/health", response_model=HealthCheckResponse)
 async def health_check():
-    """Check health status of the application."""
+    """Check health status of the application (including JDBC connection pool statistics)."""
+    from kg_builder.services.jdbc_connection_pool import get_connection_manager
+
     falkordb = get_falkordb_backend()
     graphiti = get_graphiti_backend()
-    
+
     return HealthCheckResponse(
         status="healthy",
         falkordb_connected=falkordb.is_connected(),
-        graphiti_available=graphiti.is_available()
+        graphiti_available=graphiti.is_available(),
+        jdbc_pools=get_connection_manager().stats()
     )
 
 
@@ -1114,7 +1067,8 @@ async def delete_ruleset(ruleset_id: str):
 @router.get("/reconciliation/rulesets/{ruleset_id}/export/sql")
 async def export_ruleset_to_sql(
     ruleset_id: str,
-    query_type: str = "all"
+    query_type: str = "all",
+    db_type: Optional[str] = None
 ):
     """
     Export a ruleset as SQL statements.
@@ -1126,12 +1080,14 @@ async def export_ruleset_to_sql(
             - "matched": Only matched records query
             - "unmatched_source": Only unmatched source records
             - "unmatched_target": Only unmatched target records
+        db_type: Optional dialect (mysql, oracle, postgresql, sqlserver) to quote
+            identifiers for; identifiers are left unquoted when omitted
 
     Returns:
         SQL statements as text
 
     Example:
-        GET /reconciliation/rulesets/RECON_ABC123/export/sql?query_type=all
+        GET /reconciliation/rulesets/RECON_ABC123/export/sql?query_type=all&db_type=oracle
     """
     try:
         if query_type not in ["all", "matched", "unmatched_source", "unmatched_target"]:
@@ -1141,7 +1097,7 @@ async def export_ruleset_to_sql(
             )
 
         storage = get_rule_storage()
-        sql = storage.export_ruleset_to_sql(ruleset_id, query_type=query_type)
+        sql = storage.export_ruleset_to_sql(ruleset_id, query_type=query_type, db_type=db_type)
 
         if not sql:
             raise HTTPException(status_code=404, detail=f"Ruleset '{ruleset_id}' not found")
@@ -1306,6 +1262,11 @@ async def execute_reconciliation(request: RuleExecutionRequest):
             - target_db_config: (Optional) Target database connection
             - include_matched: (Optional) Include matched records (default: True)
             - include_unmatched: (Optional) Include unmatched records (default: True)
+            - execution_mode: (Optional) "standard" runs SQL joins on the source connection;
+              "hash_join" streams both connections and reconciles in-process (use when
+              source and target live on different servers); "auto" picks standard SQL,
+              hash_join or landing per rule from table statistics and co-location, and
+              reports the chosen plan with estimated vs actual cost in execution_plan
 
     Returns:
         RuleExecutionResponse with matched and unmatched records
@@ -1417,7 +1378,10 @@ async def execute_reconciliation(request: RuleExecutionRequest):
             target_db_config=target_db_config,
             limit=request.limit,
             include_matched=getattr(request, 'include_matched', True),
-            include_unmatched=getattr(request, 'include_unmatched', True)
+            include_unmatched=getattr(request, 'include_unmatched', True),
+            execution_mode=request.execution_mode,
+            parallel=request.parallel,
+            max_workers=request.max_workers
         )
 
         return result
@@ -1429,6 +1393,68 @@ async def execute_reconciliation(request: RuleExecutionRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/reconciliation/checksum-diff", response_model=ChecksumDiffResponse)
+async def checksum_diff_reconciliation(request: ChecksumDiffRequest):
+    """
+    Detect attribute-level drift between matched rows with a checksum-bucket diff.
+
+    Rules must declare compare_source_columns (and optionally compare_target_columns).
+    Rows are hashed and aggregated inside each database; only buckets whose checksums
+    differ are drilled into and fetched.
+
+    Args:
+        request: Ruleset, optional rule IDs, both database connections and the sample limit
+
+    Returns:
+        ChecksumDiffResponse with mismatched / source-only / target-only keys per rule
+    """
+    try:
+        from kg_builder.services.reconciliation_executor import get_reconciliation_executor
+
+        executor = get_reconciliation_executor()
+        return executor.execute_checksum_diff(
+            ruleset_id=request.ruleset_id,
+            source_db_config=request.source_db_config,
+            target_db_config=request.target_db_config,
+            rule_ids=request.rule_ids,
+            limit=request.limit
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error executing checksum diff: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/reconciliation/catalog/invalidate")
+async def invalidate_reconciliation_catalog(
+    connection_key: Optional[str] = None,
+    schema: Optional[str] = None,
+    table: Optional[str] = None
+):
+    """
+    Drop cached table metadata (e.g. after DDL on a source or target database).
+
+    Args:
+        connection_key: Only this database (as returned by DatabaseConnectionInfo.connection_key())
+        schema: Only tables of this schema
+        table: Only this table
+
+    Returns:
+        Number of invalidated entries and the remaining cache statistics
+    """
+    from kg_builder.services.catalog_service import get_catalog_service
+
+    catalog = get_catalog_service()
+    removed = catalog.invalidate(scope=connection_key, schema=schema, table=table)
+    return {
+        "success": True,
+        "invalidated": removed,
+        "stats": catalog.stats()
+    }
+
+
 @router.post("/reconciliation/execute-with-landing", response_model=LandingExecutionResponse)
 async def execute_reconciliation_with_landing(request: LandingExecutionRequest):
     """
@@ -1465,6 +1491,8 @@ async def execute_reconciliation_with_landing(request: LandingExecutionRequest):
             - limit: (Optional) Limit rows per staging table
             - keep_staging: Keep staging tables for inspection (default: True, 24h TTL)
             - store_in_mongodb: Store results in MongoDB (default: True)
+            - extraction_mode: (Optional) 'full' or 'key_only' (join columns + row hash)
+            - match_strategy: (Optional) 'independent' or 'waterfall' (rules in order on residual rows)
 
     Returns:
         LandingExecutionResponse with:
@@ -1520,6 +1548,12 @@ async def execute_reconciliation_with_landing(request: LandingExecutionRequest):
             "size_mb": 15.2,
             "indexes": ["idx_recon_stage_EXEC_a1b2c3d4_source_20250124_120000_id"]
         },
+        "table_extractions": [
+            {"source_or_target": "source", "schema": "sales", "table": "orders",
+             "staging_table": "recon_stage_EXEC_a1b2c3d4_source_20250124_120000",
+             "row_count": 10000, "extract_time_ms": 1800.0, "load_time_ms": 650.0,
+             "extraction_time_ms": 2450.0}
+        ],
         "staging_retained": true,
         "staging_ttl_hours": 24
     }
@@ -1553,6 +1587,78 @@ async def execute_reconciliation_with_landing(request: LandingExecutionRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/reconciliation/landing/unmatched-rows")
+async def get_landing_unmatched_rows(request: LandingUnmatchedRowsRequest):
+    """
+    Fetch the full rows of unmatched records of a landing run.
+
+    Key-only runs (extraction_mode='key_only') stage only join columns and a row
+    hash; this finds the unmatched keys in the retained staging tables and reads
+    the complete rows from the source or target database by key. The staging
+    tables must still exist (keep_staging=true, within their TTL).
+
+    Args:
+        request: Ruleset, database connections, staging tables of the run and the side to fetch
+
+    Returns:
+        Full rows of up to `limit` unmatched records
+    """
+    try:
+        from kg_builder.services.landing_reconciliation_executor import get_landing_reconciliation_executor
+
+        if request.side not in ("source", "target"):
+            raise HTTPException(status_code=400, detail="side must be 'source' or 'target'")
+
+        executor = get_landing_reconciliation_executor()
+        if executor is None:
+            raise HTTPException(
+                status_code=503,
+                detail="Landing database is not configured or not available. "
+                       "Set LANDING_DB_ENABLED=true and run scripts/init_landing_db.py"
+            )
+
+        ruleset = get_rule_storage().load_ruleset(request.ruleset_id)
+        if not ruleset:
+            raise HTTPException(status_code=404, detail=f"Ruleset '{request.ruleset_id}' not found")
+
+        rules = [
+            rule for rule in ruleset.rules
+            if request.rule_ids is None or rule.rule_id in request.rule_ids
+        ]
+        if not rules:
+            raise HTTPException(status_code=404, detail="No matching rules in the ruleset")
+        # The staging tables hold one source/target table pair
+        pair = (rules[0].source_schema, rules[0].source_table, rules[0].target_schema, rules[0].target_table)
+        rules = [
+            rule for rule in rules
+            if (rule.source_schema, rule.source_table, rule.target_schema, rule.target_table) == pair
+        ]
+
+        db_config = request.source_db_config if request.side == "source" else request.target_db_config
+        records = executor.fetch_unmatched_rows(
+            db_config,
+            request.source_staging_table,
+            request.target_staging_table,
+            rules,
+            side=request.side,
+            limit=request.limit
+        )
+
+        return {
+            "success": True,
+            "side": request.side,
+            "rule_ids": [rule.rule_id for rule in rules],
+            "records": records,
+            "count": len(records)
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching unmatched landing rows: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/reconciliation/results/{document_id}")
 async def get_reconciliation_result(document_id: str):
     """
@@ -1628,6 +1734,63 @@ async def list_reconciliation_results(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/reconciliation/result-files/{filename}")
+async def get_reconciliation_result_file_page(
+    filename: str,
+    section: str = Query("matched", description="matched, unmatched_source or unmatched_target"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=10000)
+):
+    """
+    Read one page of records from a reconciliation result file.
+
+    The file is streamed, so only the requested page is held in memory.
+
+    Args:
+        filename: Result file name (as in result_file_path)
+        section: Record section to page through
+        offset: Number of records to skip
+        limit: Maximum number of records to return
+
+    Returns:
+        Header, footer summary and the requested page of records
+    """
+    try:
+        from kg_builder.config import RECON_RESULTS_DIR
+        from kg_builder.services.result_file_store import ResultFileReader, RESULT_SECTIONS
+
+        if section not in RESULT_SECTIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid section '{section}', expected one of {', '.join(RESULT_SECTIONS)}"
+            )
+
+        # Only serve files from the results directory
+        file_path = RECON_RESULTS_DIR / os.path.basename(filename)
+        if not file_path.is_file():
+            raise HTTPException(status_code=404, detail=f"Result file '{filename}' not found")
+
+        reader = ResultFileReader(file_path)
+        footer = reader.footer()
+
+        return {
+            "success": True,
+            "header": reader.header(),
+            "summary": {key: value for key, value in footer.items() if key != "generated_sql"},
+            "section": section,
+            "offset": offset,
+            "limit": limit,
+            "total": footer.get("sections", {}).get(section, 0),
+            "records": reader.read_page(section, offset, limit)
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error reading reconciliation result file: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/reconciliation/statistics")
 async def get_reconciliation_statistics(ruleset_id: Optional[str] = None):
     """
@@ -0,0 +1,164 @@
+"""
+Bounded producer/consumer pipeline for row batches.
+
+The landing load used to hold three full copies of a table: the fetched rows,
+the converted rows and a temp CSV. BatchPipeline runs the stages concurrently
+instead:
+
+    fetch (producer thread) -> convert (transform thread) -> load (caller)
+
+Stages are connected by bounded queues, so a slow loader blocks the fetch
+(backpressure) and peak memory is about `(2 * queue_depth + 3) * batch_size`
+rows regardless of the table size. An error in any stage stops the others and
+is re-raised in the consumer.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from kg_builder.config import LANDING_PIPELINE_QUEUE_DEPTH
+from kg_builder.services.jdbc_connection_pool import attach_thread_to_jvm
+
+logger = logging.getLogger(__name__)
+
+_END = object()
+
+
+class _StageFailure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class BatchPipeline:
+    """Iterate transformed batches while the next ones are fetched and transformed."""
+
+    def __init__(
+        self,
+        source: Iterable[List[Any]],
+        transform: Optional[Callable[[List[Any]], List[Any]]] = None,
+        queue_depth: int = LANDING_PIPELINE_QUEUE_DEPTH,
+        name: str = "pipeline"
+    ):
+        """
+        Initialize the pipeline (threads start on first iteration).
+
+        Args:
+            source: Batches to read; iterated on the producer thread (e.g. a JDBC
+                fetch generator)
+            transform: Applied to each batch on the transform thread (None: pass through)
+            queue_depth: Batches buffered between two stages
+            name: Thread name prefix
+        """
+        self.source = source
+        self.transform = transform
+        self.name = name
+        self._fetched: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, queue_depth))
+        self._transformed: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, queue_depth))
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._started = False
+        self.batches = 0
+        self.rows = 0
+        self.fetch_ms = 0.0                # Producer time spent reading the source
+        self.transform_ms = 0.0            # Transform thread time spent converting
+        self.backpressure_ms = 0.0         # Producer time blocked on a full queue
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        self._start()
+        try:
+            while True:
+                item = self._get(self._transformed)
+                if item is _END or item is None:
+                    return
+                if isinstance(item, _StageFailure):
+                    raise item.error
+                self.batches += 1
+                self.rows += len(item)
+                yield item
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop every stage and wait for the threads (idempotent)."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "fetch_ms": round(self.fetch_ms, 2),
+            "transform_ms": round(self.transform_ms, 2),
+            "backpressure_ms": round(self.backpressure_ms, 2)
+        }
+
+    def _start(self):
+        if self._started:
+            raise RuntimeError("BatchPipeline can only be iterated once")
+        self._started = True
+        self._threads = [
+            threading.Thread(target=self._produce, name=f"{self.name}-fetch", daemon=True),
+            threading.Thread(target=self._convert, name=f"{self.name}-convert", daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _produce(self):
+        attach_thread_to_jvm()
+        try:
+            batches = iter(self.source)
+            while not self._stop.is_set():
+                started = time.time()
+                batch = next(batches, _END)
+                self.fetch_ms += (time.time() - started) * 1000
+                if batch is _END:
+                    break
+                started = time.time()
+                if not self._put(self._fetched, batch):
+                    return
+                self.backpressure_ms += (time.time() - started) * 1000
+        except BaseException as e:
+            self._put(self._fetched, _StageFailure(e))
+            return
+        self._put(self._fetched, _END)
+
+    def _convert(self):
+        while True:
+            item = self._get(self._fetched)
+            if item is None:
+                return
+            if item is _END or isinstance(item, _StageFailure):
+                self._put(self._transformed, item)
+                return
+            try:
+                started = time.time()
+                if self.transform is not None:
+                    item = self.transform(item)
+                self.transform_ms += (time.time() - started) * 1000
+            except BaseException as e:
+                self._put(self._transformed, _StageFailure(e))
+                return
+            if not self._put(self._transformed, item):
+                return
+
+    def _put(self, target: "queue.Queue[Any]", item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: "queue.Queue[Any]") -> Any:
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
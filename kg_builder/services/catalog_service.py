@@ -0,0 +1,444 @@
+"""
+Catalog metadata cache for reconciliation source and target databases.
+
+Introspects tables in bulk (one INFORMATION_SCHEMA / ALL_TAB_COLUMNS query for all
+tables of a ruleset) and caches, per connection: whether a table exists, the table
+reference that reaches it (schema-qualified or the connection's default schema),
+and its columns and types. Executors consult the cache before issuing SQL, so
+existence checks and retries without the schema prefix are not repeated per query.
+
+Row-count estimates are read from the optimizer statistics on demand (never
+with COUNT(*)) and cached with the table entry.
+
+Entries expire after RECON_CATALOG_TTL_SECONDS and can be invalidated explicitly
+(per connection, per table or entirely), e.g. after DDL.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from kg_builder.config import RECON_CATALOG_TTL_SECONDS
+from kg_builder.services.rule_plan_compiler import (
+    TableResolver,
+    canonical_dialect,
+    normalize_schema_name,
+    quote_identifier
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TableInfo:
+    """Catalog entry of one table as seen from one connection."""
+    schema: str
+    table: str
+    exists: bool
+    use_schema: bool = True                                   # False: reachable only without the schema prefix
+    columns: List[str] = field(default_factory=list)          # Column names in ordinal order
+    column_types: Dict[str, str] = field(default_factory=dict)  # Lower-cased column name -> type name
+    catalog_schema: Optional[str] = None                      # Schema the table was found in, when known
+    row_estimate: Optional[int] = None                        # Statistics row count (see row_estimate_loaded)
+    row_estimate_loaded: bool = False
+    loaded_at: float = field(default_factory=time.time)
+
+    def has_column(self, column: str) -> bool:
+        """Case-insensitive column existence check."""
+        return column.lower() in self.column_types
+
+    def column_type(self, column: str) -> Optional[str]:
+        """Type name of a column (catalog type name, or driver type code when probed)."""
+        return self.column_types.get(column.lower())
+
+    def table_ref(self, db_type: str) -> str:
+        """Quoted reference that reaches the table from this connection."""
+        table_quoted = quote_identifier(self.table, db_type)
+        if self.use_schema and self.schema:
+            return f"{quote_identifier(self.schema, db_type)}.{table_quoted}"
+        return table_quoted
+
+
+def _sql_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+class CatalogService:
+    """Bulk-introspect and cache table metadata per database connection."""
+
+    # Query returning the schema unqualified table names resolve to
+    DEFAULT_SCHEMA_QUERIES = {
+        "mysql": "SELECT DATABASE()",
+        "postgresql": "SELECT current_schema()",
+        "sqlserver": "SELECT SCHEMA_NAME()",
+        "oracle": "SELECT SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA') FROM DUAL",
+    }
+
+    # Row count kept by the optimizer statistics ({schema} and {table} are lower-cased literals)
+    ROW_ESTIMATE_QUERIES = {
+        "mysql": (
+            "SELECT TABLE_ROWS FROM INFORMATION_SCHEMA.TABLES "
+            "WHERE LOWER(TABLE_SCHEMA) = {schema} AND LOWER(TABLE_NAME) = {table}"
+        ),
+        "postgresql": (
+            "SELECT c.reltuples FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE LOWER(n.nspname) = {schema} AND LOWER(c.relname) = {table}"
+        ),
+        "sqlserver": (
+            "SELECT SUM(p.rows) FROM sys.partitions p "
+            "JOIN sys.tables t ON t.object_id = p.object_id "
+            "JOIN sys.schemas s ON s.schema_id = t.schema_id "
+            "WHERE p.index_id IN (0, 1) AND LOWER(s.name) = {schema} AND LOWER(t.name) = {table}"
+        ),
+        "oracle": (
+            "SELECT NUM_ROWS FROM ALL_TABLES "
+            "WHERE LOWER(OWNER) = {schema} AND LOWER(TABLE_NAME) = {table}"
+        ),
+    }
+
+    def __init__(self, ttl_seconds: float = RECON_CATALOG_TTL_SECONDS):
+        """
+        Initialize the catalog cache.
+
+        Args:
+            ttl_seconds: Lifetime of cached entries (0 disables caching)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._tables: Dict[Tuple[str, str, str], TableInfo] = {}
+        self._versions: Dict[str, int] = {}  # Bumped whenever a scope's metadata is (re)loaded or dropped
+        self._lock = threading.Lock()
+        self.catalog_queries = 0
+        self.probe_queries = 0
+        self.statistics_queries = 0
+
+    @staticmethod
+    def _key(scope: str, schema: str, table: str) -> Tuple[str, str, str]:
+        return scope, (schema or "").lower(), table.lower()
+
+    def _cached(self, key: Tuple[str, str, str]) -> Optional[TableInfo]:
+        with self._lock:
+            info = self._tables.get(key)
+            if info and time.time() - info.loaded_at < self.ttl_seconds:
+                return info
+            return None
+
+    def get_table(
+        self,
+        conn: Any,
+        scope: str,
+        db_type: str,
+        schema: str,
+        table: str
+    ) -> TableInfo:
+        """
+        Metadata of one table, loading it (and caching it) when needed.
+
+        Args:
+            conn: DB-API connection used on a cache miss
+            scope: Identity of the database (DatabaseConnectionInfo.connection_key())
+            db_type: Database type
+            schema: Schema name as written in the rule (normalized here)
+            table: Table name
+
+        Returns:
+            TableInfo (exists=False when the table is not reachable)
+        """
+        return self.load_tables(conn, scope, db_type, [(schema, table)])[0]
+
+    def load_tables(
+        self,
+        conn: Any,
+        scope: str,
+        db_type: str,
+        tables: Iterable[Tuple[str, str]]
+    ) -> List[TableInfo]:
+        """
+        Metadata of several tables; all cache misses are introspected with one query.
+
+        Args:
+            conn: DB-API connection used on cache misses
+            scope: Identity of the database (DatabaseConnectionInfo.connection_key())
+            db_type: Database type
+            tables: (schema, table) pairs as written in the rules
+
+        Returns:
+            TableInfo per requested pair, in request order
+        """
+        db_type = canonical_dialect(db_type)
+        requested = [(normalize_schema_name(schema, db_type), table) for schema, table in tables]
+
+        found: Dict[Tuple[str, str, str], TableInfo] = {}
+        missing = []
+        for schema, table in requested:
+            key = self._key(scope, schema, table)
+            info = self._cached(key)
+            if info:
+                found[key] = info
+            elif (schema, table) not in missing:
+                missing.append((schema, table))
+
+        if missing:
+            loaded = self._introspect(conn, db_type, missing)
+            with self._lock:
+                for info in loaded:
+                    key = self._key(scope, info.schema, info.table)
+                    self._tables[key] = info
+                    found[key] = info
+                self._versions[scope] = self._versions.get(scope, 0) + 1
+
+        return [found[self._key(scope, schema, table)] for schema, table in requested]
+
+    def row_estimate(
+        self,
+        conn: Any,
+        scope: str,
+        db_type: str,
+        schema: str,
+        table: str
+    ) -> Optional[int]:
+        """
+        Approximate row count of a table from the optimizer statistics.
+
+        Args:
+            conn: DB-API connection used on a cache miss
+            scope: Identity of the database (DatabaseConnectionInfo.connection_key())
+            db_type: Database type
+            schema: Schema name as written in the rule
+            table: Table name
+
+        Returns:
+            Estimated rows, or None when the table is unknown or has no statistics
+        """
+        db_type = canonical_dialect(db_type)
+        info = self.get_table(conn, scope, db_type, schema, table)
+        if not info.exists:
+            return None
+        if info.row_estimate_loaded:
+            return info.row_estimate
+
+        estimate = None
+        query = self.ROW_ESTIMATE_QUERIES.get(db_type)
+        if query and info.catalog_schema:
+            cursor = conn.cursor()
+            try:
+                self.statistics_queries += 1
+                cursor.execute(query.format(
+                    schema=_sql_literal(info.catalog_schema.lower()),
+                    table=_sql_literal(info.table.lower())
+                ))
+                row = cursor.fetchone()
+                # PostgreSQL reports -1 for tables that were never analyzed
+                if row and row[0] is not None and float(row[0]) >= 0:
+                    estimate = int(float(row[0]))
+            except Exception as e:
+                logger.debug(f"No row estimate for {schema}.{table}: {e}")
+            finally:
+                cursor.close()
+
+        with self._lock:
+            info.row_estimate = estimate
+            info.row_estimate_loaded = True
+        return estimate
+
+    def version(self, scope: str) -> int:
+        """Metadata version of a database; part of the cache key of plans resolved against it."""
+        with self._lock:
+            return self._versions.get(scope, 0)
+
+    def table_resolver(self, conn: Any, scope: str, db_type: str) -> TableResolver:
+        """
+        Resolver for RulePlanCompiler.compile backed by this cache.
+
+        Tables the catalog cannot see keep their schema prefix and unknown columns.
+        """
+        def resolve(schema: str, table: str) -> Tuple[bool, Optional[Tuple[str, ...]]]:
+            info = self.get_table(conn, scope, db_type, schema, table)
+            if not info.exists:
+                return True, None
+            return info.use_schema, tuple(info.columns)
+
+        return resolve
+
+    def invalidate(self, scope: Optional[str] = None, schema: Optional[str] = None, table: Optional[str] = None) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            scope: Only entries of this database (all databases when None)
+            schema: Only entries of this schema
+            table: Only entries of this table
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [
+                key for key in self._tables
+                if (scope is None or key[0] == scope)
+                and (schema is None or key[1] == schema.lower())
+                and (table is None or key[2] == table.lower())
+            ]
+            for key in keys:
+                del self._tables[key]
+                self._versions[key[0]] = self._versions.get(key[0], 0) + 1
+        if keys:
+            logger.info(f"Invalidated {len(keys)} catalog entries")
+        return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        """Cache statistics."""
+        with self._lock:
+            return {
+                "tables": len(self._tables),
+                "catalog_queries": self.catalog_queries,
+                "probe_queries": self.probe_queries,
+                "statistics_queries": self.statistics_queries
+            }
+
+    def _introspect(self, conn: Any, db_type: str, tables: List[Tuple[str, str]]) -> List[TableInfo]:
+        """Load tables from the catalog views, probing only what the catalog cannot answer."""
+        try:
+            infos = self._introspect_catalog(conn, db_type, tables)
+        except Exception as e:
+            logger.debug(f"Catalog query failed ({e}); probing tables directly")
+            infos = {}
+
+        result = []
+        for schema, table in tables:
+            info = infos.get(((schema or "").lower(), table.lower()))
+            if info is None:
+                info = self._probe(conn, db_type, schema, table)
+            result.append(info)
+        return result
+
+    def _introspect_catalog(
+        self,
+        conn: Any,
+        db_type: str,
+        tables: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], TableInfo]:
+        """One catalog query for all tables; returns entries for tables the catalog knows."""
+        names = sorted({table.lower() for _, table in tables})
+        name_list = ", ".join(_sql_literal(name) for name in names)
+
+        if db_type == "oracle":
+            query = f"""
+            SELECT OWNER, TABLE_NAME, COLUMN_NAME, DATA_TYPE
+            FROM ALL_TAB_COLUMNS
+            WHERE LOWER(TABLE_NAME) IN ({name_list})
+            ORDER BY OWNER, TABLE_NAME, COLUMN_ID
+            """
+        else:
+            query = f"""
+            SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, DATA_TYPE
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE LOWER(TABLE_NAME) IN ({name_list})
+            ORDER BY TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
+            """
+
+        cursor = conn.cursor()
+        try:
+            self.catalog_queries += 1
+            cursor.execute(query)
+            rows = cursor.fetchall()
+
+            default_schema = None
+            default_query = self.DEFAULT_SCHEMA_QUERIES.get(db_type)
+            if default_query:
+                try:
+                    cursor.execute(default_query)
+                    row = cursor.fetchone()
+                    default_schema = row[0] if row else None
+                except Exception as e:
+                    logger.debug(f"Could not determine default schema: {e}")
+        finally:
+            cursor.close()
+
+        # (schema, table) -> ordered columns as reported by the catalog
+        catalog: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        for table_schema, table_name, column_name, data_type in rows:
+            catalog.setdefault((str(table_schema).lower(), str(table_name).lower()), []).append(
+                (str(column_name), str(data_type))
+            )
+
+        def entry(
+            schema: str,
+            table: str,
+            use_schema: bool,
+            catalog_schema: str,
+            columns: List[Tuple[str, str]]
+        ) -> TableInfo:
+            return TableInfo(
+                schema=schema,
+                table=table,
+                exists=True,
+                use_schema=use_schema,
+                columns=[name for name, _ in columns],
+                column_types={name.lower(): data_type for name, data_type in columns},
+                catalog_schema=catalog_schema
+            )
+
+        infos = {}
+        for schema, table in tables:
+            columns = catalog.get(((schema or "").lower(), table.lower()))
+            if columns:
+                infos[((schema or "").lower(), table.lower())] = entry(schema, table, True, schema, columns)
+            elif default_schema:
+                # Rule schema is wrong (e.g. a schema file name): fall back to the default schema
+                columns = catalog.get((str(default_schema).lower(), table.lower()))
+                if columns:
+                    logger.info(
+                        f"Table {schema}.{table} not found; using {table} from default schema {default_schema}"
+                    )
+                    infos[((schema or "").lower(), table.lower())] = entry(
+                        schema, table, False, str(default_schema), columns
+                    )
+        return infos
+
+    def _probe(self, conn: Any, db_type: str, schema: str, table: str) -> TableInfo:
+        """Zero-row SELECT with and without the schema prefix (catalog unavailable or table unknown to it)."""
+        table_quoted = quote_identifier(table, db_type)
+        candidates = []
+        if schema:
+            candidates.append((True, f"{quote_identifier(schema, db_type)}.{table_quoted}"))
+        candidates.append((False, table_quoted))
+
+        for use_schema, table_ref in candidates:
+            cursor = conn.cursor()
+            try:
+                self.probe_queries += 1
+                cursor.execute(f"SELECT * FROM {table_ref} WHERE 1=0")
+                description = cursor.description or []
+                return TableInfo(
+                    schema=schema,
+                    table=table,
+                    exists=True,
+                    use_schema=use_schema,
+                    catalog_schema=schema if use_schema else None,
+                    columns=[desc[0] for desc in description],
+                    column_types={desc[0].lower(): desc[1] for desc in description}
+                )
+            except Exception:
+                continue
+            finally:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+
+        logger.info(f"Table {schema}.{table} is not reachable from this connection")
+        return TableInfo(schema=schema, table=table, exists=False)
+
+
+# Singleton instance
+_catalog_service: Optional[CatalogService] = None
+
+
+def get_catalog_service() -> CatalogService:
+    """Get or create the singleton catalog service instance."""
+    global _catalog_service
+    if _catalog_service is None:
+        _catalog_service = CatalogService()
+    return _catalog_service
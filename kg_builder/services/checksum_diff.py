@@ -0,0 +1,482 @@
+"""
+Checksum-bucket (Merkle-style) diff for attribute-level mismatch detection.
+
+Each database hashes its own rows (MD5 via MD5() / HASHBYTES / STANDARD_HASH)
+and aggregates them into buckets keyed by a prefix of the key hash:
+
+    bucket = first N hex chars of MD5(key)
+    checksum(bucket) = (COUNT(*), SUM(first 32 bits of MD5(key + compare columns)))
+
+Only the bucket summaries cross the network. Buckets whose summaries agree on
+both sides are skipped; differing buckets are split by one more hex character
+and compared again, until they are small enough to fetch. Leaf rows are then
+compared per key, so unchanged key ranges of a 100M-row table cost a few
+kilobytes.
+
+Hashes are computed over a canonical text rendering, so the two sides may be
+different dialects: numbers are hashed as integers scaled by 10^NUMBER_SCALE
+(fractional digits beyond that are rounded away), dates and timestamps as
+'YYYY-MM-DD HH:MI:SS' (sub-second precision is ignored) and everything else as
+UTF-8 text. The value kind of a column comes from its catalog type (see
+value_kind); columns of unknown type are hashed as text. SQL Server converts
+text to UTF-8 with a _UTF8 collation, which needs SQL Server 2019 or later;
+Oracle hashes VARCHAR2 in the database character set (AL32UTF8 by default).
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from kg_builder.config import (
+    RECON_CHECKSUM_INITIAL_BUCKET_CHARS,
+    RECON_CHECKSUM_LEAF_ROWS,
+    RECON_CHECKSUM_MAX_BUCKET_CHARS
+)
+
+logger = logging.getLogger(__name__)
+
+NULL_MARKER = "<NULL>"
+KEY_HASH_COLUMN = "recon_key_hash"
+ROW_HASH_COLUMN = "recon_row_hash"
+
+# Bucket prefixes per IN (...) list
+PREFIX_BATCH_SIZE = 256
+
+
+# ---------------------------------------------------------------------- dialect helpers
+
+# Numbers are hashed as round(value * 10^NUMBER_SCALE), an integer renders the same everywhere
+NUMBER_SCALE = 10
+
+# UTF-8 collation SQL Server converts NVARCHAR text through before hashing
+SQLSERVER_UTF8_COLLATION = "Latin1_General_100_BIN2_UTF8"
+
+TEXT_KIND = "text"
+NUMBER_KIND = "number"
+BOOLEAN_KIND = "boolean"
+DATETIME_KIND = "datetime"
+
+_NUMBER_TYPES = (
+    "INT", "DECIMAL", "NUMERIC", "NUMBER", "FLOAT", "DOUBLE", "REAL", "MONEY", "SERIAL"
+)
+_BOOLEAN_TYPES = ("BOOL", "BIT")
+_DATETIME_TYPES = ("DATE", "TIME", "TIMESTAMP")
+
+
+def value_kind(type_name: Any) -> str:
+    """
+    Canonical value kind of a column type.
+
+    Args:
+        type_name: Catalog type name (e.g. 'decimal', 'NUMBER', 'datetime2'); None when unknown
+
+    Returns:
+        NUMBER_KIND, BOOLEAN_KIND, DATETIME_KIND or TEXT_KIND
+    """
+    if type_name is None:
+        return TEXT_KIND
+    name = str(type_name).upper()
+    if "INTERVAL" in name or "CHAR" in name or "TEXT" in name:
+        return TEXT_KIND
+    if any(token in name for token in _BOOLEAN_TYPES):
+        return BOOLEAN_KIND
+    if any(token in name for token in _DATETIME_TYPES):
+        return DATETIME_KIND
+    if any(token in name for token in _NUMBER_TYPES):
+        return NUMBER_KIND
+    return TEXT_KIND
+
+
+def _number_text(column: str, db_type: str, kind: str) -> str:
+    scale = 10 ** NUMBER_SCALE
+    if db_type == "oracle":
+        return f"TO_CHAR(ROUND(CAST({column} AS NUMBER) * {scale}))"
+    if db_type == "sqlserver":
+        return (
+            f"CAST(CAST(CAST({column} AS DECIMAL(38, {NUMBER_SCALE})) * {scale} AS DECIMAL(38, 0)) "
+            f"AS VARCHAR(40))"
+        )
+    if db_type == "postgresql":
+        value = f"CAST({column} AS INTEGER)" if kind == BOOLEAN_KIND else column
+        return f"CAST(ROUND(CAST({value} AS NUMERIC) * {scale}) AS TEXT)"
+    return f"CAST(CAST(ROUND({column} * {scale}) AS DECIMAL(38, 0)) AS CHAR)"
+
+
+def _datetime_text(column: str, db_type: str) -> str:
+    if db_type in ("oracle", "postgresql"):
+        return f"TO_CHAR({column}, 'YYYY-MM-DD HH24:MI:SS')"
+    if db_type == "sqlserver":
+        return f"CONVERT(VARCHAR(19), CAST({column} AS DATETIME2), 120)"
+    return f"DATE_FORMAT({column}, '%Y-%m-%d %H:%i:%s')"
+
+
+def text_expression(column: str, db_type: str, kind: str = TEXT_KIND) -> str:
+    """Render a column in its canonical text form with NULLs replaced by a marker."""
+    db_type = db_type.lower()
+    if kind in (NUMBER_KIND, BOOLEAN_KIND):
+        rendered = _number_text(column, db_type, kind)
+    elif kind == DATETIME_KIND:
+        rendered = _datetime_text(column, db_type)
+    elif db_type == "oracle":
+        rendered = f"TO_CHAR({column})"
+    elif db_type == "sqlserver":
+        rendered = f"CAST({column} AS NVARCHAR(MAX))"
+    elif db_type == "postgresql":
+        rendered = f"CAST({column} AS TEXT)"
+    else:
+        rendered = f"CAST({column} AS CHAR)"
+    if db_type == "oracle":
+        return f"NVL({rendered}, '{NULL_MARKER}')"
+    return f"COALESCE({rendered}, '{NULL_MARKER}')"
+
+
+def concat_expression(parts: List[str], db_type: str) -> str:
+    """Concatenate text expressions with a '|' separator."""
+    db_type = db_type.lower()
+    if len(parts) == 1:
+        return parts[0]
+    if db_type == "oracle":
+        return " || '|' || ".join(parts)
+    if db_type == "sqlserver":
+        return "CONCAT(" + ", '|', ".join(parts) + ")"
+    return "CONCAT_WS('|', " + ", ".join(parts) + ")"
+
+
+def md5_hex_expression(expression: str, db_type: str) -> str:
+    """Lower-case hex MD5 of the UTF-8 bytes of a text expression."""
+    db_type = db_type.lower()
+    if db_type == "oracle":
+        return f"LOWER(RAWTOHEX(STANDARD_HASH({expression}, 'MD5')))"
+    if db_type == "sqlserver":
+        # HASHBYTES on NVARCHAR would hash UTF-16LE; convert to UTF-8 VARCHAR first
+        utf8 = f"CONVERT(VARCHAR(MAX), CAST({expression} AS NVARCHAR(MAX)) COLLATE {SQLSERVER_UTF8_COLLATION})"
+        return f"LOWER(CONVERT(VARCHAR(32), HASHBYTES('MD5', {utf8}), 2))"
+    return f"MD5({expression})"
+
+
+def substring_expression(expression: str, length: int, db_type: str) -> str:
+    """First `length` characters of an expression."""
+    if db_type.lower() == "oracle":
+        return f"SUBSTR({expression}, 1, {length})"
+    return f"SUBSTRING({expression}, 1, {length})"
+
+
+def hex_prefix_to_int_expression(hex_expression: str, db_type: str) -> str:
+    """Unsigned integer value of the first 8 hex characters (32 bits) of a hex string."""
+    db_type = db_type.lower()
+    prefix = substring_expression(hex_expression, 8, db_type)
+    if db_type == "oracle":
+        return f"TO_NUMBER({prefix}, 'XXXXXXXX')"
+    if db_type == "sqlserver":
+        return f"CONVERT(BIGINT, CONVERT(VARBINARY(4), {prefix}, 2))"
+    if db_type == "postgresql":
+        return f"('x' || {prefix})::bit(32)::bigint"
+    return f"CAST(CONV({prefix}, 16, 10) AS UNSIGNED)"
+
+
+def row_hash_expression(columns: List[str], db_type: str, kinds: Optional[List[str]] = None) -> str:
+    """Lower-case hex MD5 over the canonical text of the given (quoted) columns."""
+    kinds = kinds or [TEXT_KIND] * len(columns)
+    return md5_hex_expression(
+        concat_expression([text_expression(col, db_type, kind) for col, kind in zip(columns, kinds)], db_type),
+        db_type
+    )
+
+
+# ---------------------------------------------------------------------- data classes
+
+@dataclass
+class ChecksumSide:
+    """One side of a checksum diff, with identifiers already quoted for its dialect."""
+    conn: Any
+    db_type: str
+    table_refs: List[str]          # Candidate table references, tried in order
+    key_columns: List[str]         # Quoted key columns
+    compare_columns: List[str]     # Quoted compared columns (positionally paired across sides)
+    key_names: List[str]
+    compare_names: List[str]
+    key_kinds: Optional[List[str]] = None      # value_kind() per key column (text when None)
+    compare_kinds: Optional[List[str]] = None  # value_kind() per compared column (text when None)
+
+    def kinds(self) -> List[str]:
+        """Value kinds of key_columns + compare_columns."""
+        return (
+            (self.key_kinds or [TEXT_KIND] * len(self.key_columns))
+            + (self.compare_kinds or [TEXT_KIND] * len(self.compare_columns))
+        )
+
+
+@dataclass
+class ChecksumDiffResult:
+    """Outcome of a checksum diff of one rule."""
+    source_only_count: int = 0
+    target_only_count: int = 0
+    mismatched_count: int = 0
+    identical: bool = True
+    source_only_sample: List[Dict[str, Any]] = field(default_factory=list)
+    target_only_sample: List[Dict[str, Any]] = field(default_factory=list)
+    mismatched_sample: List[Dict[str, Any]] = field(default_factory=list)
+    levels: List[Dict[str, int]] = field(default_factory=list)  # Buckets compared/differing per level
+    summary_rows_transferred: int = 0
+    leaf_rows_transferred: int = 0
+    queries: List[str] = field(default_factory=list)
+    execution_time_ms: float = 0.0
+
+
+class ChecksumDiffer:
+    """Compares two tables by recursively drilling into differing checksum buckets."""
+
+    def __init__(
+        self,
+        initial_bucket_chars: Optional[int] = None,
+        max_bucket_chars: Optional[int] = None,
+        leaf_rows: Optional[int] = None
+    ):
+        """
+        Initialize the differ.
+
+        Args:
+            initial_bucket_chars: Hex chars of the key hash in the first level (16^n buckets)
+            max_bucket_chars: Deepest level; buckets still differing there are fetched
+            leaf_rows: Buckets with at most this many rows per side are fetched and compared row by row
+        """
+        self.initial_bucket_chars = max(1, initial_bucket_chars or RECON_CHECKSUM_INITIAL_BUCKET_CHARS)
+        self.max_bucket_chars = max(
+            self.initial_bucket_chars, min(32, max_bucket_chars or RECON_CHECKSUM_MAX_BUCKET_CHARS)
+        )
+        self.leaf_rows = max(1, leaf_rows or RECON_CHECKSUM_LEAF_ROWS)
+
+    # ------------------------------------------------------------------ SQL
+
+    @staticmethod
+    def _hashed_table(side: ChecksumSide, with_values: bool) -> Callable[[str], str]:
+        kinds = side.kinds()
+        key_hash = row_hash_expression(
+            [f"t0.{col}" for col in side.key_columns], side.db_type, kinds[:len(side.key_columns)]
+        )
+        row_hash = row_hash_expression(
+            [f"t0.{col}" for col in side.key_columns + side.compare_columns], side.db_type, kinds
+        )
+        values = ""
+        if with_values:
+            seen = []
+            for col in side.key_columns + side.compare_columns:
+                if col not in seen:
+                    seen.append(col)
+            values = ", ".join(f"t0.{col}" for col in seen) + ", "
+
+        def build(table_ref: str) -> str:
+            return (
+                f"(SELECT {values}{key_hash} AS {KEY_HASH_COLUMN}, {row_hash} AS {ROW_HASH_COLUMN} "
+                f"FROM {table_ref} t0) h"
+            )
+        return build
+
+    @staticmethod
+    def _prefix_filter(side: ChecksumSide, prefixes: Optional[List[str]]) -> str:
+        if not prefixes:
+            return ""
+        length = len(prefixes[0])
+        values = ", ".join(f"'{p}'" for p in prefixes)
+        return f"WHERE {substring_expression(f'h.{KEY_HASH_COLUMN}', length, side.db_type)} IN ({values})"
+
+    @staticmethod
+    def _execute(cursor: Any, side: ChecksumSide, build_sql: Callable[[str], str]) -> str:
+        """Execute against the first table reference that works (schema prefix fallback)."""
+        last_error = None
+        for table_ref in side.table_refs:
+            sql = build_sql(table_ref)
+            try:
+                cursor.execute(sql)
+                return sql
+            except Exception as e:
+                last_error = e
+                logger.debug(f"Checksum query on {table_ref} failed: {e}")
+        raise last_error
+
+    def _bucket_summaries(
+        self,
+        side: ChecksumSide,
+        chars: int,
+        parent_prefixes: Optional[List[str]],
+        result: ChecksumDiffResult
+    ) -> Dict[str, Tuple[int, int]]:
+        """Return {bucket prefix: (row count, checksum)} for one level."""
+        bucket = substring_expression(f"h.{KEY_HASH_COLUMN}", chars, side.db_type)
+        checksum = hex_prefix_to_int_expression(f"h.{ROW_HASH_COLUMN}", side.db_type)
+        hashed = self._hashed_table(side, with_values=False)
+
+        summaries: Dict[str, Tuple[int, int]] = {}
+        batches = [None] if parent_prefixes is None else [
+            parent_prefixes[i:i + PREFIX_BATCH_SIZE]
+            for i in range(0, len(parent_prefixes), PREFIX_BATCH_SIZE)
+        ]
+        cursor = side.conn.cursor()
+        try:
+            for batch in batches:
+                where = self._prefix_filter(side, batch)
+                sql = self._execute(cursor, side, lambda ref: (
+                    f"SELECT {bucket} AS bucket, COUNT(*) AS row_count, SUM({checksum}) AS checksum "
+                    f"FROM {hashed(ref)} {where} GROUP BY {bucket}"
+                ))
+                if len(result.queries) < 8:
+                    result.queries.append(sql)
+                for prefix, row_count, total in cursor.fetchall():
+                    summaries[str(prefix).lower()] = (int(row_count), int(total or 0))
+                    result.summary_rows_transferred += 1
+        finally:
+            cursor.close()
+        return summaries
+
+    def _leaf_rows(
+        self,
+        side: ChecksumSide,
+        prefixes: List[str],
+        result: ChecksumDiffResult
+    ) -> Dict[str, List[Tuple[str, Dict[str, Any], Dict[str, Any]]]]:
+        """Fetch rows of the given buckets: {key hash: [(row hash, key values, compare values)]}."""
+        hashed = self._hashed_table(side, with_values=True)
+        rows_by_key: Dict[str, List[Tuple[str, Dict[str, Any], Dict[str, Any]]]] = {}
+        cursor = side.conn.cursor()
+        try:
+            for start in range(0, len(prefixes), PREFIX_BATCH_SIZE):
+                batch = prefixes[start:start + PREFIX_BATCH_SIZE]
+                where = self._prefix_filter(side, batch)
+                sql = self._execute(cursor, side, lambda ref: f"SELECT h.* FROM {hashed(ref)} {where}")
+                if len(result.queries) < 8:
+                    result.queries.append(sql)
+                columns = [desc[0].lower() for desc in cursor.description]
+                for row in cursor.fetchall():
+                    values = dict(zip(columns, row))
+                    result.leaf_rows_transferred += 1
+                    key_values = {name: values.get(name.lower()) for name in side.key_names}
+                    compare_values = {name: values.get(name.lower()) for name in side.compare_names}
+                    rows_by_key.setdefault(str(values[KEY_HASH_COLUMN]).lower(), []).append(
+                        (str(values[ROW_HASH_COLUMN]).lower(), key_values, compare_values)
+                    )
+        finally:
+            cursor.close()
+        return rows_by_key
+
+    # ------------------------------------------------------------------ diff
+
+    def diff(self, source: ChecksumSide, target: ChecksumSide, sample_limit: int = 100) -> ChecksumDiffResult:
+        """
+        Diff two tables on (key columns, compare columns).
+
+        Args:
+            source: Source side
+            target: Target side (compare columns paired positionally with the source's)
+            sample_limit: Maximum keys kept per sample category
+
+        Returns:
+            ChecksumDiffResult with counts of source-only, target-only and mismatched keys
+        """
+        if len(source.compare_columns) != len(target.compare_columns):
+            raise ValueError("Source and target must compare the same number of columns")
+
+        start = time.time()
+        result = ChecksumDiffResult()
+        chars = self.initial_bucket_chars
+        parents: Optional[List[str]] = None
+        leaves: List[str] = []
+
+        while True:
+            source_buckets = self._bucket_summaries(source, chars, parents, result)
+            target_buckets = self._bucket_summaries(target, chars, parents, result)
+            differing = sorted(
+                prefix for prefix in set(source_buckets) | set(target_buckets)
+                if source_buckets.get(prefix) != target_buckets.get(prefix)
+            )
+            result.levels.append({
+                "bucket_chars": chars,
+                "buckets_compared": len(set(source_buckets) | set(target_buckets)),
+                "buckets_differing": len(differing)
+            })
+            if not differing:
+                break
+
+            deeper = []
+            for prefix in differing:
+                source_rows = source_buckets.get(prefix, (0, 0))[0]
+                target_rows = target_buckets.get(prefix, (0, 0))[0]
+                if max(source_rows, target_rows) <= self.leaf_rows or chars >= self.max_bucket_chars:
+                    leaves.append(prefix)
+                else:
+                    deeper.append(prefix)
+
+            if not deeper:
+                break
+            parents = deeper
+            chars += 1
+
+        if leaves:
+            self._compare_leaves(source, target, leaves, result, sample_limit)
+
+        result.identical = not (result.source_only_count or result.target_only_count or result.mismatched_count)
+        result.execution_time_ms = (time.time() - start) * 1000
+        logger.info(
+            f"Checksum diff: {result.mismatched_count} mismatched, {result.source_only_count} source-only, "
+            f"{result.target_only_count} target-only keys ({len(result.levels)} levels, "
+            f"{result.summary_rows_transferred} bucket rows + {result.leaf_rows_transferred} leaf rows transferred)"
+        )
+        return result
+
+    def _compare_leaves(
+        self,
+        source: ChecksumSide,
+        target: ChecksumSide,
+        leaves: List[str],
+        result: ChecksumDiffResult,
+        sample_limit: int
+    ):
+        # Leaves can come from different levels; fetch each prefix length separately
+        by_length: Dict[int, List[str]] = {}
+        for prefix in leaves:
+            by_length.setdefault(len(prefix), []).append(prefix)
+
+        source_rows: Dict[str, list] = {}
+        target_rows: Dict[str, list] = {}
+        for prefixes in by_length.values():
+            source_rows.update(self._leaf_rows(source, prefixes, result))
+            target_rows.update(self._leaf_rows(target, prefixes, result))
+
+        for key_hash in sorted(set(source_rows) | set(target_rows)):
+            src = source_rows.get(key_hash, [])
+            tgt = target_rows.get(key_hash, [])
+            if not tgt:
+                result.source_only_count += len(src)
+                for _, key_values, _ in src:
+                    if len(result.source_only_sample) < sample_limit:
+                        result.source_only_sample.append(key_values)
+                continue
+            if not src:
+                result.target_only_count += len(tgt)
+                for _, key_values, _ in tgt:
+                    if len(result.target_only_sample) < sample_limit:
+                        result.target_only_sample.append(key_values)
+                continue
+            if sorted(r[0] for r in src) == sorted(r[0] for r in tgt):
+                continue
+
+            result.mismatched_count += 1
+            if len(result.mismatched_sample) < sample_limit:
+                source_values = src[0][2]
+                target_values = tgt[0][2]
+                differences = [
+                    {
+                        "source_column": source_name,
+                        "target_column": target_name,
+                        "source_value": source_values.get(source_name),
+                        "target_value": target_values.get(target_name)
+                    }
+                    for source_name, target_name in zip(source.compare_names, target.compare_names)
+                    if source_values.get(source_name) != target_values.get(target_name)
+                ]
+                result.mismatched_sample.append({
+                    "key": src[0][1],
+                    "source_rows": len(src),
+                    "target_rows": len(tgt),
+                    "differences": differences
+                })
@@ -2,22 +2,276 @@
 Data Extractor for Landing Database.
 
 Extracts data from source/target databases and loads into landing database
-using bulk loading methods (LOAD DATA INFILE for MySQL).
+using bulk loading methods (LOAD DATA INFILE for MySQL). Every table referenced
+by a ruleset is extracted into its own staging table, source and target tables
+concurrently. Each table is streamed through a bounded fetch -> convert -> load
+pipeline, so memory stays flat regardless of the table size.
 """
 import logging
 import csv
+import json
+import math
 import os
 import tempfile
+import threading
 import time
-import jaydebeapi
-from typing import List, Dict, Any, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
 from kg_builder.models import DatabaseConnectionInfo, ReconciliationRule
 from kg_builder.services.landing_db_connector import LandingDBConnector
 from kg_builder.services.staging_manager import StagingManager
+from kg_builder.services.jdbc_connection_pool import get_connection_manager
+from kg_builder.services.batch_pipeline import BatchPipeline
+from kg_builder.services.checksum_diff import ROW_HASH_COLUMN, hex_prefix_to_int_expression, row_hash_expression
+from kg_builder.services.jdbc_fetch import ColumnBatch
+from kg_builder.services.row_stream import RowStream
+from kg_builder.services.rule_plan_compiler import quote_identifier
 from kg_builder import config
 
 logger = logging.getLogger(__name__)
 
+ValueConverter = Callable[[Any], Any]
+
+_TRUE_STRINGS = frozenset(('true', '1', 'yes', 't', 'y'))
+_FALSE_STRINGS = frozenset(('false', '0', 'no', 'f', 'n'))
+
+
+def _convert_boolean(value: Any) -> Any:
+    """BOOLEAN/BIT columns: booleans, integers and boolean strings -> 1/0."""
+    if isinstance(value, str):
+        lowered = value.lower()
+        if lowered in _TRUE_STRINGS:
+            return 1
+        if lowered in _FALSE_STRINGS:
+            return 0
+        return value
+    if isinstance(value, int):
+        return 1 if value else 0
+    return value
+
+
+def _convert_integer(value: Any) -> Any:
+    """Integer columns: booleans -> 1/0, numeric strings -> int, integers unchanged."""
+    if isinstance(value, bool):
+        return 1 if value else 0
+    if isinstance(value, str):
+        lowered = value.lower()
+        if lowered in ('true', 'false'):
+            return 1 if lowered == 'true' else 0
+        try:
+            return int(float(value))  # Handle "1.0" -> 1
+        except (ValueError, TypeError):
+            return None
+    return value
+
+
+def _convert_string(value: Any) -> Any:
+    """Character columns: bytes are decoded, everything else becomes str."""
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8', errors='ignore')
+    if isinstance(value, str):
+        return value
+    return str(value)
+
+
+def _column_converter(jdbc_type: Any) -> Optional[ValueConverter]:
+    """
+    Converter for one column, resolved from its cursor description type.
+
+    JayDeBeApi reports type groups, and the NUMBER group lists BOOLEAN and BIT
+    next to the integer types, so integer names are checked first; only pure
+    boolean types map values to 1/0. The JDBC gateway reports java.sql.Types
+    codes, which are resolved to their names the same way as _describe_columns.
+    """
+    if isinstance(jdbc_type, int) and not isinstance(jdbc_type, bool):
+        jdbc_type = _JDBC_TYPE_NAMES.get(jdbc_type, jdbc_type)
+    type_str = str(jdbc_type).upper()
+    if 'INT' in type_str or 'NUMBER' in type_str:
+        return _convert_integer
+    if 'BOOL' in type_str or 'BIT' in type_str:
+        return _convert_boolean
+    if 'CHAR' in type_str or 'TEXT' in type_str:
+        return _convert_string
+    return None
+
+
+def _as_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.strip().replace('T', ' '))
+        except ValueError:
+            return None
+    return None
+
+
+def _split_range(low: Any, high: Any, partitions: int) -> List[Any]:
+    """
+    Inner boundaries cutting [low, high] into `partitions` even ranges.
+
+    Numbers stay numbers (integers stay integers); dates and timestamps (objects
+    or ISO strings, as JDBC drivers return them) become datetimes. Returns an
+    empty list when the values cannot be split.
+    """
+    if low is None or high is None:
+        return []
+    if isinstance(low, (int, float, Decimal)) and isinstance(high, (int, float, Decimal)) \
+            and not isinstance(low, bool) and not isinstance(high, bool):
+        if high <= low:
+            return []
+        step = (high - low) / partitions
+        bounds = [low + step * i for i in range(1, partitions)]
+        if isinstance(low, int) and isinstance(high, int):
+            bounds = sorted({int(math.ceil(bound)) for bound in bounds})
+        return [bound for bound in bounds if low < bound <= high]
+
+    low_dt, high_dt = _as_datetime(low), _as_datetime(high)
+    if low_dt is None or high_dt is None or high_dt <= low_dt:
+        return []
+    step = (high_dt - low_dt) / partitions
+    bounds = sorted({(low_dt + step * i).replace(microsecond=0) for i in range(1, partitions)})
+    return [bound for bound in bounds if low_dt < bound <= high_dt]
+
+
+def _range_literal(db_config: DatabaseConnectionInfo, bound: Any) -> str:
+    if isinstance(bound, datetime):
+        text = bound.strftime('%Y-%m-%d %H:%M:%S')
+        return f"TIMESTAMP '{text}'" if db_config.db_type.lower() == 'oracle' else f"'{text}'"
+    return repr(bound) if isinstance(bound, float) else str(bound)
+
+
+def _range_predicates(column: str, bounds: List[str]) -> List[str]:
+    """WHERE predicates for the ranges between `bounds`; NULL keys go to the first one."""
+    predicates = [f"({column} < {bounds[0]} OR {column} IS NULL)"]
+    for lower, upper in zip(bounds, bounds[1:]):
+        predicates.append(f"{column} >= {lower} AND {column} < {upper}")
+    predicates.append(f"{column} >= {bounds[-1]}")
+    return predicates
+
+
+# java.sql.Types codes -> type names (exact types when the cursor exposes them)
+_JDBC_TYPE_NAMES = {
+    -7: 'BIT', -6: 'TINYINT', 5: 'SMALLINT', 4: 'INTEGER', -5: 'BIGINT', 16: 'BOOLEAN',
+    6: 'FLOAT', 7: 'REAL', 8: 'DOUBLE', 2: 'NUMERIC', 3: 'DECIMAL',
+    1: 'CHAR', 12: 'VARCHAR', -1: 'LONGVARCHAR', -15: 'NCHAR', -9: 'NVARCHAR', -16: 'LONGNVARCHAR',
+    2005: 'CLOB', 2011: 'NCLOB', 2009: 'SQLXML',
+    91: 'DATE', 92: 'TIME', 93: 'TIMESTAMP', 2013: 'TIME_WITH_TIMEZONE', 2014: 'TIMESTAMP_WITH_TIMEZONE',
+    -2: 'BINARY', -3: 'VARBINARY', -4: 'LONGVARBINARY', 2004: 'BLOB',
+}
+_STRING_TYPE_NAMES = frozenset((
+    'CHAR', 'VARCHAR', 'LONGVARCHAR', 'NCHAR', 'NVARCHAR', 'LONGNVARCHAR', 'CLOB', 'NCLOB', 'SQLXML',
+    'TIME_WITH_TIMEZONE', 'TIMESTAMP_WITH_TIMEZONE', 'STRING', 'TEXT'
+))
+_BINARY_TYPE_NAMES = frozenset(('BINARY', 'VARBINARY', 'LONGVARBINARY', 'BLOB'))
+# JayDeBeApi type groups -> the name used for type mapping (first member found wins)
+_TYPE_GROUP_NAMES = {
+    'BIGINT': 'NUMBER', 'DECIMAL': 'DECIMAL', 'DOUBLE': 'DOUBLE', 'CLOB': 'TEXT', 'VARBINARY': 'BLOB',
+    'VARCHAR': 'VARCHAR', 'DATE': 'DATE', 'TIME': 'TIME', 'TIMESTAMP': 'TIMESTAMP',
+}
+_LONG_TYPE_NAMES = frozenset(('LONGVARCHAR', 'LONGNVARCHAR', 'CLOB', 'NCLOB', 'SQLXML', 'TEXT', 'LONGVARBINARY', 'BLOB'))
+
+
+@dataclass
+class SourceColumn:
+    """A result column with the type details the driver reports."""
+    name: str
+    type_name: str                         # Exact JDBC type name, or the DB-API type group
+    precision: Optional[int] = None
+    scale: Optional[int] = None
+    display_size: Optional[int] = None
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    try:
+        return None if value is None else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _describe_columns(cursor: Any) -> List[SourceColumn]:
+    """
+    Source columns of an executed cursor.
+
+    JayDeBeApi reports DB-API type groups (e.g. NUMBER for BOOLEAN..BIGINT) in
+    cursor.description, so exact java.sql.Types codes are read from the result
+    set metadata when available.
+    """
+    meta = getattr(cursor, "_meta", None)
+    columns = []
+    for index, desc in enumerate(cursor.description or []):
+        type_code = desc[1]
+        if meta is not None:
+            try:
+                type_code = int(meta.getColumnType(index + 1))
+            except Exception:
+                pass
+        if isinstance(type_code, int) and not isinstance(type_code, bool):
+            type_name = _JDBC_TYPE_NAMES.get(type_code, str(type_code))
+        else:
+            type_name = _type_group_name(type_code)
+        padded = list(desc) + [None] * (7 - len(desc))
+        columns.append(SourceColumn(
+            name=desc[0],
+            type_name=type_name,
+            precision=_optional_int(padded[4]),
+            scale=_optional_int(padded[5]),
+            display_size=_optional_int(padded[2])
+        ))
+    return columns
+
+
+def _type_group_name(type_code: Any) -> str:
+    """Representative type name for a DB-API type object (or a type name string)."""
+    values = getattr(type_code, 'values', None)
+    if values:
+        for member, name in _TYPE_GROUP_NAMES.items():
+            if member in values:
+                return name
+        return str(values[0]).upper()
+    return str(type_code).upper()
+
+@dataclass
+class TableExtraction:
+    """One table extracted to its own staging table."""
+    source_or_target: str
+    schema: str
+    table: str
+    staging_table: str
+    row_count: int
+    extract_time_ms: float                 # Fetching from the source/target database
+    load_time_ms: float                    # Streamed fetch + convert + load (overlapping stages)
+    extraction_time_ms: float              # Total for the table
+    partitions: List[Dict[str, Any]] = field(default_factory=list)  # Key ranges read in parallel
+    reused: bool = False                   # Unchanged staging snapshot reused, nothing extracted
+    key_only: bool = False                 # Join columns + row hash only (see fetch_rows_by_keys)
+
+    @property
+    def table_key(self) -> str:
+        return f"{self.schema}.{self.table}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class PartitionExtraction:
+    """One key range of a partitioned table read."""
+    partition: int
+    predicate: str
+    row_count: int
+    fetch_ms: float
+    elapsed_ms: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
 
 class DataExtractor:
     """Extracts data from source/target databases to landing database."""
@@ -38,197 +292,325 @@ class DataExtractor:
         self.staging_manager = staging_manager
         logger.info("Initialized DataExtractor")
 
-    def extract_to_landing(
+    def _snapshots_enabled(self, reuse_snapshots: Optional[bool] = None) -> bool:
+        """Snapshot reuse (default: LANDING_SNAPSHOT_REUSE) needs a landing database that outlives the execution."""
+        if reuse_snapshots is None:
+            reuse_snapshots = config.LANDING_SNAPSHOT_REUSE
+        return reuse_snapshots and not self.landing_connector.per_execution_database
+
+    def extract_ruleset_to_landing(
         self,
         source_db_config: DatabaseConnectionInfo,
+        target_db_config: DatabaseConnectionInfo,
         rules: List[ReconciliationRule],
         execution_id: str,
         ruleset_id: str,
-        source_or_target: str,  # 'source' or 'target'
-        limit: Optional[int] = None
-    ) -> Tuple[str, int, float]:
+        limit: Optional[int] = None,
+        max_workers: int = config.LANDING_EXTRACT_MAX_WORKERS,
+        max_connections_per_db: int = config.LANDING_EXTRACT_MAX_CONNECTIONS_PER_DB,
+        key_only: bool = False,
+        reuse_snapshots: Optional[bool] = None
+    ) -> List[TableExtraction]:
         """
-        Extract data from source/target database to landing staging table.
+        Extract every table referenced by the rules, on both sides, concurrently.
+
+        Each table gets its own staging table. Tables are extracted on a bounded
+        worker pool; a per-database semaphore caps how many connections (table
+        extractions plus their extra partition readers) read from the same
+        source/target database at once.
 
         Args:
             source_db_config: Source database configuration
+            target_db_config: Target database configuration
             rules: List of reconciliation rules
             execution_id: Execution ID
             ruleset_id: Ruleset ID
+            limit: Limit number of rows per table (None for all)
+            max_workers: Tables extracted at the same time
+            max_connections_per_db: Concurrent source connections per database
+            key_only: Extract only the join columns plus a server-side hash of the
+                other columns (full rows are fetched later with fetch_rows_by_keys)
+            reuse_snapshots: Reuse and register staging snapshots (default: LANDING_SNAPSHOT_REUSE)
+
+        Returns:
+            One TableExtraction per table (source tables first, in rule order)
+
+        Raises:
+            RuntimeError: If any table failed to extract (after all others finished)
+        """
+        tasks = []
+        for side, db_config in (('source', source_db_config), ('target', target_db_config)):
+            tables = self._get_tables_from_rules(rules, side, key_only=key_only)
+            if not tables:
+                raise ValueError(f"No {side} tables to extract from rules")
+            for index, table_info in enumerate(tables):
+                tasks.append((side, db_config, table_info, index))
+
+        slots = {
+            key: threading.BoundedSemaphore(max(1, max_connections_per_db))
+            for key in {db_config.connection_key() for _, db_config, _, _ in tasks}
+        }
+        workers = max(1, min(max_workers, len(tasks)))
+        logger.info(
+            f"Extracting {len(tasks)} tables on {workers} workers "
+            f"(max {max_connections_per_db} source connections per database)"
+        )
+
+        def run(side: str, db_config: DatabaseConnectionInfo, table_info: Dict[str, Any], index: int) -> TableExtraction:
+            slot = slots[db_config.connection_key()]
+            with slot:
+                try:
+                    return self.extract_table_to_landing(
+                        db_config=db_config,
+                        table_info=table_info,
+                        execution_id=execution_id,
+                        ruleset_id=ruleset_id,
+                        source_or_target=side,
+                        limit=limit,
+                        table_index=index,
+                        reuse_snapshots=reuse_snapshots,
+                        slot=slot
+                    )
+                finally:
+                    # Landing connections are per thread; don't leave one open per worker
+                    self.landing_connector.close()
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="landing-extract") as pool:
+            futures = [pool.submit(run, *task) for task in tasks]
+            results, failures = [], []
+            for (side, _, table_info, _), future in zip(tasks, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    failures.append(f"{side} {table_info['schema']}.{table_info['table']}: {e}")
+
+        if failures:
+            if self._snapshots_enabled(reuse_snapshots):
+                for extraction in results:
+                    self.staging_manager.release_snapshot(extraction.staging_table)
+            raise RuntimeError(f"Extraction failed for {len(failures)} table(s): {'; '.join(failures)}")
+        return results
+
+    def extract_table_to_landing(
+        self,
+        db_config: DatabaseConnectionInfo,
+        table_info: Dict[str, Any],
+        execution_id: str,
+        ruleset_id: str,
+        source_or_target: str,  # 'source' or 'target'
+        limit: Optional[int] = None,
+        table_index: int = 0,
+        reuse_snapshots: Optional[bool] = None,
+        slot: Optional[threading.BoundedSemaphore] = None
+    ) -> TableExtraction:
+        """
+        Extract one source/target table to its own landing staging table.
+
+        Args:
+            db_config: Configuration of the database holding the table
+            table_info: Table entry of _get_tables_from_rules()
+            execution_id: Execution ID
+            ruleset_id: Ruleset ID
             source_or_target: 'source' or 'target'
             limit: Limit number of rows (None for all)
+            table_index: Position of the table on its side (keeps staging names unique)
+            reuse_snapshots: Reuse and register staging snapshots (default: LANDING_SNAPSHOT_REUSE)
+            slot: Per-database semaphore the caller holds one slot of; extra
+                partition connections take further slots from it (None: uncapped)
 
         Returns:
-            Tuple of (staging_table_name, row_count, extraction_time_ms)
+            TableExtraction with the staging table, row count and timing
         """
         start_time = time.time()
+        schema = table_info['schema']
+        table = table_info['table']
+        source_conn = None
+        cursor = None
 
         try:
             # Connect to source database
-            source_conn = self._connect_to_database(source_db_config)
-
-            # Determine which tables and columns to extract
-            tables_to_extract = self._get_tables_from_rules(rules, source_or_target)
-
-            # Extract each table (for now, we'll handle one table; can extend for multiple)
-            # In a multi-table scenario, you'd create one staging table per source table
-            # For simplicity, we'll extract the first rule's table
-            if not tables_to_extract:
-                raise ValueError("No tables to extract from rules")
-
-            table_info = tables_to_extract[0]
-            schema = table_info['schema']
-            table = table_info['table']
-            columns = table_info['columns']
+            source_conn = self._connect_to_database(db_config)
 
             logger.info(f"Extracting {source_or_target} data from {schema}.{table}")
 
+            # Key-only: the other columns are reduced to one hash computed by the source database
+            snapshot_columns = table_info['columns']
+            if table_info.get('key_only'):
+                join_columns = {col.lower() for col in table_info['columns']}
+                table_info = dict(table_info, row_hash_columns=[
+                    col for col in self._probe_columns(source_conn, schema, table)
+                    if col.lower() not in join_columns
+                ])
+                snapshot_columns = list(table_info['columns']) + [ROW_HASH_COLUMN]
+
+            # Reuse a staging snapshot of the same extraction if the source is unchanged
+            snapshot_key = fingerprint = None
+            filter_clause = f"LIMIT {limit}" if limit else ""
+            if self._snapshots_enabled(reuse_snapshots):
+                snapshot_key = self.staging_manager.snapshot_key(
+                    db_config, schema, table, snapshot_columns, filter_clause
+                )
+                fingerprint = self._source_fingerprint(source_conn, db_config, table_info)
+                snapshot = self.staging_manager.acquire_snapshot(snapshot_key, fingerprint) if fingerprint else None
+                if snapshot:
+                    join_columns = table_info.get('join_columns', [])
+                    if join_columns:
+                        self.staging_manager.create_indexes(snapshot['table_name'], join_columns)
+                    return TableExtraction(
+                        source_or_target=source_or_target,
+                        schema=schema,
+                        table=table,
+                        staging_table=snapshot['table_name'],
+                        row_count=snapshot['row_count'],
+                        extract_time_ms=0.0,
+                        load_time_ms=0.0,
+                        extraction_time_ms=(time.time() - start_time) * 1000,
+                        reused=True,
+                        key_only=bool(table_info.get('key_only'))
+                    )
+
             # Generate staging table name
             staging_table_name = self.staging_manager.generate_staging_table_name(
                 execution_id=execution_id,
-                source_or_target=source_or_target
+                source_or_target=source_or_target,
+                table_index=table_index
             )
 
-            # Extract data from source
-            data, column_names, column_types = self._extract_data_from_source(
+            # Large tables are read as concurrent key ranges
+            partitions = self._plan_partitions(source_conn, db_config, table_info, limit)
+
+            # Widths of unbounded join columns, sampled before the extraction query holds the connection
+            join_columns = table_info.get('join_columns', [])
+            sampled_lengths = self._sample_key_lengths(source_conn, db_config, schema, table, join_columns)
+
+            # Run the extraction query (rows are fetched by the pipeline below)
+            cursor, column_names, column_types = self._open_extraction_cursor(
                 source_conn=source_conn,
-                source_db_config=source_db_config,
+                source_db_config=db_config,
                 schema=schema,
                 table=table,
-                columns=columns,
-                limit=limit
+                columns=table_info['columns'],
+                limit=limit,
+                where=partitions[0] if partitions else None,
+                row_hash_columns=table_info.get('row_hash_columns')
             )
 
-            logger.info(f"Extracted {len(data)} rows from {schema}.{table}")
-
-            # Create staging table in landing DB
-            column_defs = self._build_column_definitions(column_names, column_types)
+            # Create staging table in landing DB (tight types for join columns)
+            source_columns = _describe_columns(cursor)
+            column_defs = self._build_column_definitions(source_columns, join_columns, sampled_lengths)
             self.staging_manager.create_staging_table(
                 table_name=staging_table_name,
                 columns=column_defs,
                 execution_id=execution_id,
                 ruleset_id=ruleset_id,
                 source_or_target=source_or_target,
-                source_db_type=source_db_config.db_type,
-                source_db_host=source_db_config.host
+                source_db_type=db_config.db_type,
+                source_db_host=db_config.host
             )
 
-            # Load data into landing DB with type conversion
-            row_count = self._bulk_load_to_landing(
-                staging_table_name=staging_table_name,
-                column_names=column_names,
-                data=data,
-                column_types=column_types
-            )
+            # Stream fetch -> type conversion -> load; only a few batches are in memory
+            converters = self._column_converters(column_types)
+            load_start = time.time()
+            name = f"landing-{source_or_target}{table_index}"
+            if partitions:
+                partition_results = self._load_partitions(
+                    source_conn=source_conn,
+                    cursor=cursor,
+                    db_config=db_config,
+                    table_info=table_info,
+                    partitions=partitions,
+                    staging_table_name=staging_table_name,
+                    column_names=column_names,
+                    converters=converters,
+                    name=name,
+                    slot=slot
+                )
+                row_count = sum(result.row_count for result in partition_results)
+                fetch_ms = sum(result.fetch_ms for result in partition_results)
+            else:
+                partition_results = []
+                row_count, fetch_ms = self._stream_to_staging(
+                    cursor, staging_table_name, column_names, converters, name
+                )
+            load_time_ms = (time.time() - load_start) * 1000
 
-            # Create indexes on join columns
-            join_columns = table_info.get('join_columns', [])
+            # Create indexes on join columns after the bulk load (one pass over the loaded table)
             if join_columns:
-                self.staging_manager.create_indexes(staging_table_name, join_columns)
+                self.staging_manager.create_indexes(
+                    staging_table_name, join_columns,
+                    column_types={column['name']: column['type'] for column in column_defs}
+                )
 
             # Update row count in metadata
             self.staging_manager.update_row_count(staging_table_name)
 
-            # Close source connection
-            source_conn.close()
+            if fingerprint:
+                self.staging_manager.register_snapshot(
+                    table_name=staging_table_name,
+                    snapshot_key=snapshot_key,
+                    fingerprint=fingerprint,
+                    db_config=db_config,
+                    source_table=f"{schema}.{table}",
+                    columns=snapshot_columns,
+                    filter_clause=filter_clause,
+                    row_count=row_count
+                )
 
             extraction_time_ms = (time.time() - start_time) * 1000
             logger.info(
-                f"Extraction complete: {row_count} rows in {extraction_time_ms:.2f}ms "
-                f"({row_count/(extraction_time_ms/1000):.0f} rows/sec)"
+                f"Extraction of {schema}.{table} complete: {row_count} rows in {extraction_time_ms:.2f}ms "
+                f"({row_count/max(extraction_time_ms/1000, 1e-6):.0f} rows/sec)"
             )
 
-            return staging_table_name, row_count, extraction_time_ms
+            return TableExtraction(
+                source_or_target=source_or_target,
+                schema=schema,
+                table=table,
+                staging_table=staging_table_name,
+                row_count=row_count,
+                extract_time_ms=fetch_ms,
+                load_time_ms=load_time_ms,
+                extraction_time_ms=extraction_time_ms,
+                partitions=[result.to_dict() for result in partition_results],
+                key_only=bool(table_info.get('key_only'))
+            )
 
         except Exception as e:
-            logger.error(f"Extraction failed: {e}", exc_info=True)
+            logger.error(f"Extraction of {schema}.{table} failed: {e}", exc_info=True)
             raise
 
+        finally:
+            # Close the extraction cursor and return the source connection to the pool
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception as e:
+                    logger.debug(f"Error closing extraction cursor: {e}")
+            if source_conn is not None:
+                source_conn.close()
+
     def _connect_to_database(self, db_config: DatabaseConnectionInfo) -> Any:
-        """Connect to source/target database using JDBC."""
+        """Borrow a source/target connection from the shared JDBC connection pool."""
         try:
-            jdbc_url = self._build_jdbc_url(db_config)
-            driver_class = self._get_driver_class(db_config.db_type)
-            driver_jar = self._get_driver_jar(db_config.db_type)
-
-            logger.debug(f"Connecting to {jdbc_url}")
-
-            conn = jaydebeapi.connect(
-                driver_class,
-                jdbc_url,
-                [db_config.username, db_config.password],
-                driver_jar
-            )
-
-            logger.debug("Database connection established")
-            return conn
-
+            return get_connection_manager().connect(db_config)
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
 
-    def _build_jdbc_url(self, db_config: DatabaseConnectionInfo) -> str:
-        """Build JDBC URL based on database type."""
-        db_type = db_config.db_type.lower()
-
-        if db_type == "oracle":
-            if db_config.service_name:
-                return f"jdbc:oracle:thin:@{db_config.host}:{db_config.port}/{db_config.service_name}"
-            else:
-                return f"jdbc:oracle:thin:@{db_config.host}:{db_config.port}:{db_config.database}"
-        elif db_type == "sqlserver":
-            return f"jdbc:sqlserver://{db_config.host}:{db_config.port};databaseName={db_config.database};encrypt=true;trustServerCertificate=true"
-        elif db_type == "mysql":
-            return f"jdbc:mysql://{db_config.host}:{db_config.port}/{db_config.database}"
-        elif db_type == "postgresql":
-            return f"jdbc:postgresql://{db_config.host}:{db_config.port}/{db_config.database}"
-        else:
-            raise ValueError(f"Unsupported database type: {db_type}")
-
-    def _get_driver_class(self, db_type: str) -> str:
-        """Get JDBC driver class for database type."""
-        db_type = db_type.lower()
-        drivers = {
-            "oracle": "oracle.jdbc.OracleDriver",
-            "sqlserver": "com.microsoft.sqlserver.jdbc.SQLServerDriver",
-            "mysql": "com.mysql.cj.jdbc.Driver",
-            "postgresql": "org.postgresql.Driver"
-        }
-        return drivers.get(db_type, "")
-
-    def _get_driver_jar(self, db_type: str) -> str:
-        """Get JDBC driver JAR path for database type."""
-        jdbc_dir = config.JDBC_DRIVERS_PATH
-        db_type = db_type.lower()
-
-        jar_patterns = {
-            "oracle": "ojdbc*.jar",
-            "sqlserver": "mssql-jdbc*.jar",
-            "mysql": "mysql-connector-j*.jar",
-            "postgresql": "postgresql-*.jar"
-        }
-
-        import glob
-        pattern = os.path.join(jdbc_dir, jar_patterns.get(db_type, "*.jar"))
-        jars = glob.glob(pattern)
-
-        if not jars:
-            logger.warning(f"No JDBC driver found for {db_type} at {pattern}")
-            return ""
-
-        return jars[0]
-
     def _get_tables_from_rules(
         self,
         rules: List[ReconciliationRule],
-        source_or_target: str
+        source_or_target: str,
+        key_only: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Extract unique tables and columns from rules.
 
         NOTE: We extract ALL columns from each table (not just rule columns)
         to ensure all columns are available for JOIN operations, even if some
-        rules get filtered out during validation.
+        rules get filtered out during validation. In key-only mode the join
+        columns of all rules on the table are extracted, plus a row hash of the
+        other columns.
         """
         tables_map = {}
 
@@ -261,40 +643,53 @@ class DataExtractor:
         # Convert join_columns sets to lists
         for table_info in tables_map.values():
             table_info['join_columns'] = list(table_info['join_columns'])
+            if key_only:
+                table_info['columns'] = sorted(table_info['join_columns'])
+                table_info['key_only'] = True
 
         return list(tables_map.values())
 
-    def _extract_data_from_source(
+    def _open_extraction_cursor(
         self,
         source_conn: Any,
         source_db_config: DatabaseConnectionInfo,
         schema: str,
         table: str,
         columns,  # Can be '*' (string) or List[str]
-        limit: Optional[int]
-    ) -> Tuple[List[tuple], List[str], List[str]]:
-        """Extract data from source database."""
+        limit: Optional[int],
+        where: Optional[str] = None,
+        row_hash_columns: Optional[List[str]] = None
+    ) -> Tuple[Any, List[str], List[Any]]:
+        """Execute the extraction query; returns (cursor, column names, column types)."""
         # If no specific columns, select all
         if not columns or columns == '*' or columns == ['*']:
             columns_clause = "*"
             logger.info(f"Extracting ALL columns from {schema}.{table}")
         else:
-            columns_clause = ", ".join([f'"{col}"' if source_db_config.db_type == 'oracle' else f"`{col}`" for col in columns])
+            columns_clause = ", ".join([quote_identifier(col, source_db_config.db_type) for col in columns])
             logger.info(f"Extracting {len(columns)} columns from {schema}.{table}")
 
+        if row_hash_columns:
+            row_hash = row_hash_expression(
+                [quote_identifier(col, source_db_config.db_type) for col in row_hash_columns], source_db_config.db_type
+            )
+            columns_clause += f", {row_hash} AS {ROW_HASH_COLUMN}"
+            logger.info(f"Hashing {len(row_hash_columns)} other columns of {schema}.{table} into {ROW_HASH_COLUMN}")
+
         # Build query
+        conditions = [where] if where else []
+        top_clause = ""
         limit_clause = ""
         if limit:
             if source_db_config.db_type.lower() == "oracle":
-                limit_clause = f"WHERE ROWNUM <= {limit}"
+                conditions.append(f"ROWNUM <= {limit}")
             elif source_db_config.db_type.lower() == "sqlserver":
-                limit_clause = f"TOP {limit}"
-                query = f"SELECT {limit_clause} {columns_clause} FROM {schema}.{table}"
+                top_clause = f"TOP {limit} "
             else:  # MySQL, PostgreSQL
-                limit_clause = f"LIMIT {limit}"
+                limit_clause = f" LIMIT {limit}"
 
-        if source_db_config.db_type.lower() != "sqlserver":
-            query = f"SELECT {columns_clause} FROM {schema}.{table} {limit_clause}"
+        where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"SELECT {top_clause}{columns_clause} FROM {schema}.{table}{where_clause}{limit_clause}"
 
         logger.debug(f"Extraction query: {query}")
 
@@ -305,72 +700,520 @@ class DataExtractor:
         column_names = [desc[0] for desc in cursor.description]
         column_types = [desc[1] for desc in cursor.description]
 
-        # Fetch all data
-        data = cursor.fetchall()
-        cursor.close()
+        return cursor, column_names, column_types
 
-        return data, column_names, column_types
+    def _stream_to_staging(
+        self,
+        cursor: Any,
+        staging_table_name: str,
+        column_names: List[str],
+        converters: Tuple[Optional[ValueConverter], ...],
+        name: str
+    ) -> Tuple[int, float]:
+        """Stream one executed cursor into a staging table; returns (rows, fetch ms)."""
+        pipeline = BatchPipeline(
+            RowStream(cursor, batch_size=config.LANDING_BATCH_SIZE, close_cursor=False).batches(),
+            transform=lambda batch: self._convert_columns(batch, converters),
+            name=name
+        )
+        row_count = self._bulk_load_to_landing(
+            staging_table_name=staging_table_name,
+            column_names=column_names,
+            batches=pipeline
+        )
+        logger.info(f"Streamed {pipeline.rows} rows into {staging_table_name} ({pipeline.stats()})")
+        return row_count, pipeline.fetch_ms
+
+    def _probe_columns(self, source_conn: Any, schema: str, table: str) -> List[str]:
+        """Column names of a source table (from an empty result)."""
+        cursor = source_conn.cursor()
+        try:
+            cursor.execute(f"SELECT * FROM {schema}.{table} WHERE 1 = 0")
+            return [desc[0] for desc in cursor.description]
+        finally:
+            cursor.close()
 
-    def _build_column_definitions(
+    def fetch_rows_by_keys(
+        self,
+        db_config: DatabaseConnectionInfo,
+        schema: str,
+        table: str,
+        key_columns: List[str],
+        keys: List[tuple],
+        max_rows: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch full source rows for the given keys (drill-down of key-only staging tables).
+
+        Args:
+            db_config: Database holding the table
+            schema: Schema name
+            table: Table name
+            key_columns: Key columns, in the order of the key tuples
+            keys: Key values
+            max_rows: Stop after this many rows (None for all)
+
+        Returns:
+            Rows as dictionaries keyed by column name
+        """
+        keys = [tuple(key) for key in keys if all(value is not None for value in key)]
+        if not keys or not key_columns:
+            return []
+
+        columns = [quote_identifier(col, db_config.db_type) for col in key_columns]
+        if len(columns) == 1:
+            key_condition = f"{columns[0]} = ?"
+        else:
+            key_condition = "(" + " AND ".join(f"{col} = ?" for col in columns) + ")"
+
+        rows: List[Dict[str, Any]] = []
+        conn = self._connect_to_database(db_config)
+        try:
+            for start in range(0, len(keys), config.LANDING_DRILLDOWN_KEYS_PER_QUERY):
+                chunk = keys[start:start + config.LANDING_DRILLDOWN_KEYS_PER_QUERY]
+                query = f"SELECT * FROM {schema}.{table} WHERE " + " OR ".join([key_condition] * len(chunk))
+                cursor = conn.cursor()
+                cursor.execute(query, [value for key in chunk for value in key])
+                remaining = None if max_rows is None else max_rows - len(rows)
+                rows.extend(RowStream(cursor, max_rows=remaining).read_records())
+                if max_rows is not None and len(rows) >= max_rows:
+                    break
+        finally:
+            conn.close()
+
+        logger.info(f"Fetched {len(rows)} full rows of {schema}.{table} for {len(keys)} keys")
+        return rows
+
+    def _source_fingerprint(
         self,
+        source_conn: Any,
+        db_config: DatabaseConnectionInfo,
+        table_info: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Fingerprint of a source table's current contents, for snapshot reuse.
+
+        Combines the column list, the row count, MAX() of a change-tracking column
+        (LANDING_SNAPSHOT_UPDATED_AT_COLUMNS) and a sum of row hashes computed in
+        the source database. The checksum is always included: updates that do not
+        touch the change-tracking column must still invalidate the snapshot.
+
+        Returns:
+            Fingerprint string, or None if it could not be computed (no reuse)
+        """
+        schema, table = table_info['schema'], table_info['table']
+        try:
+            column_names = self._probe_columns(source_conn, schema, table)
+            cursor = source_conn.cursor()
+            try:
+                tracking = {name.strip().lower() for name in config.LANDING_SNAPSHOT_UPDATED_AT_COLUMNS.split(',')}
+                updated_at = next((name for name in column_names if name.lower() in tracking), None)
+
+                aggregates = ["COUNT(*)"]
+                if updated_at:
+                    aggregates.append(f"MAX({quote_identifier(updated_at, db_config.db_type)})")
+                row_hash = row_hash_expression(
+                    [quote_identifier(name, db_config.db_type) for name in column_names], db_config.db_type
+                )
+                aggregates.append(f"SUM({hex_prefix_to_int_expression(row_hash, db_config.db_type)})")
+
+                cursor.execute(f"SELECT {', '.join(aggregates)} FROM {schema}.{table}")
+                values = [str(value) for value in cursor.fetchone()]
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.info(f"No fingerprint for {schema}.{table}, extracting it again: {e}")
+            return None
+
+        return json.dumps({'columns': column_names, 'updated_at_column': updated_at, 'aggregates': values})
+
+    def _plan_partitions(
+        self,
+        source_conn: Any,
+        db_config: DatabaseConnectionInfo,
+        table_info: Dict[str, Any],
+        limit: Optional[int]
+    ) -> List[str]:
+        """
+        Split a large table into key ranges that can be read concurrently.
+
+        The partition column is the first primary key column (from JDBC metadata)
+        or else a join column; it must hold numbers or dates. Ranges are cut evenly
+        between MIN and MAX. The first range also takes NULL keys and the outer
+        ranges are open-ended, so together they cover every row.
+
+        Returns:
+            WHERE predicates, one per partition (empty: read the table in one query)
+        """
+        partitions = config.LANDING_PARTITIONS
+        if limit or partitions < 2 or config.LANDING_PARTITION_MIN_ROWS <= 0:
+            return []
+
+        schema, table = table_info['schema'], table_info['table']
+        try:
+            cursor = source_conn.cursor()
+            try:
+                cursor.execute(f"SELECT COUNT(*) FROM {schema}.{table}")
+                row_count = cursor.fetchone()[0]
+                if row_count < config.LANDING_PARTITION_MIN_ROWS:
+                    return []
+
+                for column in self._partition_candidates(source_conn, db_config, table_info):
+                    quoted = quote_identifier(column, db_config.db_type)
+                    cursor.execute(f"SELECT MIN({quoted}), MAX({quoted}) FROM {schema}.{table}")
+                    low, high = cursor.fetchone()
+                    bounds = _split_range(low, high, partitions)
+                    if bounds:
+                        literals = [_range_literal(db_config, bound) for bound in bounds]
+                        predicates = _range_predicates(quoted, literals)
+                        logger.info(
+                            f"Reading {schema}.{table} ({row_count} rows) in {len(predicates)} "
+                            f"partitions on {column}"
+                        )
+                        return predicates
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.warning(f"Could not partition {schema}.{table}, reading it in one query: {e}")
+            return []
+
+        logger.info(f"No numeric or date key to partition {schema}.{table}; reading it in one query")
+        return []
+
+    def _partition_candidates(
+        self,
+        source_conn: Any,
+        db_config: DatabaseConnectionInfo,
+        table_info: Dict[str, Any]
+    ) -> List[str]:
+        """Primary key column first (when the driver exposes it), then the join columns."""
+        candidates = []
+        jconn = getattr(source_conn, 'jconn', None)
+        if jconn is not None:
+            schema, table = table_info['schema'], table_info['table']
+            # MySQL reports databases as catalogs, the others as schemas
+            lookups = [(schema, None), (None, schema)] if db_config.db_type.lower() == 'mysql' else [(None, schema)]
+            try:
+                metadata = jconn.getMetaData()
+                for catalog, schema_pattern in lookups:
+                    result_set = metadata.getPrimaryKeys(catalog, schema_pattern, table)
+                    try:
+                        keys = []
+                        while result_set.next():
+                            keys.append((int(result_set.getShort("KEY_SEQ")), str(result_set.getString("COLUMN_NAME"))))
+                    finally:
+                        result_set.close()
+                    if keys:
+                        candidates.append(min(keys)[1])
+                        break
+            except Exception as e:
+                logger.debug(f"Primary key lookup failed for {schema}.{table}: {e}")
+
+        for column in table_info.get('join_columns', []):
+            if column not in candidates:
+                candidates.append(column)
+        return candidates
+
+    def _load_partitions(
+        self,
+        source_conn: Any,
+        cursor: Any,
+        db_config: DatabaseConnectionInfo,
+        table_info: Dict[str, Any],
+        partitions: List[str],
+        staging_table_name: str,
         column_names: List[str],
-        column_types: List[Any]
+        converters: Tuple[Optional[ValueConverter], ...],
+        name: str,
+        slot: Optional[threading.BoundedSemaphore] = None
+    ) -> List[PartitionExtraction]:
+        """
+        Read every partition concurrently into the same staging table.
+
+        The first partition uses the already-executed cursor, then the table's
+        connection reads whatever partitions are left. Extra pooled connections
+        are opened only while a slot of the per-database semaphore (slot) is
+        free, so partitioning never exceeds LANDING_EXTRACT_MAX_CONNECTIONS_PER_DB;
+        without a slot every partition gets its own connection. Each partition
+        logs its progress when done.
+
+        Raises:
+            RuntimeError: If any partition failed (after all others finished)
+        """
+        schema, table = table_info['schema'], table_info['table']
+        pending = deque(enumerate(partitions))
+        done: List[PartitionExtraction] = []
+        failures: Dict[int, str] = {}
+        done_lock = threading.Lock()
+
+        def load(index: int, predicate: str, conn: Any, part_cursor: Any = None) -> None:
+            started = time.time()
+            own_cursor = part_cursor is None
+            try:
+                if own_cursor:
+                    part_cursor, _, _ = self._open_extraction_cursor(
+                        source_conn=conn,
+                        source_db_config=db_config,
+                        schema=schema,
+                        table=table,
+                        columns=table_info['columns'],
+                        limit=None,
+                        where=predicate,
+                        row_hash_columns=table_info.get('row_hash_columns')
+                    )
+                row_count, fetch_ms = self._stream_to_staging(
+                    part_cursor, staging_table_name, column_names, converters, f"{name}p{index}"
+                )
+                result = PartitionExtraction(
+                    partition=index,
+                    predicate=predicate,
+                    row_count=row_count,
+                    fetch_ms=fetch_ms,
+                    elapsed_ms=(time.time() - started) * 1000
+                )
+                with done_lock:
+                    done.append(result)
+                    loaded = sum(item.row_count for item in done)
+                    logger.info(
+                        f"{schema}.{table} partition {index + 1}/{len(partitions)}: {row_count} rows "
+                        f"in {result.elapsed_ms:.0f}ms ({len(done)}/{len(partitions)} partitions, "
+                        f"{loaded} rows loaded)"
+                    )
+            except Exception as e:
+                with done_lock:
+                    failures[index] = f"partition {index + 1} ({predicate}): {e}"
+            finally:
+                if own_cursor and part_cursor is not None:
+                    try:
+                        part_cursor.close()
+                    except Exception as e:
+                        logger.debug(f"Error closing partition cursor: {e}")
+
+        def drain(conn: Any) -> None:
+            while True:
+                try:
+                    index, predicate = pending.popleft()
+                except IndexError:
+                    return
+                load(index, predicate, conn)
+
+        def read_on_table_connection() -> None:
+            try:
+                index, predicate = pending.popleft()
+                load(index, predicate, source_conn, cursor)
+                drain(source_conn)
+            finally:
+                # Landing connections are per thread; don't leave one open per worker
+                self.landing_connector.close()
+
+        def read_on_extra_connection() -> None:
+            # Poll for a slot: the table connection keeps reading meanwhile, so waiting never deadlocks
+            while slot is not None and not slot.acquire(timeout=0.2):
+                if not pending:
+                    return
+            conn = None
+            try:
+                if pending:
+                    conn = self._connect_to_database(db_config)
+                    drain(conn)
+            except Exception as e:
+                logger.warning(f"No extra connection for {schema}.{table} partitions: {e}")
+            finally:
+                if conn is not None:
+                    conn.close()
+                if slot is not None:
+                    slot.release()
+                self.landing_connector.close()
+
+        with ThreadPoolExecutor(max_workers=len(partitions), thread_name_prefix=f"{name}-part") as pool:
+            futures = [pool.submit(read_on_table_connection)]
+            futures += [pool.submit(read_on_extra_connection) for _ in partitions[1:]]
+        for future in futures:
+            future.result()
+
+        if failures:
+            raise RuntimeError(
+                f"Extraction of {schema}.{table} failed for {len(failures)} partition(s): "
+                + "; ".join(failures[index] for index in sorted(failures))
+            )
+        return sorted(done, key=lambda result: result.partition)
+
+    def _build_column_definitions(
+        self,
+        columns: List[SourceColumn],
+        join_columns: Iterable[str] = (),
+        sampled_lengths: Optional[Dict[str, int]] = None
     ) -> List[Dict[str, str]]:
-        """Build column definitions for staging table."""
-        column_defs = []
+        """
+        Build column definitions for staging table.
+
+        Args:
+            columns: Source columns with their JDBC type, precision and scale
+            join_columns: Columns used in joins (get tight, fully indexable types)
+            sampled_lengths: Sampled max lengths of wide/unknown-width join columns
+
+        Returns:
+            Column definitions [{'name', 'type', 'nullable'}]
+        """
+        join_names = {col.lower() for col in join_columns}
+        sampled_lengths = {name.lower(): length for name, length in (sampled_lengths or {}).items()}
 
-        for col_name, col_type in zip(column_names, column_types):
-            # Map JDBC types to MySQL types (simplified)
-            # In production, you'd have more sophisticated type mapping
-            mysql_type = self._map_jdbc_type_to_mysql(col_type)
+        column_defs = []
+        for column in columns:
+            is_join = column.name.lower() in join_names
+            mysql_type = self._map_jdbc_type_to_mysql(column, is_join, sampled_lengths.get(column.name.lower()))
 
             column_defs.append({
-                'name': col_name,
+                'name': column.name,
                 'type': mysql_type,
                 'nullable': True
             })
 
         return column_defs
 
-    def _map_jdbc_type_to_mysql(self, jdbc_type: Any) -> str:
-        """Map JDBC type to MySQL type."""
-        # This is a simplified mapping
-        # In production, use jdbc_type's type code
-        type_str = str(jdbc_type).upper()
+    def _map_jdbc_type_to_mysql(
+        self,
+        column: SourceColumn,
+        is_join: bool = False,
+        sampled_length: Optional[int] = None
+    ) -> str:
+        """
+        Map a source column to a MySQL staging type.
+
+        Numbers and dates use the source precision/scale. Join columns get
+        VARCHAR/VARBINARY of the declared width when it is indexable
+        (LANDING_KEY_VARCHAR_MAX), or of that maximum when the declared width is
+        unknown/wider but the sampled values are short; other text stays TEXT.
+        """
+        type_name = column.type_name
+        precision, scale = column.precision, column.scale
+        width = precision or column.display_size
+        key_max = config.LANDING_KEY_VARCHAR_MAX
+
+        if column.name.lower() == ROW_HASH_COLUMN:
+            return 'CHAR(32)'
 
-        # Boolean/Bit types - must check before INT
-        if 'BOOL' in type_str or 'BIT' in type_str:
+        if type_name in ('BOOLEAN',) or (type_name == 'BIT' and (precision or 1) <= 1):
             return 'TINYINT(1)'
-        # Character types
-        elif 'CHAR' in type_str or 'TEXT' in type_str or 'STRING' in type_str:
-            return 'TEXT'
-        # Tiny int specifically
-        elif 'TINYINT' in type_str:
-            return 'TINYINT'
-        # Integer types
-        elif 'INT' in type_str or 'NUMBER' in type_str:
+        if type_name == 'TINYINT':
+            return 'SMALLINT'
+        if type_name == 'SMALLINT':
+            return 'INT'
+        if type_name in ('INTEGER', 'BIGINT', 'BIT', 'NUMBER'):
             return 'BIGINT'
-        # Decimal types
-        elif 'DECIMAL' in type_str or 'NUMERIC' in type_str:
+        if type_name in ('DECIMAL', 'NUMERIC'):
+            if scale == 0 and precision and precision <= 18:
+                return 'BIGINT'
+            if precision and 0 < precision <= 65 and scale is not None and 0 <= scale <= min(precision, 30):
+                return f'DECIMAL({precision},{scale})'
             return 'DECIMAL(38,10)'
-        # Float types
-        elif 'FLOAT' in type_str or 'DOUBLE' in type_str or 'REAL' in type_str:
+        if type_name in ('FLOAT', 'REAL', 'DOUBLE'):
             return 'DOUBLE'
-        # Date types
-        elif 'DATE' in type_str and 'DATETIME' not in type_str:
+        if type_name == 'DATE':
             return 'DATE'
-        elif 'DATETIME' in type_str:
-            return 'DATETIME'
-        # Timestamp types
-        elif 'TIMESTAMP' in type_str:
-            return 'TIMESTAMP'
-        # Binary types
-        elif 'BLOB' in type_str or 'BINARY' in type_str:
-            return 'BLOB'
-        # Default to TEXT for unknown types
-        else:
-            logger.debug(f"Unknown JDBC type '{jdbc_type}', defaulting to TEXT")
+        if type_name == 'TIME':
+            return 'TIME'
+        if type_name == 'TIMESTAMP':
+            fsp = min(scale or 0, 6)
+            return f'DATETIME({fsp})' if fsp else 'DATETIME'
+        if type_name in _STRING_TYPE_NAMES:
+            if is_join:
+                if width and 0 < width <= key_max and type_name not in _LONG_TYPE_NAMES:
+                    return f'VARCHAR({width})'
+                if sampled_length is not None and sampled_length <= key_max // 3:
+                    return f'VARCHAR({key_max})'
             return 'TEXT'
+        if type_name in _BINARY_TYPE_NAMES:
+            if is_join:
+                if width and 0 < width <= key_max and type_name not in _LONG_TYPE_NAMES:
+                    return f'VARBINARY({width})'
+                if sampled_length is not None and sampled_length <= key_max // 3:
+                    return f'VARBINARY({key_max})'
+            return 'BLOB'
+
+        logger.debug(f"Unknown JDBC type '{type_name}' for {column.name}, defaulting to TEXT")
+        return 'TEXT'
+
+    def _sample_key_lengths(
+        self,
+        source_conn: Any,
+        db_config: DatabaseConnectionInfo,
+        schema: str,
+        table: str,
+        join_columns: Iterable[str]
+    ) -> Dict[str, int]:
+        """
+        Max lengths of join columns whose declared width is unknown or too wide to index.
+
+        Runs on the table's own connection before the extraction query is opened
+        (no extra connection beyond the per-database cap): the join columns are
+        described from an empty result, then LANDING_TYPE_SAMPLE_ROWS rows are read.
+
+        Returns:
+            Sampled max length per column name (empty if nothing to sample or sampling failed)
+        """
+        join_columns = list(join_columns)
+        if not join_columns or config.LANDING_TYPE_SAMPLE_ROWS <= 0:
+            return {}
+
+        db_type = db_config.db_type.lower()
+        key_max = config.LANDING_KEY_VARCHAR_MAX
+        length_function = 'LEN' if db_type == 'sqlserver' else 'LENGTH'
+        sample_rows = config.LANDING_TYPE_SAMPLE_ROWS
+        try:
+            cursor = source_conn.cursor()
+            try:
+                described = ", ".join(quote_identifier(col, db_config.db_type) for col in join_columns)
+                cursor.execute(f"SELECT {described} FROM {schema}.{table} WHERE 1 = 0")
+                wide = [
+                    column.name for column in _describe_columns(cursor)
+                    if column.type_name in _STRING_TYPE_NAMES | _BINARY_TYPE_NAMES
+                    and (column.type_name in _LONG_TYPE_NAMES
+                         or not 0 < (column.precision or column.display_size or 0) <= key_max)
+                ]
+                if not wide:
+                    return {}
+
+                quoted = [quote_identifier(col, db_config.db_type) for col in wide]
+                if db_type == 'sqlserver':
+                    sample = f"SELECT TOP {sample_rows} {', '.join(quoted)} FROM {schema}.{table}"
+                elif db_type == 'oracle':
+                    sample = f"SELECT {', '.join(quoted)} FROM {schema}.{table} WHERE ROWNUM <= {sample_rows}"
+                else:
+                    sample = f"SELECT {', '.join(quoted)} FROM {schema}.{table} LIMIT {sample_rows}"
+                lengths = ", ".join(f"MAX({length_function}(sampled.{col}))" for col in quoted)
+                cursor.execute(f"SELECT {lengths} FROM ({sample}) sampled")
+                values = cursor.fetchone()
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.info(f"Could not sample key lengths of {schema}.{table}: {e}")
+            return {}
+
+        sampled = {name: int(value or 0) for name, value in zip(wide, values)}
+        logger.info(f"Sampled key lengths of {schema}.{table}: {sampled}")
+        return sampled
+
+    def _column_converters(self, column_types: List[Any]) -> Tuple[Optional[ValueConverter], ...]:
+        """Resolve one converter per column from the cursor description (None: keep values as-is)."""
+        return tuple(_column_converter(jdbc_type) for jdbc_type in column_types)
+
+    def _convert_columns(
+        self,
+        batch: ColumnBatch,
+        converters: Tuple[Optional[ValueConverter], ...]
+    ) -> List[tuple]:
+        """
+        Convert a column batch with precompiled converters and return row tuples.
+
+        Conversion runs column by column, so pass-through columns are not touched
+        and no type checks happen per cell.
+        """
+        columns = [
+            values if convert is None else [None if value is None else convert(value) for value in values]
+            for values, convert in zip(batch.columns, converters)
+        ]
+        return list(zip(*columns))
 
     def _convert_data_values(
         self,
@@ -392,183 +1235,171 @@ class DataExtractor:
         Returns:
             Converted data
         """
-        converted_data = []
-
-        for row in data:
-            converted_row = []
-            for value, jdbc_type in zip(row, column_types):
-                converted_value = self._convert_single_value(value, jdbc_type)
-                converted_row.append(converted_value)
-            converted_data.append(tuple(converted_row))
-
-        return converted_data
+        converters = self._column_converters(column_types)
+        if not data or all(convert is None for convert in converters):
+            return list(data)
+        batch = ColumnBatch([], list(column_types), [list(values) for values in zip(*data)])
+        return self._convert_columns(batch, converters)
 
     def _convert_single_value(self, value: Any, jdbc_type: Any) -> Any:
         """Convert a single value based on its JDBC type."""
-        # Handle NULL
-        if value is None:
-            return None
-
-        type_str = str(jdbc_type).upper()
-
-        # Boolean conversion
-        if 'BOOL' in type_str or 'BIT' in type_str:
-            if isinstance(value, str):
-                if value.lower() in ('true', '1', 'yes', 't', 'y'):
-                    return 1
-                elif value.lower() in ('false', '0', 'no', 'f', 'n'):
-                    return 0
-            elif isinstance(value, bool):
-                return 1 if value else 0
-            elif isinstance(value, int):
-                return 1 if value else 0
-
-        # Integer conversion - handle boolean strings in integer columns
-        elif 'INT' in type_str or 'NUMBER' in type_str:
-            if isinstance(value, str):
-                # Check if it's a boolean string
-                if value.lower() in ('true', 'false'):
-                    return 1 if value.lower() == 'true' else 0
-                # Try to convert to int
-                try:
-                    return int(float(value))  # Handle "1.0" -> 1
-                except (ValueError, TypeError):
-                    return None
-
-        # String conversion
-        elif 'CHAR' in type_str or 'TEXT' in type_str:
-            if isinstance(value, (bytes, bytearray)):
-                return value.decode('utf-8', errors='ignore')
-            return str(value) if value is not None else None
-
-        return value
+        convert = _column_converter(jdbc_type)
+        if value is None or convert is None:
+            return value
+        return convert(value)
 
     def _bulk_load_to_landing(
         self,
         staging_table_name: str,
         column_names: List[str],
-        data: List[tuple],
-        column_types: Optional[List[Any]] = None
+        batches: Iterable[List[tuple]]
     ) -> int:
         """
-        Bulk load data into landing database using LOAD DATA INFILE.
+        Stream converted row batches into a staging table.
+
+        On MySQL uses LOAD DATA LOCAL INFILE reading from a named pipe (no temp
+        file, no full copy of the table); on PostgreSQL uses COPY FROM STDIN.
+        Uses batched INSERTs on the embedded SQLite engine (in-process, one
+        transaction per batch) and when bulk copy is disabled, named pipes are
+        unavailable or the server refuses LOCAL INFILE.
 
         Args:
             staging_table_name: Target staging table
             column_names: List of column names
-            data: Data rows
-            column_types: JDBC column types for conversion
+            batches: Row batches already converted for the landing database
 
         Returns:
             Number of rows inserted
         """
-        if not data:
-            return 0
+        batches = iter(batches)
+        db_type = self.landing_connector.db_type
 
-        # Convert data values to MySQL-compatible formats
-        if column_types:
-            logger.info("Converting data values for MySQL compatibility...")
-            data = self._convert_data_values(data, column_types)
+        if config.LANDING_USE_BULK_COPY and db_type == "postgresql":
+            return self.landing_connector.copy_rows(staging_table_name, column_names, batches)
 
-        if config.LANDING_USE_BULK_COPY:
-            return self._bulk_load_with_load_data_infile(
-                staging_table_name, column_names, data
-            )
-        else:
-            return self._bulk_load_with_batch_insert(
-                staging_table_name, column_names, data
-            )
+        if config.LANDING_USE_BULK_COPY and db_type == "mysql" and hasattr(os, "mkfifo"):
+            row_count = self._bulk_load_with_load_data_infile(staging_table_name, column_names, batches)
+            if row_count is not None:
+                return row_count
+
+        return self._bulk_load_with_batch_insert(staging_table_name, column_names, batches)
+
+    @staticmethod
+    def _csv_rows(batch: List[tuple]) -> Iterator[List[str]]:
+        """Rows for the LOAD DATA stream (None becomes MySQL's \\N NULL marker)."""
+        for row in batch:
+            yield ['\\N' if val is None else str(val) for val in row]
 
     def _bulk_load_with_load_data_infile(
         self,
         staging_table_name: str,
         column_names: List[str],
-        data: List[tuple]
-    ) -> int:
-        """Bulk load using MySQL LOAD DATA LOCAL INFILE."""
-        try:
-            # Create temporary CSV file
-            temp_file = tempfile.NamedTemporaryFile(
-                mode='w',
-                newline='',
-                suffix='.csv',
-                delete=False,
-                encoding='utf-8'
-            )
+        batches: Iterator[List[tuple]]
+    ) -> Optional[int]:
+        """
+        Bulk load using MySQL LOAD DATA LOCAL INFILE streaming from a named pipe.
+
+        A writer thread turns batches into CSV and writes them into the pipe while
+        the server reads it, so only the batch being written is held as CSV.
+
+        Returns:
+            Rows loaded, or None if the server refused the load before reading any
+            row (the batches are untouched and can be loaded another way)
+        """
+        fifo_dir = tempfile.mkdtemp(prefix="landing_load_")
+        fifo_path = os.path.join(fifo_dir, f"{staging_table_name}.csv")
+        os.mkfifo(fifo_path, 0o600)
 
+        opened = threading.Event()
+        abort = threading.Event()
+        writer_errors: List[BaseException] = []
+
+        def write():
             try:
-                # Write data to CSV
-                writer = csv.writer(temp_file, quoting=csv.QUOTE_MINIMAL)
-                for row in data:
-                    # Convert None to NULL string and handle other types
-                    cleaned_row = []
-                    for val in row:
-                        if val is None:
-                            cleaned_row.append('\\N')  # MySQL NULL representation
-                        else:
-                            cleaned_row.append(str(val))
-                    writer.writerow(cleaned_row)
-
-                temp_file.close()
-
-                # Load data using LOAD DATA INFILE
-                columns_clause = ', '.join([f"`{col}`" for col in column_names])
-
-                load_sql = f"""
-                LOAD DATA LOCAL INFILE '{temp_file.name.replace(chr(92), '/')}'
-                INTO TABLE `{staging_table_name}`
-                FIELDS TERMINATED BY ','
-                OPTIONALLY ENCLOSED BY '"'
-                LINES TERMINATED BY '\\n'
-                ({columns_clause})
-                """
+                fd = os.open(fifo_path, os.O_WRONLY)  # Blocks until the client opens the pipe
+                opened.set()
+                with open(fd, 'w', newline='', encoding='utf-8') as stream:
+                    if abort.is_set():
+                        return
+                    writer = csv.writer(stream, quoting=csv.QUOTE_MINIMAL)
+                    for batch in batches:
+                        writer.writerows(self._csv_rows(batch))
+            except BaseException as e:
+                writer_errors.append(e)
+
+        writer_thread = threading.Thread(target=write, name=f"load-{staging_table_name}", daemon=True)
+        writer_thread.start()
+
+        columns_clause = ', '.join([f"`{col}`" for col in column_names])
+        load_sql = f"""
+        LOAD DATA LOCAL INFILE '{fifo_path.replace(chr(92), '/')}'
+        INTO TABLE `{staging_table_name}`
+        FIELDS TERMINATED BY ','
+        OPTIONALLY ENCLOSED BY '"'
+        LINES TERMINATED BY '\\n'
+        ({columns_clause})
+        """
 
+        try:
+            try:
                 with self.landing_connector.cursor() as cursor:
                     cursor.execute(load_sql)
                     row_count = cursor.rowcount
-
-                logger.info(f"Bulk loaded {row_count} rows using LOAD DATA INFILE")
-                return row_count
-
-            finally:
-                # Clean up temp file
-                try:
-                    os.unlink(temp_file.name)
-                except Exception as e:
-                    logger.warning(f"Failed to delete temp file: {e}")
-
-        except Exception as e:
-            logger.warning(f"LOAD DATA INFILE failed: {e}. Falling back to batch insert.")
-            return self._bulk_load_with_batch_insert(staging_table_name, column_names, data)
+            except Exception as e:
+                if opened.is_set():
+                    raise
+                # Refused before reading: release the writer without consuming any batch
+                abort.set()
+                unblock = os.open(fifo_path, os.O_RDONLY | os.O_NONBLOCK)
+                writer_thread.join()
+                os.close(unblock)
+                logger.warning(f"LOAD DATA LOCAL INFILE failed: {e}. Falling back to batch insert.")
+                return None
+
+            writer_thread.join()
+            if writer_errors:
+                raise writer_errors[0]
+
+            logger.info(f"Bulk loaded {row_count} rows using LOAD DATA LOCAL INFILE (streamed)")
+            return row_count
+
+        finally:
+            writer_thread.join()
+            try:
+                os.unlink(fifo_path)
+                os.rmdir(fifo_dir)
+            except Exception as e:
+                logger.warning(f"Failed to delete load pipe: {e}")
 
     def _bulk_load_with_batch_insert(
         self,
         staging_table_name: str,
         column_names: List[str],
-        data: List[tuple]
+        batches: Iterable[List[tuple]]
     ) -> int:
-        """Bulk load using batch INSERT statements."""
+        """Bulk load using batch INSERT statements, one executemany per batch."""
         batch_size = config.LANDING_BATCH_SIZE
         total_inserted = 0
 
         try:
-            columns_clause = ', '.join([f"`{col}`" for col in column_names])
+            quote = self.landing_connector.quote
+            columns_clause = ', '.join([quote(col) for col in column_names])
             placeholders = ', '.join(['%s'] * len(column_names))
             insert_sql = f"""
-            INSERT INTO `{staging_table_name}` ({columns_clause})
+            INSERT INTO {quote(staging_table_name)} ({columns_clause})
             VALUES ({placeholders})
             """
 
             # Insert in batches
-            for i in range(0, len(data), batch_size):
-                batch = data[i:i + batch_size]
+            for rows in batches:
+                for i in range(0, len(rows), batch_size):
+                    batch = rows[i:i + batch_size]
 
-                with self.landing_connector.cursor(dictionary=False) as cursor:
-                    cursor.executemany(insert_sql, batch)
-                    total_inserted += len(batch)
+                    with self.landing_connector.cursor(dictionary=False) as cursor:
+                        cursor.executemany(insert_sql, batch)
+                        total_inserted += len(batch)
 
-                if (i // batch_size + 1) % 10 == 0:
-                    logger.debug(f"Inserted {total_inserted}/{len(data)} rows")
+                logger.debug(f"Inserted {total_inserted} rows")
 
             logger.info(f"Batch inserted {total_inserted} rows")
             return total_inserted
@@ -0,0 +1,303 @@
+"""
+Adaptive execution planner for reconciliation rules.
+
+Picks, per rule, the cheapest of the strategies that can run it:
+  - standard:  SQL join on the source server (only when source and target are
+               the same connection, or RECON_PLANNER_CROSS_DATABASE declares the
+               source server able to reach the target's tables)
+  - hash_join: stream the keys of both sides and join in-process
+  - landing:   extract both sides into the landing database and join there
+
+Row counts come from the optimizer statistics (CatalogService.row_estimate),
+never from COUNT(*). Costs are rough wall-time estimates in milliseconds driven
+by the RECON_PLANNER_* settings: they only have to rank the strategies, and the
+executor reports them next to the actual rule time so the settings can be tuned.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from kg_builder.config import (
+    RECON_HASH_JOIN_MEMORY_ROWS,
+    RECON_PLANNER_CROSS_DATABASE,
+    RECON_PLANNER_DEFAULT_ROWS,
+    RECON_PLANNER_FETCH_ROW_COST_US,
+    RECON_PLANNER_LANDING_FIXED_MS,
+    RECON_PLANNER_LANDING_ROW_COST_US,
+    RECON_PLANNER_QUERY_FIXED_MS,
+    RECON_PLANNER_SPILL_ROW_COST_US,
+    RECON_PLANNER_SQL_ROW_COST_US
+)
+from kg_builder.models import (
+    DatabaseConnectionInfo,
+    ReconciliationExecutionMode,
+    ReconciliationRule
+)
+from kg_builder.services.catalog_service import CatalogService, get_catalog_service
+from kg_builder.services.rule_plan_compiler import RulePlan
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RuleStrategy:
+    """Strategy chosen for one rule, with the estimates it was chosen from."""
+    rule_id: str
+    rule_name: str
+    execution_mode: ReconciliationExecutionMode
+    reason: str
+    source_rows: Optional[int]                     # Statistics estimate (None when unavailable)
+    target_rows: Optional[int]
+    co_located: bool                               # Target table reachable from the source connection
+    estimated_costs_ms: Dict[str, float] = field(default_factory=dict)  # Candidate strategy -> estimate
+    executed_mode: Optional[ReconciliationExecutionMode] = None  # Differs from execution_mode after a fallback
+    actual_ms: Optional[float] = None
+
+    @property
+    def estimated_ms(self) -> Optional[float]:
+        """Estimated cost of the chosen strategy."""
+        return self.estimated_costs_ms.get(self.execution_mode.value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Entry of RuleExecutionResponse.execution_plan."""
+        return {
+            "rule_id": self.rule_id,
+            "rule_name": self.rule_name,
+            "strategy": self.execution_mode.value,
+            "executed_strategy": (self.executed_mode or self.execution_mode).value,
+            "reason": self.reason,
+            "source_rows": self.source_rows,
+            "target_rows": self.target_rows,
+            "co_located": self.co_located,
+            "estimated_costs_ms": {name: round(cost, 1) for name, cost in self.estimated_costs_ms.items()},
+            "estimated_ms": round(self.estimated_ms, 1) if self.estimated_ms is not None else None,
+            "actual_ms": round(self.actual_ms, 1) if self.actual_ms is not None else None
+        }
+
+
+class ExecutionPlanner:
+    """Choose standard SQL, in-memory hash join or landing execution per rule."""
+
+    def __init__(
+        self,
+        catalog: Optional[CatalogService] = None,
+        query_fixed_ms: float = RECON_PLANNER_QUERY_FIXED_MS,
+        sql_row_cost_us: float = RECON_PLANNER_SQL_ROW_COST_US,
+        fetch_row_cost_us: float = RECON_PLANNER_FETCH_ROW_COST_US,
+        spill_row_cost_us: float = RECON_PLANNER_SPILL_ROW_COST_US,
+        landing_row_cost_us: float = RECON_PLANNER_LANDING_ROW_COST_US,
+        landing_fixed_ms: float = RECON_PLANNER_LANDING_FIXED_MS,
+        memory_rows: int = RECON_HASH_JOIN_MEMORY_ROWS,
+        default_rows: int = RECON_PLANNER_DEFAULT_ROWS,
+        cross_database: bool = RECON_PLANNER_CROSS_DATABASE
+    ):
+        """
+        Initialize the planner.
+
+        Args:
+            catalog: Catalog cache providing row estimates (default: shared instance)
+            query_fixed_ms: Fixed cost of one query (round trip, parsing, planning)
+            sql_row_cost_us: Per-row cost of a join executed by the database server
+            fetch_row_cost_us: Per-row cost of streaming a row and probing it in-process
+            spill_row_cost_us: Additional per-row cost once the hash join spills to disk
+            landing_row_cost_us: Per-row cost of extracting, loading and joining in landing
+            landing_fixed_ms: Fixed cost of a landing run (staging tables, indexes, KPIs)
+            memory_rows: Rows the hash join buffers before spilling partitions
+            default_rows: Rows assumed for a table without statistics
+            cross_database: The source server can query tables of a different target
+                connection; without it only identical connections are co-located
+        """
+        self.catalog = catalog or get_catalog_service()
+        self.query_fixed_ms = query_fixed_ms
+        self.sql_row_cost_us = sql_row_cost_us
+        self.fetch_row_cost_us = fetch_row_cost_us
+        self.spill_row_cost_us = spill_row_cost_us
+        self.landing_row_cost_us = landing_row_cost_us
+        self.landing_fixed_ms = landing_fixed_ms
+        self.memory_rows = memory_rows
+        self.default_rows = default_rows
+        self.cross_database = cross_database
+
+    @staticmethod
+    def supports_hash_join(rule: ReconciliationRule) -> bool:
+        """Whether a rule can be reconciled in-process (plain column equality only)."""
+        return (
+            not rule.transformation
+            and not rule.is_multi_table()
+            and bool(rule.source_columns)
+            and len(rule.source_columns) == len(rule.target_columns)
+        )
+
+    def estimate_costs(
+        self,
+        source_rows: int,
+        target_rows: int,
+        co_located: bool,
+        hash_join_supported: bool = True,
+        landing_supported: bool = False
+    ) -> Dict[str, float]:
+        """
+        Estimated wall time (ms) of every strategy that can run a rule.
+
+        Args:
+            source_rows: Rows of the source table
+            target_rows: Rows of the target table
+            co_located: Target table is reachable from the source connection
+            hash_join_supported: Rule is a plain column join
+            landing_supported: Landing database is configured and can stage the rule
+
+        Returns:
+            Strategy name (ReconciliationExecutionMode value) -> estimated ms
+        """
+        rows = source_rows + target_rows
+        costs = {}
+        if co_located:
+            # Matched, unmatched source and unmatched target queries
+            costs[ReconciliationExecutionMode.STANDARD.value] = (
+                3 * self.query_fixed_ms + rows * self.sql_row_cost_us / 1000
+            )
+        if hash_join_supported:
+            spilled = max(0, rows - self.memory_rows)
+            costs[ReconciliationExecutionMode.HASH_JOIN.value] = (
+                2 * self.query_fixed_ms
+                + rows * self.fetch_row_cost_us / 1000
+                + spilled * self.spill_row_cost_us / 1000
+            )
+        if landing_supported:
+            costs[ReconciliationExecutionMode.LANDING.value] = (
+                self.landing_fixed_ms + rows * self.landing_row_cost_us / 1000
+            )
+        return costs
+
+    def choose(
+        self,
+        rule: ReconciliationRule,
+        source_rows: Optional[int],
+        target_rows: Optional[int],
+        co_located: bool,
+        landing_available: bool = False
+    ) -> RuleStrategy:
+        """
+        Pick the cheapest strategy for one rule.
+
+        Args:
+            rule: Rule to plan
+            source_rows: Statistics estimate of the source table (None = unknown)
+            target_rows: Statistics estimate of the target table (None = unknown)
+            co_located: Target table is reachable from the source connection
+            landing_available: Landing database is configured
+
+        Returns:
+            RuleStrategy; standard SQL when no strategy fits the rule
+        """
+        costs = self.estimate_costs(
+            self.default_rows if source_rows is None else source_rows,
+            self.default_rows if target_rows is None else target_rows,
+            co_located,
+            hash_join_supported=self.supports_hash_join(rule),
+            landing_supported=landing_available and not rule.is_multi_table()
+        )
+
+        if not costs:
+            mode = ReconciliationExecutionMode.STANDARD
+            reason = (
+                "tables are on different servers but the rule needs SQL "
+                "(transformation or multi-table join); running on the source connection"
+            )
+        else:
+            name = min(costs, key=costs.get)
+            mode = ReconciliationExecutionMode(name)
+            if len(costs) > 1:
+                reason = f"{name} is the cheapest of {', '.join(sorted(costs))}"
+            else:
+                reason = f"only {name} can run this rule"
+            if not co_located:
+                reason += "; target table not reachable from the source connection"
+            if source_rows is None or target_rows is None:
+                reason += f"; no statistics for some tables (assumed {self.default_rows} rows)"
+
+        return RuleStrategy(
+            rule_id=rule.rule_id,
+            rule_name=rule.rule_name,
+            execution_mode=mode,
+            reason=reason,
+            source_rows=source_rows,
+            target_rows=target_rows,
+            co_located=co_located,
+            estimated_costs_ms=costs
+        )
+
+    def plan_rules(
+        self,
+        rules: List[ReconciliationRule],
+        plans: List[RulePlan],
+        source_conn: Any,
+        target_conn: Any,
+        source_db_config: DatabaseConnectionInfo,
+        target_db_config: DatabaseConnectionInfo,
+        landing_available: bool = False
+    ) -> List[RuleStrategy]:
+        """
+        Plan every rule of a ruleset.
+
+        Args:
+            rules: Rules to plan
+            plans: Rule plans compiled against the source connection (aligned with
+                `rules`); with cross_database, their resolved target table tells
+                whether the target is reachable from the source server
+            source_conn: Source connection (statistics of the source tables)
+            target_conn: Target connection (statistics of the target tables)
+            source_db_config: Source database connection info
+            target_db_config: Target database connection info
+            landing_available: Landing database is configured
+
+        Returns:
+            RuleStrategy per rule, in rule order
+        """
+        source_key = source_db_config.connection_key()
+        target_key = target_db_config.connection_key()
+        strategies = []
+
+        for rule, plan in zip(rules, plans):
+            # A same-named table in the source catalog is usually the source server's
+            # own copy (prod vs. replica), so name lookups alone never imply co-location
+            co_located = source_key == target_key
+            if not co_located and self.cross_database and plan.schema_resolved:
+                co_located = plan.target_table_columns is not None
+
+            source_rows = self._row_estimate(
+                source_conn, source_key, source_db_config.db_type, rule.source_schema, rule.source_table
+            )
+            target_rows = self._row_estimate(
+                target_conn, target_key, target_db_config.db_type, rule.target_schema, rule.target_table
+            )
+
+            strategy = self.choose(rule, source_rows, target_rows, co_located, landing_available)
+            logger.info(
+                f"Planned rule {rule.rule_name}: {strategy.execution_mode.value} "
+                f"(~{source_rows}/{target_rows} rows, co-located={co_located}, "
+                f"estimates={ {name: round(cost) for name, cost in strategy.estimated_costs_ms.items()} })"
+            )
+            strategies.append(strategy)
+
+        return strategies
+
+    def _row_estimate(self, conn: Any, scope: str, db_type: str, schema: str, table: str) -> Optional[int]:
+        try:
+            return self.catalog.row_estimate(conn, scope, db_type, schema, table)
+        except Exception as e:
+            logger.debug(f"Row estimate of {schema}.{table} failed: {e}")
+            return None
+
+
+# Singleton instance
+_execution_planner: Optional[ExecutionPlanner] = None
+
+
+def get_execution_planner() -> ExecutionPlanner:
+    """Get or create the singleton execution planner instance."""
+    global _execution_planner
+    if _execution_planner is None:
+        _execution_planner = ExecutionPlanner()
+    return _execution_planner
@@ -0,0 +1,366 @@
+"""
+Partitioned (grace) hash join for in-process reconciliation.
+
+Used when source and target tables live on different database servers, so a
+single SQL JOIN cannot be pushed down. Both sides are streamed in batches and
+hash-partitioned on the join key; partitions are spilled to disk whenever the
+rows buffered in memory exceed the configured budget. Each partition is then
+joined independently, so peak memory is bounded by the largest partition
+rather than by the table size.
+"""
+
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from kg_builder.config import (
+    RECON_HASH_JOIN_MEMORY_ROWS,
+    RECON_HASH_JOIN_PARTITIONS,
+    RECON_HASH_JOIN_SPILL_DIR
+)
+
+logger = logging.getLogger(__name__)
+
+SIDES = ("source", "target")
+
+# Oversized partitions are re-partitioned with a new hash salt up to this depth
+MAX_REPARTITION_DEPTH = 3
+
+
+def normalize_key_value(value: Any) -> Any:
+    """
+    Normalize a single join key value so equal values from different drivers compare equal.
+
+    Strings are right-trimmed (SQL Server and Oracle CHAR columns are blank-padded and
+    compare equal ignoring trailing spaces). Bytes are decoded. Numbers are left as-is
+    because Python already treats 1, 1.0 and Decimal('1') as equal with equal hashes.
+    """
+    if isinstance(value, str):
+        return value.rstrip()
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8", errors="ignore").rstrip()
+    return value
+
+
+def build_key(row: Sequence[Any], key_positions: Sequence[int]) -> Optional[Tuple[Any, ...]]:
+    """
+    Build a normalized join key from a row.
+
+    Returns None when any key component is NULL: like SQL, NULL never equals NULL,
+    so such rows can only ever be unmatched.
+    """
+    key = []
+    for pos in key_positions:
+        value = row[pos]
+        if value is None:
+            return None
+        key.append(normalize_key_value(value))
+    return tuple(key)
+
+
+@dataclass
+class HashJoinResult:
+    """Outcome of a partitioned hash join: exact counts plus bounded samples."""
+    matched_count: int = 0
+    unmatched_source_count: int = 0
+    unmatched_target_count: int = 0
+    matched_sample: List[Tuple[tuple, tuple]] = field(default_factory=list)
+    unmatched_source_sample: List[tuple] = field(default_factory=list)
+    unmatched_target_sample: List[tuple] = field(default_factory=list)
+    source_rows: int = 0
+    target_rows: int = 0
+    partitions: int = 0
+    spilled_partitions: int = 0
+    spill_bytes: int = 0
+
+
+class _Partition:
+    """One hash partition: an in-memory buffer per side plus optional spill files."""
+
+    def __init__(self, spill_dir: str, name: str):
+        self.spill_dir = spill_dir
+        self.name = name
+        self.buffers: Dict[str, List[Tuple[Optional[tuple], tuple]]] = {side: [] for side in SIDES}
+        self.spill_paths: Dict[str, Optional[str]] = {side: None for side in SIDES}
+        self.counts: Dict[str, int] = {side: 0 for side in SIDES}
+
+    @property
+    def spilled(self) -> bool:
+        return any(self.spill_paths.values())
+
+    def buffered_rows(self) -> int:
+        return sum(len(buf) for buf in self.buffers.values())
+
+    def append(self, side: str, key: Optional[tuple], row: tuple):
+        self.buffers[side].append((key, row))
+        self.counts[side] += 1
+
+    def spill(self) -> int:
+        """Flush in-memory buffers to the spill files. Returns bytes written."""
+        written = 0
+        for side in SIDES:
+            buf = self.buffers[side]
+            if not buf:
+                continue
+            path = self.spill_paths[side]
+            if path is None:
+                path = os.path.join(self.spill_dir, f"{self.name}_{side}.spill")
+                self.spill_paths[side] = path
+            with open(path, "ab") as f:
+                before = f.tell()
+                pickle.dump(buf, f, protocol=pickle.HIGHEST_PROTOCOL)
+                written += f.tell() - before
+            self.buffers[side] = []
+        return written
+
+    def iter_side(self, side: str) -> Iterable[Tuple[Optional[tuple], tuple]]:
+        """Iterate spilled rows first, then rows still buffered in memory."""
+        path = self.spill_paths[side]
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                while True:
+                    try:
+                        chunk = pickle.load(f)
+                    except EOFError:
+                        break
+                    yield from chunk
+        yield from self.buffers[side]
+
+    def discard(self):
+        for side in SIDES:
+            path = self.spill_paths[side]
+            if path and os.path.exists(path):
+                try:
+                    os.unlink(path)
+                except OSError as e:
+                    logger.warning(f"Failed to delete spill file {path}: {e}")
+            self.buffers[side] = []
+
+
+class PartitionedHashJoin:
+    """
+    Grace hash join of two row streams on an equality key.
+
+    Usage:
+        join = PartitionedHashJoin()
+        join.add_rows("source", source_batch, key_positions=[0])
+        join.add_rows("target", target_batch, key_positions=[2])
+        result = join.execute(sample_limit=100)
+        join.close()
+
+    Counts follow SQL semantics: matched_count is the number of joined row pairs,
+    unmatched counts are rows on one side with no equal key on the other side.
+    """
+
+    def __init__(
+        self,
+        num_partitions: Optional[int] = None,
+        memory_budget_rows: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        salt: int = 0,
+        depth: int = 0
+    ):
+        """
+        Initialize the hash join.
+
+        Args:
+            num_partitions: Number of hash partitions (default from config)
+            memory_budget_rows: Maximum rows buffered in memory before spilling (default from config)
+            spill_dir: Parent directory for spill files (default: system temp dir)
+            salt: Hash salt, changed when re-partitioning an oversized partition
+            depth: Re-partitioning depth (internal)
+        """
+        self.num_partitions = max(1, num_partitions or RECON_HASH_JOIN_PARTITIONS)
+        self.memory_budget_rows = max(1, memory_budget_rows or RECON_HASH_JOIN_MEMORY_ROWS)
+        self.salt = salt
+        self.depth = depth
+        parent_dir = spill_dir or RECON_HASH_JOIN_SPILL_DIR or None
+        self._spill_root = tempfile.mkdtemp(prefix="recon_hj_", dir=parent_dir)
+        self._partitions = [
+            _Partition(self._spill_root, f"p{i:04d}") for i in range(self.num_partitions)
+        ]
+        self._buffered = 0
+        self._spill_bytes = 0
+        self._closed = False
+
+    def _partition_for(self, key: Optional[tuple]) -> _Partition:
+        if key is None:
+            # NULL keys never match; keep them together in partition 0
+            return self._partitions[0]
+        return self._partitions[hash((self.salt, key)) % self.num_partitions]
+
+    def add_rows(
+        self,
+        side: str,
+        rows: Iterable[Sequence[Any]],
+        key_positions: Sequence[int]
+    ) -> int:
+        """
+        Add a batch of rows for one side of the join.
+
+        Args:
+            side: 'source' or 'target'
+            rows: Row tuples (as returned by a DB-API cursor)
+            key_positions: Indexes of the join key columns within each row
+
+        Returns:
+            Number of rows added
+        """
+        if side not in SIDES:
+            raise ValueError(f"Invalid side '{side}', expected 'source' or 'target'")
+
+        added = 0
+        for row in rows:
+            row = tuple(row)
+            self._add_keyed(side, build_key(row, key_positions), row)
+            added += 1
+        return added
+
+    def _add_keyed(self, side: str, key: Optional[tuple], row: tuple):
+        self._partition_for(key).append(side, key, row)
+        self._buffered += 1
+        if self._buffered > self.memory_budget_rows:
+            self._spill_largest()
+
+    def _spill_largest(self):
+        """Spill the largest in-memory partitions until under half the budget."""
+        target = self.memory_budget_rows // 2
+        for partition in sorted(self._partitions, key=lambda p: p.buffered_rows(), reverse=True):
+            if self._buffered <= target:
+                break
+            rows = partition.buffered_rows()
+            if rows == 0:
+                break
+            self._spill_bytes += partition.spill()
+            self._buffered -= rows
+        logger.debug(
+            f"Hash join spill: {self._buffered} rows buffered, {self._spill_bytes} bytes on disk"
+        )
+
+    def execute(self, sample_limit: Optional[int] = 100) -> HashJoinResult:
+        """
+        Join all partitions and return exact counts with bounded samples.
+
+        Args:
+            sample_limit: Maximum rows to keep per sample category (None keeps all)
+
+        Returns:
+            HashJoinResult
+        """
+        result = HashJoinResult(partitions=self.num_partitions)
+        for partition in self._partitions:
+            result.source_rows += partition.counts["source"]
+            result.target_rows += partition.counts["target"]
+            if partition.spilled:
+                result.spilled_partitions += 1
+            self._join_partition(partition, result, sample_limit)
+            partition.discard()
+
+        result.spill_bytes += self._spill_bytes
+        logger.info(
+            f"Hash join complete: {result.matched_count} matched, "
+            f"{result.unmatched_source_count} source-only, {result.unmatched_target_count} target-only "
+            f"({result.spilled_partitions}/{result.partitions} partitions spilled, "
+            f"{result.spill_bytes} bytes)"
+        )
+        return result
+
+    def _join_partition(self, partition: _Partition, result: HashJoinResult, sample_limit: Optional[int]):
+        source_count = partition.counts["source"]
+
+        if source_count > self.memory_budget_rows and self.depth < MAX_REPARTITION_DEPTH:
+            # Skewed partition: split it again with a different salt
+            logger.debug(
+                f"Re-partitioning {partition.name} ({source_count} source rows) at depth {self.depth + 1}"
+            )
+            sub_join = PartitionedHashJoin(
+                num_partitions=self.num_partitions,
+                memory_budget_rows=self.memory_budget_rows,
+                spill_dir=self._spill_root,
+                salt=self.salt + 1,
+                depth=self.depth + 1
+            )
+            try:
+                for side in SIDES:
+                    for key, row in partition.iter_side(side):
+                        sub_join._add_keyed(side, key, row)
+                sub_result = sub_join.execute(sample_limit=sample_limit)
+            finally:
+                sub_join.close()
+            self._merge_result(result, sub_result, sample_limit)
+            result.spill_bytes += sub_result.spill_bytes
+            return
+
+        # Build phase: load the source side of this partition
+        build: Dict[tuple, List[tuple]] = {}
+        for key, row in partition.iter_side("source"):
+            if key is None:
+                result.unmatched_source_count += 1
+                _append_sample(result.unmatched_source_sample, row, sample_limit)
+                continue
+            build.setdefault(key, []).append(row)
+
+        # Probe phase: stream the target side
+        matched_keys = set()
+        for key, row in partition.iter_side("target"):
+            source_rows = build.get(key) if key is not None else None
+            if not source_rows:
+                result.unmatched_target_count += 1
+                _append_sample(result.unmatched_target_sample, row, sample_limit)
+                continue
+            matched_keys.add(key)
+            result.matched_count += len(source_rows)
+            for source_row in source_rows:
+                if sample_limit is not None and len(result.matched_sample) >= sample_limit:
+                    break
+                result.matched_sample.append((source_row, row))
+
+        for key, source_rows in build.items():
+            if key in matched_keys:
+                continue
+            result.unmatched_source_count += len(source_rows)
+            for source_row in source_rows:
+                if not _append_sample(result.unmatched_source_sample, source_row, sample_limit):
+                    break
+
+    @staticmethod
+    def _merge_result(result: HashJoinResult, other: HashJoinResult, sample_limit: Optional[int]):
+        result.matched_count += other.matched_count
+        result.unmatched_source_count += other.unmatched_source_count
+        result.unmatched_target_count += other.unmatched_target_count
+        for pair in other.matched_sample:
+            if not _append_sample(result.matched_sample, pair, sample_limit):
+                break
+        for row in other.unmatched_source_sample:
+            if not _append_sample(result.unmatched_source_sample, row, sample_limit):
+                break
+        for row in other.unmatched_target_sample:
+            if not _append_sample(result.unmatched_target_sample, row, sample_limit):
+                break
+
+    def close(self):
+        """Delete all spill files."""
+        if self._closed:
+            return
+        for partition in self._partitions:
+            partition.discard()
+        shutil.rmtree(self._spill_root, ignore_errors=True)
+        self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _append_sample(sample: list, item: Any, sample_limit: Optional[int]) -> bool:
+    """Append to a sample list unless full. Returns False once the sample is full."""
+    if sample_limit is not None and len(sample) >= sample_limit:
+        return False
+    sample.append(item)
+    return True
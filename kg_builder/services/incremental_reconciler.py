@@ -0,0 +1,638 @@
+"""
+Watermark-based incremental (delta) reconciliation.
+
+For a 2-table equality rule, matched/unmatched totals depend only on how many
+rows each side has per join key:
+
+    matched          = sum(source_count * target_count)   (join pairs)
+    unmatched_source = sum(source_count where target_count == 0)
+    unmatched_target = sum(target_count where source_count == 0)
+
+A run persists that key-state snapshot together with each side's watermark
+(max updated_at / rowversion). The next run only reads rows whose watermark is
+at or after the stored one, collects their keys, and re-counts exactly those
+keys on both sides, so unchanged keys are never re-read.
+
+Deletes and key updates leave stale counts on keys that no longer appear in the
+changed rows. Stale counts can only overcount, so they are detected by
+comparing the snapshot total with COUNT(*) of each table; any mismatch, a
+changed rule definition or a changed table schema triggers a full refresh
+(server-side GROUP BY on the key, still without fetching rows).
+
+Snapshots are SQLite files: the per-key counts are streamed in with fetchmany()
+and aggregated on disk, so memory stays flat however many keys a table has.
+A full refresh builds a new file and swaps it in atomically; an incremental
+update runs in one SQLite transaction. Runs of the same rule and scope are
+serialized with a lock file.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from filelock import FileLock
+
+from kg_builder.config import (
+    RECON_FETCH_BATCH_SIZE,
+    RECON_INCREMENTAL_KEY_BATCH,
+    RECON_SNAPSHOT_LOCK_TIMEOUT_SECONDS,
+    RECON_SNAPSHOT_PATH
+)
+from kg_builder.models import ReconciliationRule
+from kg_builder.services.hash_join_reconciler import build_key
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 2
+SOURCE, TARGET = 0, 1
+COUNT_COLUMNS = ("source_count", "target_count")
+
+
+def encode_key(key: tuple) -> str:
+    """
+    Canonical text of a normalized join key (the snapshot's primary key).
+
+    Numbers are encoded by value, so 1, 1.0 and Decimal('1') read from different
+    drivers land on the same key, as they do in a Python dict.
+    """
+    parts: List[List[Any]] = []
+    for value in key:
+        if isinstance(value, bool):
+            parts.append(["b", int(value)])
+        elif isinstance(value, (int, float, Decimal)):
+            number = Decimal(repr(value)) if isinstance(value, float) else Decimal(value)
+            if number.is_finite() and number == number.to_integral_value():
+                parts.append(["n", str(int(number))])
+            else:
+                parts.append(["n", str(number.normalize())])
+        elif isinstance(value, str):
+            parts.append(["s", value])
+        elif isinstance(value, (datetime, date)):
+            parts.append(["d", value.isoformat()])
+        else:
+            parts.append(["o", repr(value)])
+    return json.dumps(parts, separators=(",", ":"))
+
+
+@dataclass
+class ReconcileSide:
+    """One side of a rule, with identifiers already quoted for its dialect."""
+    conn: Any
+    table_refs: List[str]          # Candidate table references, tried in order
+    key_columns: List[str]         # Quoted join key columns
+    key_names: List[str]           # Unquoted key column names (for sample records)
+    watermark_column: Optional[str]  # Quoted watermark column
+
+
+class KeyStateSnapshot:
+    """
+    Per-key row counts of both sides after a run, kept in an SQLite file.
+
+    Only the metadata (fingerprint, watermarks, NULL-key counts) lives in memory;
+    changes are written in a transaction that commit() makes durable.
+    """
+
+    def __init__(self, path: Path, conn: sqlite3.Connection):
+        self.path = path
+        self.conn = conn
+        self.fingerprint = ""
+        self.null_counts: List[int] = [0, 0]     # rows with a NULL key part
+        self.watermarks: List[Any] = [None, None]
+        self.created_at = datetime.utcnow().isoformat()
+
+    @classmethod
+    def create(cls, path: Path, fingerprint: str) -> "KeyStateSnapshot":
+        """Create an empty snapshot file (replacing any file at `path`)."""
+        if path.exists():
+            path.unlink()
+        conn = sqlite3.connect(str(path))
+        conn.execute("CREATE TABLE meta (name TEXT PRIMARY KEY, value BLOB)")
+        conn.execute(
+            "CREATE TABLE key_counts (key TEXT PRIMARY KEY, key_value BLOB NOT NULL, "
+            "source_count INTEGER NOT NULL DEFAULT 0, target_count INTEGER NOT NULL DEFAULT 0)"
+        )
+        snapshot = cls(path, conn)
+        snapshot.fingerprint = fingerprint
+        return snapshot
+
+    @classmethod
+    def open(cls, path: Path) -> Optional["KeyStateSnapshot"]:
+        """Open an existing snapshot file, or None if it is missing, unreadable or outdated."""
+        if not path.exists():
+            return None
+        conn = None
+        try:
+            conn = sqlite3.connect(str(path))
+            meta = {name: pickle.loads(value) for name, value in conn.execute("SELECT name, value FROM meta")}
+            if meta.get("version") != SNAPSHOT_VERSION:
+                conn.close()
+                return None
+            snapshot = cls(path, conn)
+            snapshot.fingerprint = meta["fingerprint"]
+            snapshot.null_counts = list(meta["null_counts"])
+            snapshot.watermarks = list(meta["watermarks"])
+            snapshot.created_at = meta["created_at"]
+            return snapshot
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable snapshot {path}: {e}")
+            if conn is not None:
+                conn.close()
+            return None
+
+    def write_meta(self):
+        """Stage the metadata in the current transaction."""
+        meta = {
+            "version": SNAPSHOT_VERSION,
+            "fingerprint": self.fingerprint,
+            "null_counts": self.null_counts,
+            "watermarks": self.watermarks,
+            "created_at": self.created_at
+        }
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+            [(name, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)) for name, value in meta.items()]
+        )
+
+    def add_counts(self, side: int, counts: Iterable[Tuple[tuple, int]]):
+        """Add row counts of one side (keys may repeat)."""
+        column = COUNT_COLUMNS[side]
+        self.conn.executemany(
+            f"INSERT INTO key_counts (key, key_value, {column}) VALUES (?, ?, ?) "
+            f"ON CONFLICT(key) DO UPDATE SET {column} = {column} + excluded.{column}",
+            [(encode_key(key), pickle.dumps(key), count) for key, count in counts]
+        )
+
+    def set_counts(self, side: int, counts: Iterable[Tuple[tuple, int]]):
+        """Replace the row counts of one side for the given keys."""
+        column = COUNT_COLUMNS[side]
+        self.conn.executemany(
+            f"INSERT INTO key_counts (key, key_value, {column}) VALUES (?, ?, ?) "
+            f"ON CONFLICT(key) DO UPDATE SET {column} = excluded.{column}",
+            [(encode_key(key), pickle.dumps(key), count) for key, count in counts]
+        )
+
+    def prune(self):
+        """Drop keys that no longer have rows on either side."""
+        self.conn.execute("DELETE FROM key_counts WHERE source_count = 0 AND target_count = 0")
+
+    def row_count(self, side: int) -> int:
+        column = COUNT_COLUMNS[side]
+        total = self.conn.execute(f"SELECT COALESCE(SUM({column}), 0) FROM key_counts").fetchone()[0]
+        return int(total) + self.null_counts[side]
+
+    def totals(self) -> Tuple[int, int, int]:
+        """(matched pairs, source-only rows, target-only rows) over the non-NULL keys."""
+        matched, source_only, target_only = self.conn.execute(
+            "SELECT "
+            "COALESCE(SUM(CASE WHEN source_count > 0 AND target_count > 0 "
+            "THEN source_count * target_count ELSE 0 END), 0), "
+            "COALESCE(SUM(CASE WHEN target_count = 0 THEN source_count ELSE 0 END), 0), "
+            "COALESCE(SUM(CASE WHEN source_count = 0 THEN target_count ELSE 0 END), 0) "
+            "FROM key_counts"
+        ).fetchone()
+        return int(matched), int(source_only), int(target_only)
+
+    def sample(self, where: str, limit: int) -> List[tuple]:
+        """Keys of the first `limit` entries matching a condition on the count columns."""
+        rows = self.conn.execute(
+            f"SELECT key_value FROM key_counts WHERE {where} ORDER BY key LIMIT ?", (limit,)
+        )
+        return [pickle.loads(value) for (value,) in rows]
+
+    # Changed keys of an incremental run are collected on disk as well
+
+    def add_changed_keys(self, keys: Iterable[tuple]):
+        self.conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS changed_keys (key TEXT PRIMARY KEY, key_value BLOB NOT NULL)"
+        )
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO changed_keys (key, key_value) VALUES (?, ?)",
+            [(encode_key(key), pickle.dumps(key)) for key in keys]
+        )
+
+    def changed_key_count(self) -> int:
+        try:
+            return int(self.conn.execute("SELECT COUNT(*) FROM changed_keys").fetchone()[0])
+        except sqlite3.OperationalError:
+            return 0
+
+    def changed_key_batches(self, batch_size: int) -> Iterator[List[tuple]]:
+        """Changed keys in batches of at most `batch_size`, ordered by key."""
+        last = ""
+        while True:
+            rows = self.conn.execute(
+                "SELECT key, key_value FROM changed_keys WHERE key > ? ORDER BY key LIMIT ?",
+                (last, batch_size)
+            ).fetchall()
+            if not rows:
+                return
+            last = rows[-1][0]
+            yield [pickle.loads(value) for _, value in rows]
+
+    def commit(self):
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+
+    def close(self):
+        self.conn.close()
+
+
+@dataclass
+class IncrementalResult:
+    """Totals and bounded key samples of an incremental run."""
+    matched_count: int = 0
+    unmatched_source_count: int = 0
+    unmatched_target_count: int = 0
+    matched_sample: List[tuple] = field(default_factory=list)
+    unmatched_source_sample: List[tuple] = field(default_factory=list)
+    unmatched_target_sample: List[tuple] = field(default_factory=list)
+    refresh: str = "incremental"          # "incremental" or "full"
+    refresh_reason: Optional[str] = None
+    changed_rows: List[int] = field(default_factory=lambda: [0, 0])
+    changed_keys: int = 0
+    queries: List[str] = field(default_factory=list)
+
+
+class IncrementalReconciler:
+    """Maintains key-state snapshots and reconciles rules from the rows changed since the last run."""
+
+    def __init__(
+        self,
+        snapshot_dir: Optional[Path] = None,
+        key_batch_size: Optional[int] = None,
+        fetch_batch_size: Optional[int] = None,
+        lock_timeout_seconds: Optional[float] = None
+    ):
+        """
+        Initialize the reconciler.
+
+        Args:
+            snapshot_dir: Directory for snapshot files (default: RECON_SNAPSHOT_PATH)
+            key_batch_size: Keys per recount query (default: RECON_INCREMENTAL_KEY_BATCH)
+            fetch_batch_size: Rows per fetchmany() (default: RECON_FETCH_BATCH_SIZE)
+            lock_timeout_seconds: How long a run waits for another run of the same
+                rule and scope (default: RECON_SNAPSHOT_LOCK_TIMEOUT_SECONDS)
+        """
+        self.snapshot_dir = Path(snapshot_dir or RECON_SNAPSHOT_PATH)
+        self.key_batch_size = max(1, key_batch_size or RECON_INCREMENTAL_KEY_BATCH)
+        self.fetch_batch_size = max(1, fetch_batch_size or RECON_FETCH_BATCH_SIZE)
+        self.lock_timeout_seconds = (
+            RECON_SNAPSHOT_LOCK_TIMEOUT_SECONDS if lock_timeout_seconds is None else lock_timeout_seconds
+        )
+
+    @staticmethod
+    def supports(rule: ReconciliationRule) -> bool:
+        """Incremental execution needs a watermark and a plain column-equality join."""
+        return bool(rule.watermark_column) and not rule.transformation and not rule.is_multi_table()
+
+    # ------------------------------------------------------------------ snapshots
+
+    def _snapshot_path(self, scope: str, rule: ReconciliationRule) -> Path:
+        digest = hashlib.sha256(f"{scope}|{rule.rule_id}".encode("utf-8")).hexdigest()[:32]
+        return self.snapshot_dir / f"{rule.rule_id}_{digest}.snapshot.db"
+
+    def _lock(self, path: Path) -> FileLock:
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        return FileLock(str(path) + ".lock", timeout=self.lock_timeout_seconds)
+
+    def load_snapshot(self, scope: str, rule: ReconciliationRule) -> Optional[KeyStateSnapshot]:
+        """Open the previous snapshot of a rule (the caller closes it), or None if there is none."""
+        return KeyStateSnapshot.open(self._snapshot_path(scope, rule))
+
+    def invalidate(self, scope: str, rule: ReconciliationRule) -> bool:
+        """Delete a rule's snapshot so the next run does a full refresh."""
+        path = self._snapshot_path(scope, rule)
+        with self._lock(path):
+            if path.exists():
+                path.unlink()
+                return True
+        return False
+
+    # ------------------------------------------------------------------ SQL helpers
+
+    @staticmethod
+    def _execute(cursor: Any, side: ReconcileSide, build_sql: Callable[[str], str],
+                 params: Optional[Sequence[Any]] = None) -> str:
+        """Execute against the first table reference that works (schema prefix fallback)."""
+        last_error = None
+        for table_ref in side.table_refs:
+            sql = build_sql(table_ref)
+            try:
+                if params:
+                    cursor.execute(sql, list(params))
+                else:
+                    cursor.execute(sql)
+                return sql
+            except Exception as e:
+                last_error = e
+                logger.debug(f"Query on {table_ref} failed: {e}")
+        raise last_error
+
+    def _table_columns(self, side: ReconcileSide) -> List[str]:
+        cursor = side.conn.cursor()
+        try:
+            self._execute(cursor, side, lambda ref: f"SELECT * FROM {ref} WHERE 1=0")
+            return [desc[0].lower() for desc in cursor.description]
+        finally:
+            cursor.close()
+
+    def _fingerprint(self, rule: ReconciliationRule, sides: Tuple[ReconcileSide, ReconcileSide]) -> str:
+        parts = [
+            rule.source_schema, rule.source_table, ",".join(rule.source_columns),
+            rule.target_schema, rule.target_table, ",".join(rule.target_columns),
+            rule.watermark_column or "", rule.get_target_watermark_column() or "",
+            "|".join(",".join(self._table_columns(side)) for side in sides)
+        ]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def _count_rows(self, side: ReconcileSide, queries: List[str]) -> int:
+        cursor = side.conn.cursor()
+        try:
+            queries.append(self._execute(cursor, side, lambda ref: f"SELECT COUNT(*) FROM {ref}"))
+            row = cursor.fetchone()
+            return int(row[0]) if row else 0
+        finally:
+            cursor.close()
+
+    # ------------------------------------------------------------------ refresh paths
+
+    def _full_refresh(self, path: Path, sides: Tuple[ReconcileSide, ReconcileSide], fingerprint: str,
+                      queries: List[str]) -> KeyStateSnapshot:
+        """
+        Rebuild the snapshot with one GROUP BY per side (rows are aggregated server-side).
+
+        Groups are streamed into a new file, which replaces the old one only when complete.
+        """
+        tmp_path = path.with_name(path.name + ".tmp")
+        snapshot = KeyStateSnapshot.create(tmp_path, fingerprint)
+        try:
+            for index, side in enumerate(sides):
+                keys = ", ".join(side.key_columns)
+                watermark = f", MAX({side.watermark_column})" if side.watermark_column else ""
+                cursor = side.conn.cursor()
+                try:
+                    queries.append(self._execute(
+                        cursor, side,
+                        lambda ref: f"SELECT {keys}, COUNT(*){watermark} FROM {ref} GROUP BY {keys}"
+                    ))
+                    key_positions = list(range(len(side.key_columns)))
+                    count_pos = len(side.key_columns)
+                    max_watermark = None
+                    while True:
+                        batch = cursor.fetchmany(self.fetch_batch_size)
+                        if not batch:
+                            break
+                        counts = []
+                        for row in batch:
+                            key = build_key(row, key_positions)
+                            count = int(row[count_pos])
+                            if key is None:
+                                snapshot.null_counts[index] += count
+                            else:
+                                counts.append((key, count))
+                            if watermark and row[count_pos + 1] is not None:
+                                if max_watermark is None or row[count_pos + 1] > max_watermark:
+                                    max_watermark = row[count_pos + 1]
+                        snapshot.add_counts(index, counts)
+                    snapshot.watermarks[index] = max_watermark
+                finally:
+                    cursor.close()
+            snapshot.write_meta()
+            snapshot.commit()
+        finally:
+            snapshot.close()
+
+        os.replace(tmp_path, path)
+        return KeyStateSnapshot.open(path)
+
+    def _fetch_changed_keys(self, side: ReconcileSide, since: Any, snapshot: KeyStateSnapshot,
+                            queries: List[str]) -> Tuple[int, bool, Any]:
+        """Collect changed keys into the snapshot; returns (changed row count, any NULL key changed, new max watermark)."""
+        keys = ", ".join(side.key_columns)
+        wm = side.watermark_column
+        cursor = side.conn.cursor()
+        try:
+            # >= so rows committed later with the boundary watermark are not missed;
+            # recounting a key twice is harmless
+            queries.append(self._execute(
+                cursor, side, lambda ref: f"SELECT {keys}, {wm} FROM {ref} WHERE {wm} >= ?", [since]
+            ))
+            key_positions = list(range(len(side.key_columns)))
+            wm_pos = len(side.key_columns)
+            rows = 0
+            null_changed = False
+            max_watermark = since
+            while True:
+                batch = cursor.fetchmany(self.fetch_batch_size)
+                if not batch:
+                    break
+                changed = []
+                for row in batch:
+                    rows += 1
+                    key = build_key(row, key_positions)
+                    if key is None:
+                        null_changed = True
+                    else:
+                        changed.append(key)
+                    if row[wm_pos] is not None and row[wm_pos] > max_watermark:
+                        max_watermark = row[wm_pos]
+                snapshot.add_changed_keys(changed)
+            return rows, null_changed, max_watermark
+        finally:
+            cursor.close()
+
+    def _recount_keys(self, side: ReconcileSide, keys: List[tuple], queries: List[str],
+                      log_query: bool = True) -> Dict[tuple, int]:
+        """Exact row counts for the given keys (batched IN / OR-of-AND predicates)."""
+        counts: Dict[tuple, int] = {}
+        key_sql = ", ".join(side.key_columns)
+        key_positions = list(range(len(side.key_columns)))
+        cursor = side.conn.cursor()
+        try:
+            for start in range(0, len(keys), self.key_batch_size):
+                batch = keys[start:start + self.key_batch_size]
+                if len(side.key_columns) == 1:
+                    predicate = f"{side.key_columns[0]} IN ({', '.join('?' for _ in batch)})"
+                else:
+                    one_key = "(" + " AND ".join(f"{col} = ?" for col in side.key_columns) + ")"
+                    predicate = " OR ".join(one_key for _ in batch)
+                params = [value for key in batch for value in key]
+                sql = self._execute(
+                    cursor, side,
+                    lambda ref: f"SELECT {key_sql}, COUNT(*) FROM {ref} WHERE {predicate} GROUP BY {key_sql}",
+                    params
+                )
+                if start == 0 and log_query:
+                    queries.append(sql)
+                for row in cursor.fetchall():
+                    key = build_key(row, key_positions)
+                    if key is not None:
+                        counts[key] = counts.get(key, 0) + int(row[len(side.key_columns)])
+            return counts
+        finally:
+            cursor.close()
+
+    def _count_null_keys(self, side: ReconcileSide, queries: List[str]) -> int:
+        predicate = " OR ".join(f"{col} IS NULL" for col in side.key_columns)
+        cursor = side.conn.cursor()
+        try:
+            queries.append(self._execute(
+                cursor, side, lambda ref: f"SELECT COUNT(*) FROM {ref} WHERE {predicate}"
+            ))
+            row = cursor.fetchone()
+            return int(row[0]) if row else 0
+        finally:
+            cursor.close()
+
+    # ------------------------------------------------------------------ entry point
+
+    def reconcile(
+        self,
+        rule: ReconciliationRule,
+        source: ReconcileSide,
+        target: ReconcileSide,
+        scope: str,
+        sample_limit: int = 100,
+        force_full: bool = False
+    ) -> IncrementalResult:
+        """
+        Reconcile a rule incrementally and update its snapshot.
+
+        Args:
+            rule: Rule with watermark_column set
+            source: Source side
+            target: Target side
+            scope: Identity of the databases/ruleset the snapshot belongs to
+            sample_limit: Maximum keys kept per sample category
+            force_full: Ignore the existing snapshot
+
+        Returns:
+            IncrementalResult with the same totals a full run would report
+        """
+        start = time.time()
+        sides = (source, target)
+        result = IncrementalResult()
+        fingerprint = self._fingerprint(rule, sides)
+        path = self._snapshot_path(scope, rule)
+
+        with self._lock(path):
+            snapshot = None if force_full else KeyStateSnapshot.open(path)
+            try:
+                reason = None
+                if force_full:
+                    reason = "forced"
+                elif snapshot is None:
+                    reason = "no previous snapshot"
+                elif snapshot.fingerprint != fingerprint:
+                    reason = "rule or table schema changed"
+                elif None in snapshot.watermarks:
+                    reason = "no previous watermark"
+
+                if reason is None:
+                    reason = self._apply_changes(snapshot, sides, result)
+
+                if reason is not None:
+                    logger.info(f"Full refresh of incremental snapshot for rule {rule.rule_name}: {reason}")
+                    if snapshot is not None:
+                        snapshot.rollback()
+                        snapshot.close()
+                        snapshot = None
+                    result.refresh = "full"
+                    result.refresh_reason = reason
+                    snapshot = self._full_refresh(path, sides, fingerprint, result.queries)
+
+                self._summarize(snapshot, result, sample_limit)
+                snapshot.created_at = datetime.utcnow().isoformat()
+                snapshot.write_meta()
+                snapshot.commit()
+            except Exception:
+                if snapshot is not None:
+                    snapshot.rollback()
+                raise
+            finally:
+                if snapshot is not None:
+                    snapshot.close()
+
+        logger.info(
+            f"Incremental rule {rule.rule_name} ({result.refresh}): {result.changed_keys} changed keys, "
+            f"{result.matched_count} matched, {result.unmatched_source_count} source-only, "
+            f"{result.unmatched_target_count} target-only in {(time.time() - start) * 1000:.1f}ms"
+        )
+        return result
+
+    def _apply_changes(
+        self,
+        snapshot: KeyStateSnapshot,
+        sides: Tuple[ReconcileSide, ReconcileSide],
+        result: IncrementalResult
+    ) -> Optional[str]:
+        """
+        Recount the keys changed since the snapshot's watermarks (uncommitted).
+
+        Returns:
+            Reason for a full refresh, or None when the snapshot is up to date
+        """
+        null_changed = [False, False]
+        new_watermarks = list(snapshot.watermarks)
+        for index, side in enumerate(sides):
+            result.changed_rows[index], null_changed[index], new_watermarks[index] = self._fetch_changed_keys(
+                side, snapshot.watermarks[index], snapshot, result.queries
+            )
+
+        # Changed keys are recounted on both sides: a changed source row can
+        # change the match state of target rows with the same key
+        first = True
+        for keys in snapshot.changed_key_batches(self.key_batch_size):
+            for index, side in enumerate(sides):
+                fresh = self._recount_keys(side, keys, result.queries, log_query=first)
+                snapshot.set_counts(index, [(key, fresh.get(key, 0)) for key in keys])
+            first = False
+        for index, side in enumerate(sides):
+            if null_changed[index]:
+                snapshot.null_counts[index] = self._count_null_keys(side, result.queries)
+        snapshot.prune()
+        snapshot.watermarks = new_watermarks
+        result.changed_keys = snapshot.changed_key_count()
+
+        # Deletes and key changes leave overcounted keys behind
+        for index, side in enumerate(sides):
+            actual = self._count_rows(side, result.queries)
+            if actual != snapshot.row_count(index):
+                return (
+                    f"{'source' if index == SOURCE else 'target'} row count changed outside "
+                    f"the watermark ({snapshot.row_count(index)} in snapshot, {actual} in table)"
+                )
+        return None
+
+    @staticmethod
+    def _summarize(snapshot: KeyStateSnapshot, result: IncrementalResult, sample_limit: int):
+        matched, source_only, target_only = snapshot.totals()
+        result.matched_count = matched
+        result.unmatched_source_count = source_only + snapshot.null_counts[SOURCE]
+        result.unmatched_target_count = target_only + snapshot.null_counts[TARGET]
+        result.matched_sample = snapshot.sample("source_count > 0 AND target_count > 0", sample_limit)
+        result.unmatched_source_sample = snapshot.sample("source_count > 0 AND target_count = 0", sample_limit)
+        result.unmatched_target_sample = snapshot.sample("source_count = 0 AND target_count > 0", sample_limit)
+
+
+# Singleton instance
+_incremental_reconciler: Optional[IncrementalReconciler] = None
+
+
+def get_incremental_reconciler() -> IncrementalReconciler:
+    """Get or create the incremental reconciler singleton."""
+    global _incremental_reconciler
+    if _incremental_reconciler is None:
+        _incremental_reconciler = IncrementalReconciler()
+    return _incremental_reconciler
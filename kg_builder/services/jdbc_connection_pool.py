@@ -0,0 +1,676 @@
+"""
+Shared JDBC connection pool for every JayDeBeApi call site.
+
+Connections are pooled per connection identity (database, user and password)
+with a minimum and maximum size. Borrowed connections are validated before they
+are handed out and rolled back (autocommit restored) when returned; idle
+connections beyond the minimum are evicted after JDBC_POOL_IDLE_TIMEOUT_SECONDS
+by a background sweep, and the borrowing thread is attached to the JVM.
+
+Callers get a PooledConnection: a drop-in replacement for the JayDeBeApi
+connection whose close() returns the connection to the pool, so existing
+`conn.close()` calls keep working unchanged. On connections opened with
+autocommit off (PostgreSQL) a failing statement rolls the transaction back at
+once, so the fallbacks and retries that reuse the connection keep working.
+
+The JDBC URL, driver class and driver JAR lookups used by all services live
+here too; JAR paths are globbed once per database type. URLs and driver
+properties carry fetch-size hints (JDBC_FETCH_SIZE) so large result sets are
+streamed in big batches instead of row by row (MySQL) or all at once (PostgreSQL).
+
+With JDBC_GATEWAY_ENABLED the manager hands out connections borrowed inside the
+out-of-process JDBC gateway instead (see jdbc_gateway), so this process never
+starts a JVM.
+"""
+
+import glob
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+try:
+    import jaydebeapi
+    JAYDEBEAPI_AVAILABLE = True
+except ImportError:
+    JAYDEBEAPI_AVAILABLE = False
+
+from kg_builder.config import (
+    JDBC_DRIVERS_PATH,
+    JDBC_FETCH_SIZE,
+    JDBC_GATEWAY_ENABLED,
+    JDBC_GATEWAY_SOCKET,
+    JDBC_POOL_ACQUIRE_TIMEOUT_SECONDS,
+    JDBC_POOL_ENABLED,
+    JDBC_POOL_EVICTION_INTERVAL_SECONDS,
+    JDBC_POOL_IDLE_TIMEOUT_SECONDS,
+    JDBC_POOL_MAX_SIZE,
+    JDBC_POOL_MIN_SIZE,
+    JDBC_POOL_VALIDATION_TIMEOUT_SECONDS
+)
+from kg_builder.models import DatabaseConnectionInfo
+
+logger = logging.getLogger(__name__)
+
+JDBC_DRIVER_CLASSES = {
+    "oracle": "oracle.jdbc.OracleDriver",
+    "sqlserver": "com.microsoft.sqlserver.jdbc.SQLServerDriver",
+    "mssql": "com.microsoft.sqlserver.jdbc.SQLServerDriver",
+    "postgresql": "org.postgresql.Driver",
+    "postgres": "org.postgresql.Driver",
+    "mysql": "com.mysql.cj.jdbc.Driver"
+}
+
+JDBC_JAR_PATTERNS = {
+    "oracle": "ojdbc*.jar",
+    "sqlserver": "mssql-jdbc*.jar",
+    "mssql": "mssql-jdbc*.jar",
+    "postgresql": "postgresql*.jar",
+    "postgres": "postgresql*.jar",
+    "mysql": "mysql-connector*.jar"
+}
+
+# Driver properties passed with the credentials
+JDBC_DRIVER_PROPERTIES = {
+    "oracle": {"defaultRowPrefetch": str(JDBC_FETCH_SIZE)}
+}
+
+# Fallback validation when the driver connection has no isValid()
+VALIDATION_QUERIES = {
+    "oracle": "SELECT 1 FROM DUAL"
+}
+
+_driver_jars: Dict[Tuple[str, str], str] = {}
+_driver_jars_lock = threading.Lock()
+
+
+def attach_thread_to_jvm():
+    """Attach the current thread to the JVM (JDBC calls from unattached threads can crash JPype)."""
+    try:
+        import jpype
+        if jpype.isJVMStarted() and not jpype.isThreadAttachedToJVM():
+            jpype.attachThreadToJVM()
+    except ImportError:
+        pass
+
+
+def build_jdbc_url(db_config: DatabaseConnectionInfo) -> str:
+    """Build JDBC URL based on database type."""
+    db_type = db_config.db_type.lower()
+
+    if db_type == "oracle":
+        if db_config.service_name:
+            return f"jdbc:oracle:thin:@{db_config.host}:{db_config.port}/{db_config.service_name}"
+        return f"jdbc:oracle:thin:@{db_config.host}:{db_config.port}:{db_config.database}"
+
+    elif db_type == "sqlserver" or db_type == "mssql":
+        return f"jdbc:sqlserver://{db_config.host}:{db_config.port};databaseName={db_config.database};encrypt=true;trustServerCertificate=true"
+
+    elif db_type == "postgresql" or db_type == "postgres":
+        # defaultRowFetchSize: stream with a cursor instead of buffering the whole result
+        # (the driver only does so inside a transaction: connections are opened with
+        # autocommit off, see _open_jdbc_connection)
+        return f"jdbc:postgresql://{db_config.host}:{db_config.port}/{db_config.database}?defaultRowFetchSize={JDBC_FETCH_SIZE}"
+
+    elif db_type == "mysql":
+        # connectTimeout: time to establish connection (60s)
+        # socketTimeout: time to wait for data from server (120s for complex joins)
+        # useCursorFetch + defaultFetchSize: server-side cursor read in JDBC_FETCH_SIZE batches
+        return (
+            f"jdbc:mysql://{db_config.host}:{db_config.port}/{db_config.database}"
+            f"?connectTimeout=60000&socketTimeout=120000&autoReconnect=true"
+            f"&useCursorFetch=true&defaultFetchSize={JDBC_FETCH_SIZE}"
+        )
+
+    else:
+        raise ValueError(f"Unsupported database type: {db_config.db_type}")
+
+
+def get_driver_class(db_type: str) -> str:
+    """Get JDBC driver class name for database type."""
+    db_type = db_type.lower()
+    if db_type not in JDBC_DRIVER_CLASSES:
+        raise ValueError(f"Unknown database type: {db_type}")
+    return JDBC_DRIVER_CLASSES[db_type]
+
+
+def get_driver_jar(db_type: str, drivers_path: Optional[str] = None) -> str:
+    """
+    Get path to the JDBC driver JAR of a database type (globbed once, then cached).
+
+    Args:
+        db_type: Database type
+        drivers_path: Directory holding the driver JARs (default: JDBC_DRIVERS_PATH)
+
+    Returns:
+        Path of the first matching JAR
+
+    Raises:
+        ValueError: If the type is unknown or no JAR matches
+    """
+    drivers_path = str(drivers_path or JDBC_DRIVERS_PATH)
+    db_type = db_type.lower()
+    if db_type not in JDBC_JAR_PATTERNS:
+        raise ValueError(f"Unknown database type: {db_type}")
+
+    key = (drivers_path, db_type)
+    with _driver_jars_lock:
+        if key in _driver_jars:
+            return _driver_jars[key]
+
+    if not drivers_path or not os.path.isdir(drivers_path):
+        raise ValueError(f"JDBC drivers path not configured or doesn't exist: {drivers_path}")
+
+    pattern = os.path.join(drivers_path, JDBC_JAR_PATTERNS[db_type])
+    jars = sorted(glob.glob(pattern))
+    if not jars:
+        raise ValueError(f"JDBC driver not found for {db_type}. Expected pattern: {pattern}")
+
+    with _driver_jars_lock:
+        _driver_jars[key] = jars[0]
+    return jars[0]
+
+
+class PooledConnection:
+    """
+    Connection borrowed from a JDBCConnectionPool.
+
+    Behaves like the underlying DB-API connection; close() hands it back to the
+    pool instead of closing it.
+    """
+
+    def __init__(self, pool: "JDBCConnectionPool", raw: Any):
+        self._pool = pool
+        self._raw = raw
+        self._released = False
+
+    @property
+    def raw(self) -> Any:
+        """Underlying JayDeBeApi connection."""
+        return self._raw
+
+    def cursor(self) -> Any:
+        if self._released:
+            raise RuntimeError("Connection was returned to the pool")
+        cursor = self._raw.cursor()
+        if self._pool.opened_in_transaction(self._raw):
+            return RollbackOnErrorCursor(cursor, self._raw)
+        return cursor
+
+    def close(self):
+        """Return the connection to the pool (idempotent)."""
+        if not self._released:
+            self._released = True
+            self._pool.release(self._raw)
+
+    def invalidate(self):
+        """Close the connection for good instead of returning it (e.g. after a fatal driver error)."""
+        if not self._released:
+            self._released = True
+            self._pool.release(self._raw, broken=True)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._raw, name)
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RollbackOnErrorCursor:
+    """
+    Cursor of a connection with autocommit off that rolls back when a statement fails.
+
+    PostgreSQL rejects every statement of a failed transaction until it is rolled
+    back; rolling back right away lets the caller retry or fall back on the same
+    connection. Everything else is delegated to the wrapped cursor.
+    """
+
+    def __init__(self, cursor: Any, conn: Any):
+        self._cursor = cursor
+        self._conn = conn
+
+    def execute(self, operation: str, parameters: Any = None) -> Any:
+        try:
+            if parameters is None:
+                return self._cursor.execute(operation)
+            return self._cursor.execute(operation, parameters)
+        except Exception:
+            self._rollback()
+            raise
+
+    def executemany(self, operation: str, seq_of_parameters: Any) -> Any:
+        try:
+            return self._cursor.executemany(operation, seq_of_parameters)
+        except Exception:
+            self._rollback()
+            raise
+
+    def _rollback(self):
+        try:
+            self._conn.rollback()
+        except Exception as e:
+            logger.debug(f"Rollback after failed statement failed: {e}")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+
+class JDBCConnectionPool:
+    """Bounded pool of connections to one database identity."""
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        min_size: int = JDBC_POOL_MIN_SIZE,
+        max_size: int = JDBC_POOL_MAX_SIZE,
+        idle_timeout: float = JDBC_POOL_IDLE_TIMEOUT_SECONDS,
+        validation_timeout: int = JDBC_POOL_VALIDATION_TIMEOUT_SECONDS,
+        validation_query: str = "SELECT 1"
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            name: Display name (DatabaseConnectionInfo.connection_key(), no password)
+            factory: Opens a new raw connection
+            min_size: Idle connections kept open regardless of idle_timeout
+            max_size: Maximum open connections (borrowers wait beyond that)
+            idle_timeout: Seconds an idle connection above min_size stays open
+            validation_timeout: Seconds allowed for the validation on borrow
+            validation_query: Query used when the driver connection has no isValid()
+        """
+        self.name = name
+        self.factory = factory
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.idle_timeout = idle_timeout
+        self.validation_timeout = validation_timeout
+        self.validation_query = validation_query
+
+        self._idle: Deque[Tuple[Any, float]] = deque()  # (connection, returned_at), most recent last
+        self._autocommit: Dict[int, bool] = {}  # Autocommit mode of each open connection when it was opened
+        self._open = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._counters = {
+            "borrowed": 0,
+            "created": 0,
+            "reused": 0,
+            "validation_failures": 0,
+            "reset_failures": 0,
+            "evicted": 0,
+            "waits": 0,
+            "timeouts": 0
+        }
+
+    def acquire(self, timeout: float = JDBC_POOL_ACQUIRE_TIMEOUT_SECONDS) -> PooledConnection:
+        """
+        Borrow a validated connection, opening one if the pool is below max_size.
+
+        Raises:
+            TimeoutError: If no connection became available within `timeout`
+        """
+        attach_thread_to_jvm()
+        deadline = time.time() + timeout
+
+        while True:
+            raw = None
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError(f"Connection pool {self.name} is closed")
+                self._evict_idle_locked()
+                if self._idle:
+                    raw, _ = self._idle.pop()
+                elif self._open < self.max_size:
+                    self._open += 1
+                else:
+                    self._counters["waits"] += 1
+                    remaining = deadline - time.time()
+                    if remaining <= 0 or not self._condition.wait(remaining):
+                        self._counters["timeouts"] += 1
+                        raise TimeoutError(
+                            f"No connection to {self.name} available within {timeout}s "
+                            f"(max_size={self.max_size})"
+                        )
+                    continue
+
+            if raw is not None:
+                if self._validate(raw):
+                    with self._condition:
+                        self._counters["borrowed"] += 1
+                        self._counters["reused"] += 1
+                    return PooledConnection(self, raw)
+                with self._condition:
+                    self._counters["validation_failures"] += 1
+                self._discard(raw)
+                continue
+
+            try:
+                raw = self.factory()
+            except Exception:
+                with self._condition:
+                    self._open -= 1
+                    self._condition.notify()
+                raise
+            self._remember(raw)
+            with self._condition:
+                self._counters["borrowed"] += 1
+                self._counters["created"] += 1
+            return PooledConnection(self, raw)
+
+    def release(self, raw: Any, broken: bool = False):
+        """
+        Return a borrowed connection, rolled back to the state it was opened in.
+
+        Broken connections, connections that cannot be reset and any returned
+        after close_all are closed.
+        """
+        if not broken and not self._reset(raw):
+            broken = True
+            with self._condition:
+                self._counters["reset_failures"] += 1
+        with self._condition:
+            keep = not broken and not self._closed
+            if keep:
+                self._idle.append((raw, time.time()))
+                self._condition.notify()
+        if not keep:
+            self._discard(raw)
+
+    def warm_up(self):
+        """Open connections until min_size are idle."""
+        while True:
+            with self._condition:
+                if self._closed or self._open >= self.min_size:
+                    return
+                self._open += 1
+            try:
+                raw = self.factory()
+            except Exception as e:
+                with self._condition:
+                    self._open -= 1
+                logger.warning(f"Could not pre-open connection to {self.name}: {e}")
+                return
+            self._remember(raw)
+            with self._condition:
+                self._counters["created"] += 1
+            self.release(raw)
+
+    def evict_idle(self) -> int:
+        """Close idle connections above min_size that exceeded idle_timeout."""
+        with self._condition:
+            return self._evict_idle_locked()
+
+    def opened_in_transaction(self, raw: Any) -> bool:
+        """Whether a connection was opened with autocommit off (its statements run in a transaction)."""
+        with self._condition:
+            return self._autocommit.get(id(raw)) is False
+
+    def close_all(self):
+        """Close idle connections now; borrowed ones are closed when returned."""
+        with self._condition:
+            self._closed = True
+            idle = [raw for raw, _ in self._idle]
+            self._idle.clear()
+            self._condition.notify_all()
+        for raw in idle:
+            self._discard(raw)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size and usage counters."""
+        with self._condition:
+            return {
+                "pool": self.name,
+                "open": self._open,
+                "idle": len(self._idle),
+                "in_use": self._open - len(self._idle),
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                **self._counters
+            }
+
+    def _evict_idle_locked(self) -> int:
+        now = time.time()
+        evicted = []
+        # Oldest idle connections sit at the left of the deque
+        while self._idle and self._open - len(evicted) > self.min_size:
+            raw, returned_at = self._idle[0]
+            if now - returned_at < self.idle_timeout:
+                break
+            self._idle.popleft()
+            self._autocommit.pop(id(raw), None)
+            evicted.append(raw)
+        if evicted:
+            self._open -= len(evicted)
+            self._counters["evicted"] += len(evicted)
+            self._condition.notify(len(evicted))
+        for raw in evicted:
+            self._close_quietly(raw)
+        return len(evicted)
+
+    def _validate(self, raw: Any) -> bool:
+        try:
+            jconn = getattr(raw, "jconn", None)
+            if jconn is not None:
+                return bool(jconn.isValid(self.validation_timeout))
+            cursor = raw.cursor()
+            try:
+                cursor.execute(self.validation_query)
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception as e:
+            logger.info(f"Discarding invalid pooled connection to {self.name}: {e}")
+            return False
+
+    def _remember(self, raw: Any):
+        """Record the autocommit mode a new connection was opened with (restored on release)."""
+        jconn = getattr(raw, "jconn", None)
+        if jconn is None:
+            return
+        try:
+            autocommit = bool(jconn.getAutoCommit())
+        except Exception as e:
+            logger.debug(f"Could not read autocommit mode of {self.name}: {e}")
+            return
+        with self._condition:
+            self._autocommit[id(raw)] = autocommit
+
+    def _reset(self, raw: Any) -> bool:
+        """Roll back unfinished work and restore the connection's original autocommit mode."""
+        try:
+            jconn = getattr(raw, "jconn", None)
+            if jconn is None:
+                raw.rollback()
+                return True
+            with self._condition:
+                autocommit = self._autocommit.get(id(raw), True)
+            if not jconn.getAutoCommit():
+                jconn.rollback()
+            if bool(jconn.getAutoCommit()) != autocommit:
+                jconn.setAutoCommit(autocommit)
+            return True
+        except Exception as e:
+            logger.info(f"Discarding pooled connection to {self.name} that could not be reset: {e}")
+            return False
+
+    def _discard(self, raw: Any):
+        self._close_quietly(raw)
+        with self._condition:
+            self._autocommit.pop(id(raw), None)
+            self._open -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def _close_quietly(raw: Any):
+        try:
+            raw.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection: {e}")
+
+
+class JDBCConnectionManager:
+    """Registry of connection pools keyed by connection identity."""
+
+    def __init__(
+        self,
+        enabled: bool = JDBC_POOL_ENABLED,
+        gateway_socket: Optional[str] = None,
+        eviction_interval: float = JDBC_POOL_EVICTION_INTERVAL_SECONDS
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            enabled: Pool connections (False: every connect() opens a fresh connection
+                whose close() really closes it)
+            gateway_socket: Unix socket of a JDBC gateway; when set, connections are
+                borrowed inside the gateway process and pools live there
+            eviction_interval: Seconds between background sweeps for expired idle
+                connections, started with the first pool (0: only on acquire and /health)
+        """
+        self.enabled = enabled
+        self.gateway_socket = gateway_socket
+        self.eviction_interval = eviction_interval
+        self._pools: Dict[Tuple[str, str, str], JDBCConnectionPool] = {}
+        self._lock = threading.Lock()
+        self._eviction_stop: Optional[threading.Event] = None
+
+    def connect(
+        self,
+        db_config: DatabaseConnectionInfo,
+        timeout: float = JDBC_POOL_ACQUIRE_TIMEOUT_SECONDS
+    ) -> Any:
+        """
+        Borrow a connection to a database.
+
+        Args:
+            db_config: Database connection configuration
+            timeout: Seconds to wait for a free connection when the pool is exhausted
+
+        Returns:
+            PooledConnection (a plain JayDeBeApi connection when pooling is disabled,
+            a GatewayConnection when a gateway is configured)
+        """
+        if self.gateway_socket:
+            from kg_builder.services.jdbc_gateway import GatewayConnection
+            return GatewayConnection(db_config, self.gateway_socket, timeout)
+        if not self.enabled:
+            attach_thread_to_jvm()
+            return _open_jdbc_connection(db_config)
+        return self.pool_for(db_config).acquire(timeout)
+
+    def pool_for(self, db_config: DatabaseConnectionInfo) -> JDBCConnectionPool:
+        """Pool of a connection identity, created on first use."""
+        jdbc_url = build_jdbc_url(db_config)
+        key = (jdbc_url, db_config.username, db_config.password)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = JDBCConnectionPool(
+                    name=db_config.connection_key(),
+                    factory=lambda: _open_jdbc_connection(db_config),
+                    validation_query=VALIDATION_QUERIES.get(db_config.db_type.lower(), "SELECT 1")
+                )
+                self._pools[key] = pool
+                created = True
+                self._start_eviction_locked()
+            else:
+                created = False
+        if created:
+            pool.warm_up()
+        return pool
+
+    def _start_eviction_locked(self):
+        """Start the background idle sweep (once, until close_all)."""
+        if self.eviction_interval <= 0 or self._eviction_stop is not None:
+            return
+        stop = self._eviction_stop = threading.Event()
+
+        def sweep():
+            while not stop.wait(self.eviction_interval):
+                try:
+                    evicted = self.evict_idle()
+                    if evicted:
+                        logger.debug(f"Evicted {evicted} idle JDBC connections")
+                except Exception as e:
+                    logger.warning(f"Idle JDBC connection eviction failed: {e}")
+
+        threading.Thread(target=sweep, name="jdbc-pool-evictor", daemon=True).start()
+
+    def evict_idle(self) -> int:
+        """Evict expired idle connections of every pool (the gateway evicts its own)."""
+        with self._lock:
+            pools = list(self._pools.values())
+        return sum(pool.evict_idle() for pool in pools)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Statistics of every pool (the gateway's pools when a gateway is configured)."""
+        if self.gateway_socket:
+            from kg_builder.services.jdbc_gateway import gateway_stats
+            try:
+                return gateway_stats(self.gateway_socket)
+            except Exception as e:
+                logger.warning(f"JDBC gateway statistics unavailable: {e}")
+                return []
+        with self._lock:
+            pools = list(self._pools.values())
+        return [pool.stats() for pool in pools]
+
+    def close_all(self):
+        """Close and forget every pool and stop the idle sweep."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+            if self._eviction_stop is not None:
+                self._eviction_stop.set()
+                self._eviction_stop = None
+        for pool in pools:
+            pool.close_all()
+
+
+def _open_jdbc_connection(db_config: DatabaseConnectionInfo) -> Any:
+    """Open a new JayDeBeApi connection."""
+    if not JAYDEBEAPI_AVAILABLE:
+        raise RuntimeError("JayDeBeApi is not installed. Please install it with: pip install JayDeBeApi")
+
+    jdbc_url = build_jdbc_url(db_config)
+    driver_class = get_driver_class(db_config.db_type)
+    driver_jar = get_driver_jar(db_config.db_type)
+
+    logger.debug(f"Connecting to {jdbc_url} with driver {driver_class}")
+    properties = JDBC_DRIVER_PROPERTIES.get(db_config.db_type.lower())
+    if properties:
+        driver_args = {"user": db_config.username, "password": db_config.password, **properties}
+    else:
+        driver_args = [db_config.username, db_config.password]
+    conn = jaydebeapi.connect(driver_class, jdbc_url, driver_args, driver_jar)
+    if db_config.db_type.lower() in ("postgresql", "postgres"):
+        # pgjdbc ignores defaultRowFetchSize in autocommit mode and buffers whole results
+        # (pooled cursors roll back failed statements, see RollbackOnErrorCursor)
+        conn.jconn.setAutoCommit(False)
+    logger.debug("Database connection established")
+    return conn
+
+
+# Singleton instance
+_connection_manager: Optional[JDBCConnectionManager] = None
+_connection_manager_lock = threading.Lock()
+
+
+def get_connection_manager() -> JDBCConnectionManager:
+    """Get or create the singleton JDBC connection manager."""
+    global _connection_manager
+    with _connection_manager_lock:
+        if _connection_manager is None:
+            _connection_manager = JDBCConnectionManager(
+                gateway_socket=JDBC_GATEWAY_SOCKET if JDBC_GATEWAY_ENABLED else None
+            )
+        return _connection_manager
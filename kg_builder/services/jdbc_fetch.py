@@ -0,0 +1,240 @@
+"""
+Columnar bulk fetch from JDBC result sets.
+
+JayDeBeApi's fetchone()/fetchall() make several Java calls per cell: the column
+count per row, the column type per cell, then getObject() and an unboxing call.
+This module reads a JayDeBeApi cursor's ResultSet directly: the column types
+are resolved once per result set into one typed getter per column (getLong /
+getDouble / getString with a wasNull() check only on zero or empty values, and
+getBigDecimal for whole numbers wider than a long), and
+rows are read in large batches into per-column lists (Arrow-style column
+buffers, convertible to NumPy arrays when NumPy is installed).
+
+The ResultSet fetch size is raised to JDBC_FETCH_SIZE so drivers transfer rows
+in large network batches; the connection URLs carry the matching driver hints
+(see jdbc_connection_pool.build_jdbc_url).
+
+Cursors that are not JayDeBeApi cursors (other DB-API drivers, tests) are read
+with fetchmany() and transposed, so callers can use one code path.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from kg_builder.config import JDBC_COLUMNAR_FETCH, JDBC_FETCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Whole-number DECIMALs up to this precision fit in a Java long (getLong)
+_LONG_DECIMAL_PRECISION = 18
+
+# java.sql.Types constants (stable across JDBC versions)
+_INTEGER_TYPES = {-6, 5, 4, -5}          # TINYINT, SMALLINT, INTEGER, BIGINT
+_FLOAT_TYPES = {6, 7, 8}                 # FLOAT, REAL, DOUBLE
+_DECIMAL_TYPES = {2, 3}                  # NUMERIC, DECIMAL
+_STRING_TYPES = {1, 12, -1, -15, -9, -16}  # CHAR, VARCHAR, LONGVARCHAR, NCHAR, NVARCHAR, LONGNVARCHAR
+
+Getter = Callable[[Any, int], Any]
+
+
+@dataclass
+class ColumnBatch:
+    """A batch of rows stored column by column."""
+    names: List[str]
+    types: List[Any]                                   # JDBC type codes (cursor.description[i][1])
+    columns: List[List[Any]] = field(default_factory=list)
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def rows(self) -> List[tuple]:
+        """Row tuples, as cursor.fetchall() would return them."""
+        return list(zip(*self.columns)) if self.columns else []
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Rows as dictionaries keyed by column name."""
+        return [dict(zip(self.names, row)) for row in zip(*self.columns)] if self.columns else []
+
+    def column(self, name: str) -> List[Any]:
+        """Values of one column (case-insensitive name)."""
+        lookup = {col.lower(): i for i, col in enumerate(self.names)}
+        return self.columns[lookup[name.lower()]]
+
+    def extend(self, other: "ColumnBatch"):
+        """Append the rows of another batch with the same columns."""
+        if not self.columns:
+            self.columns = [list(values) for values in other.columns]
+            return
+        for values, more in zip(self.columns, other.columns):
+            values.extend(more)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Columns as NumPy arrays (object dtype where values are mixed or nullable)."""
+        try:
+            import numpy as np
+        except ImportError:
+            raise RuntimeError("NumPy is not installed. Please install it with: pip install numpy")
+        arrays = {}
+        for name, values in zip(self.names, self.columns):
+            if values and None not in values:
+                arrays[name] = np.asarray(values)
+            else:
+                arrays[name] = np.asarray(values, dtype=object)
+        return arrays
+
+
+def _is_jdbc_cursor(cursor: Any) -> bool:
+    return getattr(cursor, "_rs", None) is not None and getattr(cursor, "_meta", None) is not None
+
+
+def _integer_getter(rs: Any, col: int) -> Optional[int]:
+    value = rs.getLong(col)
+    if value == 0 and rs.wasNull():
+        return None
+    return int(value)
+
+
+def _big_integer_getter(rs: Any, col: int) -> Optional[int]:
+    value = rs.getBigDecimal(col)
+    return None if value is None else int(str(value.toPlainString()))
+
+
+def _float_getter(rs: Any, col: int) -> Optional[float]:
+    value = rs.getDouble(col)
+    if value == 0 and rs.wasNull():
+        return None
+    return float(value)
+
+
+def _string_getter(rs: Any, col: int) -> Optional[str]:
+    value = rs.getString(col)
+    return None if value is None else str(value)
+
+
+def _column_getters(cursor: Any) -> List[Getter]:
+    """One getter per column, resolved from the result set metadata once."""
+    import jaydebeapi
+
+    meta = cursor._meta
+    getters = []
+    for col in range(1, meta.getColumnCount() + 1):
+        sql_type = meta.getColumnType(col)
+        if sql_type in _INTEGER_TYPES:
+            getters.append(_integer_getter)
+        elif sql_type in _FLOAT_TYPES:
+            getters.append(_float_getter)
+        elif sql_type in _DECIMAL_TYPES and meta.getPrecision(col) > 0 and meta.getScale(col) >= 0:
+            # Whole numbers as exact ints (getLong would overflow beyond 18 digits, e.g.
+            # NUMBER(38,0)); fractional ones as float, as JayDeBeApi converts DECIMAL
+            if meta.getScale(col) > 0:
+                getters.append(_float_getter)
+            elif meta.getPrecision(col) <= _LONG_DECIMAL_PRECISION:
+                getters.append(_integer_getter)
+            else:
+                getters.append(_big_integer_getter)
+        elif sql_type in _STRING_TYPES:
+            getters.append(_string_getter)
+        else:
+            getters.append((cursor._converters or {}).get(sql_type, jaydebeapi._unknownSqlTypeConverter))
+    return getters
+
+
+def apply_fetch_size(cursor: Any, fetch_size: int = JDBC_FETCH_SIZE):
+    """Ask the driver to transfer rows of an executed query in batches of `fetch_size`."""
+    rs = getattr(cursor, "_rs", None)
+    if rs is None or fetch_size <= 0:
+        return
+    try:
+        rs.setFetchSize(fetch_size)
+    except Exception as e:
+        logger.debug(f"Driver ignored fetch size hint: {e}")
+
+
+def fetch_batches(
+    cursor: Any,
+    batch_size: int = JDBC_FETCH_SIZE,
+    max_rows: Optional[int] = None
+) -> Iterator[ColumnBatch]:
+    """
+    Read an executed cursor in column batches.
+
+    Args:
+        cursor: Cursor after execute()
+        batch_size: Rows per batch
+        max_rows: Stop after this many rows (None: read everything)
+
+    Yields:
+        ColumnBatch per batch (never empty)
+    """
+    description = cursor.description or []
+    names = [desc[0] for desc in description]
+    types = [desc[1] for desc in description]
+    if not names:
+        return
+    batch_size = max(1, batch_size)
+
+    if JDBC_COLUMNAR_FETCH and _is_jdbc_cursor(cursor):
+        rs = cursor._rs
+        apply_fetch_size(cursor, batch_size)
+        getters = list(enumerate(_column_getters(cursor), start=1))
+        remaining = max_rows
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            columns = [[] for _ in getters]
+            appenders = [values.append for values in columns]
+            readers = [(append, getter, col) for append, (col, getter) in zip(appenders, getters)]
+            count = 0
+            while count < size and rs.next():
+                for append, getter, col in readers:
+                    append(getter(rs, col))
+                count += 1
+            if count == 0:
+                return
+            if remaining is not None:
+                remaining -= count
+            yield ColumnBatch(names, types, columns)
+            if count < size:
+                return
+        return
+
+    # Generic DB-API cursor: fetch rows and transpose
+    remaining = max_rows
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        rows = cursor.fetchmany(size)
+        if not rows:
+            return
+        if remaining is not None:
+            remaining -= len(rows)
+        yield ColumnBatch(names, types, [list(values) for values in zip(*rows)])
+        if len(rows) < size:
+            return
+
+
+def fetch_columns(cursor: Any, batch_size: int = JDBC_FETCH_SIZE, max_rows: Optional[int] = None) -> ColumnBatch:
+    """Read all rows of an executed cursor into one ColumnBatch."""
+    description = cursor.description or []
+    result = ColumnBatch([desc[0] for desc in description], [desc[1] for desc in description])
+    for batch in fetch_batches(cursor, batch_size, max_rows):
+        result.extend(batch)
+    if not result.columns:
+        result.columns = [[] for _ in result.names]
+    return result
+
+
+def fetch_rows(cursor: Any, batch_size: int = JDBC_FETCH_SIZE, max_rows: Optional[int] = None) -> List[tuple]:
+    """Drop-in replacement for cursor.fetchall() using the columnar fetch."""
+    rows: List[tuple] = []
+    for batch in fetch_batches(cursor, batch_size, max_rows):
+        rows.extend(batch.rows())
+    return rows
+
+
+def fetch_records(cursor: Any, batch_size: int = JDBC_FETCH_SIZE, max_rows: Optional[int] = None) -> List[Dict[str, Any]]:
+    """All rows of an executed cursor as dictionaries keyed by column name."""
+    records: List[Dict[str, Any]] = []
+    for batch in fetch_batches(cursor, batch_size, max_rows):
+        records.extend(batch.records())
+    return records
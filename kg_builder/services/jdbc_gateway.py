@@ -0,0 +1,552 @@
+"""
+Out-of-process JDBC gateway.
+
+Every API worker that opens a JayDeBeApi connection boots its own JVM through
+JPype (hundreds of MB and seconds of cold start per worker). The gateway is one
+local process that owns the JVM and the shared connection pools; API workers
+talk to it over a Unix socket and never start a JVM themselves.
+
+Run it next to the API workers and point them at its socket:
+
+    python -m kg_builder.services.jdbc_gateway --socket /tmp/kg_builder_jdbc_gateway.sock
+    JDBC_GATEWAY_ENABLED=true uvicorn kg_builder.main:app --workers 4
+
+With JDBC_GATEWAY_ENABLED, get_connection_manager().connect() returns a
+GatewayConnection (a DB-API connection proxy), so every `_connect_to_database`
+helper switches to the gateway without changes. /health reports the gateway's
+pool statistics.
+
+Protocol: each message is a 4-byte big-endian length followed by a JSON
+object. One client socket is one borrowed connection. Query results travel in
+batches of JDBC_FETCH_SIZE rows, column by column (see jdbc_fetch); a column of
+dates, decimals or bytes carries one codec tag for the whole column instead of
+one per value.
+"""
+
+import argparse
+import base64
+import datetime
+import json
+import logging
+import os
+import socket
+import socketserver
+import struct
+import threading
+from collections import deque
+from decimal import Decimal
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from kg_builder.config import (
+    JDBC_FETCH_SIZE,
+    JDBC_GATEWAY_SOCKET,
+    JDBC_POOL_ACQUIRE_TIMEOUT_SECONDS,
+    JDBC_POOL_IDLE_TIMEOUT_SECONDS
+)
+from kg_builder.models import DatabaseConnectionInfo
+from kg_builder.services.jdbc_connection_pool import JDBCConnectionManager, attach_thread_to_jvm
+from kg_builder.services.jdbc_fetch import fetch_batches
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct(">I")
+_MAX_FRAME_BYTES = 1 << 30
+
+# Values JSON carries natively
+_JSON_TYPES = (bool, int, float, str)
+
+# codec name -> (python type, encode, decode); looked up by exact type (datetime is a date subclass)
+_CODECS: Dict[str, Tuple[type, Callable[[Any], Any], Callable[[Any], Any]]] = {
+    "datetime": (datetime.datetime, datetime.datetime.isoformat, datetime.datetime.fromisoformat),
+    "date": (datetime.date, datetime.date.isoformat, datetime.date.fromisoformat),
+    "time": (datetime.time, datetime.time.isoformat, datetime.time.fromisoformat),
+    "decimal": (Decimal, str, Decimal),
+    "bytes": (bytes, lambda v: base64.b64encode(v).decode("ascii"), base64.b64decode),
+}
+_CODEC_BY_TYPE = {python_type: name for name, (python_type, _, _) in _CODECS.items()}
+
+
+class JDBCGatewayError(Exception):
+    """Error reported by the JDBC gateway (or the gateway is unreachable)."""
+
+
+def encode_value(value: Any) -> Any:
+    """Encode one value for the wire ([codec, payload] for non-JSON types)."""
+    if value is None or type(value) in _JSON_TYPES:
+        return value
+    if isinstance(value, bytearray):
+        value = bytes(value)
+    codec = _CODEC_BY_TYPE.get(type(value))
+    if codec is None:
+        # Java objects without a Python conversion: send their string form
+        return str(value)
+    return [codec, _CODECS[codec][1](value)]
+
+
+def decode_value(value: Any) -> Any:
+    """Inverse of encode_value()."""
+    if isinstance(value, list):
+        codec, payload = value
+        return _CODECS[codec][2](payload)
+    return value
+
+
+def encode_column(values: List[Any]) -> Any:
+    """
+    Encode one column of a batch.
+
+    JSON-native columns are sent as plain lists; a column whose values share one
+    codec is sent as {"codec": name, "values": [...]}; anything else is tagged
+    per value.
+    """
+    kinds = {type(value) for value in values if value is not None}
+    if all(kind in _JSON_TYPES for kind in kinds):
+        return values
+    if len(kinds) == 1:
+        codec = _CODEC_BY_TYPE.get(kinds.pop())
+        if codec is not None:
+            encode = _CODECS[codec][1]
+            return {"codec": codec, "values": [None if v is None else encode(v) for v in values]}
+    return {"codec": "mixed", "values": [encode_value(value) for value in values]}
+
+
+def decode_column(column: Any) -> List[Any]:
+    """Inverse of encode_column()."""
+    if isinstance(column, list):
+        return column
+    if column["codec"] == "mixed":
+        return [decode_value(value) for value in column["values"]]
+    decode = _CODECS[column["codec"]][2]
+    return [None if v is None else decode(v) for v in column["values"]]
+
+
+def send_frame(sock: socket.socket, message: Dict[str, Any]):
+    """Send one length-prefixed JSON message."""
+    payload = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def recv_frame(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """Receive one message (None when the peer closed the socket)."""
+    header = _recv_exactly(sock, _HEADER.size)
+    if header is None:
+        return None
+    (length,) = _HEADER.unpack(header)
+    if length > _MAX_FRAME_BYTES:
+        raise JDBCGatewayError(f"Gateway frame too large: {length} bytes")
+    payload = _recv_exactly(sock, length)
+    if payload is None:
+        raise JDBCGatewayError("Gateway connection closed mid-frame")
+    return json.loads(payload.decode("utf-8"))
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> Optional[bytes]:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(min(remaining, 1 << 20))
+        if not chunk:
+            if remaining == size:
+                return None
+            raise JDBCGatewayError("Gateway connection closed mid-frame")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _describe(cursor: Any) -> Optional[List[List[Any]]]:
+    """cursor.description with JSON-safe type codes (java.sql.Types ints for JDBC cursors) and sizes."""
+    if not cursor.description:
+        return None
+    meta = getattr(cursor, "_meta", None)
+    description = []
+    for index, desc in enumerate(cursor.description):
+        type_code = desc[1]
+        if meta is not None:
+            type_code = int(meta.getColumnType(index + 1))
+        elif type_code is not None and type(type_code) not in _JSON_TYPES:
+            type_code = str(type_code)
+        sizes = [int(value) if isinstance(value, int) else None for value in list(desc[2:7]) + [None] * 5][:5]
+        description.append([desc[0], type_code, *sizes])
+    return description
+
+
+class _GatewaySession(socketserver.BaseRequestHandler):
+    """One client socket: one borrowed connection and its cursors."""
+
+    server: "_GatewaySocketServer"
+
+    def setup(self):
+        self.conn: Any = None
+        self.cursors: Dict[int, Any] = {}
+        self.next_cursor_id = 1
+
+    def handle(self):
+        attach_thread_to_jvm()
+        while True:
+            try:
+                request = recv_frame(self.request)
+            except (OSError, JDBCGatewayError) as e:
+                logger.debug(f"Gateway client disconnected: {e}")
+                return
+            if request is None:
+                return
+            try:
+                response = {"ok": True, **self._dispatch(request)}
+            except Exception as e:
+                response = {"ok": False, "error": str(e), "error_type": type(e).__name__}
+            try:
+                send_frame(self.request, response)
+            except OSError as e:
+                logger.debug(f"Gateway client went away: {e}")
+                return
+            if request.get("op") == "close":
+                return
+
+    def finish(self):
+        for cursor in self.cursors.values():
+            self._close_quietly(cursor)
+        self.cursors.clear()
+        if self.conn is not None:
+            self._close_quietly(self.conn)
+            self.conn = None
+
+    def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        if op == "stats":
+            return {"pools": self.server.manager.stats()}
+        if op == "connect":
+            if self.conn is not None:
+                raise JDBCGatewayError("Session already holds a connection")
+            config = DatabaseConnectionInfo(**request["config"])
+            self.conn = self.server.manager.connect(
+                config, request.get("timeout", JDBC_POOL_ACQUIRE_TIMEOUT_SECONDS)
+            )
+            return {}
+        if self.conn is None:
+            raise JDBCGatewayError(f"'{op}' before 'connect'")
+
+        if op == "cursor":
+            cursor_id = self.next_cursor_id
+            self.next_cursor_id += 1
+            self.cursors[cursor_id] = self.conn.cursor()
+            return {"cursor": cursor_id}
+        if op in ("execute", "executemany"):
+            cursor = self._cursor(request)
+            if op == "execute":
+                params = request.get("params")
+                if params is None:
+                    cursor.execute(request["sql"])
+                else:
+                    cursor.execute(request["sql"], [decode_value(value) for value in params])
+            else:
+                cursor.executemany(
+                    request["sql"],
+                    [[decode_value(value) for value in params] for params in request["params"]]
+                )
+            return {"description": _describe(cursor), "rowcount": getattr(cursor, "rowcount", -1)}
+        if op == "fetch":
+            cursor = self._cursor(request)
+            size = max(1, int(request.get("size") or self.server.batch_size))
+            batch = next(fetch_batches(cursor, size, max_rows=size), None)
+            if batch is None:
+                return {"columns": None, "rows": 0}
+            return {"columns": [encode_column(values) for values in batch.columns], "rows": batch.num_rows}
+        if op == "close_cursor":
+            cursor = self.cursors.pop(request["cursor"], None)
+            if cursor is not None:
+                self._close_quietly(cursor)
+            return {}
+        if op == "commit":
+            self.conn.commit()
+            return {}
+        if op == "rollback":
+            self.conn.rollback()
+            return {}
+        if op == "close":
+            self.finish()
+            return {}
+        raise JDBCGatewayError(f"Unknown gateway operation: {op}")
+
+    def _cursor(self, request: Dict[str, Any]) -> Any:
+        cursor = self.cursors.get(request.get("cursor"))
+        if cursor is None:
+            raise JDBCGatewayError(f"Unknown cursor: {request.get('cursor')}")
+        return cursor
+
+    @staticmethod
+    def _close_quietly(resource: Any):
+        try:
+            resource.close()
+        except Exception as e:
+            logger.debug(f"Error closing gateway resource: {e}")
+
+
+class _GatewaySocketServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, manager: Any, batch_size: int):
+        self.manager = manager
+        self.batch_size = batch_size
+        super().__init__(socket_path, _GatewaySession)
+
+
+class JDBCGatewayServer:
+    """Gateway process side: serves pooled JDBC connections over a Unix socket."""
+
+    def __init__(
+        self,
+        socket_path: str = JDBC_GATEWAY_SOCKET,
+        manager: Optional[Any] = None,
+        batch_size: int = JDBC_FETCH_SIZE,
+        eviction_interval: float = JDBC_POOL_IDLE_TIMEOUT_SECONDS
+    ):
+        """
+        Initialize the gateway.
+
+        Args:
+            socket_path: Unix socket to listen on (created with mode 0600)
+            manager: Connection manager the sessions borrow from (default: a local
+                JDBCConnectionManager; never the gateway-routed singleton)
+            batch_size: Rows per fetch batch when the client does not ask for a size
+            eviction_interval: Seconds between idle-connection evictions
+        """
+        self.socket_path = socket_path
+        self.manager = manager if manager is not None else JDBCConnectionManager()
+        self.batch_size = batch_size
+        self.eviction_interval = eviction_interval
+        self._server: Optional[_GatewaySocketServer] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> "JDBCGatewayServer":
+        """Bind the socket and serve in background threads."""
+        self._remove_stale_socket()
+        self._server = _GatewaySocketServer(self.socket_path, self.manager, self.batch_size)
+        os.chmod(self.socket_path, 0o600)
+        threading.Thread(target=self._server.serve_forever, name="jdbc-gateway", daemon=True).start()
+        threading.Thread(target=self._evict_idle_loop, name="jdbc-gateway-evictor", daemon=True).start()
+        logger.info(f"JDBC gateway listening on {self.socket_path}")
+        return self
+
+    def serve_forever(self):
+        """Start and block until shutdown()."""
+        self.start()
+        self._stopped.wait()
+
+    def shutdown(self):
+        """Stop serving, close every pool and remove the socket."""
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        self.manager.close_all()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def _evict_idle_loop(self):
+        while not self._stopped.wait(self.eviction_interval):
+            try:
+                self.manager.evict_idle()
+            except Exception as e:
+                logger.warning(f"JDBC gateway idle eviction failed: {e}")
+
+    def _remove_stale_socket(self):
+        if not os.path.exists(self.socket_path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            os.unlink(self.socket_path)
+            return
+        finally:
+            probe.close()
+        raise JDBCGatewayError(f"A JDBC gateway is already listening on {self.socket_path}")
+
+
+class GatewayCursor:
+    """DB-API cursor proxy whose rows are read from the gateway in column batches."""
+
+    def __init__(self, connection: "GatewayConnection", cursor_id: int):
+        self._connection = connection
+        self._cursor_id = cursor_id
+        self._rows: Deque[tuple] = deque()
+        self._exhausted = True
+        self.description: Optional[List[tuple]] = None
+        self.rowcount = -1
+        self.arraysize = 1
+
+    def execute(self, sql: str, parameters: Optional[Any] = None):
+        params = None if parameters is None else [encode_value(value) for value in parameters]
+        self._after_execute(self._connection._call("execute", cursor=self._cursor_id, sql=sql, params=params))
+
+    def executemany(self, sql: str, seq_of_parameters: Any):
+        params = [[encode_value(value) for value in parameters] for parameters in seq_of_parameters]
+        self._after_execute(self._connection._call("executemany", cursor=self._cursor_id, sql=sql, params=params))
+
+    def fetchone(self) -> Optional[tuple]:
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+
+    def fetchmany(self, size: Optional[int] = None) -> List[tuple]:
+        size = size or self.arraysize
+        while len(self._rows) < size and self._fetch_batch(max(size, self._connection.batch_size)):
+            pass
+        return [self._rows.popleft() for _ in range(min(size, len(self._rows)))]
+
+    def fetchall(self) -> List[tuple]:
+        while self._fetch_batch(self._connection.batch_size):
+            pass
+        rows = list(self._rows)
+        self._rows.clear()
+        return rows
+
+    def close(self):
+        if self._cursor_id is not None:
+            if not self._connection.closed:
+                self._connection._call("close_cursor", cursor=self._cursor_id)
+            self._cursor_id = None
+            self._rows.clear()
+
+    def _after_execute(self, response: Dict[str, Any]):
+        self._rows.clear()
+        description = response.get("description")
+        self.description = [tuple(desc) for desc in description] if description else None
+        self.rowcount = response.get("rowcount", -1)
+        self._exhausted = self.description is None
+
+    def _fetch_batch(self, size: int) -> bool:
+        if self._exhausted:
+            return False
+        response = self._connection._call("fetch", cursor=self._cursor_id, size=size)
+        if not response["columns"]:
+            self._exhausted = True
+            return False
+        columns = [decode_column(column) for column in response["columns"]]
+        self._rows.extend(zip(*columns))
+        if response["rows"] < size:
+            self._exhausted = True
+        return True
+
+
+class GatewayConnection:
+    """
+    DB-API connection proxy backed by a connection borrowed inside the gateway.
+
+    close() ends the session, which returns the connection to the gateway's pool.
+    """
+
+    def __init__(
+        self,
+        db_config: DatabaseConnectionInfo,
+        socket_path: str = JDBC_GATEWAY_SOCKET,
+        timeout: float = JDBC_POOL_ACQUIRE_TIMEOUT_SECONDS,
+        batch_size: int = JDBC_FETCH_SIZE
+    ):
+        """
+        Open a gateway session and borrow a connection.
+
+        Args:
+            db_config: Database connection configuration
+            socket_path: Gateway Unix socket
+            timeout: Seconds the gateway waits for a free pooled connection
+            batch_size: Rows per fetch round trip
+
+        Raises:
+            JDBCGatewayError: If the gateway is unreachable or cannot connect
+        """
+        self.batch_size = batch_size
+        self.closed = False
+        self._lock = threading.Lock()
+        self._sock = _open_socket(socket_path)
+        try:
+            self._call("connect", config=db_config.model_dump(), timeout=timeout)
+        except Exception:
+            self._sock.close()
+            self.closed = True
+            raise
+
+    def cursor(self) -> GatewayCursor:
+        return GatewayCursor(self, self._call("cursor")["cursor"])
+
+    def commit(self):
+        self._call("commit")
+
+    def rollback(self):
+        self._call("rollback")
+
+    def close(self):
+        """End the session (idempotent)."""
+        if self.closed:
+            return
+        try:
+            self._call("close")
+        except (OSError, JDBCGatewayError) as e:
+            logger.debug(f"Error closing gateway session: {e}")
+        finally:
+            self.closed = True
+            self._sock.close()
+
+    def __enter__(self) -> "GatewayConnection":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _call(self, op: str, **args) -> Dict[str, Any]:
+        if self.closed:
+            raise JDBCGatewayError("Gateway connection is closed")
+        with self._lock:
+            send_frame(self._sock, {"op": op, **args})
+            response = recv_frame(self._sock)
+        return _check(response)
+
+
+def _open_socket(socket_path: str) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError as e:
+        sock.close()
+        raise JDBCGatewayError(f"JDBC gateway not reachable at {socket_path}: {e}")
+    return sock
+
+
+def _check(response: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if response is None:
+        raise JDBCGatewayError("JDBC gateway closed the connection")
+    if not response.get("ok"):
+        raise JDBCGatewayError(f"{response.get('error_type')}: {response.get('error')}")
+    return response
+
+
+def gateway_stats(socket_path: str = JDBC_GATEWAY_SOCKET) -> List[Dict[str, Any]]:
+    """Pool statistics of the gateway process."""
+    sock = _open_socket(socket_path)
+    try:
+        send_frame(sock, {"op": "stats"})
+        return _check(recv_frame(sock))["pools"]
+    finally:
+        sock.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the gateway in the foreground."""
+    parser = argparse.ArgumentParser(description="JDBC gateway: one JVM and connection pool for all API workers")
+    parser.add_argument("--socket", default=JDBC_GATEWAY_SOCKET, help="Unix socket path")
+    parser.add_argument("--batch-size", type=int, default=JDBC_FETCH_SIZE, help="Rows per fetch batch")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    server = JDBCGatewayServer(args.socket, batch_size=args.batch_size)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
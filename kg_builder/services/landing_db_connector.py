@@ -2,12 +2,21 @@
 Landing Database Connector for MySQL.
 
 Handles connection management, pooling, and health checks for the landing database.
+Each thread gets its own connection (pymysql connections are not thread-safe), so
+concurrent extractions can load staging tables in parallel.
+
+The connector also owns the backend-specific SQL of the staging tables (DDL,
+size and index introspection). Other backends subclass LandingDBConnector
+(see landing_postgres_connector and the embedded landing_sqlite_connector);
+create_landing_connector() picks the class for LANDING_DB_TYPE.
 """
 import logging
+import threading
 import pymysql
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List
 from contextlib import contextmanager
 from kg_builder.models import DatabaseConnectionInfo
+from kg_builder.services.rule_plan_compiler import canonical_dialect, quote_identifier
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +24,10 @@ logger = logging.getLogger(__name__)
 class LandingDBConnector:
     """MySQL connector for landing database with connection pooling."""
 
+    db_type = "mysql"
+    index_build_workers = 1  # ALTER TABLE adds all indexes of a table in one pass
+    per_execution_database = False  # Embedded backends give each execution its own database
+
     def __init__(self, db_config: DatabaseConnectionInfo):
         """
         Initialize landing database connector.
@@ -22,13 +35,25 @@ class LandingDBConnector:
         Args:
             db_config: Database connection information
         """
-        if db_config.db_type.lower() != "mysql":
-            raise ValueError(f"Unsupported landing database type: {db_config.db_type}. Only MySQL is supported.")
+        if canonical_dialect(db_config.db_type) != self.db_type:
+            raise ValueError(
+                f"Unsupported landing database type for {type(self).__name__}: {db_config.db_type}. "
+                f"Use create_landing_connector() to pick the connector."
+            )
 
         self.db_config = db_config
-        self.connection = None
+        self._local = threading.local()
         logger.info(f"Initialized LandingDBConnector for {db_config.host}:{db_config.port}/{db_config.database}")
 
+    @property
+    def connection(self) -> Any:
+        """Connection of the calling thread (None until connected)."""
+        return getattr(self._local, "connection", None)
+
+    @connection.setter
+    def connection(self, value: Any):
+        self._local.connection = value
+
     def connect(self) -> Any:
         """
         Establish connection to MySQL landing database.
@@ -46,7 +71,8 @@ class LandingDBConnector:
                 charset='utf8mb4',
                 cursorclass=pymysql.cursors.DictCursor,
                 autocommit=False,
-                connect_timeout=30
+                connect_timeout=30,
+                local_infile=True  # Staging loads stream through LOAD DATA LOCAL INFILE
             )
             logger.info("Successfully connected to landing database")
             return self.connection
@@ -82,7 +108,7 @@ class LandingDBConnector:
             return False
 
     def close(self):
-        """Close database connection."""
+        """Close the calling thread's database connection."""
         if self.connection:
             try:
                 self.connection.close()
@@ -104,8 +130,7 @@ class LandingDBConnector:
             Database cursor
         """
         conn = self.get_connection()
-        cursor_class = pymysql.cursors.DictCursor if dictionary else pymysql.cursors.Cursor
-        cursor = conn.cursor(cursor_class)
+        cursor = self._new_cursor(conn, dictionary)
 
         try:
             yield cursor
@@ -117,6 +142,70 @@ class LandingDBConnector:
         finally:
             cursor.close()
 
+    def _new_cursor(self, conn: Any, dictionary: bool) -> Any:
+        cursor_class = pymysql.cursors.DictCursor if dictionary else pymysql.cursors.Cursor
+        return conn.cursor(cursor_class)
+
+    def quote(self, identifier: str) -> str:
+        """Quote a table or column name for the landing database."""
+        return quote_identifier(identifier, self.db_type)
+
+    def staging_table_sql(self, table_name: str, columns: List[Dict[str, Any]]) -> str:
+        """
+        CREATE TABLE statement of a staging table.
+
+        Args:
+            table_name: Staging table name
+            columns: Column definitions [{'name', 'type', 'nullable'}] (MySQL types)
+
+        Returns:
+            DDL statement
+        """
+        column_defs = []
+        for col in columns:
+            null_clause = '' if col.get('nullable', True) else 'NOT NULL'
+            column_defs.append(f"{self.quote(col['name'])} {col.get('type', 'TEXT')} {null_clause}")
+        columns_sql = ',\n    '.join(column_defs)
+
+        return f"""
+            CREATE TABLE IF NOT EXISTS {self.quote(table_name)} (
+                `_staging_id` BIGINT AUTO_INCREMENT PRIMARY KEY,
+                `_created_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                {columns_sql}
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """
+
+    def table_size_mb(self, table_name: str) -> float:
+        """Data + index size of a table in MB (0 if unknown)."""
+        result = self.execute_one("""
+            SELECT
+                ROUND((data_length + index_length) / 1024 / 1024, 2) as size_mb
+            FROM information_schema.tables
+            WHERE table_schema = %s
+            AND table_name = %s
+        """, (self.db_config.database, table_name))
+        return (result.get('size_mb') or 0) if result else 0
+
+    def table_indexes(self, table_name: str) -> List[str]:
+        """Secondary index names of a table."""
+        rows = self.execute("""
+            SELECT DISTINCT index_name
+            FROM information_schema.statistics
+            WHERE table_schema = %s
+            AND table_name = %s
+            AND index_name != 'PRIMARY'
+        """, (self.db_config.database, table_name))
+        indexes = []
+        for idx in rows or []:
+            # Handle both uppercase and lowercase column names
+            idx_name = idx.get('index_name') or idx.get('INDEX_NAME') or idx.get('Index_name')
+            if idx_name:
+                indexes.append(idx_name)
+        return indexes
+
+    def analyze_table(self, table_name: str):
+        """Refresh planner statistics after a load (InnoDB does this on its own)."""
+
     def execute(self, query: str, params: Optional[tuple] = None) -> Any:
         """
         Execute a query and return results.
@@ -238,6 +327,28 @@ class LandingDBConnector:
         self.close()
 
 
+def create_landing_connector(db_config: DatabaseConnectionInfo) -> LandingDBConnector:
+    """
+    Connector for the landing database type (mysql, postgresql or sqlite).
+
+    Args:
+        db_config: Landing database configuration
+
+    Returns:
+        LandingDBConnector (or subclass) instance
+    """
+    db_type = canonical_dialect(db_config.db_type)
+    if db_type == "mysql":
+        return LandingDBConnector(db_config)
+    if db_type == "postgresql":
+        from kg_builder.services.landing_postgres_connector import PostgresLandingConnector
+        return PostgresLandingConnector(db_config)
+    if db_type == "sqlite":
+        from kg_builder.services.landing_sqlite_connector import SQLiteLandingConnector
+        return SQLiteLandingConnector(db_config)
+    raise ValueError(f"Unsupported landing database type: {db_config.db_type}. Use mysql, postgresql or sqlite.")
+
+
 # Singleton instance
 _landing_connector: Optional[LandingDBConnector] = None
 
@@ -263,7 +374,7 @@ def get_landing_connector(db_config: Optional[DatabaseConnectionInfo] = None) ->
         return None
 
     if _landing_connector is None:
-        _landing_connector = LandingDBConnector(db_config)
+        _landing_connector = create_landing_connector(db_config)
 
     return _landing_connector
 
@@ -8,10 +8,12 @@ Integrates KPI definitions with NL query execution pipeline.
 import logging
 import time
 from typing import Any, Dict, Optional
+from kg_builder.config import RESULT_STREAM_MAX_ROWS
 from kg_builder.services.landing_kpi_service_jdbc import LandingKPIServiceJDBC
 from kg_builder.services.nl_query_classifier import get_nl_query_classifier
 from kg_builder.services.nl_query_parser import get_nl_query_parser
 from kg_builder.services.nl_query_executor import get_nl_query_executor
+from kg_builder.services.row_stream import RowStream
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +97,7 @@ class LandingKPIExecutor:
             Dictionary with execution results
         """
         start_time = time.time()
+        connection = None
 
         try:
             # Extract parameters from new payload structure
@@ -266,6 +269,7 @@ class LandingKPIExecutor:
                     'confidence_score': query_result.get('confidence_score', 1.0),
                     'error_message': query_result.get('error_message', None),
                     'result_data': query_result.get('result_data', []),
+                    'truncated': query_result.get('truncated', False),
                     'source_table': query_result.get('source_table', ''),
                     'target_table': query_result.get('target_table', '')
                 }
@@ -283,6 +287,7 @@ class LandingKPIExecutor:
                     'confidence_score': query_result.confidence,
                     'error_message': query_result.error,
                     'result_data': query_result.records,
+                    'truncated': query_result.truncated,
                     'source_table': query_result.source_table,
                     'target_table': query_result.target_table
                 }
@@ -301,6 +306,14 @@ class LandingKPIExecutor:
                 'result_data': []
             }
 
+        finally:
+            # Return the connection to the pool
+            if connection:
+                try:
+                    connection.close()
+                except Exception as e:
+                    logger.warning(f"Error releasing database connection: {e}")
+
     def _execute_cached_sql(self, cached_sql: str, connection, limit: int, definition: str, db_type: str = 'sqlserver') -> Dict[str, Any]:
         """Execute cached SQL directly without LLM generation."""
         import time
@@ -328,22 +341,14 @@ class LandingKPIExecutor:
             cursor = connection.cursor()
             cursor.execute(sql_with_limit)
 
-            # Fetch results
-            columns = [desc[0] for desc in cursor.description]
-            rows = cursor.fetchall()
-
-            # Convert to list of dictionaries
-            records = []
-            for row in rows:
-                record = {}
-                for i, value in enumerate(row):
-                    record[columns[i]] = value
-                records.append(record)
+            # Stream results as dictionaries (columnar batches, capped at RESULT_STREAM_MAX_ROWS)
+            stream = RowStream(cursor, max_rows=RESULT_STREAM_MAX_ROWS)
+            records = stream.read_records()
 
             execution_time_ms = (time.time() - start_time) * 1000
 
             logger.info(f"✅ Cached SQL executed successfully")
-            logger.info(f"   Records returned: {len(records)}")
+            logger.info(f"   Records returned: {len(records)}" + (" (truncated)" if stream.truncated else ""))
             logger.info(f"   Execution time: {execution_time_ms:.2f}ms")
 
             return {
@@ -351,6 +356,7 @@ class LandingKPIExecutor:
                 'generated_sql': cached_sql,
                 'number_of_records': len(records),
                 'result_data': records,
+                'truncated': stream.truncated,
                 'execution_time_ms': execution_time_ms,
                 'sql_query_type': 'cached_sql',
                 'operation': 'CACHED',
@@ -376,70 +382,28 @@ class LandingKPIExecutor:
 
 def _get_source_database_connection(db_type: str = 'sqlserver') -> Optional[Any]:
     """
-    Get a connection to the source database for KPI execution.
+    Borrow a connection to the source database for KPI execution from the shared JDBC pool.
 
     Args:
         db_type: Database type (sqlserver, mysql, postgresql, oracle)
 
     Returns:
-        Database connection object or None if not configured
+        Pooled database connection (close() returns it to the pool) or None if not configured
     """
     try:
-        import jaydebeapi
-        import glob
-        import os
-        from kg_builder.config import get_source_db_config, JDBC_DRIVERS_PATH
+        from kg_builder.config import get_source_db_config
+        from kg_builder.services.jdbc_connection_pool import get_connection_manager
 
         db_config = get_source_db_config()
         if not db_config:
             logger.warning("Source database is not configured")
             return None
 
-        # Build JDBC URL based on database type
-        db_type_lower = db_type.lower()
-
-        if db_type_lower == "sqlserver":
-            jdbc_url = f"jdbc:sqlserver://{db_config.host}:{db_config.port};databaseName={db_config.database};encrypt=true;trustServerCertificate=true"
-            driver_class = "com.microsoft.sqlserver.jdbc.SQLServerDriver"
-            jar_pattern = "mssql-jdbc*.jar"
-        elif db_type_lower == "mysql":
-            jdbc_url = f"jdbc:mysql://{db_config.host}:{db_config.port}/{db_config.database}?connectTimeout=60000&socketTimeout=120000&autoReconnect=true"
-            driver_class = "com.mysql.cj.jdbc.Driver"
-            jar_pattern = "mysql-connector-j*.jar"
-        elif db_type_lower == "postgresql":
-            jdbc_url = f"jdbc:postgresql://{db_config.host}:{db_config.port}/{db_config.database}"
-            driver_class = "org.postgresql.Driver"
-            jar_pattern = "postgresql-*.jar"
-        elif db_type_lower == "oracle":
-            service_name = db_config.service_name or db_config.database
-            jdbc_url = f"jdbc:oracle:thin:@{db_config.host}:{db_config.port}:{service_name}"
-            driver_class = "oracle.jdbc.driver.OracleDriver"
-            jar_pattern = "ojdbc*.jar"
-        else:
-            raise ValueError(f"Unsupported database type: {db_type}")
-
-        # Find JDBC driver JAR using proper pattern
-        driver_pattern = os.path.join(JDBC_DRIVERS_PATH, jar_pattern)
-        jars = glob.glob(driver_pattern)
-
-        if not jars:
-            logger.error(f"No JDBC driver found for {db_type} at {driver_pattern}")
-            logger.error(f"Available files in {JDBC_DRIVERS_PATH}: {os.listdir(JDBC_DRIVERS_PATH) if os.path.exists(JDBC_DRIVERS_PATH) else 'directory not found'}")
-            return None
-
-        driver_jar = jars[0]
-        logger.info(f"Using JDBC driver: {driver_jar}")
-
-        logger.info(f"Connecting to source database: {db_type} at {db_config.host}:{db_config.port}/{db_config.database}")
-
-        # Connect
-        conn = jaydebeapi.connect(
-            driver_class,
-            jdbc_url,
-            [db_config.username, db_config.password],
-            driver_jar
-        )
+        if db_type and db_type.lower() != db_config.db_type.lower():
+            db_config = db_config.model_copy(update={"db_type": db_type.lower()})
 
+        logger.info(f"Connecting to source database: {db_config.db_type} at {db_config.host}:{db_config.port}/{db_config.database}")
+        conn = get_connection_manager().connect(db_config)
         logger.info("Successfully connected to source database")
         return conn
 
@@ -5,22 +5,14 @@ Uses the existing JDBC infrastructure that's already working in the system.
 
 import logging
 from typing import Dict, List, Any, Optional
-from pathlib import Path
-import glob
-import os
-
-try:
-    import jaydebeapi
-    JAYDEBEAPI_AVAILABLE = True
-except ImportError:
-    JAYDEBEAPI_AVAILABLE = False
-    logging.warning("JayDeBeApi not installed. Database execution will not be available.")
 
 from kg_builder.config import (
     KPI_DB_HOST, KPI_DB_PORT, KPI_DB_DATABASE,
-    KPI_DB_USERNAME, KPI_DB_PASSWORD, KPI_DB_TYPE,
-    JDBC_DRIVERS_PATH
+    KPI_DB_USERNAME, KPI_DB_PASSWORD, KPI_DB_TYPE, RESULT_STREAM_MAX_ROWS
 )
+from kg_builder.models import DatabaseConnectionInfo
+from kg_builder.services.jdbc_connection_pool import get_connection_manager
+from kg_builder.services.row_stream import RowStream
 
 logger = logging.getLogger(__name__)
 
@@ -49,48 +41,28 @@ class LandingKPIServiceJDBC:
         self.username = KPI_DB_USERNAME
         self.password = KPI_DB_PASSWORD
         self.db_type = KPI_DB_TYPE
+        self.db_config = DatabaseConnectionInfo(
+            db_type=self.db_type,
+            host=self.host,
+            port=self.port,
+            database=self.database,
+            username=self.username,
+            password=self.password
+        )
 
         logger.info(f"KPI Service initialized for {self.db_type} at {self.host}:{self.port}/{self.database}")
     
     def _get_connection(self):
-        """Get JDBC database connection (same as other services use)."""
-        if not JAYDEBEAPI_AVAILABLE:
-            raise Exception("jaydebeapi is not available - cannot connect to database")
+        """Borrow a KPI database connection from the shared JDBC connection pool."""
+        if self.db_type.lower() not in ['sqlserver', 'mssql']:
+            raise ValueError(f"Unsupported database type: {self.db_type}")
 
         try:
-            # Build JDBC URL
-            if self.db_type.lower() in ['sqlserver', 'mssql']:
-                jdbc_url = f"jdbc:sqlserver://{self.host}:{self.port};databaseName={self.database};encrypt=true;trustServerCertificate=true"
-                driver_class = "com.microsoft.sqlserver.jdbc.SQLServerDriver"
-                jar_pattern = "mssql-jdbc*.jar"
-            else:
-                raise ValueError(f"Unsupported database type: {self.db_type}")
-            
-            # Find JDBC driver
-            jdbc_dir = JDBC_DRIVERS_PATH
-            pattern = os.path.join(jdbc_dir, jar_pattern)
-            jars = glob.glob(pattern)
-            
-            if not jars:
-                raise Exception(f"No JDBC driver found for {self.db_type} at {pattern}")
-            
-            driver_jar = jars[0]
-            logger.debug(f"Using JDBC driver: {driver_jar}")
-            
-            # Connect using jaydebeapi (same as other services)
-            conn = jaydebeapi.connect(
-                driver_class,
-                jdbc_url,
-                [self.username, self.password],
-                driver_jar
-            )
-            
-            return conn
-            
+            return get_connection_manager().connect(self.db_config)
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
-    
+
     def get_all_kpis(self, include_inactive: bool = False) -> List[Dict[str, Any]]:
         """Get all KPIs using JDBC connection."""
         conn = self._get_connection()
@@ -769,18 +741,9 @@ class LandingKPIServiceJDBC:
                 cursor = connection.cursor()
                 cursor.execute(sql_to_execute)
 
-                # Fetch results
-                rows = cursor.fetchall()
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
-
-                # Convert to list of dictionaries
-                records = []
-                for row in rows:
-                    record = {}
-                    for i, value in enumerate(row):
-                        if i < len(columns):
-                            record[columns[i]] = value
-                    records.append(record)
+                # Stream results as dictionaries (columnar batches, capped at RESULT_STREAM_MAX_ROWS)
+                stream = RowStream(cursor, max_rows=RESULT_STREAM_MAX_ROWS)
+                records = stream.read_records()
 
                 result = QueryResult(
                     definition=kpi['nl_definition'],
@@ -794,10 +757,12 @@ class LandingKPIServiceJDBC:
                     execution_time_ms=(time.time() - start_time) * 1000,
                     error=None,
                     source_table=None,
-                    target_table=None
+                    target_table=None,
+                    truncated=stream.truncated
                 )
 
-                logger.info(f"✅ Enhanced SQL executed successfully: {len(records)} records found")
+                logger.info(f"✅ Enhanced SQL executed successfully: {len(records)} records found"
+                            + (" (truncated)" if stream.truncated else ""))
 
             except Exception as e:
                 logger.error(f"❌ Enhanced SQL execution failed: {e}")
@@ -858,6 +823,7 @@ class LandingKPIServiceJDBC:
                 'ops_planner_added': False,
                 'confidence_score': execution_record['confidence_score'],
                 'data': result.records,
+                'truncated': result.truncated,
                 'error_message': execution_record['error_message']
             }
 
@@ -0,0 +1,294 @@
+"""
+Landing Database Connector for PostgreSQL.
+
+PostgreSQL backend of the landing database, selected with LANDING_DB_TYPE=postgresql:
+
+- staging tables are UNLOGGED (no WAL; they are rebuilt by re-extraction after
+  a crash) and use PostgreSQL types translated from the staging type mapping
+- rows are loaded with COPY FROM STDIN in CSV format, streamed batch by batch
+  from the extraction pipeline (no temp file, no server-side file access)
+- indexes are built after the load, one connection per index (see
+  StagingManager.create_indexes), then the table is analyzed
+
+Connections are per thread, as for MySQL. Requires psycopg2.
+"""
+import csv
+import io
+import logging
+from typing import Any, Dict, Iterable, Iterator, List
+
+from kg_builder import config
+from kg_builder.models import DatabaseConnectionInfo
+from kg_builder.services.landing_db_connector import LandingDBConnector
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psycopg2
+    import psycopg2.extras
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+# NULL marker of the COPY stream (same as the MySQL LOAD DATA stream)
+COPY_NULL = '\\N'
+
+
+def postgres_staging_type(mysql_type: str) -> str:
+    """
+    Translate a staging type of the (MySQL) type mapping to PostgreSQL.
+
+    Args:
+        mysql_type: e.g. 'TINYINT(1)', 'DATETIME(3)', 'DECIMAL(18,2)', 'VARBINARY(16)'
+
+    Returns:
+        PostgreSQL type
+    """
+    type_name = mysql_type.strip().upper()
+    base, _, args = type_name.partition('(')
+    args = f"({args}" if args else ''
+
+    if base == 'TINYINT':
+        return 'SMALLINT'
+    if base == 'INT':
+        return 'INTEGER'
+    if base == 'DOUBLE':
+        return 'DOUBLE PRECISION'
+    if base == 'DATETIME':
+        return f'TIMESTAMP{args}'
+    if base == 'DECIMAL':
+        return f'NUMERIC{args}'
+    if base in ('VARBINARY', 'BINARY', 'BLOB', 'MEDIUMBLOB', 'LONGBLOB'):
+        return 'BYTEA'
+    if base in ('MEDIUMTEXT', 'LONGTEXT'):
+        return 'TEXT'
+    return type_name
+
+
+def _copy_value(value: Any) -> Any:
+    """Value as written to the COPY CSV stream."""
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '\\x' + bytes(value).hex()
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    return value
+
+
+class CsvCopyStream:
+    """
+    File-like CSV view of row batches for COPY FROM STDIN.
+
+    Batches are rendered to CSV only when the driver reads, so at most one
+    rendered batch is held in memory.
+    """
+
+    def __init__(self, batches: Iterable[List[tuple]]):
+        self._batches: Iterator[List[tuple]] = iter(batches)
+        self._buffer = ''
+        self._position = 0
+        self.rows = 0
+
+    def _fill(self) -> bool:
+        batch = next(self._batches, None)
+        if batch is None:
+            return False
+        out = io.StringIO()
+        csv.writer(out, lineterminator='\n').writerows(
+            [_copy_value(value) for value in row] for row in batch
+        )
+        self._buffer = self._buffer[self._position:] + out.getvalue()
+        self._position = 0
+        self.rows += len(batch)
+        return True
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) - self._position < size:
+            if not self._fill():
+                break
+        end = len(self._buffer) if size < 0 else self._position + size
+        data = self._buffer[self._position:end]
+        self._position = min(end, len(self._buffer))
+        return data
+
+    def readline(self, size: int = -1) -> str:
+        while '\n' not in self._buffer[self._position:] and self._fill():
+            pass
+        end = self._buffer.find('\n', self._position)
+        end = len(self._buffer) if end < 0 else end + 1
+        if size >= 0:
+            end = min(end, self._position + size)
+        data = self._buffer[self._position:end]
+        self._position = end
+        return data
+
+
+class PostgresLandingConnector(LandingDBConnector):
+    """PostgreSQL connector for landing database (UNLOGGED staging tables, COPY loads)."""
+
+    db_type = "postgresql"
+    index_build_workers = config.LANDING_INDEX_BUILD_WORKERS
+
+    def __init__(self, db_config: DatabaseConnectionInfo):
+        super().__init__(db_config)
+        self.schema = db_config.schema or None
+
+    def connect(self) -> Any:
+        """
+        Establish connection to PostgreSQL landing database.
+
+        Returns:
+            psycopg2 connection object
+        """
+        if not PSYCOPG2_AVAILABLE:
+            raise RuntimeError("psycopg2 is not installed. Install with: pip install psycopg2-binary")
+        try:
+            options = f"-c search_path={self.schema},public" if self.schema else None
+            self.connection = psycopg2.connect(
+                host=self.db_config.host,
+                port=self.db_config.port,
+                user=self.db_config.username,
+                password=self.db_config.password,
+                dbname=self.db_config.database,
+                connect_timeout=30,
+                application_name="kg_builder_landing",
+                options=options
+            )
+            logger.info("Successfully connected to landing database")
+            return self.connection
+        except Exception as e:
+            logger.error(f"Failed to connect to landing database: {e}")
+            raise
+
+    def is_connected(self) -> bool:
+        """
+        Check if connection is active.
+
+        Returns:
+            True if connected, False otherwise
+        """
+        return self.connection is not None and self.connection.closed == 0
+
+    def _new_cursor(self, conn: Any, dictionary: bool) -> Any:
+        if dictionary:
+            return conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        return conn.cursor()
+
+    def staging_table_sql(self, table_name: str, columns: List[Dict[str, Any]]) -> str:
+        """CREATE [UNLOGGED] TABLE statement of a staging table (types translated from MySQL)."""
+        column_defs = []
+        for col in columns:
+            null_clause = '' if col.get('nullable', True) else 'NOT NULL'
+            col_type = postgres_staging_type(col.get('type', 'TEXT'))
+            column_defs.append(f"{self.quote(col['name'])} {col_type} {null_clause}")
+        columns_sql = ',\n    '.join(column_defs)
+        unlogged = 'UNLOGGED ' if config.LANDING_PG_UNLOGGED else ''
+
+        return f"""
+            CREATE {unlogged}TABLE IF NOT EXISTS {self.quote(table_name)} (
+                "_staging_id" BIGSERIAL PRIMARY KEY,
+                "_created_at" TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                {columns_sql}
+            )
+            """
+
+    def copy_rows(self, table_name: str, column_names: List[str], batches: Iterable[List[tuple]]) -> int:
+        """
+        Stream row batches into a table with COPY FROM STDIN (CSV).
+
+        Args:
+            table_name: Target staging table
+            column_names: Columns of the rows, in order
+            batches: Row batches
+
+        Returns:
+            Number of rows loaded
+        """
+        columns_clause = ', '.join(self.quote(col) for col in column_names)
+        copy_sql = (
+            f"COPY {self.quote(table_name)} ({columns_clause}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+        )
+        stream = CsvCopyStream(batches)
+        with self.cursor(dictionary=False) as cursor:
+            cursor.copy_expert(copy_sql, stream, size=1024 * 1024)
+
+        logger.info(f"Bulk loaded {stream.rows} rows using COPY FROM STDIN (streamed)")
+        return stream.rows
+
+    def table_size_mb(self, table_name: str) -> float:
+        """Data + index size of a table in MB (0 if unknown)."""
+        result = self.execute_one(
+            "SELECT ROUND(pg_total_relation_size(to_regclass(%s)) / 1024.0 / 1024, 2) as size_mb",
+            (self.quote(table_name),)
+        )
+        return float(result.get('size_mb') or 0) if result else 0
+
+    def table_indexes(self, table_name: str) -> List[str]:
+        """Secondary index names of a table."""
+        rows = self.execute("""
+            SELECT i.relname as index_name
+            FROM pg_index x
+            JOIN pg_class i ON i.oid = x.indexrelid
+            WHERE x.indrelid = to_regclass(%s)
+            AND NOT x.indisprimary
+        """, (self.quote(table_name),))
+        return [row['index_name'] for row in rows or []]
+
+    def analyze_table(self, table_name: str):
+        """Refresh planner statistics (fresh and UNLOGGED tables have none until autovacuum)."""
+        try:
+            with self.cursor() as cursor:
+                cursor.execute(f"ANALYZE {self.quote(table_name)}")
+        except Exception as e:
+            logger.warning(f"Failed to analyze {table_name}: {e}")
+
+    def get_database_info(self) -> dict:
+        """
+        Get database information.
+
+        Returns:
+            Dictionary with database info
+        """
+        try:
+            version = self.execute_one("SELECT VERSION() as version")
+            size = self.execute_one(
+                "SELECT ROUND(pg_database_size(current_database()) / 1024.0 / 1024, 2) as size_mb"
+            )
+            table_count = self.execute_one("""
+                SELECT COUNT(*) as count
+                FROM information_schema.tables
+                WHERE table_schema = ANY(current_schemas(false))
+                AND table_name LIKE 'recon_stage_%%'
+            """)
+
+            return {
+                "database": self.db_config.database,
+                "version": version.get('version') if version else "Unknown",
+                "size_mb": float(size.get('size_mb') or 0) if size else 0,
+                "staging_table_count": table_count.get('count', 0) if table_count else 0,
+                "connected": self.is_connected()
+            }
+        except Exception as e:
+            logger.error(f"Failed to get database info: {e}")
+            return {
+                "database": self.db_config.database,
+                "error": str(e),
+                "connected": False
+            }
+
+    def create_schema_if_not_exists(self, schema_name: str):
+        """
+        Create schema if it doesn't exist.
+
+        Args:
+            schema_name: Schema name to create
+        """
+        try:
+            with self.cursor() as cursor:
+                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {self.quote(schema_name)}")
+            logger.info(f"Schema '{schema_name}' is ready")
+        except Exception as e:
+            logger.error(f"Failed to create schema: {e}")
+            raise
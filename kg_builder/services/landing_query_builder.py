@@ -1,15 +1,50 @@
 """
 Landing Query Builder for Reconciliation.
 
-Builds SQL queries for reconciliation and KPI calculation in landing database (MySQL).
+Builds SQL queries for reconciliation and KPI calculation in landing database
+(MySQL 8+, PostgreSQL or the embedded SQLite engine). Each rule is evaluated as
+its own equi-join so the staging indexes on the join columns can be used; rules
+are combined with UNION ALL (matches) and ANDed NOT EXISTS (non-matches).
+
+The waterfall strategy (build_waterfall_queries) evaluates the rules in order
+on shrinking residual sets instead, so every row is attributed to one rule.
 """
 import logging
+from dataclasses import dataclass, field
 from typing import List, Dict, Any
 from kg_builder.models import ReconciliationRule, ReconciliationRuleSet
+from kg_builder.services.rule_plan_compiler import (
+    RulePlan,
+    canonical_dialect,
+    get_rule_plan_compiler,
+    limit_clause,
+    quote_identifier
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class WaterfallStep:
+    """Statements matching one rule against the residual rows."""
+    rule_order: int
+    rule_id: str
+    rule_name: str
+    confidence: float
+    statements: List[str]
+
+
+@dataclass
+class WaterfallQueries:
+    """Temp tables and statements of a waterfall reconciliation of one table pair."""
+    setup: List[str]                       # Residual id sets (every staging row) + attribution table
+    steps: List[WaterfallStep]             # One per rule, in ruleset order
+    residual_counts: str                   # Rows left on each side (source_left, target_left)
+    attribution_counts: str                # Matches per (rule_order, side)
+    teardown: List[str] = field(default_factory=list)
+    matched_rows: Dict[str, str] = field(default_factory=dict)  # (row_id, confidence) of matched rows per side
+
+
 class LandingQueryBuilder:
     """Builds SQL queries for landing database reconciliation."""
 
@@ -18,11 +53,70 @@ class LandingQueryBuilder:
         Initialize query builder.
 
         Args:
-            db_type: Database type (mysql or postgresql)
+            db_type: Database type (mysql, postgresql or sqlite)
         """
-        self.db_type = db_type.lower()
-        if self.db_type not in ["mysql", "postgresql"]:
+        self.db_type = canonical_dialect(db_type)
+        if self.db_type not in ["mysql", "postgresql", "sqlite"]:
             raise ValueError(f"Unsupported database type: {db_type}")
+        self.plan_compiler = get_rule_plan_compiler()
+
+    def _quote(self, identifier: str) -> str:
+        """Quote a staging table or column name for the landing database."""
+        return quote_identifier(identifier, self.db_type)
+
+    def _rule_plans(self, rules: List[ReconciliationRule]) -> List[RulePlan]:
+        """Compile plans for rules that are not part of a (cached) ruleset."""
+        return [self.plan_compiler.compile_rule(rule, self.db_type) for rule in rules]
+
+    @staticmethod
+    def _join_plans(plans: List[RulePlan]) -> List[RulePlan]:
+        """Plans with a key equality (staging tables keep the original column names)."""
+        join_plans = [plan for plan in plans if plan.key_join_condition]
+        if not join_plans:
+            raise ValueError("No valid join conditions in ruleset")
+        return join_plans
+
+    @staticmethod
+    def _literal(value: str) -> str:
+        """SQL string literal (MySQL and PostgreSQL)."""
+        return "'" + str(value).replace("'", "''") + "'"
+
+    @staticmethod
+    def _matched_rows_cte(
+        plans: List[RulePlan],
+        side_table: str,
+        side_alias: str,
+        other_table: str,
+        other_alias: str,
+        confidences: Dict[str, float]
+    ) -> str:
+        """
+        One semi-join per rule, stacked with UNION ALL: (rule_order, rule_id, row_id, confidence).
+
+        Each EXISTS is a plain equi-join on the rule's key columns, so it can use
+        the staging indexes; a row matched by several rules appears once per rule.
+        """
+        selects = []
+        for order, plan in enumerate(plans):
+            selects.append(f"""
+            SELECT {order} AS rule_order, {LandingQueryBuilder._literal(plan.rule_id)} AS rule_id,
+                   {side_alias}._staging_id AS row_id,
+                   CAST({confidences.get(plan.rule_id, 0.0)} AS DECIMAL(6,4)) AS confidence
+            FROM {side_table} {side_alias}
+            WHERE EXISTS (
+                SELECT 1
+                FROM {other_table} {other_alias}
+                WHERE {plan.key_join_condition}
+            )""")
+        return "\n            UNION ALL".join(selects)
+
+    @staticmethod
+    def _no_rule_matches(plans: List[RulePlan], other_table: str, other_alias: str) -> str:
+        """AND of per-rule anti-joins (rows matched by no rule)."""
+        return "\n        AND ".join(
+            f"NOT EXISTS (SELECT 1 FROM {other_table} {other_alias} WHERE {plan.key_join_condition})"
+            for plan in plans
+        )
 
     def build_reconciliation_with_kpis_query(
         self,
@@ -33,7 +127,12 @@ class LandingQueryBuilder:
         """
         Build comprehensive query that performs reconciliation AND calculates KPIs in one query.
 
-        This is the most efficient approach - single query for everything.
+        Every rule is evaluated as its own equi-join semi-join (index-driven)
+        instead of one join ORing all rules. A source/target row is matched when
+        at least one rule matches it; its confidence is that of the best matching
+        rule. The query returns one row per rule: the ruleset KPIs (same on every
+        row) plus the rule's own match counts and confidence. Runs on MySQL 8+,
+        PostgreSQL and SQLite.
 
         Args:
             source_staging_table: Source staging table name
@@ -43,80 +142,85 @@ class LandingQueryBuilder:
         Returns:
             SQL query string
         """
-        # Build join conditions from rules
-        join_conditions = []
-        confidence_values = []
-
-        for rule in ruleset.rules:
-            conditions = []
-            for src_col, tgt_col in zip(rule.source_columns, rule.target_columns):
-                conditions.append(f"s.`{src_col}` = t.`{tgt_col}`")
-
-            if conditions:
-                join_conditions.append(f"({' AND '.join(conditions)})")
-                confidence_values.append(rule.confidence_score)
-
-        if not join_conditions:
-            raise ValueError("No valid join conditions in ruleset")
-
-        # For simplicity, use first rule's confidence (in production, calculate per-rule)
-        avg_confidence = sum(confidence_values) / len(confidence_values)
+        plans = self._join_plans(list(self.plan_compiler.compile(ruleset, self.db_type).plans))
+        rules_by_id = {rule.rule_id: rule for rule in ruleset.rules}
+        confidences = {plan.rule_id: float(rules_by_id[plan.rule_id].confidence_score) for plan in plans}
+        source_table = self._quote(source_staging_table)
+        target_table = self._quote(target_staging_table)
+
+        rule_list = "\n            UNION ALL\n            ".join(
+            f"SELECT {order} AS rule_order, {self._literal(plan.rule_id)} AS rule_id, "
+            f"{self._literal(plan.rule_name)} AS rule_name, "
+            f"CAST({confidences[plan.rule_id]} AS DECIMAL(6,4)) AS rule_confidence"
+            for order, plan in enumerate(plans)
+        )
 
         query = f"""
         WITH
         -- Count total records in source
         source_total AS (
             SELECT COUNT(*) as total_count
-            FROM `{source_staging_table}`
+            FROM {source_table}
         ),
 
         -- Count total records in target
         target_total AS (
             SELECT COUNT(*) as total_count
-            FROM `{target_staging_table}`
+            FROM {target_table}
+        ),
+
+        -- Source rows matched per rule (one equi-join semi-join per rule)
+        source_matches AS ({self._matched_rows_cte(plans, source_table, 's', target_table, 't', confidences)}
+        ),
+
+        -- Target rows matched per rule
+        target_matches AS ({self._matched_rows_cte(plans, target_table, 't', source_table, 's', confidences)}
+        ),
+
+        -- Each matched source row once, with its best rule confidence
+        source_best AS (
+            SELECT row_id, MAX(confidence) as confidence
+            FROM source_matches
+            GROUP BY row_id
         ),
 
         -- Find matched records
         matched AS (
             SELECT
                 COUNT(*) as matched_count,
-                {avg_confidence} as avg_confidence,
-                SUM(CASE WHEN {avg_confidence} >= 0.9 THEN 1 ELSE 0 END) as high_conf,
-                SUM(CASE WHEN {avg_confidence} >= 0.8 AND {avg_confidence} < 0.9 THEN 1 ELSE 0 END) as med_conf,
-                SUM(CASE WHEN {avg_confidence} < 0.8 THEN 1 ELSE 0 END) as low_conf
-            FROM `{source_staging_table}` s
-            INNER JOIN `{target_staging_table}` t
-                ON {' OR '.join(join_conditions)}
+                AVG(confidence) as avg_confidence,
+                SUM(CASE WHEN confidence >= 0.9 THEN 1 ELSE 0 END) as high_conf,
+                SUM(CASE WHEN confidence >= 0.8 AND confidence < 0.9 THEN 1 ELSE 0 END) as med_conf,
+                SUM(CASE WHEN confidence < 0.8 THEN 1 ELSE 0 END) as low_conf
+            FROM source_best
         ),
 
-        -- Find unmatched source records
-        unmatched_source AS (
-            SELECT COUNT(*) as count
-            FROM `{source_staging_table}` s
-            WHERE NOT EXISTS (
-                SELECT 1
-                FROM `{target_staging_table}` t
-                WHERE {' OR '.join(join_conditions)}
-            )
+        matched_target AS (
+            SELECT COUNT(DISTINCT row_id) as matched_count
+            FROM target_matches
         ),
 
-        -- Find unmatched target records
-        unmatched_target AS (
-            SELECT COUNT(*) as count
-            FROM `{target_staging_table}` t
-            WHERE NOT EXISTS (
-                SELECT 1
-                FROM `{source_staging_table}` s
-                WHERE {' OR '.join(join_conditions)}
-            )
+        -- Per-rule match counts
+        rule_source AS (
+            SELECT rule_id, COUNT(*) as matched_count
+            FROM source_matches
+            GROUP BY rule_id
+        ),
+        rule_target AS (
+            SELECT rule_id, COUNT(*) as matched_count
+            FROM target_matches
+            GROUP BY rule_id
+        ),
+        rule_list AS (
+            {rule_list}
         ),
 
         -- Calculate KPIs
         kpis AS (
             SELECT
                 m.matched_count,
-                us.count as unmatched_source_count,
-                ut.count as unmatched_target_count,
+                st.total_count - m.matched_count as unmatched_source_count,
+                tt.total_count - mt.matched_count as unmatched_target_count,
                 st.total_count as total_source_count,
                 tt.total_count as total_target_count,
 
@@ -128,33 +232,40 @@ class LandingQueryBuilder:
                     ELSE 'CRITICAL'
                 END as rcr_status,
 
-                -- DQCS Calculation
-                ROUND(m.avg_confidence, 3) as dqcs,
+                -- DQCS Calculation (best rule confidence of each matched row)
+                ROUND(COALESCE(m.avg_confidence, 0), 3) as dqcs,
                 CASE
-                    WHEN m.avg_confidence >= 0.8 THEN 'GOOD'
-                    WHEN m.avg_confidence >= 0.7 THEN 'ACCEPTABLE'
+                    WHEN COALESCE(m.avg_confidence, 0) >= 0.8 THEN 'GOOD'
+                    WHEN COALESCE(m.avg_confidence, 0) >= 0.7 THEN 'ACCEPTABLE'
                     ELSE 'POOR'
                 END as dqcs_status,
 
                 -- Confidence distribution
-                m.high_conf as high_confidence_count,
-                m.med_conf as medium_confidence_count,
-                m.low_conf as low_confidence_count,
+                COALESCE(m.high_conf, 0) as high_confidence_count,
+                COALESCE(m.med_conf, 0) as medium_confidence_count,
+                COALESCE(m.low_conf, 0) as low_confidence_count,
 
                 -- REI Calculation (simplified)
-                ROUND(
-                    (m.matched_count * 100.0 / NULLIF(st.total_count, 0)) *
-                    ({len(ruleset.rules)} * 1.0 / {max(len(ruleset.rules), 1)})
-                , 2) as rei
+                ROUND((m.matched_count * 100.0 / NULLIF(st.total_count, 0)), 2) as rei
 
             FROM matched m
-            CROSS JOIN unmatched_source us
-            CROSS JOIN unmatched_target ut
+            CROSS JOIN matched_target mt
             CROSS JOIN source_total st
             CROSS JOIN target_total tt
         )
 
-        SELECT * FROM kpis;
+        SELECT
+            k.*,
+            r.rule_id,
+            r.rule_name,
+            r.rule_confidence,
+            COALESCE(rs.matched_count, 0) as rule_matched_source_count,
+            COALESCE(rt.matched_count, 0) as rule_matched_target_count
+        FROM kpis k
+        CROSS JOIN rule_list r
+        LEFT JOIN rule_source rs ON rs.rule_id = r.rule_id
+        LEFT JOIN rule_target rt ON rt.rule_id = r.rule_id
+        ORDER BY r.rule_order;
         """
 
         logger.debug("=" * 80)
@@ -165,6 +276,168 @@ class LandingQueryBuilder:
 
         return query
 
+    def build_waterfall_queries(
+        self,
+        source_staging_table: str,
+        target_staging_table: str,
+        ruleset: ReconciliationRuleSet,
+        suffix: str
+    ) -> WaterfallQueries:
+        """
+        Build a waterfall (residual) reconciliation of one table pair.
+
+        Temp tables hold the staging ids not matched yet on each side. Rule 1
+        is matched against every row; each following rule only sees the rows
+        no earlier rule matched, and its matches are removed from the residual
+        sets. Each matched row is recorded once, with its rule, in an
+        attribution table. Temp tables live in the session, so every
+        statement must run on the same connection.
+
+        Args:
+            source_staging_table: Source staging table name
+            target_staging_table: Target staging table name
+            ruleset: Reconciliation ruleset (rule order is the matching priority)
+            suffix: Unique suffix of the temp table names
+
+        Returns:
+            WaterfallQueries
+        """
+        plans = self._join_plans(list(self.plan_compiler.compile(ruleset, self.db_type).plans))
+        rules_by_id = {rule.rule_id: rule for rule in ruleset.rules}
+        source_table = self._quote(source_staging_table)
+        target_table = self._quote(target_staging_table)
+        residual_source = self._quote(f"recon_wf_src_{suffix}")
+        residual_target = self._quote(f"recon_wf_tgt_{suffix}")
+        matches = self._quote(f"recon_wf_match_{suffix}")
+
+        setup = [
+            f"CREATE TEMPORARY TABLE {residual_source} (row_id BIGINT PRIMARY KEY)",
+            f"INSERT INTO {residual_source} (row_id) SELECT _staging_id FROM {source_table}",
+            f"CREATE TEMPORARY TABLE {residual_target} (row_id BIGINT PRIMARY KEY)",
+            f"INSERT INTO {residual_target} (row_id) SELECT _staging_id FROM {target_table}",
+            f"""CREATE TEMPORARY TABLE {matches} (
+                side VARCHAR(6) NOT NULL,
+                rule_order INT NOT NULL,
+                row_id BIGINT NOT NULL,
+                confidence DECIMAL(6,4) NOT NULL,
+                PRIMARY KEY (side, rule_order, row_id)
+            )""",
+        ]
+
+        steps = []
+        for order, plan in enumerate(plans):
+            confidence = float(rules_by_id[plan.rule_id].confidence_score)
+            statements = [
+                # Residual source rows with a residual target row under this rule
+                f"""
+                INSERT INTO {matches} (side, rule_order, row_id, confidence)
+                SELECT 'source', {order}, r.row_id, {confidence}
+                FROM {residual_source} r
+                JOIN {source_table} s ON s._staging_id = r.row_id
+                WHERE EXISTS (
+                    SELECT 1
+                    FROM {target_table} t
+                    WHERE {plan.key_join_condition}
+                    AND t._staging_id IN (SELECT row_id FROM {residual_target})
+                )""",
+                f"""
+                INSERT INTO {matches} (side, rule_order, row_id, confidence)
+                SELECT 'target', {order}, r.row_id, {confidence}
+                FROM {residual_target} r
+                JOIN {target_table} t ON t._staging_id = r.row_id
+                WHERE EXISTS (
+                    SELECT 1
+                    FROM {source_table} s
+                    WHERE {plan.key_join_condition}
+                    AND s._staging_id IN (SELECT row_id FROM {residual_source})
+                )""",
+                # Matched rows leave the residual sets
+                f"""
+                DELETE FROM {residual_source}
+                WHERE row_id IN (SELECT row_id FROM {matches} WHERE side = 'source' AND rule_order = {order})""",
+                f"""
+                DELETE FROM {residual_target}
+                WHERE row_id IN (SELECT row_id FROM {matches} WHERE side = 'target' AND rule_order = {order})""",
+            ]
+            steps.append(WaterfallStep(
+                rule_order=order,
+                rule_id=plan.rule_id,
+                rule_name=plan.rule_name,
+                confidence=confidence,
+                statements=statements
+            ))
+
+        drop = "DROP TEMPORARY TABLE IF EXISTS" if self.db_type == "mysql" else "DROP TABLE IF EXISTS"
+        return WaterfallQueries(
+            setup=setup,
+            steps=steps,
+            residual_counts=(
+                f"SELECT (SELECT COUNT(*) FROM {residual_source}) as source_left, "
+                f"(SELECT COUNT(*) FROM {residual_target}) as target_left"
+            ),
+            attribution_counts=(
+                f"SELECT rule_order, side, COUNT(*) as match_count FROM {matches} GROUP BY rule_order, side"
+            ),
+            teardown=[f"{drop} {table}" for table in (residual_source, residual_target, matches)],
+            matched_rows={
+                side: f"SELECT row_id, confidence FROM {matches} WHERE side = '{side}'"
+                for side in ('source', 'target')
+            }
+        )
+
+    def build_matched_rows_query(
+        self,
+        source_staging_table: str,
+        target_staging_table: str,
+        ruleset: ReconciliationRuleSet,
+        side: str
+    ) -> str:
+        """
+        Rows of one side matched by any rule of the ruleset: (rule_order, rule_id, row_id, confidence).
+
+        Used to recount a staging table that takes part in several table pairs
+        (see build_table_match_counts_query).
+        """
+        plans = self._join_plans(list(self.plan_compiler.compile(ruleset, self.db_type).plans))
+        rules_by_id = {rule.rule_id: rule for rule in ruleset.rules}
+        confidences = {plan.rule_id: float(rules_by_id[plan.rule_id].confidence_score) for plan in plans}
+        source_table = self._quote(source_staging_table)
+        target_table = self._quote(target_staging_table)
+        if side == 'source':
+            return self._matched_rows_cte(plans, source_table, 's', target_table, 't', confidences)
+        return self._matched_rows_cte(plans, target_table, 't', source_table, 's', confidences)
+
+    def build_table_match_counts_query(self, staging_table: str, matched_rows: List[str]) -> str:
+        """
+        Count the rows of one staging table once across all the table pairs it belongs to.
+
+        A row is matched when any of the matched_rows selects (one per pair,
+        yielding row_id and confidence) returns it; its confidence is the best
+        one. Returns total_count, matched_count, avg_confidence and the
+        high/medium/low confidence counts.
+        """
+        matches = "\n            UNION ALL\n            ".join(
+            f"SELECT row_id, confidence FROM ({select}\n            ) pair_{index}"
+            for index, select in enumerate(matched_rows)
+        )
+        return f"""
+        WITH best AS (
+            SELECT row_id, MAX(confidence) as confidence
+            FROM (
+            {matches}
+            ) pair_matches
+            GROUP BY row_id
+        )
+        SELECT
+            (SELECT COUNT(*) FROM {self._quote(staging_table)}) as total_count,
+            COUNT(*) as matched_count,
+            COALESCE(AVG(confidence), 0) as avg_confidence,
+            COALESCE(SUM(CASE WHEN confidence >= 0.9 THEN 1 ELSE 0 END), 0) as high_conf,
+            COALESCE(SUM(CASE WHEN confidence >= 0.8 AND confidence < 0.9 THEN 1 ELSE 0 END), 0) as med_conf,
+            COALESCE(SUM(CASE WHEN confidence < 0.8 THEN 1 ELSE 0 END), 0) as low_conf
+        FROM best
+        """
+
     def build_matched_records_query(
         self,
         source_staging_table: str,
@@ -175,6 +448,9 @@ class LandingQueryBuilder:
         """
         Build query to fetch matched records.
 
+        One equi-join per rule, combined with UNION ALL (a pair matched by
+        several rules is returned once per rule).
+
         Args:
             source_staging_table: Source staging table
             target_staging_table: Target staging table
@@ -184,23 +460,31 @@ class LandingQueryBuilder:
         Returns:
             SQL query string
         """
-        join_conditions = []
-        for rule in rules:
-            conditions = []
-            for src_col, tgt_col in zip(rule.source_columns, rule.target_columns):
-                conditions.append(f"s.`{src_col}` = t.`{tgt_col}`")
-            if conditions:
-                join_conditions.append(f"({' AND '.join(conditions)})")
+        plans = self._join_plans(self._rule_plans(rules))
+        confidences = {rule.rule_id: rule.confidence_score for rule in rules}
+        source_table = self._quote(source_staging_table)
+        target_table = self._quote(target_staging_table)
+
+        # SQLite has no parenthesized compound members; a LIMITed subquery per rule instead
+        opening, closing = ("SELECT * FROM (", ")") if self.db_type == "sqlite" else ("(", ")")
+        selects = [
+            f"""{opening}
+            SELECT
+                s.*,
+                t.*,
+                {confidences.get(plan.rule_id, 0.0)} as match_confidence,
+                {self._literal(plan.rule_id)} as matched_rule_id
+            FROM {source_table} s
+            INNER JOIN {target_table} t
+                ON {plan.key_join_condition}
+            {limit_clause(limit, self.db_type)}
+        {closing}"""
+            for plan in plans
+        ]
 
         query = f"""
-        SELECT
-            s.*,
-            t.*,
-            {rules[0].confidence_score} as match_confidence
-        FROM `{source_staging_table}` s
-        INNER JOIN `{target_staging_table}` t
-            ON {' OR '.join(join_conditions)}
-        LIMIT {limit}
+        {" UNION ALL ".join(selects)}
+        {limit_clause(limit, self.db_type)}
         """
 
         return query
@@ -212,24 +496,16 @@ class LandingQueryBuilder:
         rules: List[ReconciliationRule],
         limit: int = 1000
     ) -> str:
-        """Build query to fetch unmatched source records."""
-        join_conditions = []
-        for rule in rules:
-            conditions = []
-            for src_col, tgt_col in zip(rule.source_columns, rule.target_columns):
-                conditions.append(f"s.`{src_col}` = t.`{tgt_col}`")
-            if conditions:
-                join_conditions.append(f"({' AND '.join(conditions)})")
+        """Build query to fetch unmatched source records (one anti-join per rule)."""
+        plans = self._join_plans(self._rule_plans(rules))
+        source_table = self._quote(source_staging_table)
+        target_table = self._quote(target_staging_table)
 
         query = f"""
         SELECT s.*
-        FROM `{source_staging_table}` s
-        WHERE NOT EXISTS (
-            SELECT 1
-            FROM `{target_staging_table}` t
-            WHERE {' OR '.join(join_conditions)}
-        )
-        LIMIT {limit}
+        FROM {source_table} s
+        WHERE {self._no_rule_matches(plans, target_table, 't')}
+        {limit_clause(limit, self.db_type)}
         """
 
         return query
@@ -241,24 +517,16 @@ class LandingQueryBuilder:
         rules: List[ReconciliationRule],
         limit: int = 1000
     ) -> str:
-        """Build query to fetch unmatched target records."""
-        join_conditions = []
-        for rule in rules:
-            conditions = []
-            for src_col, tgt_col in zip(rule.source_columns, rule.target_columns):
-                conditions.append(f"s.`{src_col}` = t.`{tgt_col}`")
-            if conditions:
-                join_conditions.append(f"({' AND '.join(conditions)})")
+        """Build query to fetch unmatched target records (one anti-join per rule)."""
+        plans = self._join_plans(self._rule_plans(rules))
+        source_table = self._quote(source_staging_table)
+        target_table = self._quote(target_staging_table)
 
         query = f"""
         SELECT t.*
-        FROM `{target_staging_table}` t
-        WHERE NOT EXISTS (
-            SELECT 1
-            FROM `{source_staging_table}` s
-            WHERE {' OR '.join(join_conditions)}
-        )
-        LIMIT {limit}
+        FROM {target_table} t
+        WHERE {self._no_rule_matches(plans, source_table, 's')}
+        {limit_clause(limit, self.db_type)}
         """
 
         return query
@@ -269,7 +537,7 @@ class LandingQueryBuilder:
         SELECT
             COUNT(*) as row_count,
             COUNT(DISTINCT _staging_id) as unique_records
-        FROM `{table_name}`
+        FROM {self._quote(table_name)}
         """
 
 
@@ -3,14 +3,24 @@ Landing Reconciliation Executor.
 
 Main service for executing reconciliation using landing database approach.
 Orchestrates extraction, reconciliation, and KPI calculation.
+
+With the embedded landing engine (LANDING_DB_TYPE=sqlite) each execution runs
+in its own database file, deleted when the execution completes.
+
+Rules are matched independently by default (every rule sees every row). The
+waterfall strategy matches them in ruleset order on the rows no earlier rule
+matched, so each row counts for exactly one rule.
 """
+import copy
 import logging
 import time
 import uuid
+from collections import Counter
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from kg_builder.models import (
     DatabaseConnectionInfo,
+    ReconciliationRule,
     ReconciliationRuleSet,
     LandingExecutionRequest,
     LandingExecutionResponse,
@@ -51,8 +61,10 @@ class LandingReconciliationExecutor:
 
         self.staging_manager = staging_manager or get_staging_manager(self.landing_connector)
         self.data_extractor = data_extractor or get_data_extractor(self.landing_connector, self.staging_manager)
-        self.query_builder = query_builder or get_query_builder(config.LANDING_DB_TYPE)
+        self.query_builder = query_builder or get_query_builder(self.landing_connector.db_type)
         self.rule_storage = get_rule_storage()
+        if not self.landing_connector.per_execution_database:
+            self.staging_manager.start_sweeper()
 
         logger.info("Initialized LandingReconciliationExecutor")
 
@@ -66,10 +78,37 @@ class LandingReconciliationExecutor:
         Returns:
             Landing execution response with KPIs
         """
-        total_start_time = time.time()
         execution_id = f"EXEC_{uuid.uuid4().hex[:8]}"
 
+        if self.landing_connector.per_execution_database:
+            return self._execute_in_isolated_database(request, execution_id)
+        return self._execute(request, execution_id)
+
+    def _execute_in_isolated_database(
+        self,
+        request: LandingExecutionRequest,
+        execution_id: str
+    ) -> LandingExecutionResponse:
+        """Run one execution on its own embedded landing database, deleted afterwards."""
+        landing_connector = self.landing_connector.for_execution(execution_id)
+        scoped = copy.copy(self)
+        scoped.landing_connector = landing_connector
+        scoped.staging_manager = StagingManager(landing_connector)
+        scoped.data_extractor = DataExtractor(landing_connector, scoped.staging_manager)
+        try:
+            return scoped._execute(request, execution_id)
+        finally:
+            landing_connector.discard()
+
+    def _execute(self, request: LandingExecutionRequest, execution_id: str) -> LandingExecutionResponse:
+        """Execute reconciliation under `execution_id` on this executor's landing database."""
+        total_start_time = time.time()
+        per_execution_database = self.landing_connector.per_execution_database
+        # Snapshots outlive the execution, so keep_staging=False opts out of reuse
+        reuse_snapshots = config.LANDING_SNAPSHOT_REUSE and not per_execution_database and request.keep_staging
+
         logger.info(f"Starting landing-based reconciliation execution: {execution_id}")
+        extractions = []
 
         try:
             # Load ruleset
@@ -77,58 +116,57 @@ class LandingReconciliationExecutor:
             if not ruleset:
                 raise ValueError(f"Ruleset not found: {request.ruleset_id}")
 
+            if request.rule_ids:
+                rules = [rule for rule in ruleset.rules if rule.rule_id in set(request.rule_ids)]
+                if not rules:
+                    raise ValueError(f"None of the rules {request.rule_ids} are in ruleset {request.ruleset_id}")
+                ruleset = ruleset.model_copy(update={"rules": rules})
+
             logger.info(f"Loaded ruleset '{ruleset.ruleset_id}' with {len(ruleset.rules)} rules")
 
-            # Phase 1: Extract source data to landing
+            # Phase 1: Extract every source and target table to landing, concurrently
             logger.info("=" * 60)
-            logger.info("PHASE 1: Extracting source data to landing database")
+            logger.info("PHASE 1: Extracting source and target tables to landing database")
             logger.info("=" * 60)
 
             extraction_start = time.time()
 
-            source_staging_table, source_row_count, source_extract_time = \
-                self.data_extractor.extract_to_landing(
-                    source_db_config=request.source_db_config,
-                    rules=ruleset.rules,
-                    execution_id=execution_id,
-                    ruleset_id=request.ruleset_id,
-                    source_or_target='source',
-                    limit=request.limit
-                )
-
-            logger.info(f"Source extraction: {source_row_count} rows in {source_extract_time:.2f}ms")
-
-            # Phase 2: Extract target data to landing
-            logger.info("=" * 60)
-            logger.info("PHASE 2: Extracting target data to landing database")
-            logger.info("=" * 60)
+            extraction_mode = (request.extraction_mode or config.LANDING_EXTRACTION_MODE).lower()
+            if extraction_mode not in ('full', 'key_only'):
+                raise ValueError(f"Unsupported extraction mode: {extraction_mode}")
+            match_strategy = (request.match_strategy or config.LANDING_MATCH_STRATEGY).lower()
+            if match_strategy not in ('independent', 'waterfall'):
+                raise ValueError(f"Unsupported match strategy: {match_strategy}")
+
+            extractions = self.data_extractor.extract_ruleset_to_landing(
+                source_db_config=request.source_db_config,
+                target_db_config=request.target_db_config,
+                rules=ruleset.rules,
+                execution_id=execution_id,
+                ruleset_id=request.ruleset_id,
+                limit=request.limit,
+                key_only=extraction_mode == 'key_only',
+                reuse_snapshots=reuse_snapshots
+            )
 
-            target_staging_table, target_row_count, target_extract_time = \
-                self.data_extractor.extract_to_landing(
-                    source_db_config=request.target_db_config,
-                    rules=ruleset.rules,
-                    execution_id=execution_id,
-                    ruleset_id=request.ruleset_id,
-                    source_or_target='target',
-                    limit=request.limit
+            for extraction in extractions:
+                logger.info(
+                    f"{extraction.source_or_target.capitalize()} extraction of {extraction.table_key}: "
+                    f"{extraction.row_count} rows in {extraction.extraction_time_ms:.2f}ms"
                 )
 
-            logger.info(f"Target extraction: {target_row_count} rows in {target_extract_time:.2f}ms")
-
             total_extraction_time = (time.time() - extraction_start) * 1000
+            source_table_count = sum(1 for e in extractions if e.source_or_target == 'source')
+            staging_tables = {(e.source_or_target, e.table_key): e.staging_table for e in extractions}
 
-            # Phase 3: Reconcile in landing DB and calculate KPIs
+            # Phase 2: Reconcile in landing DB and calculate KPIs
             logger.info("=" * 60)
-            logger.info("PHASE 3: Reconciling in landing database and calculating KPIs")
+            logger.info("PHASE 2: Reconciling in landing database and calculating KPIs")
             logger.info("=" * 60)
 
             recon_start = time.time()
 
-            kpi_results = self._execute_reconciliation_with_kpis(
-                source_staging_table=source_staging_table,
-                target_staging_table=target_staging_table,
-                ruleset=ruleset
-            )
+            kpi_results = self._reconcile_table_pairs(staging_tables, ruleset, match_strategy)
 
             reconciliation_time = (time.time() - recon_start) * 1000
 
@@ -140,11 +178,11 @@ class LandingReconciliationExecutor:
             logger.info(f"  - DQCS: {kpi_results['dqcs']} ({kpi_results['dqcs_status']})")
             logger.info(f"  - REI: {kpi_results['rei']}")
 
-            # Phase 4: Store results in MongoDB (if requested)
+            # Phase 3: Store results in MongoDB (if requested)
             mongodb_doc_id = None
             if request.store_in_mongodb:
                 logger.info("=" * 60)
-                logger.info("PHASE 4: Storing results in MongoDB")
+                logger.info("PHASE 3: Storing results in MongoDB")
                 logger.info("=" * 60)
 
                 mongodb_doc_id = self._store_results_in_mongodb(
@@ -155,39 +193,41 @@ class LandingReconciliationExecutor:
 
                 logger.info(f"Stored in MongoDB: {mongodb_doc_id}")
 
-            # Phase 5: Cleanup or retain staging tables
-            if not request.keep_staging:
+            # Phase 4: Cleanup or retain staging tables (snapshots are released in finally)
+            if per_execution_database:
+                logger.info("Embedded landing database is deleted when the execution completes")
+            elif reuse_snapshots:
+                logger.info(
+                    f"Staging snapshots kept for reuse (swept when unreferenced for "
+                    f"{config.LANDING_STAGING_TTL_HOURS}h or stale)"
+                )
+            elif not request.keep_staging:
                 logger.info("=" * 60)
-                logger.info("PHASE 5: Cleaning up staging tables")
+                logger.info("PHASE 4: Cleaning up staging tables")
                 logger.info("=" * 60)
 
-                self.staging_manager.drop_staging_table(source_staging_table)
-                self.staging_manager.drop_staging_table(target_staging_table)
+                for extraction in extractions:
+                    self.staging_manager.drop_staging_table(extraction.staging_table)
                 logger.info("Staging tables dropped")
             else:
                 logger.info(f"Staging tables retained (TTL: {config.LANDING_STAGING_TTL_HOURS}h)")
 
-            # Get staging table info
-            source_staging_info = self.staging_manager.get_staging_table_info(source_staging_table)
-            target_staging_info = self.staging_manager.get_staging_table_info(target_staging_table)
-
-            # Provide defaults if info retrieval failed
-            if source_staging_info is None:
-                source_staging_info = StagingTableInfo(
-                    table_name=source_staging_table,
-                    row_count=source_row_count,
-                    created_at=datetime.utcnow(),
-                    size_mb=0.0,
-                    indexes=[]
-                )
-            if target_staging_info is None:
-                target_staging_info = StagingTableInfo(
-                    table_name=target_staging_table,
-                    row_count=target_row_count,
-                    created_at=datetime.utcnow(),
-                    size_mb=0.0,
-                    indexes=[]
-                )
+            # Get staging table info (defaults if info retrieval failed)
+            staging_infos = []
+            for extraction in extractions:
+                info = self.staging_manager.get_staging_table_info(extraction.staging_table)
+                if info is None:
+                    info = StagingTableInfo(
+                        table_name=extraction.staging_table,
+                        row_count=extraction.row_count,
+                        created_at=datetime.utcnow(),
+                        size_mb=0.0,
+                        indexes=[]
+                    )
+                staging_infos.append(info)
+            # Source tables come first
+            source_staging_info = staging_infos[0]
+            target_staging_info = staging_infos[source_table_count]
 
             total_time = (time.time() - total_start_time) * 1000
 
@@ -210,13 +250,17 @@ class LandingReconciliationExecutor:
                 dqcs=kpi_results['dqcs'],
                 dqcs_status=kpi_results['dqcs_status'],
                 rei=kpi_results['rei'],
+                rule_kpis=kpi_results.get('rule_kpis', []),
+                match_strategy=match_strategy,
                 source_staging=source_staging_info,
                 target_staging=target_staging_info,
+                staging_tables=staging_infos,
+                table_extractions=[extraction.to_dict() for extraction in extractions],
                 extraction_time_ms=total_extraction_time,
                 reconciliation_time_ms=reconciliation_time,
                 total_time_ms=total_time,
                 mongodb_document_id=mongodb_doc_id,
-                staging_retained=request.keep_staging,
+                staging_retained=not per_execution_database and (request.keep_staging or reuse_snapshots),
                 staging_ttl_hours=config.LANDING_STAGING_TTL_HOURS
             )
 
@@ -226,6 +270,215 @@ class LandingReconciliationExecutor:
             logger.error(f"Landing reconciliation execution failed: {e}", exc_info=True)
             raise
 
+        finally:
+            if reuse_snapshots:
+                for extraction in extractions:
+                    self.staging_manager.release_snapshot(extraction.staging_table)
+
+    def _reconcile_table_pairs(
+        self,
+        staging_tables: Dict[Tuple[str, str], str],
+        ruleset: ReconciliationRuleSet,
+        match_strategy: str = 'independent'
+    ) -> Dict[str, Any]:
+        """
+        Reconcile each (source table, target table) pair of the ruleset on its staging tables.
+
+        Rules are grouped by the tables they join; each group runs the single
+        reconciliation + KPI query (or the waterfall) on its two staging tables.
+        Ruleset-level counts take every source/target table once: a table in
+        several pairs is recounted on the landing database, a row being matched
+        when any of its pairs matches it.
+
+        Args:
+            staging_tables: Staging table per ('source' | 'target', 'schema.table')
+            ruleset: Reconciliation ruleset
+            match_strategy: 'independent' or 'waterfall'
+
+        Returns:
+            Dictionary with counts and KPIs
+        """
+        pairs: Dict[Tuple[str, str], List[ReconciliationRule]] = {}
+        for rule in ruleset.rules:
+            key = (f"{rule.source_schema}.{rule.source_table}", f"{rule.target_schema}.{rule.target_table}")
+            pairs.setdefault(key, []).append(rule)
+
+        if len(pairs) == 1:
+            (source_key, target_key), rules = next(iter(pairs.items()))
+            return self._reconcile_pair(
+                staging_tables[('source', source_key)], staging_tables[('target', target_key)],
+                ruleset.model_copy(update={"rules": rules}), match_strategy
+            )
+
+        pair_counts = {
+            side: Counter(key[index] for key in pairs) for index, side in enumerate(('source', 'target'))
+        }
+        matched_rows: Dict[str, List[str]] = {}
+        cleanup: List[str] = []
+        pair_results = []
+        try:
+            for (source_key, target_key), rules in pairs.items():
+                source_staging = staging_tables[('source', source_key)]
+                target_staging = staging_tables[('target', target_key)]
+                shared = {
+                    'source': source_staging if pair_counts['source'][source_key] > 1 else None,
+                    'target': target_staging if pair_counts['target'][target_key] > 1 else None
+                }
+                result = self._reconcile_pair(
+                    source_staging, target_staging, ruleset.model_copy(update={"rules": rules}),
+                    match_strategy, shared=shared, matched_rows=matched_rows, cleanup=cleanup
+                )
+                pair_results.append((source_staging, target_staging, result))
+
+            table_counts = {
+                staging_table: self.landing_connector.execute(
+                    self.query_builder.build_table_match_counts_query(staging_table, selects)
+                )[0]
+                for staging_table, selects in matched_rows.items()
+            }
+        finally:
+            for statement in cleanup:
+                try:
+                    self.landing_connector.execute(statement)
+                except Exception as e:
+                    logger.warning(f"Failed to drop waterfall temp table: {e}")
+
+        return self._combine_kpi_results(pair_results, table_counts)
+
+    def _reconcile_pair(
+        self,
+        source_staging_table: str,
+        target_staging_table: str,
+        ruleset: ReconciliationRuleSet,
+        match_strategy: str,
+        shared: Optional[Dict[str, Optional[str]]] = None,
+        matched_rows: Optional[Dict[str, List[str]]] = None,
+        cleanup: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Reconcile one table pair; for its staging tables listed in shared, also
+        collect the select of their matched rows (for the recount across pairs).
+        """
+        shared = shared or {}
+        logger.info(
+            f"Reconciling {source_staging_table} -> {target_staging_table} "
+            f"({len(ruleset.rules)} rules, {match_strategy})"
+        )
+        if match_strategy == 'waterfall':
+            keep_matches = any(shared.values())
+            result = self._execute_waterfall_reconciliation(
+                source_staging_table=source_staging_table,
+                target_staging_table=target_staging_table,
+                ruleset=ruleset,
+                keep_matches=keep_matches
+            )
+            if keep_matches:
+                cleanup.append(result.pop('drop_matches'))
+                for side, selects in result.pop('matched_rows').items():
+                    if shared.get(side):
+                        matched_rows.setdefault(shared[side], []).append(selects)
+            return result
+
+        for side, staging_table in shared.items():
+            if staging_table:
+                matched_rows.setdefault(staging_table, []).append(
+                    self.query_builder.build_matched_rows_query(
+                        source_staging_table, target_staging_table, ruleset, side
+                    )
+                )
+        return self._execute_reconciliation_with_kpis(
+            source_staging_table=source_staging_table,
+            target_staging_table=target_staging_table,
+            ruleset=ruleset
+        )
+
+    @staticmethod
+    def _combine_kpi_results(
+        pair_results: List[Tuple[str, str, Dict[str, Any]]],
+        table_counts: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Ruleset KPIs of several table pairs (same thresholds as the SQL).
+
+        Every staging table is counted once: tables in one pair take that
+        pair's counts, tables in several pairs their recount (table_counts,
+        rows of build_table_match_counts_query).
+        """
+        table_counts = table_counts or {}
+        sources: Dict[str, Dict[str, float]] = {}
+        targets: Dict[str, Dict[str, float]] = {}
+        for source_table, target_table, result in pair_results:
+            if source_table not in sources:
+                matched = int(result.get('matched_count') or 0)
+                sources[source_table] = {
+                    'total': int(result.get('total_source_count') or 0),
+                    'matched': matched,
+                    'confidence': float(result.get('dqcs') or 0) * matched,
+                    'high': int(result.get('high_confidence_count') or 0),
+                    'medium': int(result.get('medium_confidence_count') or 0),
+                    'low': int(result.get('low_confidence_count') or 0)
+                }
+            if target_table not in targets:
+                total = int(result.get('total_target_count') or 0)
+                targets[target_table] = {
+                    'total': total,
+                    'matched': total - int(result.get('unmatched_target_count') or 0)
+                }
+
+        for table, counts in table_counts.items():
+            matched = int(counts.get('matched_count') or 0)
+            recount = {'total': int(counts.get('total_count') or 0), 'matched': matched}
+            if table in sources:
+                sources[table] = dict(
+                    recount,
+                    confidence=float(counts.get('avg_confidence') or 0) * matched,
+                    high=int(counts.get('high_conf') or 0),
+                    medium=int(counts.get('med_conf') or 0),
+                    low=int(counts.get('low_conf') or 0)
+                )
+            if table in targets:
+                targets[table] = recount
+
+        def total(tables: Dict[str, Dict[str, float]], key: str) -> Any:
+            return sum(counts[key] for counts in tables.values())
+
+        total_source, matched = total(sources, 'total'), total(sources, 'matched')
+        total_target = total(targets, 'total')
+        rcr = round(matched * 100.0 / total_source, 2) if total_source else 0.0
+        dqcs = round(total(sources, 'confidence') / matched, 3) if matched else 0.0
+
+        return {
+            'matched_count': matched,
+            'unmatched_source_count': total_source - matched,
+            'unmatched_target_count': total_target - total(targets, 'matched'),
+            'total_source_count': total_source,
+            'total_target_count': total_target,
+            'rcr': rcr,
+            'rcr_status': 'HEALTHY' if rcr >= 90 else 'WARNING' if rcr >= 80 else 'CRITICAL',
+            'dqcs': dqcs,
+            'dqcs_status': 'GOOD' if dqcs >= 0.8 else 'ACCEPTABLE' if dqcs >= 0.7 else 'POOR',
+            'high_confidence_count': total(sources, 'high'),
+            'medium_confidence_count': total(sources, 'medium'),
+            'low_confidence_count': total(sources, 'low'),
+            'rei': rcr,
+            'rule_kpis': [rule for _, _, result in pair_results for rule in result.get('rule_kpis', [])]
+        }
+
+    @staticmethod
+    def _rule_kpis(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Per-rule counts from one row of the reconciliation query."""
+        total_source = int(row.get('total_source_count') or 0)
+        matched_source = int(row.get('rule_matched_source_count') or 0)
+        return {
+            'rule_id': row.get('rule_id'),
+            'rule_name': row.get('rule_name'),
+            'confidence': float(row.get('rule_confidence') or 0),
+            'matched_source_count': matched_source,
+            'matched_target_count': int(row.get('rule_matched_target_count') or 0),
+            'unmatched_source_count': total_source - matched_source,
+            'rcr': round(matched_source * 100.0 / total_source, 2) if total_source else 0.0
+        }
+
     def _execute_reconciliation_with_kpis(
         self,
         source_staging_table: str,
@@ -253,11 +506,12 @@ class LandingReconciliationExecutor:
 
             logger.debug(f"Executing reconciliation query...")
 
-            # Execute query
-            result = self.landing_connector.execute_one(query)
+            # Execute query (one row per rule, ruleset KPIs repeated on each row)
+            rows = self.landing_connector.execute(query)
 
-            if not result:
+            if not rows:
                 raise ValueError("Reconciliation query returned no results")
+            result = rows[0]
 
             # Parse results
             kpi_results = {
@@ -266,14 +520,15 @@ class LandingReconciliationExecutor:
                 'unmatched_target_count': result.get('unmatched_target_count', 0),
                 'total_source_count': result.get('total_source_count', 0),
                 'total_target_count': result.get('total_target_count', 0),
-                'rcr': float(result.get('rcr', 0)),
+                'rcr': float(result.get('rcr') or 0),
                 'rcr_status': result.get('rcr_status', 'UNKNOWN'),
-                'dqcs': float(result.get('dqcs', 0)),
+                'dqcs': float(result.get('dqcs') or 0),
                 'dqcs_status': result.get('dqcs_status', 'UNKNOWN'),
                 'high_confidence_count': result.get('high_confidence_count', 0),
                 'medium_confidence_count': result.get('medium_confidence_count', 0),
                 'low_confidence_count': result.get('low_confidence_count', 0),
-                'rei': float(result.get('rei', 0))
+                'rei': float(result.get('rei') or 0),
+                'rule_kpis': [self._rule_kpis(row) for row in rows]
             }
 
             return kpi_results
@@ -282,6 +537,120 @@ class LandingReconciliationExecutor:
             logger.error(f"Failed to execute reconciliation: {e}")
             raise
 
+    def _execute_waterfall_reconciliation(
+        self,
+        source_staging_table: str,
+        target_staging_table: str,
+        ruleset: ReconciliationRuleSet,
+        keep_matches: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Execute a waterfall reconciliation and calculate KPIs.
+
+        Rules run in ruleset order; each one only matches the rows left over
+        by the rules before it, so every matched row is attributed to exactly
+        one rule and carries that rule's confidence. The waterfall stops early
+        once either side has no rows left.
+
+        Args:
+            source_staging_table: Source staging table name
+            target_staging_table: Target staging table name
+            ruleset: Reconciliation ruleset (rule order is the matching priority)
+            keep_matches: Keep the attribution temp table; the result then also
+                has 'matched_rows' (select per side) and 'drop_matches'
+
+        Returns:
+            Dictionary with counts and KPIs (same keys as the independent strategy)
+        """
+        queries = self.query_builder.build_waterfall_queries(
+            source_staging_table=source_staging_table,
+            target_staging_table=target_staging_table,
+            ruleset=ruleset,
+            suffix=uuid.uuid4().hex[:8]
+        )
+        residuals: Dict[int, Dict[str, int]] = {}
+
+        # Temp tables are per session: every statement runs on this cursor's connection
+        with self.landing_connector.cursor() as cursor:
+            try:
+                for statement in queries.setup:
+                    cursor.execute(statement)
+                cursor.execute(queries.residual_counts)
+                totals = cursor.fetchone()
+                source_left, target_left = int(totals['source_left']), int(totals['target_left'])
+
+                for step in queries.steps:
+                    if not source_left or not target_left:
+                        logger.debug(f"Waterfall exhausted before rule {step.rule_id}")
+                        break
+                    for statement in step.statements:
+                        cursor.execute(statement)
+                    cursor.execute(queries.residual_counts)
+                    left = cursor.fetchone()
+                    source_left, target_left = int(left['source_left']), int(left['target_left'])
+                    residuals[step.rule_order] = {'source': source_left, 'target': target_left}
+                    logger.debug(
+                        f"Waterfall rule {step.rule_id}: {source_left} source / {target_left} target rows left"
+                    )
+
+                cursor.execute(queries.attribution_counts)
+                attributions = cursor.fetchall()
+            finally:
+                teardown = queries.teardown[:-1] if keep_matches else queries.teardown
+                for statement in teardown:
+                    try:
+                        cursor.execute(statement)
+                    except Exception as e:
+                        logger.warning(f"Failed to drop waterfall temp table: {e}")
+
+        counts = {(int(row['rule_order']), row['side']): int(row['match_count']) for row in attributions}
+        total_source, total_target = int(totals['source_left']), int(totals['target_left'])
+
+        rule_kpis = []
+        matched_count, weighted_confidence = 0, 0.0
+        confidence_counts = {'high': 0, 'medium': 0, 'low': 0}
+        for step in queries.steps:
+            matched_source = counts.get((step.rule_order, 'source'), 0)
+            matched_count += matched_source
+            weighted_confidence += matched_source * step.confidence
+            bucket = 'high' if step.confidence >= 0.9 else 'medium' if step.confidence >= 0.8 else 'low'
+            confidence_counts[bucket] += matched_source
+            left = residuals.get(step.rule_order, {'source': source_left, 'target': target_left})
+            rule_kpis.append({
+                'rule_id': step.rule_id,
+                'rule_name': step.rule_name,
+                'confidence': step.confidence,
+                'matched_source_count': matched_source,
+                'matched_target_count': counts.get((step.rule_order, 'target'), 0),
+                'unmatched_source_count': total_source - matched_source,
+                'rcr': round(matched_source * 100.0 / total_source, 2) if total_source else 0.0,
+                'residual_source_count': left['source'],
+                'residual_target_count': left['target']
+            })
+
+        rcr = round(matched_count * 100.0 / total_source, 2) if total_source else 0.0
+        dqcs = round(weighted_confidence / matched_count, 3) if matched_count else 0.0
+
+        result = {
+            'matched_count': matched_count,
+            'unmatched_source_count': source_left,
+            'unmatched_target_count': target_left,
+            'total_source_count': total_source,
+            'total_target_count': total_target,
+            'rcr': rcr,
+            'rcr_status': 'HEALTHY' if rcr >= 90 else 'WARNING' if rcr >= 80 else 'CRITICAL',
+            'dqcs': dqcs,
+            'dqcs_status': 'GOOD' if dqcs >= 0.8 else 'ACCEPTABLE' if dqcs >= 0.7 else 'POOR',
+            'high_confidence_count': confidence_counts['high'],
+            'medium_confidence_count': confidence_counts['medium'],
+            'low_confidence_count': confidence_counts['low'],
+            'rei': rcr,
+            'rule_kpis': rule_kpis
+        }
+        if keep_matches:
+            result.update(matched_rows=queries.matched_rows, drop_matches=queries.teardown[-1])
+        return result
+
     def _store_results_in_mongodb(
         self,
         execution_id: str,
@@ -320,14 +689,62 @@ class LandingReconciliationExecutor:
             logger.warning(f"Failed to store results in MongoDB: {e}")
             return None
 
+    def fetch_unmatched_rows(
+        self,
+        db_config: DatabaseConnectionInfo,
+        source_staging_table: str,
+        target_staging_table: str,
+        rules: List[ReconciliationRule],
+        side: str = 'source',
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Full rows of unmatched records, fetched from their database on demand.
+
+        Key-only staging tables hold just the join columns and a row hash, so the
+        unmatched keys are found in the landing database and the complete rows are
+        read from the source/target table by key.
+
+        Args:
+            db_config: Database of the requested side
+            source_staging_table: Source staging table
+            target_staging_table: Target staging table
+            rules: Rules joining the two tables
+            side: 'source' or 'target'
+            limit: Maximum records to return
+
+        Returns:
+            Full rows of unmatched records
+        """
+        if side == 'source':
+            query = self.query_builder.build_unmatched_source_query(
+                source_staging_table, target_staging_table, rules, limit
+            )
+            schema, table = rules[0].source_schema, rules[0].source_table
+            columns = [col for rule in rules for col in rule.source_columns]
+        else:
+            query = self.query_builder.build_unmatched_target_query(
+                source_staging_table, target_staging_table, rules, limit
+            )
+            schema, table = rules[0].target_schema, rules[0].target_table
+            columns = [col for rule in rules for col in rule.target_columns]
+        key_columns = list(dict.fromkeys(columns))
+
+        keys = []
+        for row in self.landing_connector.execute(query):
+            values = {name.lower(): value for name, value in row.items()}
+            keys.append(tuple(values.get(col.lower()) for col in key_columns))
+
+        return self.data_extractor.fetch_rows_by_keys(db_config, schema, table, key_columns, keys, max_rows=limit)
+
     def cleanup_expired_staging_tables(self) -> int:
         """
-        Cleanup expired staging tables.
+        Drop unreferenced staging tables now (the background sweeper does this periodically).
 
         Returns:
             Number of tables cleaned up
         """
-        return self.staging_manager.cleanup_expired_tables()
+        return self.staging_manager.sweep_expired_tables()
 
 
 # Singleton instance
@@ -0,0 +1,257 @@
+"""
+Embedded Landing Database Connector (SQLite).
+
+For small and medium reconciliations a landing server costs more in network
+round trips than the join itself. With LANDING_DB_TYPE=sqlite the landing
+database is an embedded SQLite file on local disk instead:
+
+- every execution gets its own database file under LANDING_SQLITE_DIR
+  (for_execution()), deleted when the execution completes (discard())
+- the file is tuned for disposable bulk data: WAL journal, synchronous=OFF,
+  in-memory temp store, large page cache and memory-mapped reads
+- staging tables, indexes and the reconciliation queries are the same as on
+  the server backends (StagingManager / LandingQueryBuilder)
+
+The connector created from the configuration only serves health checks; it
+is backed by an in-memory database. No credentials are needed.
+"""
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, List
+
+from kg_builder import config
+from kg_builder.models import DatabaseConnectionInfo
+from kg_builder.services.landing_db_connector import LandingDBConnector
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = re.compile(r"%%|%s")
+
+
+def _qmark(sql: str) -> str:
+    """Translate the connectors' %s placeholders (and %% escapes) to SQLite's qmark style."""
+    return _PLACEHOLDER.sub(lambda match: '%' if match.group() == '%%' else '?', sql)
+
+
+def _dict_row(cursor: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+    return {description[0]: value for description, value in zip(cursor.description, row)}
+
+
+class _SQLiteCursor:
+    """sqlite3 cursor accepting the %s parameter style used by the landing services."""
+
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+
+    def execute(self, sql: str, params: Any = ()) -> "_SQLiteCursor":
+        self._cursor.execute(_qmark(sql), params or ())
+        return self
+
+    def executemany(self, sql: str, rows: Any) -> "_SQLiteCursor":
+        self._cursor.executemany(_qmark(sql), rows)
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+
+class SQLiteLandingConnector(LandingDBConnector):
+    """Embedded SQLite landing database, one file per execution."""
+
+    db_type = "sqlite"
+    per_execution_database = True
+
+    def __init__(self, db_config: DatabaseConnectionInfo, database_path: str = ":memory:"):
+        """
+        Initialize embedded landing connector.
+
+        Args:
+            db_config: Landing database configuration (db_type sqlite)
+            database_path: Database file (':memory:' for the configuration-level connector)
+        """
+        super().__init__(db_config)
+        self.database_path = database_path
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+    def for_execution(self, execution_id: str) -> "SQLiteLandingConnector":
+        """
+        Connector on a new database file for one execution.
+
+        Args:
+            execution_id: Execution ID (names the file)
+
+        Returns:
+            SQLiteLandingConnector; call discard() when the execution completes
+        """
+        os.makedirs(config.LANDING_SQLITE_DIR, exist_ok=True)
+        path = os.path.join(config.LANDING_SQLITE_DIR, f"landing_{execution_id}.sqlite")
+        logger.info(f"Embedded landing database for {execution_id}: {path}")
+        return SQLiteLandingConnector(self.db_config, path)
+
+    def connect(self) -> Any:
+        """
+        Open the database file with bulk-load pragmas.
+
+        Returns:
+            sqlite3 connection object
+        """
+        try:
+            conn = sqlite3.connect(
+                self.database_path,
+                timeout=config.LANDING_SQLITE_BUSY_TIMEOUT_SECONDS,
+                check_same_thread=False  # discard() closes every thread's connection
+            )
+            conn.execute("PRAGMA journal_mode=WAL")  # Readers do not block the loading threads
+            conn.execute("PRAGMA synchronous=OFF")  # The file is deleted after the execution
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute(f"PRAGMA cache_size=-{config.LANDING_SQLITE_CACHE_MB * 1024}")
+            conn.execute(f"PRAGMA mmap_size={config.LANDING_SQLITE_CACHE_MB * 1024 * 1024}")
+            with self._connections_lock:
+                self._connections.append(conn)
+            self.connection = conn
+            logger.debug(f"Connected to embedded landing database {self.database_path}")
+            return conn
+        except Exception as e:
+            logger.error(f"Failed to open embedded landing database {self.database_path}: {e}")
+            raise
+
+    def is_connected(self) -> bool:
+        """
+        Check if connection is active.
+
+        Returns:
+            True if connected, False otherwise
+        """
+        return self.connection is not None
+
+    def close(self):
+        """Close the calling thread's database connection."""
+        conn = self.connection
+        if conn is not None:
+            with self._connections_lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+        super().close()
+
+    def discard(self):
+        """Close every connection and delete the database file (and its WAL files)."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.debug(f"Error closing embedded landing connection: {e}")
+        self.connection = None
+
+        if self.database_path == ":memory:":
+            return
+        for path in (self.database_path, f"{self.database_path}-wal", f"{self.database_path}-shm"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Failed to delete embedded landing file {path}: {e}")
+        logger.info(f"Deleted embedded landing database {self.database_path}")
+
+    def _new_cursor(self, conn: Any, dictionary: bool) -> Any:
+        cursor = conn.cursor()
+        if dictionary:
+            cursor.row_factory = _dict_row
+        return _SQLiteCursor(cursor)
+
+    def quote(self, identifier: str) -> str:
+        """Quote a table or column name for SQLite."""
+        return '"' + identifier.replace('"', '""') + '"'
+
+    def staging_table_sql(self, table_name: str, columns: List[Dict[str, Any]]) -> str:
+        """CREATE TABLE statement of a staging table (the staging id is the rowid)."""
+        column_defs = []
+        for col in columns:
+            null_clause = '' if col.get('nullable', True) else 'NOT NULL'
+            # SQLite derives the storage affinity from the type name; VARBINARY would be NUMERIC
+            col_type = col.get('type', 'TEXT')
+            if col_type.upper().startswith('VARBINARY'):
+                col_type = 'BLOB'
+            column_defs.append(f"{self.quote(col['name'])} {col_type} {null_clause}")
+        columns_sql = ',\n    '.join(column_defs)
+
+        return f"""
+            CREATE TABLE IF NOT EXISTS {self.quote(table_name)} (
+                "_staging_id" INTEGER PRIMARY KEY,
+                "_created_at" TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                {columns_sql}
+            )
+            """
+
+    def table_size_mb(self, table_name: str) -> float:
+        """Size of a table and its indexes in MB (0 when the dbstat table is not compiled in)."""
+        try:
+            result = self.execute_one("""
+                SELECT ROUND(SUM(pgsize) / 1024.0 / 1024, 2) as size_mb
+                FROM dbstat
+                WHERE name = %s
+                OR name IN (SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = %s)
+            """, (table_name, table_name))
+            return float(result.get('size_mb') or 0) if result else 0
+        except Exception:
+            return 0
+
+    def table_indexes(self, table_name: str) -> List[str]:
+        """Secondary index names of a table."""
+        rows = self.execute("""
+            SELECT name as index_name
+            FROM sqlite_master
+            WHERE type = 'index' AND tbl_name = %s AND sql IS NOT NULL
+        """, (table_name,))
+        return [row['index_name'] for row in rows or []]
+
+    def analyze_table(self, table_name: str):
+        """Collect index statistics for the query planner."""
+        try:
+            with self.cursor() as cursor:
+                cursor.execute(f"ANALYZE {self.quote(table_name)}")
+        except Exception as e:
+            logger.warning(f"Failed to analyze {table_name}: {e}")
+
+    def get_database_info(self) -> dict:
+        """
+        Get database information.
+
+        Returns:
+            Dictionary with database info
+        """
+        try:
+            version = self.execute_one("SELECT sqlite_version() as version")
+            table_count = self.execute_one("""
+                SELECT COUNT(*) as count
+                FROM sqlite_master
+                WHERE type = 'table' AND name LIKE 'recon_stage_%%'
+            """)
+            size_mb = 0.0
+            if self.database_path != ":memory:" and os.path.exists(self.database_path):
+                size_mb = round(os.path.getsize(self.database_path) / 1024 / 1024, 2)
+
+            return {
+                "database": self.database_path,
+                "version": f"SQLite {version.get('version')}" if version else "Unknown",
+                "size_mb": size_mb,
+                "staging_table_count": table_count.get('count', 0) if table_count else 0,
+                "connected": self.is_connected()
+            }
+        except Exception as e:
+            logger.error(f"Failed to get database info: {e}")
+            return {
+                "database": self.database_path,
+                "error": str(e),
+                "connected": False
+            }
+
+    def create_schema_if_not_exists(self, schema_name: str):
+        """Schemas do not apply to the embedded database (one file per execution)."""
+        logger.debug(f"Embedded landing database ignores schema '{schema_name}'")
@@ -8,8 +8,10 @@ import logging
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, asdict
 
+from kg_builder.config import RESULT_STREAM_MAX_ROWS
 from kg_builder.services.nl_query_parser import QueryIntent
 from kg_builder.services.nl_sql_generator import NLSQLGenerator
+from kg_builder.services.row_stream import RowStream
 
 if TYPE_CHECKING:
     from kg_builder.models import KnowledgeGraph
@@ -32,6 +34,7 @@ class QueryResult:
     error: Optional[str] = None
     source_table: Optional[str] = None
     target_table: Optional[str] = None
+    truncated: bool = False  # records stop at RESULT_STREAM_MAX_ROWS; the query returned more rows
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -137,22 +140,17 @@ class NLQueryExecutor:
             logger.info(success_msg)
             print(success_msg)
 
-            # Fetch results
-            rows = cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description] if cursor.description else []
-
-            # Convert rows to dictionaries
-            records = []
-            for row in rows:
-                record = {}
-                for i, col in enumerate(columns):
-                    record[col] = row[i]
-                records.append(record)
+            # Stream results as dictionaries (columnar batches, capped at RESULT_STREAM_MAX_ROWS)
+            stream = RowStream(cursor, max_rows=RESULT_STREAM_MAX_ROWS)
+            records = stream.read_records()
 
             result.records = records
             result.record_count = len(records)
+            result.truncated = stream.truncated
 
             result_msg = f"📊 Query Result: Found {result.record_count} records in {(time.time() - start_time)*1000:.2f}ms"
+            if result.truncated:
+                result_msg += f" (truncated at RESULT_STREAM_MAX_ROWS={RESULT_STREAM_MAX_ROWS})"
             logger.info(result_msg)
             print(result_msg)
 
@@ -5,38 +5,71 @@ This service executes SQL-based reconciliation queries to find matched and unmat
 """
 
 import logging
+import threading
 import time
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
-from pathlib import Path
-
-try:
-    import jaydebeapi
-    JAYDEBEAPI_AVAILABLE = True
-except ImportError:
-    JAYDEBEAPI_AVAILABLE = False
-    logging.warning("JayDeBeApi not installed. Database execution will not be available.")
+from typing import Callable, Dict, List, Any, Optional, Tuple
 
 from kg_builder.models import (
     ReconciliationRule,
     ReconciliationRuleSet,
     DatabaseConnectionInfo,
     MatchedRecord,
-    RuleExecutionResponse
+    RuleExecutionResponse,
+    ReconciliationExecutionMode,
+    ChecksumDiffResponse,
+    LandingExecutionRequest
+)
+from kg_builder.config import (
+    RECON_FETCH_BATCH_SIZE,
+    RECON_MAX_WORKERS,
+    RECON_MAX_CONNECTIONS_PER_DB,
+    JDBC_POOL_MAX_SIZE,
+    RECON_RESULTS_DIR,
+    RECON_RESULT_COMPRESSION,
+    get_landing_db_config
 )
-from kg_builder.config import JDBC_DRIVERS_PATH
 from kg_builder.services.rule_storage import get_rule_storage
+from kg_builder.services.hash_join_reconciler import PartitionedHashJoin
+from kg_builder.services.result_file_store import ResultFileWriter, result_file_name
+from kg_builder.services.checksum_diff import ChecksumDiffer, ChecksumSide, value_kind
+from kg_builder.services.incremental_reconciler import (
+    IncrementalReconciler,
+    ReconcileSide,
+    get_incremental_reconciler
+)
+from kg_builder.services.rule_plan_compiler import (
+    RulePlan,
+    RuleSetPlan,
+    get_rule_plan_compiler,
+    limit_clause,
+    normalize_schema_name,
+    quote_identifier
+)
+from kg_builder.services.catalog_service import get_catalog_service
+from kg_builder.services.jdbc_connection_pool import attach_thread_to_jvm, get_connection_manager
+from kg_builder.services.jdbc_fetch import fetch_batches
+from kg_builder.services.row_stream import RowStream
+from kg_builder.services.execution_planner import ExecutionPlanner, RuleStrategy, get_execution_planner
 
 logger = logging.getLogger(__name__)
 
+# Helper columns added by the single-pass classification query (no leading
+# underscore: Oracle identifiers must start with a letter)
+SINGLE_PASS_SOURCE_MARKER = "recon_src_marker"
+SINGLE_PASS_TARGET_MARKER = "recon_tgt_marker"
+SINGLE_PASS_INACTIVE_COLUMN = "recon_inactive_total"
+SINGLE_PASS_STATUS_COLUMN = "recon_status"
+SINGLE_PASS_COUNT_COLUMN = "recon_status_count"
+SINGLE_PASS_ROW_NUMBER_COLUMN = "recon_status_row"
+
 
 class ReconciliationExecutor:
     """Execute reconciliation rules against actual databases using SQL."""
 
     def __init__(self):
         """Initialize the reconciliation executor."""
-        self.jdbc_drivers_path = Path(JDBC_DRIVERS_PATH) if JDBC_DRIVERS_PATH else None
         self.storage = get_rule_storage()
 
     @staticmethod
@@ -53,12 +86,7 @@ class ReconciliationExecutor:
         Returns:
             Normalized schema name
         """
-        if db_type.lower() == "sqlserver":
-            # If schema looks like a filename (has -, _, or mix of cases), use 'dbo'
-            if any(char in schema_name for char in ['-', '_']) or schema_name.islower():
-                logger.info(f"Normalizing SQL Server schema '{schema_name}' to 'dbo'")
-                return "dbo"
-        return schema_name
+        return normalize_schema_name(schema_name, db_type)
 
     @staticmethod
     def _quote_identifier(identifier: str, db_type: str = "mysql") -> str:
@@ -72,26 +100,7 @@ class ReconciliationExecutor:
         Returns:
             Quoted identifier appropriate for the database type
         """
-        if not identifier:
-            return identifier
-
-        db_type = db_type.lower()
-
-        if db_type == "mysql":
-            # MySQL uses backticks
-            return f"`{identifier}`"
-        elif db_type == "oracle":
-            # Oracle uses double quotes
-            return f'"{identifier}"'
-        elif db_type == "postgresql":
-            # PostgreSQL uses double quotes
-            return f'"{identifier}"'
-        elif db_type == "sqlserver":
-            # SQL Server uses square brackets
-            return f"[{identifier}]"
-        else:
-            # Default to backticks (MySQL style)
-            return f"`{identifier}`"
+        return quote_identifier(identifier, db_type)
 
     def _log_sql_query(self, query_type: str, rule_name: str, sql: str, attempt: str = "FIRST"):
         """
@@ -123,21 +132,7 @@ class ReconciliationExecutor:
         Returns:
             Database-specific limit clause
         """
-        db_type = db_type.lower()
-
-        if db_type == "mysql":
-            return f"LIMIT {limit}"
-        elif db_type == "oracle":
-            # Oracle uses ROWNUM in WHERE clause
-            return f"AND ROWNUM <= {limit}" if is_where_clause else f"WHERE ROWNUM <= {limit}"
-        elif db_type == "postgresql":
-            return f"LIMIT {limit}"
-        elif db_type == "sqlserver":
-            # SQL Server uses TOP in SELECT clause
-            return f"TOP {limit}"
-        else:
-            # Default to MySQL style
-            return f"LIMIT {limit}"
+        return limit_clause(limit, db_type, is_where_clause)
 
     def execute_ruleset(
         self,
@@ -146,7 +141,10 @@ class ReconciliationExecutor:
         target_db_config: DatabaseConnectionInfo,
         limit: int = 100,
         include_matched: bool = True,
-        include_unmatched: bool = True
+        include_unmatched: bool = True,
+        execution_mode: ReconciliationExecutionMode = ReconciliationExecutionMode.STANDARD,
+        parallel: bool = False,
+        max_workers: Optional[int] = None
     ) -> RuleExecutionResponse:
         """
         Execute a complete ruleset against databases.
@@ -155,20 +153,25 @@ class ReconciliationExecutor:
             ruleset_id: ID of the ruleset to execute
             source_db_config: Source database connection info
             target_db_config: Target database connection info
-            limit: Maximum number of records to return per category
+            limit: Maximum number of records to return per category. Only bounds the
+                returned sample; matched/unmatched counts are exact totals
             include_matched: Include matched records in results
             include_unmatched: Include unmatched records in results
+            execution_mode: STANDARD runs SQL joins on the source connection;
+                HASH_JOIN streams both sides and reconciles in-process;
+                SINGLE_PASS classifies all rows of a rule with one query;
+                INCREMENTAL re-evaluates only keys changed since the last run;
+                LANDING stages both sides in the landing database (counts only);
+                AUTO lets the execution planner pick standard, hash_join or landing
+                per rule and reports its estimates as execution_plan
+            parallel: Execute rules concurrently, each worker on its own connections
+            max_workers: Worker pool size for parallel execution (default: RECON_MAX_WORKERS)
 
         Returns:
             RuleExecutionResponse with matched and unmatched records, generated SQL, and file path
         """
-        if not JAYDEBEAPI_AVAILABLE:
-            raise RuntimeError(
-                "JayDeBeApi is not installed. "
-                "Please install it with: pip install JayDeBeApi"
-            )
-
-        logger.info(f"Executing ruleset '{ruleset_id}' with limit={limit}")
+        execution_mode = ReconciliationExecutionMode(execution_mode)
+        logger.info(f"Executing ruleset '{ruleset_id}' with limit={limit}, mode={execution_mode.value}")
         start_time = time.time()
 
         # Load the ruleset
@@ -179,6 +182,7 @@ class ReconciliationExecutor:
         # Connect to databases
         source_conn = None
         target_conn = None
+        result_file = None
 
         try:
             # Establish connections
@@ -192,83 +196,153 @@ class ReconciliationExecutor:
             if not target_conn:
                 raise RuntimeError("Failed to connect to target database")
 
-            # Execute all rules and collect SQL queries
-            all_matched = []
-            all_unmatched_source = []
-            all_unmatched_target = []
-            generated_sql = []
+            # Incremental snapshots are kept per ruleset and database pair
+            snapshot_scope = (
+                f"{ruleset_id}|{source_db_config.connection_key()}|{target_db_config.connection_key()}"
+            )
 
-            for rule in ruleset.rules:
-                logger.debug(f"Executing rule: {rule.rule_name}")
+            # Compiled once per ruleset version and database, resolved against the
+            # catalog cache: SQL joins run on the source connection; queries that
+            # read only the target side use the target plans
+            plans = list(self.compile_ruleset_plan(ruleset, source_conn, source_db_config).plans)
+            target_plans = list(self.compile_ruleset_plan(ruleset, target_conn, target_db_config).plans)
+
+            # AUTO: pick a strategy per rule from catalog statistics and co-location
+            execution_plan: List[RuleStrategy] = []
+            rule_modes = [execution_mode] * len(ruleset.rules)
+            if execution_mode == ReconciliationExecutionMode.AUTO:
+                execution_plan = get_execution_planner().plan_rules(
+                    ruleset.rules, plans, source_conn, target_conn,
+                    source_db_config, target_db_config,
+                    landing_available=get_landing_db_config() is not None
+                )
+                rule_modes = [strategy.execution_mode for strategy in execution_plan]
 
-                # Execute matched records query
-                if include_matched:
-                    matched, matched_sql = self._execute_matched_query(
-                        source_conn, target_conn, rule, limit, source_db_config.db_type
-                    )
-                    all_matched.extend(matched)
-                    if matched_sql:
-                        generated_sql.append(matched_sql)
+            # Records are written to the result file while the rules fetch them
+            result_file = self._open_result_file(ruleset_id)
 
-                # Execute unmatched queries
-                if include_unmatched:
-                    unmatched_src, unmatched_src_sql = self._execute_unmatched_source_query(
-                        source_conn, target_conn, rule, limit, source_db_config.db_type
+            outcomes: List[Optional[Dict[str, Any]]] = [None] * len(ruleset.rules)
+
+            # Landing rules are staged and reconciled by the landing executor, one at a time
+            for index, rule in enumerate(ruleset.rules):
+                if rule_modes[index] != ReconciliationExecutionMode.LANDING:
+                    continue
+                try:
+                    outcomes[index] = self._execute_landing_rule(
+                        ruleset_id, rule, source_db_config, target_db_config,
+                        include_matched, include_unmatched
+                    )
+                    self._write_outcome(result_file, outcomes[index])
+                except Exception as e:
+                    rule_modes[index] = (
+                        ReconciliationExecutionMode.HASH_JOIN if self._supports_hash_join(rule)
+                        else ReconciliationExecutionMode.STANDARD
+                    )
+                    logger.warning(
+                        f"Landing execution failed for rule {rule.rule_name}: {e}. "
+                        f"Falling back to {rule_modes[index].value}"
                     )
-                    all_unmatched_source.extend(unmatched_src)
-                    if unmatched_src_sql:
-                        generated_sql.append(unmatched_src_sql)
 
-                    unmatched_tgt, unmatched_tgt_sql = self._execute_unmatched_target_query(
-                        source_conn, target_conn, rule, limit, source_db_config.db_type
+            # Execute the other rules, serially on the shared connections or on a worker pool
+            pending = [index for index, outcome in enumerate(outcomes) if outcome is None]
+            if parallel and len(pending) > 1:
+                # Hand the shared connections back: the workers borrow their own from the same pools
+                for conn in (source_conn, target_conn):
+                    conn.close()
+                source_conn = target_conn = None
+                parallel_outcomes = self._execute_rules_parallel(
+                    [ruleset.rules[index] for index in pending],
+                    source_db_config, target_db_config, limit,
+                    include_matched, include_unmatched, execution_mode, max_workers,
+                    snapshot_scope=snapshot_scope,
+                    plans=[plans[index] for index in pending],
+                    target_plans=[target_plans[index] for index in pending],
+                    rule_modes=[rule_modes[index] for index in pending],
+                    count_inactive_first=(pending[0] == 0),
+                    sink=result_file
+                )
+                for index, outcome in zip(pending, parallel_outcomes):
+                    outcomes[index] = outcome
+            else:
+                for index in pending:
+                    outcomes[index] = self._execute_rule(
+                        source_conn, target_conn, ruleset.rules[index], limit,
+                        source_db_config.db_type, target_db_config.db_type,
+                        include_matched, include_unmatched, rule_modes[index],
+                        count_inactive=(index == 0),
+                        snapshot_scope=snapshot_scope,
+                        plan=plans[index],
+                        target_plan=target_plans[index],
+                        sink=result_file
                     )
-                    all_unmatched_target.extend(unmatched_tgt)
-                    if unmatched_tgt_sql:
-                        generated_sql.append(unmatched_tgt_sql)
+
+            for index, strategy in enumerate(execution_plan):
+                strategy.executed_mode = rule_modes[index]
+                strategy.actual_ms = outcomes[index].get("rule_execution_time_ms")
+
+            # Merge per-rule outcomes in ruleset order so results are deterministic
+            all_matched = []
+            all_unmatched_source = []
+            all_unmatched_target = []
+            generated_sql = []
+            matched_total = 0
+            unmatched_source_total = 0
+            unmatched_target_total = 0
+
+            for outcome in outcomes:
+                all_matched.extend(outcome["matched"])
+                all_unmatched_source.extend(outcome["unmatched_source"])
+                all_unmatched_target.extend(outcome["unmatched_target"])
+                matched_total += outcome["matched_count"]
+                unmatched_source_total += outcome["unmatched_source_count"]
+                unmatched_target_total += outcome["unmatched_target_count"]
+                generated_sql.extend(outcome["sql_info"])
 
             elapsed_ms = (time.time() - start_time) * 1000
 
-            # Count inactive records from source data
-            inactive_count = self._count_inactive_records(
-                source_conn, ruleset, source_db_config.db_type
-            )
+            # Count inactive records from source data (the single-pass query of the
+            # first rule already counted them when the column exists)
+            inactive_count = outcomes[0].get("inactive_count") if outcomes else None
+            if inactive_count is None:
+                if source_conn is None:
+                    source_conn = self._connect_to_database(source_db_config)
+                    if not source_conn:
+                        raise RuntimeError("Failed to connect to source database")
+                inactive_count = self._count_inactive_records(
+                    source_conn, ruleset, source_db_config.db_type, plans[0] if plans else None
+                )
 
             logger.info(
-                f"Execution complete: {len(all_matched)} matched, "
-                f"{len(all_unmatched_source)} unmatched source, "
-                f"{len(all_unmatched_target)} unmatched target, "
+                f"Execution complete: {matched_total} matched, "
+                f"{unmatched_source_total} unmatched source, "
+                f"{unmatched_target_total} unmatched target, "
                 f"{inactive_count} inactive records"
             )
 
             # Prepare response
             response_data = {
                 "success": True,
-                "matched_count": len(all_matched),
-                "unmatched_source_count": len(all_unmatched_source),
-                "unmatched_target_count": len(all_unmatched_target),
+                "matched_count": matched_total,
+                "unmatched_source_count": unmatched_source_total,
+                "unmatched_target_count": unmatched_target_total,
                 "matched_records": all_matched[:limit] if limit else all_matched,
                 "unmatched_source": all_unmatched_source[:limit] if limit else all_unmatched_source,
                 "unmatched_target": all_unmatched_target[:limit] if limit else all_unmatched_target,
                 "execution_time_ms": elapsed_ms,
                 "inactive_count": inactive_count,
-                "generated_sql": generated_sql
+                "generated_sql": generated_sql,
+                "execution_plan": [strategy.to_dict() for strategy in execution_plan]
             }
 
-            # Store results to file
-            result_file_path = None
-            try:
-                result_file_path = self._store_results_to_file(
-                    ruleset_id=ruleset_id,
-                    response_data=response_data,
-                    all_matched=all_matched,
-                    all_unmatched_source=all_unmatched_source,
-                    all_unmatched_target=all_unmatched_target
-                )
-                logger.info(f"Results stored to file: {result_file_path}")
-                response_data["result_file_path"] = result_file_path
-            except Exception as e:
-                logger.warning(f"Failed to store results to file: {e}")
-                # Continue without file storage
+            # Complete the result file with the totals
+            if result_file is not None:
+                try:
+                    response_data["result_file_path"] = self._finish_result_file(
+                        result_file, response_data
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to store results to file: {e}")
+                    # Continue without file storage
 
             return RuleExecutionResponse(**response_data)
 
@@ -277,6 +351,10 @@ class ReconciliationExecutor:
             raise
 
         finally:
+            # Drop a result file left incomplete by a failure (no-op once finished)
+            if result_file is not None:
+                result_file.abort()
+
             # Clean up connections
             if source_conn:
                 try:
@@ -292,11 +370,471 @@ class ReconciliationExecutor:
                 except Exception as e:
                     logger.error(f"Error closing target connection: {e}")
 
+    def _execute_rule(
+        self,
+        source_conn: Any,
+        target_conn: Any,
+        rule: ReconciliationRule,
+        limit: int,
+        source_db_type: str,
+        target_db_type: str,
+        include_matched: bool = True,
+        include_unmatched: bool = True,
+        execution_mode: ReconciliationExecutionMode = ReconciliationExecutionMode.STANDARD,
+        count_inactive: bool = False,
+        snapshot_scope: str = "",
+        plan: Optional[RulePlan] = None,
+        target_plan: Optional[RulePlan] = None,
+        sink: Optional[ResultFileWriter] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a single rule on the given connections.
+
+        Args:
+            count_inactive: SINGLE_PASS only - also count inactive source rows in the
+                same query (returned as inactive_count)
+            snapshot_scope: INCREMENTAL only - identity of the ruleset and databases
+                the rule's key-state snapshot belongs to
+            plan: Compiled plan of the rule for the source dialect (compiled on the
+                fly, with per-query schema fallback, when omitted)
+            target_plan: Compiled plan of the rule resolved against the target database,
+                used by the modes that read the target side on its own connection
+            sink: Result file the rule's records are written to (by the standard
+                queries as they are fetched, by the other modes when the rule ends)
+
+        Returns:
+            Dictionary with matched/unmatched records, their counts and the
+            generated SQL entries (each annotated with its own timing)
+        """
+        logger.debug(f"Executing rule: {rule.rule_name}")
+        rule_start = time.time()
+
+        if execution_mode == ReconciliationExecutionMode.HASH_JOIN:
+            if self._supports_hash_join(rule):
+                outcome = self._execute_hash_join_rule(
+                    source_conn, target_conn, rule, limit,
+                    source_db_type, target_db_type,
+                    include_matched, include_unmatched,
+                    plan, target_plan
+                )
+                outcome["sql_info"] = [outcome["sql_info"]]
+                self._write_outcome(sink, outcome)
+                return self._finalize_rule_outcome(outcome, rule_start)
+            logger.warning(
+                f"Rule {rule.rule_name} uses a transformation or multi-table join; "
+                f"falling back to standard SQL execution"
+            )
+
+        if execution_mode == ReconciliationExecutionMode.INCREMENTAL:
+            if IncrementalReconciler.supports(rule):
+                try:
+                    outcome = self._execute_incremental_rule(
+                        source_conn, target_conn, rule, limit,
+                        source_db_type, target_db_type, snapshot_scope,
+                        include_matched, include_unmatched,
+                        plan, target_plan
+                    )
+                    outcome["sql_info"] = [outcome["sql_info"]]
+                    self._write_outcome(sink, outcome)
+                    return self._finalize_rule_outcome(outcome, rule_start)
+                except Exception as e:
+                    logger.warning(
+                        f"Incremental execution failed for rule {rule.rule_name}: {e}. "
+                        f"Falling back to standard SQL execution"
+                    )
+            else:
+                logger.warning(
+                    f"Rule {rule.rule_name} has no watermark_column or is not a plain column join; "
+                    f"falling back to standard SQL execution"
+                )
+
+        if execution_mode == ReconciliationExecutionMode.SINGLE_PASS:
+            if not rule.is_multi_table():
+                try:
+                    outcome = self._execute_single_pass_rule(
+                        source_conn, rule, limit, source_db_type,
+                        include_matched, include_unmatched, count_inactive, plan
+                    )
+                    outcome["sql_info"]["execution_time_ms"] = (time.time() - rule_start) * 1000
+                    outcome["sql_info"] = [outcome["sql_info"]]
+                    self._write_outcome(sink, outcome)
+                    return self._finalize_rule_outcome(outcome, rule_start)
+                except Exception as e:
+                    logger.warning(
+                        f"Single-pass query failed for rule {rule.rule_name}: {e}. "
+                        f"Falling back to standard SQL execution"
+                    )
+            else:
+                logger.warning(
+                    f"Rule {rule.rule_name} is a multi-table join; falling back to standard SQL execution"
+                )
+
+        outcome = {
+            "matched": [],
+            "unmatched_source": [],
+            "unmatched_target": [],
+            "matched_count": 0,
+            "unmatched_source_count": 0,
+            "unmatched_target_count": 0,
+            "sql_info": []
+        }
+
+        # Execute matched records query
+        if include_matched:
+            query_start = time.time()
+            matched, matched_sql = self._execute_matched_query(
+                source_conn, target_conn, rule, limit, source_db_type, plan, sink
+            )
+            outcome["matched"] = matched
+            outcome["matched_count"] = len(matched)
+            if matched_sql:
+                matched_sql["execution_time_ms"] = (time.time() - query_start) * 1000
+                outcome["sql_info"].append(matched_sql)
+
+        # Execute unmatched queries
+        if include_unmatched:
+            query_start = time.time()
+            unmatched_src, unmatched_src_sql = self._execute_unmatched_source_query(
+                source_conn, target_conn, rule, limit, source_db_type, plan, sink
+            )
+            outcome["unmatched_source"] = unmatched_src
+            outcome["unmatched_source_count"] = len(unmatched_src)
+            if unmatched_src_sql:
+                unmatched_src_sql["execution_time_ms"] = (time.time() - query_start) * 1000
+                outcome["sql_info"].append(unmatched_src_sql)
+
+            query_start = time.time()
+            # Runs on the target connection: use the plan resolved against the target
+            unmatched_tgt, unmatched_tgt_sql = self._execute_unmatched_target_query(
+                source_conn, target_conn, rule, limit, target_db_type, target_plan, sink
+            )
+            outcome["unmatched_target"] = unmatched_tgt
+            outcome["unmatched_target_count"] = len(unmatched_tgt)
+            if unmatched_tgt_sql:
+                unmatched_tgt_sql["execution_time_ms"] = (time.time() - query_start) * 1000
+                outcome["sql_info"].append(unmatched_tgt_sql)
+
+        # The record queries are capped at `limit`; when any of them hit the cap,
+        # replace the sample sizes with exact server-side totals
+        capped = (
+            (include_matched and len(outcome["matched"]) >= limit) or
+            (include_unmatched and (
+                len(outcome["unmatched_source"]) >= limit or
+                len(outcome["unmatched_target"]) >= limit
+            ))
+        )
+        if capped:
+            query_start = time.time()
+            counts, counts_sql = self._execute_count_query(source_conn, rule, source_db_type, plan)
+            if counts:
+                if include_matched:
+                    outcome["matched_count"] = counts["matched_count"]
+                if include_unmatched:
+                    outcome["unmatched_source_count"] = counts["unmatched_source_count"]
+                    outcome["unmatched_target_count"] = counts["unmatched_target_count"]
+                counts_sql["execution_time_ms"] = (time.time() - query_start) * 1000
+                outcome["sql_info"].append(counts_sql)
+            else:
+                logger.warning(
+                    f"Exact counts unavailable for rule {rule.rule_name}; "
+                    f"reporting sample sizes (capped at {limit})"
+                )
+
+        return self._finalize_rule_outcome(outcome, rule_start)
+
+    @staticmethod
+    def _finalize_rule_outcome(outcome: Dict[str, Any], rule_start: float) -> Dict[str, Any]:
+        """Stamp the outcome and every SQL entry of a rule with the rule's total wall time."""
+        rule_time_ms = (time.time() - rule_start) * 1000
+        outcome["rule_execution_time_ms"] = rule_time_ms
+        for sql_info in outcome["sql_info"]:
+            sql_info["rule_execution_time_ms"] = rule_time_ms
+        return outcome
+
+    def _execute_landing_rule(
+        self,
+        ruleset_id: str,
+        rule: ReconciliationRule,
+        source_db_config: DatabaseConnectionInfo,
+        target_db_config: DatabaseConnectionInfo,
+        include_matched: bool = True,
+        include_unmatched: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Reconcile one rule through the landing database.
+
+        Landing reconciliation computes totals in the landing database and returns
+        no sample records; staging tables are dropped afterwards.
+
+        Returns:
+            Rule outcome with exact counts and a single "landing" SQL entry
+
+        Raises:
+            RuntimeError: If the landing database is not configured
+        """
+        from kg_builder.services.landing_reconciliation_executor import get_landing_reconciliation_executor
+
+        landing_executor = get_landing_reconciliation_executor()
+        if landing_executor is None:
+            raise RuntimeError("Landing database is not configured")
+
+        rule_start = time.time()
+        response = landing_executor.execute(LandingExecutionRequest(
+            ruleset_id=ruleset_id,
+            source_db_config=source_db_config,
+            target_db_config=target_db_config,
+            rule_ids=[rule.rule_id],
+            store_in_mongodb=False,
+            keep_staging=False
+        ))
+
+        outcome = {
+            "matched": [],
+            "unmatched_source": [],
+            "unmatched_target": [],
+            "matched_count": response.matched_count if include_matched else 0,
+            "unmatched_source_count": response.unmatched_source_count if include_unmatched else 0,
+            "unmatched_target_count": response.unmatched_target_count if include_unmatched else 0,
+            "sql_info": [{
+                "rule_id": rule.rule_id,
+                "rule_name": rule.rule_name,
+                "query_type": "landing",
+                "source_sql": None,
+                "target_sql": None,
+                "description": (
+                    f"Staged {response.total_source_count} source and {response.total_target_count} "
+                    f"target rows in the landing database and reconciled them there"
+                ),
+                "landing_execution_id": response.execution_id,
+                "extraction_time_ms": response.extraction_time_ms,
+                "execution_time_ms": response.total_time_ms
+            }]
+        }
+        return self._finalize_rule_outcome(outcome, rule_start)
+
+    def _execute_rules_parallel(
+        self,
+        rules: List[ReconciliationRule],
+        source_db_config: DatabaseConnectionInfo,
+        target_db_config: DatabaseConnectionInfo,
+        limit: int,
+        include_matched: bool,
+        include_unmatched: bool,
+        execution_mode: ReconciliationExecutionMode,
+        max_workers: Optional[int] = None,
+        snapshot_scope: str = "",
+        plans: Optional[List[RulePlan]] = None,
+        target_plans: Optional[List[RulePlan]] = None,
+        rule_modes: Optional[List[ReconciliationExecutionMode]] = None,
+        count_inactive_first: bool = True,
+        sink: Optional[ResultFileWriter] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute rules on a bounded worker pool.
+
+        Each worker thread opens and reuses its own source/target connections
+        (JDBC connections are not safe to share across threads). The worker
+        count is capped so no server gets more than RECON_MAX_CONNECTIONS_PER_DB
+        rules at once and every worker's connections fit in one JDBC pool
+        (JDBC_POOL_MAX_SIZE): a worker never waits for a connection held by
+        another worker. The caller must not hold connections of these pools.
+
+        `plans` and `target_plans` (aligned with `rules`) are shared read-only by
+        all workers. `rule_modes` (aligned with `rules`) overrides `execution_mode`
+        per rule; `count_inactive_first` lets the first rule count inactive rows
+        (False when it is not the first rule of the ruleset). All workers write
+        their records to the shared `sink` result file.
+
+        Returns:
+            Rule outcomes in the same order as `rules`
+        """
+        # Source and target in one pool: each worker holds two of its connections
+        per_worker = 2 if source_db_config.connection_key() == target_db_config.connection_key() else 1
+        max_workers = max(1, min(
+            max_workers or RECON_MAX_WORKERS,
+            len(rules),
+            RECON_MAX_CONNECTIONS_PER_DB,
+            JDBC_POOL_MAX_SIZE // per_worker
+        ))
+
+        local = threading.local()
+        opened_connections = []
+        opened_lock = threading.Lock()
+
+        logger.info(
+            f"Executing {len(rules)} rules on {max_workers} workers "
+            f"(max {RECON_MAX_CONNECTIONS_PER_DB} concurrent rules per database)"
+        )
+
+        def worker_connections() -> Tuple[Any, Any]:
+            connections = getattr(local, "connections", None)
+            if connections is None:
+                attach_thread_to_jvm()
+                worker_source = self._connect_to_database(source_db_config)
+                worker_target = self._connect_to_database(target_db_config)
+                with opened_lock:
+                    opened_connections.extend(c for c in (worker_source, worker_target) if c)
+                if not worker_source or not worker_target:
+                    raise RuntimeError(
+                        f"Worker {threading.current_thread().name} failed to connect to "
+                        f"{'source' if not worker_source else 'target'} database"
+                    )
+                connections = (worker_source, worker_target)
+                local.connections = connections
+            return connections
+
+        def run_rule(index: int, rule: ReconciliationRule) -> Dict[str, Any]:
+            worker_source, worker_target = worker_connections()
+            outcome = self._execute_rule(
+                worker_source, worker_target, rule, limit,
+                source_db_config.db_type, target_db_config.db_type,
+                include_matched, include_unmatched,
+                rule_modes[index] if rule_modes else execution_mode,
+                count_inactive=(index == 0 and count_inactive_first),
+                snapshot_scope=snapshot_scope,
+                plan=plans[index] if plans else None,
+                target_plan=target_plans[index] if target_plans else None,
+                sink=sink
+            )
+            for sql_info in outcome["sql_info"]:
+                sql_info["worker"] = threading.current_thread().name
+            return outcome
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="recon-rule") as pool:
+                futures = [pool.submit(run_rule, index, rule) for index, rule in enumerate(rules)]
+                return [future.result() for future in futures]
+        finally:
+            for conn in opened_connections:
+                try:
+                    conn.close()
+                except Exception as e:
+                    logger.error(f"Error closing worker connection: {e}")
+
+    def execute_checksum_diff(
+        self,
+        ruleset_id: str,
+        source_db_config: DatabaseConnectionInfo,
+        target_db_config: DatabaseConnectionInfo,
+        rule_ids: Optional[List[str]] = None,
+        limit: int = 100
+    ) -> ChecksumDiffResponse:
+        """
+        Find attribute-level differences between matched rows with a checksum-bucket diff.
+
+        Each database hashes and aggregates its own rows; only buckets whose checksums
+        differ are drilled into, so unchanged key ranges transfer almost nothing.
+
+        Args:
+            ruleset_id: ID of the ruleset
+            source_db_config: Source database connection info
+            target_db_config: Target database connection info
+            rule_ids: Rules to diff (default: all rules with compare_source_columns)
+            limit: Maximum sample keys returned per category
+
+        Returns:
+            ChecksumDiffResponse with per-rule counts and samples
+        """
+        start_time = time.time()
+        ruleset = self.storage.load_ruleset(ruleset_id)
+        if not ruleset:
+            raise ValueError(f"Ruleset '{ruleset_id}' not found")
+
+        rules = [
+            rule for rule in ruleset.rules
+            if (rule_ids is None or rule.rule_id in rule_ids) and rule.compare_source_columns
+        ]
+        if not rules:
+            raise ValueError(
+                f"No rules in ruleset '{ruleset_id}' define compare_source_columns for a checksum diff"
+            )
+
+        source_conn = None
+        target_conn = None
+        try:
+            source_conn = self._connect_to_database(source_db_config)
+            if not source_conn:
+                raise RuntimeError("Failed to connect to source database")
+            target_conn = self._connect_to_database(target_db_config)
+            if not target_conn:
+                raise RuntimeError("Failed to connect to target database")
+
+            source_plans = self.compile_ruleset_plan(ruleset, source_conn, source_db_config)
+            target_plans = self.compile_ruleset_plan(ruleset, target_conn, target_db_config)
+
+            differ = ChecksumDiffer()
+            rule_results = []
+            for rule in rules:
+                compare_source, compare_target = rule.get_compare_columns()
+                if rule.transformation or rule.is_multi_table() or len(compare_source) != len(compare_target):
+                    logger.warning(f"Skipping checksum diff for rule {rule.rule_name}: unsupported rule shape")
+                    continue
+
+                def side(conn, db_config, name, plan, schema, table, key_columns, compare_columns):
+                    db_type = db_config.db_type
+                    # Catalog types select the canonical rendering hashed on each side
+                    info = get_catalog_service().get_table(conn, db_config.connection_key(), db_type, schema, table)
+                    return ChecksumSide(
+                        conn=conn,
+                        db_type=db_type,
+                        table_refs=plan.refs(name),
+                        key_columns=[self._quote_identifier(col, db_type) for col in key_columns],
+                        compare_columns=[self._quote_identifier(col, db_type) for col in compare_columns],
+                        key_names=list(key_columns),
+                        compare_names=list(compare_columns),
+                        key_kinds=[value_kind(info.column_type(col)) for col in key_columns],
+                        compare_kinds=[value_kind(info.column_type(col)) for col in compare_columns]
+                    )
+
+                result = differ.diff(
+                    side(source_conn, source_db_config, "source", source_plans.get(rule.rule_id),
+                         rule.source_schema, rule.source_table, rule.source_columns, compare_source),
+                    side(target_conn, target_db_config, "target", target_plans.get(rule.rule_id),
+                         rule.target_schema, rule.target_table, rule.target_columns, compare_target),
+                    sample_limit=limit
+                )
+                rule_results.append({
+                    "rule_id": rule.rule_id,
+                    "rule_name": rule.rule_name,
+                    "identical": result.identical,
+                    "mismatched_count": result.mismatched_count,
+                    "source_only_count": result.source_only_count,
+                    "target_only_count": result.target_only_count,
+                    "mismatched": result.mismatched_sample,
+                    "source_only": result.source_only_sample,
+                    "target_only": result.target_only_sample,
+                    "levels": result.levels,
+                    "summary_rows_transferred": result.summary_rows_transferred,
+                    "leaf_rows_transferred": result.leaf_rows_transferred,
+                    "generated_sql": result.queries,
+                    "execution_time_ms": result.execution_time_ms
+                })
+
+            return ChecksumDiffResponse(
+                success=True,
+                ruleset_id=ruleset_id,
+                identical=all(r["identical"] for r in rule_results),
+                mismatched_count=sum(r["mismatched_count"] for r in rule_results),
+                source_only_count=sum(r["source_only_count"] for r in rule_results),
+                target_only_count=sum(r["target_only_count"] for r in rule_results),
+                rules=rule_results,
+                execution_time_ms=(time.time() - start_time) * 1000
+            )
+
+        finally:
+            for conn in (source_conn, target_conn):
+                if conn:
+                    try:
+                        conn.close()
+                    except Exception as e:
+                        logger.error(f"Error closing connection: {e}")
+
     def _count_inactive_records(
         self,
         source_conn: Any,
         ruleset: ReconciliationRuleSet,
-        db_type: str = "mysql"
+        db_type: str = "mysql",
+        plan: Optional[RulePlan] = None
     ) -> int:
         """
         Count inactive records in the source database.
@@ -308,6 +846,8 @@ class ReconciliationExecutor:
             source_conn: Database connection
             ruleset: The reconciliation ruleset
             db_type: Database type (mysql, oracle, etc.)
+            plan: Compiled plan of the first rule; its catalog columns answer whether
+                is_active exists without querying the database
 
         Returns:
             Count of inactive records (0 if is_active column doesn't exist)
@@ -318,112 +858,49 @@ class ReconciliationExecutor:
                 return 0
 
             # Get the first rule to determine source table
-            first_rule = ruleset.rules[0]
-            source_schema = self._normalize_schema_name(first_rule.source_schema, db_type)
-            source_table = first_rule.source_table
-
-            # Quote identifiers based on database type
-            schema_quoted = self._quote_identifier(source_schema, db_type)
-            table_quoted = self._quote_identifier(source_table, db_type)
+            plan = self._rule_plan(ruleset.rules[0], db_type, plan)
             is_active_quoted = self._quote_identifier("is_active", db_type)
+            table_refs = plan.refs("source")
 
-            # First, check if the is_active column exists
             cursor = source_conn.cursor()
-            column_exists = False
-
             try:
-                # Try to check if column exists (database-specific approach)
-                if db_type == "sqlserver":
-                    # SQL Server - check INFORMATION_SCHEMA
-                    check_query = f"""
-                    SELECT COUNT(*)
-                    FROM INFORMATION_SCHEMA.COLUMNS
-                    WHERE TABLE_NAME = '{source_table}'
-                    AND COLUMN_NAME = 'is_active'
-                    """
-                    if source_schema:
-                        check_query = f"""
-                        SELECT COUNT(*)
-                        FROM INFORMATION_SCHEMA.COLUMNS
-                        WHERE TABLE_SCHEMA = '{source_schema}'
-                        AND TABLE_NAME = '{source_table}'
-                        AND COLUMN_NAME = 'is_active'
-                        """
-                elif db_type == "oracle":
-                    # Oracle - check ALL_TAB_COLUMNS
-                    check_query = f"""
-                    SELECT COUNT(*)
-                    FROM ALL_TAB_COLUMNS
-                    WHERE TABLE_NAME = UPPER('{source_table}')
-                    AND COLUMN_NAME = UPPER('is_active')
-                    """
-                    if source_schema:
-                        check_query += f" AND OWNER = UPPER('{source_schema}')"
-                else:
-                    # MySQL/PostgreSQL - check INFORMATION_SCHEMA
-                    check_query = f"""
-                    SELECT COUNT(*)
-                    FROM INFORMATION_SCHEMA.COLUMNS
-                    WHERE TABLE_NAME = '{source_table}'
-                    AND COLUMN_NAME = 'is_active'
-                    """
-                    if source_schema:
-                        check_query += f" AND TABLE_SCHEMA = '{source_schema}'"
-
-                cursor.execute(check_query)
-                result = cursor.fetchone()
-                column_exists = result and result[0] > 0
-
-            except Exception as check_error:
-                # If checking fails, try to query the column directly
-                logger.debug(f"Column existence check failed, trying direct query: {check_error}")
-                try:
-                    test_query = f"SELECT {is_active_quoted} FROM {schema_quoted}.{table_quoted} WHERE 1=0"
-                    cursor.execute(test_query)
-                    column_exists = True
-                except:
-                    try:
-                        test_query = f"SELECT {is_active_quoted} FROM {table_quoted} WHERE 1=0"
-                        cursor.execute(test_query)
-                        column_exists = True
-                    except:
-                        column_exists = False
-
-            # If column doesn't exist, return 0
-            if not column_exists:
-                logger.info(f"Column 'is_active' does not exist in {source_schema}.{source_table}. Skipping inactive count.")
-                cursor.close()
-                return 0
-
-            # Column exists, proceed with counting inactive records
-            query = f"""
+                # First, check if the is_active column exists
+                column_exists = plan.has_column("source", "is_active")
+                if column_exists is None:
+                    column_exists = self._column_exists(cursor, table_refs, "is_active", db_type)
+
+                # If column doesn't exist, return 0
+                if not column_exists:
+                    logger.info(f"Column 'is_active' does not exist in {plan.source_ref}. Skipping inactive count.")
+                    return 0
+
+                # Column exists, proceed with counting inactive records
+                def build_query(table_ref: str) -> str:
+                    return f"""
             SELECT COUNT(*) as inactive_count
-            FROM {schema_quoted}.{table_quoted}
+            FROM {table_ref}
             WHERE {is_active_quoted} = 0 OR {is_active_quoted} IS NULL
             """
 
-            self._log_sql_query("INACTIVE_COUNT", f"{source_schema}.{source_table}", query, "FIRST")
-
-            # Execute query
-            try:
-                cursor.execute(query)
-            except Exception as schema_error:
-                # If schema prefix fails, try without schema (defaults to dbo in SQL Server)
-                logger.warning(f"Query with schema prefix failed: {schema_error}. Trying without schema prefix...")
-                query_no_schema = f"""
-                SELECT COUNT(*) as inactive_count
-                FROM {table_quoted}
-                WHERE {is_active_quoted} = 0 OR {is_active_quoted} IS NULL
-                """
-                self._log_sql_query("INACTIVE_COUNT", f"{source_schema}.{source_table}", query_no_schema, "RETRY")
-                cursor.execute(query_no_schema)
-                query = query_no_schema  # Use the no-schema version for logging
+                query = build_query(table_refs[0])
+                self._log_sql_query("INACTIVE_COUNT", plan.source_ref, query, "FIRST")
+                try:
+                    cursor.execute(query)
+                except Exception as schema_error:
+                    if len(table_refs) == 1:
+                        raise
+                    # If schema prefix fails, try without schema (defaults to dbo in SQL Server)
+                    logger.warning(f"Query with schema prefix failed: {schema_error}. Trying without schema prefix...")
+                    query = build_query(table_refs[1])
+                    self._log_sql_query("INACTIVE_COUNT", plan.source_ref, query, "RETRY")
+                    cursor.execute(query)
 
-            result = cursor.fetchone()
-            cursor.close()
+                result = cursor.fetchone()
+            finally:
+                cursor.close()
 
             inactive_count = result[0] if result else 0
-            logger.info(f"Found {inactive_count} inactive records in {source_schema}.{source_table}")
+            logger.info(f"Found {inactive_count} inactive records in {plan.source_ref}")
 
             return inactive_count
 
@@ -471,15 +948,20 @@ class ReconciliationExecutor:
         self,
         rule: ReconciliationRule,
         db_type: str = "mysql",
-        limit_clause: str = ""
+        limit_clause: str = "",
+        count_only: bool = False
     ) -> str:
-        """Build SQL query for multi-table joins."""
+        """Build SQL query for multi-table joins (or its row count with count_only=True)."""
         join_tables = rule.get_join_tables()
         join_order = rule.get_join_order()
         join_types = rule.get_join_types()
 
         # Build SELECT clause
-        select_clause = self._build_select_clause(rule, db_type, limit_clause)
+        if count_only:
+            select_clause = "SELECT COUNT(*)"
+            limit_clause = ""
+        else:
+            select_clause = self._build_select_clause(rule, db_type, limit_clause)
 
         # Build FROM clause with first table
         first_table = join_order[0]
@@ -547,9 +1029,10 @@ class ReconciliationExecutor:
         source_conn: Any,
         rule: ReconciliationRule,
         limit: int,
-        db_type: str = "mysql"
+        db_type: str = "mysql",
+        sink: Optional[ResultFileWriter] = None
     ) -> Tuple[List[MatchedRecord], Optional[Dict[str, Any]]]:
-        """Execute query to find matched records for multi-table joins."""
+        """Execute query to find matched records for multi-table joins (each also written to `sink`)."""
         try:
             # Get database-specific limit clause
             limit_clause = self._get_limit_clause(limit, db_type, is_where_clause=False)
@@ -567,17 +1050,9 @@ class ReconciliationExecutor:
                 logger.debug(f"Query was: {query}")
                 return [], None
 
-            # Get column names
-            all_columns = [desc[0] for desc in cursor.description]
-
-            # Fetch results
-            rows = cursor.fetchall()
-            cursor.close()
-
+            # Stream results in column batches (the stream closes the cursor)
             matched_records = []
-            for row in rows:
-                row_dict = dict(zip(all_columns, row))
-
+            for row_dict in RowStream(cursor).records():
                 matched_records.append(MatchedRecord(
                     source_record=row_dict,
                     target_record=row_dict,
@@ -585,6 +1060,8 @@ class ReconciliationExecutor:
                     rule_used=rule.rule_id,
                     rule_name=rule.rule_name
                 ))
+                if sink is not None:
+                    sink.write_record("matched", self._matched_file_record(matched_records[-1]))
 
             logger.debug(f"Found {len(matched_records)} matched records for multi-table rule {rule.rule_name}")
 
@@ -607,97 +1084,102 @@ class ReconciliationExecutor:
             logger.error(f"Error executing multi-table matched query: {e}")
             return [], None
 
+    def _rule_plan(self, rule: ReconciliationRule, db_type: str, plan: Optional[RulePlan] = None) -> RulePlan:
+        """Return the compiled plan of a rule, compiling it (schema unresolved) when none was given."""
+        return plan or get_rule_plan_compiler().compile_rule(rule, db_type)
+
+    def compile_ruleset_plan(
+        self,
+        ruleset: ReconciliationRuleSet,
+        conn: Any,
+        db_config: DatabaseConnectionInfo
+    ) -> RuleSetPlan:
+        """
+        Compile (or reuse) the plans of a ruleset for the database behind `conn`.
+
+        All tables of the ruleset are looked up in the catalog cache (one bulk
+        catalog query on a miss), so every plan carries the table reference that
+        works on this database and the rule queries never retry without schema.
+        Plans are reused until the ruleset or the cached catalog entries change.
+        """
+        catalog = get_catalog_service()
+        scope = db_config.connection_key()
+        tables = []
+        for rule in ruleset.rules:
+            tables.append((rule.source_schema, rule.source_table))
+            tables.append((rule.target_schema, rule.target_table))
+        catalog.load_tables(conn, scope, db_config.db_type, tables)
+
+        return get_rule_plan_compiler().compile(
+            ruleset,
+            db_config.db_type,
+            table_resolver=catalog.table_resolver(conn, scope, db_config.db_type),
+            scope=f"{scope}@{catalog.version(scope)}"
+        )
+
+    def _execute_plan_query(
+        self,
+        conn: Any,
+        plan: RulePlan,
+        query_type: str,
+        build_query: Callable[[RulePlan], str]
+    ) -> Tuple[Any, str]:
+        """
+        Execute a query built from a rule plan and return (cursor, executed SQL).
+
+        Plans whose table references were resolved at compile time run as is; for
+        unresolved plans a failing schema-prefixed query is retried without schema.
+        """
+        query = build_query(plan)
+        self._log_sql_query(query_type, plan.rule_name, query, "FIRST")
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query)
+        except Exception as schema_error:
+            if plan.schema_resolved:
+                cursor.close()
+                raise
+            # If schema prefix fails, try without schema (defaults to dbo in SQL Server)
+            logger.warning(f"Query with schema prefix failed: {schema_error}. Trying without schema prefix...")
+            query = build_query(plan.without_schema())
+            self._log_sql_query(query_type, plan.rule_name, query, "RETRY")
+            try:
+                cursor.execute(query)
+            except Exception:
+                cursor.close()
+                raise
+        return cursor, query
+
     def _execute_matched_query(
         self,
         source_conn: Any,
         target_conn: Any,
         rule: ReconciliationRule,
         limit: int,
-        db_type: str = "mysql"
+        db_type: str = "mysql",
+        plan: Optional[RulePlan] = None,
+        sink: Optional[ResultFileWriter] = None
     ) -> Tuple[List[MatchedRecord], Optional[Dict[str, Any]]]:
-        """Execute query to find matched records. Returns (records, sql_info)."""
+        """Execute query to find matched records (each also written to `sink`). Returns (records, sql_info)."""
         try:
             # Check if this is a multi-table rule
             if rule.is_multi_table():
                 return self._execute_multi_table_matched_query(
-                    source_conn, rule, limit, db_type
+                    source_conn, rule, limit, db_type, sink
                 )
 
             # Original 2-table logic
-            # Build JOIN query
-            join_conditions = []
-            for src_col, tgt_col in zip(rule.source_columns, rule.target_columns):
-                if rule.transformation:
-                    join_conditions.append(f"{rule.transformation} = t.{tgt_col}")
-                else:
-                    join_conditions.append(f"s.{src_col} = t.{tgt_col}")
-
-            join_condition = " AND ".join(join_conditions)
-
-            # Normalize and quote identifiers based on database type
-            source_schema = self._normalize_schema_name(rule.source_schema, db_type)
-            target_schema = self._normalize_schema_name(rule.target_schema, db_type)
-
-            source_schema_quoted = self._quote_identifier(source_schema, db_type)
-            source_table_quoted = self._quote_identifier(rule.source_table, db_type)
-            target_schema_quoted = self._quote_identifier(target_schema, db_type)
-            target_table_quoted = self._quote_identifier(rule.target_table, db_type)
-
-            # Get database-specific limit clause
-            limit_clause = self._get_limit_clause(limit, db_type, is_where_clause=False)
-
-            # For SQL Server, TOP goes in SELECT clause
-            if db_type.lower() == "sqlserver":
-                query = f"""
-            SELECT {limit_clause} s.*, t.*
-            FROM {source_schema_quoted}.{source_table_quoted} s
-            INNER JOIN {target_schema_quoted}.{target_table_quoted} t
-                ON {join_condition}
-            """
-            else:
-                # For MySQL, Oracle, PostgreSQL, LIMIT goes at the end
-                query = f"""
-            SELECT s.*, t.*
-            FROM {source_schema_quoted}.{source_table_quoted} s
-            INNER JOIN {target_schema_quoted}.{target_table_quoted} t
-                ON {join_condition}
-            {limit_clause}
-            """
-
-            self._log_sql_query("MATCHED", rule.rule_name, query, "FIRST")
-
-            cursor = source_conn.cursor()
-            try:
-                cursor.execute(query)
-            except Exception as schema_error:
-                # If schema prefix fails, try without schema (defaults to dbo in SQL Server)
-                logger.warning(f"Query with schema prefix failed: {schema_error}. Trying without schema prefix...")
-                query_no_schema = f"""
-                SELECT s.*, t.*
-                FROM {source_table_quoted} s
-                INNER JOIN {target_table_quoted} t
-                    ON {join_condition}
-                {limit_clause}
-                """
-                self._log_sql_query("MATCHED", rule.rule_name, query_no_schema, "RETRY")
-                cursor.execute(query_no_schema)
-                query = query_no_schema  # Use the no-schema version for response
-
-            # Get column names
-            source_columns = []
-            target_columns = []
-            all_columns = [desc[0] for desc in cursor.description]
-
-            # Fetch results
-            rows = cursor.fetchall()
-            cursor.close()
+            plan = self._rule_plan(rule, db_type, plan)
+            cursor, query = self._execute_plan_query(
+                source_conn, plan, "MATCHED", lambda p: p.matched_sql(limit)
+            )
 
+            # Stream results in column batches (the stream closes the cursor)
             matched_records = []
-            for row in rows:
+            for row_dict in RowStream(cursor).records():
                 # Split row data into source and target
                 # This is simplified - in production, you'd need better column mapping
-                row_dict = dict(zip(all_columns, row))
-
                 matched_records.append(MatchedRecord(
                     source_record=row_dict,  # Simplified
                     target_record=row_dict,  # Simplified
@@ -705,6 +1187,8 @@ class ReconciliationExecutor:
                     rule_used=rule.rule_id,
                     rule_name=rule.rule_name
                 ))
+                if sink is not None:
+                    sink.write_record("matched", self._matched_file_record(matched_records[-1]))
 
             logger.debug(f"Found {len(matched_records)} matched records for rule {rule.rule_name}")
 
@@ -730,91 +1214,26 @@ class ReconciliationExecutor:
         target_conn: Any,
         rule: ReconciliationRule,
         limit: int,
-        db_type: str = "mysql"
+        db_type: str = "mysql",
+        plan: Optional[RulePlan] = None,
+        sink: Optional[ResultFileWriter] = None
     ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
-        """Execute query to find unmatched source records. Returns (records, sql_info)."""
+        """Execute query to find unmatched source records (each also written to `sink`). Returns (records, sql_info)."""
         try:
             # Build NOT EXISTS query
-            join_conditions = []
-            for src_col, tgt_col in zip(rule.source_columns, rule.target_columns):
-                if rule.transformation:
-                    join_conditions.append(f"{rule.transformation} = t.{tgt_col}")
-                else:
-                    join_conditions.append(f"s.{src_col} = t.{tgt_col}")
-
-            join_condition = " AND ".join(join_conditions)
-
-            # Normalize and quote identifiers based on database type
-            source_schema = self._normalize_schema_name(rule.source_schema, db_type)
-            target_schema = self._normalize_schema_name(rule.target_schema, db_type)
-
-            source_schema_quoted = self._quote_identifier(source_schema, db_type)
-            source_table_quoted = self._quote_identifier(rule.source_table, db_type)
-            target_schema_quoted = self._quote_identifier(target_schema, db_type)
-            target_table_quoted = self._quote_identifier(rule.target_table, db_type)
-
-            # Get database-specific limit clause
-            limit_clause = self._get_limit_clause(limit, db_type, is_where_clause=False)
-
-            # For SQL Server, TOP goes in SELECT clause
-            if db_type.lower() == "sqlserver":
-                query = f"""
-            SELECT {limit_clause} s.*
-            FROM {source_schema_quoted}.{source_table_quoted} s
-            WHERE NOT EXISTS (
-                SELECT 1
-                FROM {target_schema_quoted}.{target_table_quoted} t
-                WHERE {join_condition}
-            )
-            """
-            else:
-                # For MySQL, Oracle, PostgreSQL, LIMIT goes at the end
-                query = f"""
-            SELECT s.*
-            FROM {source_schema_quoted}.{source_table_quoted} s
-            WHERE NOT EXISTS (
-                SELECT 1
-                FROM {target_schema_quoted}.{target_table_quoted} t
-                WHERE {join_condition}
+            plan = self._rule_plan(rule, db_type, plan)
+            cursor, query = self._execute_plan_query(
+                source_conn, plan, "UNMATCHED_SOURCE", lambda p: p.unmatched_source_sql(limit)
             )
-            {limit_clause}
-            """
-
-            self._log_sql_query("UNMATCHED_SOURCE", rule.rule_name, query, "FIRST")
-
-            cursor = source_conn.cursor()
-            try:
-                cursor.execute(query)
-            except Exception as schema_error:
-                # If schema prefix fails, try without schema (defaults to dbo in SQL Server)
-                logger.warning(f"Query with schema prefix failed: {schema_error}. Trying without schema prefix...")
-                query_no_schema = f"""
-                SELECT s.*
-                FROM {source_table_quoted} s
-                WHERE NOT EXISTS (
-                    SELECT 1
-                    FROM {target_table_quoted} t
-                    WHERE {join_condition}
-                )
-                {limit_clause}
-                """
-                self._log_sql_query("UNMATCHED_SOURCE", rule.rule_name, query_no_schema, "RETRY")
-                cursor.execute(query_no_schema)
-                query = query_no_schema  # Use the no-schema version for response
-
-            # Get column names
-            columns = [desc[0] for desc in cursor.description]
-
-            # Fetch results
-            rows = cursor.fetchall()
-            cursor.close()
 
+            # Stream results in column batches (the stream closes the cursor)
             unmatched = []
-            for row in rows:
-                row_dict = dict(zip(columns, row))
+            for row_dict in RowStream(cursor).records():
                 row_dict['rule_id'] = rule.rule_id
                 row_dict['rule_name'] = rule.rule_name
                 unmatched.append(row_dict)
+                if sink is not None:
+                    sink.write_record("unmatched_source", row_dict)
 
             logger.debug(f"Found {len(unmatched)} unmatched source records for rule {rule.rule_name}")
 
@@ -840,91 +1259,31 @@ class ReconciliationExecutor:
         target_conn: Any,
         rule: ReconciliationRule,
         limit: int,
-        db_type: str = "mysql"
+        db_type: str = "mysql",
+        plan: Optional[RulePlan] = None,
+        sink: Optional[ResultFileWriter] = None
     ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
-        """Execute query to find unmatched target records. Returns (records, sql_info)."""
+        """
+        Execute query to find unmatched target records (each also written to `sink`).
+
+        The query runs on `target_conn`, so `db_type` and `plan` must be the target's.
+        Returns (records, sql_info).
+        """
         try:
             # Build NOT EXISTS query
-            join_conditions = []
-            for src_col, tgt_col in zip(rule.source_columns, rule.target_columns):
-                if rule.transformation:
-                    join_conditions.append(f"{rule.transformation} = t.{tgt_col}")
-                else:
-                    join_conditions.append(f"s.{src_col} = t.{tgt_col}")
-
-            join_condition = " AND ".join(join_conditions)
-
-            # Normalize and quote identifiers based on database type
-            source_schema = self._normalize_schema_name(rule.source_schema, db_type)
-            target_schema = self._normalize_schema_name(rule.target_schema, db_type)
-
-            source_schema_quoted = self._quote_identifier(source_schema, db_type)
-            source_table_quoted = self._quote_identifier(rule.source_table, db_type)
-            target_schema_quoted = self._quote_identifier(target_schema, db_type)
-            target_table_quoted = self._quote_identifier(rule.target_table, db_type)
-
-            # Get database-specific limit clause
-            limit_clause = self._get_limit_clause(limit, db_type, is_where_clause=False)
-
-            # For SQL Server, TOP goes in SELECT clause
-            if db_type.lower() == "sqlserver":
-                query = f"""
-            SELECT {limit_clause} t.*
-            FROM {target_schema_quoted}.{target_table_quoted} t
-            WHERE NOT EXISTS (
-                SELECT 1
-                FROM {source_schema_quoted}.{source_table_quoted} s
-                WHERE {join_condition}
+            plan = self._rule_plan(rule, db_type, plan)
+            cursor, query = self._execute_plan_query(
+                target_conn, plan, "UNMATCHED_TARGET", lambda p: p.unmatched_target_sql(limit)
             )
-            """
-            else:
-                # For MySQL, Oracle, PostgreSQL, LIMIT goes at the end
-                query = f"""
-            SELECT t.*
-            FROM {target_schema_quoted}.{target_table_quoted} t
-            WHERE NOT EXISTS (
-                SELECT 1
-                FROM {source_schema_quoted}.{source_table_quoted} s
-                WHERE {join_condition}
-            )
-            {limit_clause}
-            """
-
-            self._log_sql_query("UNMATCHED_TARGET", rule.rule_name, query, "FIRST")
-
-            cursor = target_conn.cursor()
-            try:
-                cursor.execute(query)
-            except Exception as schema_error:
-                # If schema prefix fails, try without schema (defaults to dbo in SQL Server)
-                logger.warning(f"Query with schema prefix failed: {schema_error}. Trying without schema prefix...")
-                query_no_schema = f"""
-                SELECT t.*
-                FROM {target_table_quoted} t
-                WHERE NOT EXISTS (
-                    SELECT 1
-                    FROM {source_table_quoted} s
-                    WHERE {join_condition}
-                )
-                {limit_clause}
-                """
-                self._log_sql_query("UNMATCHED_TARGET", rule.rule_name, query_no_schema, "RETRY")
-                cursor.execute(query_no_schema)
-                query = query_no_schema  # Use the no-schema version for response
-
-            # Get column names
-            columns = [desc[0] for desc in cursor.description]
-
-            # Fetch results
-            rows = cursor.fetchall()
-            cursor.close()
 
+            # Stream results in column batches (the stream closes the cursor)
             unmatched = []
-            for row in rows:
-                row_dict = dict(zip(columns, row))
+            for row_dict in RowStream(cursor).records():
                 row_dict['rule_id'] = rule.rule_id
                 row_dict['rule_name'] = rule.rule_name
                 unmatched.append(row_dict)
+                if sink is not None:
+                    sink.write_record("unmatched_target", row_dict)
 
             logger.debug(f"Found {len(unmatched)} unmatched target records for rule {rule.rule_name}")
 
@@ -944,188 +1303,666 @@ class ReconciliationExecutor:
             logger.error(f"Error executing unmatched target query: {e}")
             return [], None
 
-    def _store_results_to_file(
-        self,
-        ruleset_id: str,
-        response_data: Dict[str, Any],
-        all_matched: List[MatchedRecord],
-        all_unmatched_source: List[Dict[str, Any]],
-        all_unmatched_target: List[Dict[str, Any]]
-    ) -> str:
+    @staticmethod
+    def _window_order_clause(db_type: str) -> str:
+        """ORDER BY for ROW_NUMBER() where no ordering is needed (mandatory in SQL Server/Oracle)."""
+        db_type = db_type.lower()
+        if db_type == "sqlserver":
+            return " ORDER BY (SELECT NULL)"
+        if db_type == "oracle":
+            return " ORDER BY NULL"
+        return ""
+
+    def _column_exists(self, cursor: Any, table_refs: List[str], column: str, db_type: str) -> bool:
         """
-        Store reconciliation results to a JSON file.
+        Check whether a column exists with a zero-row probe (no scan, no catalog query).
 
         Args:
-            ruleset_id: ID of the ruleset
-            response_data: Response data dictionary
-            all_matched: List of matched records
-            all_unmatched_source: List of unmatched source records
-            all_unmatched_target: List of unmatched target records
+            cursor: Open cursor on the database
+            table_refs: Candidate table references, tried in order (e.g. with and without schema)
+            column: Column name to probe
+            db_type: Database type
 
         Returns:
-            Path to the saved file
+            True if any table reference has the column
+        """
+        column_quoted = self._quote_identifier(column, db_type)
+        for table_ref in table_refs:
+            try:
+                cursor.execute(f"SELECT {column_quoted} FROM {table_ref} WHERE 1=0")
+                cursor.fetchall()
+                return True
+            except Exception:
+                continue
+        return False
+
+    def _build_single_pass_query(
+        self,
+        rule: ReconciliationRule,
+        source_ref: str,
+        target_ref: str,
+        limit: int,
+        db_type: str = "mysql",
+        count_inactive: bool = False,
+        aggregate_only: bool = False
+    ) -> str:
         """
-        # Create results directory if it doesn't exist
-        results_dir = Path("results")
-        results_dir.mkdir(exist_ok=True)
+        Build a query that classifies every source/target row of a rule in one pass.
 
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"reconciliation_result_{ruleset_id}_{timestamp}.json"
-        file_path = results_dir / filename
-
-        # Prepare data for JSON serialization
-        matched_dicts = [
-            {
-                "source_record": m.source_record,
-                "target_record": m.target_record,
-                "match_confidence": m.match_confidence,
-                "rule_used": m.rule_used,
-                "rule_name": m.rule_name
-            }
-            for m in all_matched
-        ]
+        Each output row carries its status (matched / source_only / target_only), the
+        exact number of rows with that status (window COUNT) and a per-status row number.
+        Ordering by the row number interleaves the statuses, so the limit keeps a sample
+        of every status while the counts stay exact.
 
-        # Prepare complete result document
-        result_document = {
-            "ruleset_id": ruleset_id,
-            "execution_timestamp": datetime.now().isoformat(),
-            "matched_count": response_data["matched_count"],
-            "unmatched_source_count": response_data["unmatched_source_count"],
-            "unmatched_target_count": response_data["unmatched_target_count"],
-            "execution_time_ms": response_data["execution_time_ms"],
-            "inactive_count": response_data.get("inactive_count", 0),
-            "matched_records": matched_dicts,
-            "unmatched_source": all_unmatched_source,
-            "unmatched_target": all_unmatched_target,
-            "generated_sql": response_data.get("generated_sql", [])
-        }
+        With aggregate_only=True the same classification is summed server-side and a
+        single row (matched_count, unmatched_source_count, unmatched_target_count) is
+        returned, so exact totals never require fetching rows.
 
-        # Write to file
-        with open(file_path, 'w') as f:
-            json.dump(result_document, f, indent=2, default=str)
+        Uses FULL OUTER JOIN where supported. MySQL has no FULL JOIN, so it runs a LEFT
+        JOIN (matched + source_only) UNION ALL a target anti-join (target_only); statuses
+        never span the two branches, so per-branch windows are still exact.
+        """
+        db_type = db_type.lower()
 
-        logger.info(f"Results stored to file: {file_path}")
-        return str(file_path)
+        join_conditions = []
+        for src_col, tgt_col in zip(rule.source_columns, rule.target_columns):
+            if rule.transformation:
+                join_conditions.append(f"{rule.transformation} = t.{tgt_col}")
+            else:
+                join_conditions.append(f"s.{src_col} = t.{tgt_col}")
+        join_condition = " AND ".join(join_conditions)
 
-    def _connect_to_database(
+        source_extra = ""
+        if count_inactive and not aggregate_only:
+            is_active_quoted = self._quote_identifier("is_active", db_type)
+            source_extra = (
+                f", SUM(CASE WHEN s0.{is_active_quoted} = 0 OR s0.{is_active_quoted} IS NULL "
+                f"THEN 1 ELSE 0 END) OVER () AS {SINGLE_PASS_INACTIVE_COLUMN}"
+            )
+        source_derived = f"(SELECT s0.*, 1 AS {SINGLE_PASS_SOURCE_MARKER}{source_extra} FROM {source_ref} s0) s"
+        target_derived = f"(SELECT t0.*, 1 AS {SINGLE_PASS_TARGET_MARKER} FROM {target_ref} t0) t"
+        source_missing = f"s.{SINGLE_PASS_SOURCE_MARKER} IS NULL"
+        target_missing = f"t.{SINGLE_PASS_TARGET_MARKER} IS NULL"
+
+        if aggregate_only:
+            flags = (
+                f"CASE WHEN {source_missing} OR {target_missing} THEN 0 ELSE 1 END AS matched_rows, "
+                f"CASE WHEN {target_missing} THEN 1 ELSE 0 END AS source_only_rows, "
+                f"CASE WHEN {source_missing} THEN 1 ELSE 0 END AS target_only_rows"
+            )
+            if db_type == "mysql":
+                classified = f"""
+                SELECT {flags}
+                FROM {source_derived}
+                LEFT JOIN {target_derived}
+                    ON {join_condition}
+                UNION ALL
+                SELECT {flags}
+                FROM {target_derived}
+                LEFT JOIN {source_derived}
+                    ON {join_condition}
+                WHERE {source_missing}
+                """
+            else:
+                classified = f"""
+                SELECT {flags}
+                FROM {source_derived}
+                FULL OUTER JOIN {target_derived}
+                    ON {join_condition}
+                """
+            return f"""
+            SELECT SUM(c.matched_rows) AS matched_count,
+                   SUM(c.source_only_rows) AS unmatched_source_count,
+                   SUM(c.target_only_rows) AS unmatched_target_count
+            FROM ({classified}) c
+            """
+
+        status_expr = (
+            f"CASE WHEN {source_missing} THEN 'target_only' "
+            f"WHEN {target_missing} THEN 'source_only' "
+            f"ELSE 'matched' END"
+        )
+        window_order = self._window_order_clause(db_type)
+        columns = (
+            f"s.*, t.*, {status_expr} AS {SINGLE_PASS_STATUS_COLUMN}, "
+            f"COUNT(*) OVER (PARTITION BY {status_expr}) AS {SINGLE_PASS_COUNT_COLUMN}, "
+            f"ROW_NUMBER() OVER (PARTITION BY {status_expr}{window_order}) AS {SINGLE_PASS_ROW_NUMBER_COLUMN}"
+        )
+        # Up to `limit` rows per status survive the interleaved ordering
+        sample_rows = limit * 3
+
+        if db_type == "mysql":
+            return f"""
+            SELECT {columns}
+            FROM {source_derived}
+            LEFT JOIN {target_derived}
+                ON {join_condition}
+            UNION ALL
+            SELECT {columns}
+            FROM {target_derived}
+            LEFT JOIN {source_derived}
+                ON {join_condition}
+            WHERE {source_missing}
+            ORDER BY {SINGLE_PASS_ROW_NUMBER_COLUMN}
+            LIMIT {sample_rows}
+            """
+
+        top_clause = f"TOP {sample_rows} " if db_type == "sqlserver" else ""
+        if db_type == "sqlserver":
+            tail_clause = ""
+        elif db_type == "oracle":
+            tail_clause = f"FETCH FIRST {sample_rows} ROWS ONLY"
+        else:
+            tail_clause = f"LIMIT {sample_rows}"
+
+        return f"""
+            SELECT {top_clause}{columns}
+            FROM {source_derived}
+            FULL OUTER JOIN {target_derived}
+                ON {join_condition}
+            ORDER BY {SINGLE_PASS_ROW_NUMBER_COLUMN}
+            {tail_clause}
+            """
+
+    def _execute_count_query(
         self,
-        db_config: DatabaseConnectionInfo
-    ) -> Optional[Any]:
+        source_conn: Any,
+        rule: ReconciliationRule,
+        db_type: str = "mysql",
+        plan: Optional[RulePlan] = None
+    ) -> Tuple[Optional[Dict[str, int]], Optional[Dict[str, Any]]]:
         """
-        Connect to a database using JayDeBeApi.
+        Compute exact matched/unmatched totals for a rule without fetching any rows.
 
-        Args:
-            db_config: Database connection configuration
+        Runs the aggregate-only classification query (one scan of each table). For
+        multi-table rules the matched total is the row count of the full multi-table join.
 
         Returns:
-            Database connection or None if failed
+            (counts, sql_info); counts is None if the counts could not be computed
         """
+        plan = self._rule_plan(rule, db_type, plan)
+
         try:
-            # Build JDBC URL based on database type
-            jdbc_url = self._build_jdbc_url(db_config)
+            cursor, query = self._execute_plan_query(
+                source_conn, plan, "COUNTS",
+                lambda p: self._build_single_pass_query(
+                    rule, p.source_ref, p.target_ref, 0, db_type, aggregate_only=True
+                )
+            )
+            try:
+                row = cursor.fetchone() or (0, 0, 0)
+                counts = {
+                    "matched_count": int(row[0] or 0),
+                    "unmatched_source_count": int(row[1] or 0),
+                    "unmatched_target_count": int(row[2] or 0)
+                }
+                queries = [query]
+
+                if rule.is_multi_table():
+                    multi_query = self._build_multi_table_join_query(rule, db_type, count_only=True)
+                    self._log_sql_query("COUNTS_MULTI", rule.rule_name, multi_query, "FIRST")
+                    cursor.execute(multi_query)
+                    row = cursor.fetchone()
+                    counts["matched_count"] = int(row[0] or 0) if row else 0
+                    queries.append(multi_query)
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.error(f"Error executing count query for rule {rule.rule_name}: {e}")
+            return None, None
+
+        sql_info = {
+            "rule_id": rule.rule_id,
+            "rule_name": rule.rule_name,
+            "query_type": "counts",
+            "source_sql": "\n".join(queries),
+            "target_sql": None,
+            "description": f"Exact matched/unmatched totals for {rule.source_table} and {rule.target_table}",
+            "counts": dict(counts)
+        }
+        return counts, sql_info
 
-            # Get JDBC driver class
-            driver_class = self._get_driver_class(db_config.db_type)
+    def _execute_single_pass_rule(
+        self,
+        source_conn: Any,
+        rule: ReconciliationRule,
+        limit: int,
+        db_type: str = "mysql",
+        include_matched: bool = True,
+        include_unmatched: bool = True,
+        count_inactive: bool = False,
+        plan: Optional[RulePlan] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a rule with a single classification query on the source connection.
 
-            # Get driver JAR path
-            driver_jar = self._get_driver_jar(db_config.db_type)
+        Args:
+            source_conn: Source database connection (both tables must be reachable from it)
+            rule: Reconciliation rule to execute
+            limit: Maximum records returned per status
+            db_type: Database type
+            include_matched: Include matched records and count
+            include_unmatched: Include unmatched records and counts
+            count_inactive: Also count inactive source rows (is_active = 0 or NULL), if the column exists
+            plan: Compiled plan of the rule (compiled on the fly when omitted)
 
-            # Connect using JayDeBeApi
-            logger.debug(f"Connecting to {jdbc_url} with driver {driver_class}")
+        Returns:
+            Dictionary with matched/unmatched records, counts, inactive_count (None when
+            not computed) and sql_info
+        """
+        plan = self._rule_plan(rule, db_type, plan)
+
+        # Once requested, the inactive count is reported (0 without an is_active column)
+        inactive_requested = count_inactive
+        if count_inactive:
+            count_inactive = plan.has_column("source", "is_active")
+            if count_inactive is None:
+                # Columns unknown (plan not resolved against the catalog): probe
+                probe_cursor = source_conn.cursor()
+                try:
+                    count_inactive = self._column_exists(
+                        probe_cursor, plan.refs("source"), "is_active", db_type
+                    )
+                finally:
+                    probe_cursor.close()
+            if not count_inactive:
+                logger.info(
+                    f"Column 'is_active' does not exist in {plan.source_ref}. Skipping inactive count."
+                )
 
-            conn = jaydebeapi.connect(
-                driver_class,
-                jdbc_url,
-                [db_config.username, db_config.password],
-                driver_jar
+        cursor, query = self._execute_plan_query(
+            source_conn, plan, "SINGLE_PASS",
+            lambda p: self._build_single_pass_query(
+                rule, p.source_ref, p.target_ref, limit, db_type, count_inactive
             )
+        )
+        # Stream the classified rows in column batches (the stream closes the cursor)
+        with RowStream(cursor) as stream:
+            columns = stream.columns
+
+            # s.* ends at the source marker, t.* at the target marker
+            lowered = [column.lower() for column in columns]
+            source_end = lowered.index(SINGLE_PASS_SOURCE_MARKER)
+            target_end = lowered.index(SINGLE_PASS_TARGET_MARKER)
+            inactive_pos = lowered.index(SINGLE_PASS_INACTIVE_COLUMN) if count_inactive else None
+            status_pos = lowered.index(SINGLE_PASS_STATUS_COLUMN)
+            count_pos = lowered.index(SINGLE_PASS_COUNT_COLUMN)
+            source_columns = columns[:source_end]
+            target_start = max(source_end, inactive_pos or 0) + 1
+            target_columns = columns[target_start:target_end]
+
+            status_counts = {"matched": 0, "source_only": 0, "target_only": 0}
+            status_records = {"matched": [], "source_only": [], "target_only": []}
+            inactive_count = 0 if inactive_requested else None
+
+            for row in stream:
+                status = row[status_pos]
+                status = status.strip() if isinstance(status, str) else status
+                status_counts[status] = int(row[count_pos])
+                if inactive_pos is not None and row[inactive_pos] is not None:
+                    inactive_count = int(row[inactive_pos])
+                if len(status_records[status]) >= limit:
+                    continue
 
-            logger.debug("Database connection established")
-            return conn
+                source_record = dict(zip(source_columns, row[:source_end]))
+                target_record = dict(zip(target_columns, row[target_start:target_end]))
+                if status == "matched":
+                    status_records[status].append(MatchedRecord(
+                        source_record=source_record,
+                        target_record=target_record,
+                        match_confidence=rule.confidence_score,
+                        rule_used=rule.rule_id,
+                        rule_name=rule.rule_name
+                    ))
+                else:
+                    record = source_record if status == "source_only" else target_record
+                    record['rule_id'] = rule.rule_id
+                    record['rule_name'] = rule.rule_name
+                    status_records[status].append(record)
+
+        logger.debug(
+            f"Single-pass rule {rule.rule_name}: {status_counts['matched']} matched, "
+            f"{status_counts['source_only']} source-only, {status_counts['target_only']} target-only"
+        )
+
+        sql_info = {
+            "rule_id": rule.rule_id,
+            "rule_name": rule.rule_name,
+            "query_type": "single_pass",
+            "source_sql": query,
+            "target_sql": None,
+            "description": (
+                f"Classify rows of {rule.source_table} and {rule.target_table} as matched, "
+                f"source-only or target-only in one query"
+            ),
+            "status_counts": dict(status_counts)
+        }
 
-        except Exception as e:
-            logger.error(f"Failed to connect to database: {e}")
-            return None
+        return {
+            "matched": status_records["matched"] if include_matched else [],
+            "unmatched_source": status_records["source_only"] if include_unmatched else [],
+            "unmatched_target": status_records["target_only"] if include_unmatched else [],
+            "matched_count": status_counts["matched"] if include_matched else 0,
+            "unmatched_source_count": status_counts["source_only"] if include_unmatched else 0,
+            "unmatched_target_count": status_counts["target_only"] if include_unmatched else 0,
+            "inactive_count": inactive_count,
+            "sql_info": sql_info
+        }
 
-    def _build_jdbc_url(self, db_config: DatabaseConnectionInfo) -> str:
-        """Build JDBC URL based on database type."""
-        db_type = db_config.db_type.lower()
+    @staticmethod
+    def _supports_hash_join(rule: ReconciliationRule) -> bool:
+        """Check whether a rule can be reconciled in-process (plain column equality only)."""
+        return ExecutionPlanner.supports_hash_join(rule)
 
-        if db_type == "oracle":
-            if db_config.service_name:
-                return f"jdbc:oracle:thin:@{db_config.host}:{db_config.port}/{db_config.service_name}"
-            else:
-                return f"jdbc:oracle:thin:@{db_config.host}:{db_config.port}:{db_config.database}"
+    def _build_stream_query(
+        self,
+        table_ref: str,
+        key_columns: List[str],
+        requested_columns: Optional[List[str]],
+        db_type: str
+    ) -> str:
+        """Build a SELECT streaming join keys plus requested columns (all columns if none requested)."""
+        if requested_columns:
+            columns = list(dict.fromkeys(list(key_columns) + list(requested_columns)))
+            columns_clause = ", ".join(self._quote_identifier(col, db_type) for col in columns)
+        else:
+            columns_clause = "*"
+        return f"SELECT {columns_clause} FROM {table_ref}"
 
-        elif db_type == "sqlserver" or db_type == "mssql":
-            return f"jdbc:sqlserver://{db_config.host}:{db_config.port};databaseName={db_config.database};encrypt=true;trustServerCertificate=true"
+    def _stream_side_into_join(
+        self,
+        conn: Any,
+        join: PartitionedHashJoin,
+        side: str,
+        rule: ReconciliationRule,
+        db_type: str,
+        plan: Optional[RulePlan] = None
+    ) -> Tuple[str, List[str]]:
+        """
+        Stream one side of a rule into the hash join in columnar fetch batches.
 
-        elif db_type == "postgresql" or db_type == "postgres":
-            return f"jdbc:postgresql://{db_config.host}:{db_config.port}/{db_config.database}"
+        Returns:
+            Tuple of (executed SQL, column names)
+        """
+        if side == "source":
+            table, key_columns = rule.source_table, rule.source_columns
+        else:
+            table, key_columns = rule.target_table, rule.target_columns
 
-        elif db_type == "mysql":
-            # Add connection timeout and other parameters for MySQL
-            # Increased timeouts for complex reconciliation queries that may take longer
-            # connectTimeout: time to establish connection (60s)
-            # socketTimeout: time to wait for data from server (120s for complex joins)
-            return f"jdbc:mysql://{db_config.host}:{db_config.port}/{db_config.database}?connectTimeout=60000&socketTimeout=120000&autoReconnect=true"
+        requested = rule.select_columns.get(table) if rule.select_columns else None
+        cursor, query = self._execute_plan_query(
+            conn, self._rule_plan(rule, db_type, plan), f"STREAM_{side.upper()}",
+            lambda p: self._build_stream_query(p.refs(side)[0], key_columns, requested, db_type)
+        )
+        try:
+            columns = [desc[0] for desc in cursor.description]
+            lookup = {col.lower(): i for i, col in enumerate(columns)}
+            missing = [col for col in key_columns if col.lower() not in lookup]
+            if missing:
+                raise ValueError(f"Join columns {missing} not found in {table}")
+            key_positions = [lookup[col.lower()] for col in key_columns]
+
+            for batch in fetch_batches(cursor, RECON_FETCH_BATCH_SIZE):
+                join.add_rows(side, batch.rows(), key_positions)
+        finally:
+            cursor.close()
 
-        else:
-            raise ValueError(f"Unsupported database type: {db_config.db_type}")
+        return query, columns
 
-    def _get_driver_class(self, db_type: str) -> str:
-        """Get JDBC driver class name for database type."""
-        db_type = db_type.lower()
+    def _execute_hash_join_rule(
+        self,
+        source_conn: Any,
+        target_conn: Any,
+        rule: ReconciliationRule,
+        limit: int,
+        source_db_type: str,
+        target_db_type: str,
+        include_matched: bool = True,
+        include_unmatched: bool = True,
+        source_plan: Optional[RulePlan] = None,
+        target_plan: Optional[RulePlan] = None
+    ) -> Dict[str, Any]:
+        """
+        Reconcile a rule in-process with a partitioned hash join.
+
+        Each side is read from its own connection, so source and target may live on
+        different servers. Counts are exact; returned records are capped at `limit`.
+        """
+        rule_start = time.time()
 
-        drivers = {
-            "oracle": "oracle.jdbc.OracleDriver",
-            "sqlserver": "com.microsoft.sqlserver.jdbc.SQLServerDriver",
-            "mssql": "com.microsoft.sqlserver.jdbc.SQLServerDriver",
-            "postgresql": "org.postgresql.Driver",
-            "postgres": "org.postgresql.Driver",
-            "mysql": "com.mysql.cj.jdbc.Driver"
+        with PartitionedHashJoin() as join:
+            source_sql, source_columns = self._stream_side_into_join(
+                source_conn, join, "source", rule, source_db_type, source_plan
+            )
+            target_sql, target_columns = self._stream_side_into_join(
+                target_conn, join, "target", rule, target_db_type, target_plan
+            )
+            result = join.execute(sample_limit=limit)
+
+        matched = []
+        if include_matched:
+            for source_row, target_row in result.matched_sample:
+                matched.append(MatchedRecord(
+                    source_record=dict(zip(source_columns, source_row)),
+                    target_record=dict(zip(target_columns, target_row)),
+                    match_confidence=rule.confidence_score,
+                    rule_used=rule.rule_id,
+                    rule_name=rule.rule_name
+                ))
+
+        unmatched_source = []
+        unmatched_target = []
+        if include_unmatched:
+            for row in result.unmatched_source_sample:
+                row_dict = dict(zip(source_columns, row))
+                row_dict['rule_id'] = rule.rule_id
+                row_dict['rule_name'] = rule.rule_name
+                unmatched_source.append(row_dict)
+            for row in result.unmatched_target_sample:
+                row_dict = dict(zip(target_columns, row))
+                row_dict['rule_id'] = rule.rule_id
+                row_dict['rule_name'] = rule.rule_name
+                unmatched_target.append(row_dict)
+
+        sql_info = {
+            "rule_id": rule.rule_id,
+            "rule_name": rule.rule_name,
+            "query_type": "hash_join",
+            "source_sql": source_sql,
+            "target_sql": target_sql,
+            "description": (
+                f"In-process partitioned hash join of {rule.source_table} and {rule.target_table}"
+            ),
+            "rows_streamed": {"source": result.source_rows, "target": result.target_rows},
+            "spilled_partitions": result.spilled_partitions,
+            "spill_bytes": result.spill_bytes,
+            "execution_time_ms": (time.time() - rule_start) * 1000
         }
 
-        if db_type not in drivers:
-            raise ValueError(f"Unknown database type: {db_type}")
+        return {
+            "matched": matched,
+            "unmatched_source": unmatched_source,
+            "unmatched_target": unmatched_target,
+            "matched_count": result.matched_count if include_matched else 0,
+            "unmatched_source_count": result.unmatched_source_count if include_unmatched else 0,
+            "unmatched_target_count": result.unmatched_target_count if include_unmatched else 0,
+            "sql_info": sql_info
+        }
 
-        return drivers[db_type]
+    def _execute_incremental_rule(
+        self,
+        source_conn: Any,
+        target_conn: Any,
+        rule: ReconciliationRule,
+        limit: int,
+        source_db_type: str,
+        target_db_type: str,
+        snapshot_scope: str,
+        include_matched: bool = True,
+        include_unmatched: bool = True,
+        source_plan: Optional[RulePlan] = None,
+        target_plan: Optional[RulePlan] = None
+    ) -> Dict[str, Any]:
+        """
+        Reconcile a rule from the rows changed since its last run (see IncrementalReconciler).
 
-    def _get_driver_jar(self, db_type: str) -> str:
-        """Get path to JDBC driver JAR file."""
-        if not self.jdbc_drivers_path or not self.jdbc_drivers_path.exists():
-            raise ValueError(
-                f"JDBC drivers path not configured or doesn't exist: {self.jdbc_drivers_path}"
+        Counts are identical to a full run. Returned records are samples of join keys,
+        since unchanged rows are never read.
+        """
+        rule_start = time.time()
+
+        def side(conn, name, plan, columns, watermark, db_type):
+            return ReconcileSide(
+                conn=conn,
+                table_refs=self._rule_plan(rule, db_type, plan).refs(name),
+                key_columns=[self._quote_identifier(col, db_type) for col in columns],
+                key_names=list(columns),
+                watermark_column=self._quote_identifier(watermark, db_type)
             )
 
-        db_type = db_type.lower()
+        source = side(source_conn, "source", source_plan, rule.source_columns,
+                      rule.watermark_column, source_db_type)
+        target = side(target_conn, "target", target_plan, rule.target_columns,
+                      rule.get_target_watermark_column(), target_db_type)
+
+        result = get_incremental_reconciler().reconcile(
+            rule, source, target, scope=snapshot_scope, sample_limit=limit
+        )
+
+        def key_record(names, key):
+            record = dict(zip(names, key))
+            record['rule_id'] = rule.rule_id
+            record['rule_name'] = rule.rule_name
+            return record
+
+        matched = []
+        if include_matched:
+            for key in result.matched_sample:
+                matched.append(MatchedRecord(
+                    source_record=dict(zip(source.key_names, key)),
+                    target_record=dict(zip(target.key_names, key)),
+                    match_confidence=rule.confidence_score,
+                    rule_used=rule.rule_id,
+                    rule_name=rule.rule_name
+                ))
 
-        # Map database types to JAR file patterns
-        jar_patterns = {
-            "oracle": "ojdbc*.jar",
-            "sqlserver": "mssql-jdbc*.jar",
-            "mssql": "mssql-jdbc*.jar",
-            "postgresql": "postgresql*.jar",
-            "postgres": "postgresql*.jar",
-            "mysql": "mysql-connector*.jar"
+        sql_info = {
+            "rule_id": rule.rule_id,
+            "rule_name": rule.rule_name,
+            "query_type": "incremental",
+            "source_sql": "\n".join(result.queries),
+            "target_sql": None,
+            "description": (
+                f"Incremental reconciliation of {rule.source_table} and {rule.target_table} "
+                f"({result.refresh} refresh)"
+            ),
+            "refresh": result.refresh,
+            "refresh_reason": result.refresh_reason,
+            "changed_rows": {"source": result.changed_rows[0], "target": result.changed_rows[1]},
+            "changed_keys": result.changed_keys,
+            "execution_time_ms": (time.time() - rule_start) * 1000
         }
 
-        if db_type not in jar_patterns:
-            raise ValueError(f"Unknown database type: {db_type}")
+        return {
+            "matched": matched,
+            "unmatched_source": [
+                key_record(source.key_names, key) for key in result.unmatched_source_sample
+            ] if include_unmatched else [],
+            "unmatched_target": [
+                key_record(target.key_names, key) for key in result.unmatched_target_sample
+            ] if include_unmatched else [],
+            "matched_count": result.matched_count if include_matched else 0,
+            "unmatched_source_count": result.unmatched_source_count if include_unmatched else 0,
+            "unmatched_target_count": result.unmatched_target_count if include_unmatched else 0,
+            "sql_info": sql_info
+        }
 
-        # Find the JAR file
-        pattern = jar_patterns[db_type]
-        jar_files = list(self.jdbc_drivers_path.glob(pattern))
+    def _open_result_file(self, ruleset_id: str) -> Optional[ResultFileWriter]:
+        """
+        Open the NDJSON result file the rules of an execution stream their records to.
 
-        if not jar_files:
-            raise ValueError(
-                f"JDBC driver not found for {db_type}. "
-                f"Expected pattern: {pattern} in {self.jdbc_drivers_path}"
-            )
+        Records are appended as they are fetched, so the full result set is never
+        built in memory; rules executed in parallel may interleave their records
+        (each line names its section). Read the file back with ResultFileReader.
 
-        # Use the first matching JAR
-        return str(jar_files[0])
+        Args:
+            ruleset_id: ID of the ruleset
+
+        Returns:
+            The open writer, or None if the file cannot be created (the execution
+            then continues without file storage)
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = result_file_name(
+            f"reconciliation_result_{ruleset_id}_{timestamp}", RECON_RESULT_COMPRESSION
+        )
+        header = {
+            "ruleset_id": ruleset_id,
+            "execution_timestamp": datetime.now().isoformat()
+        }
+        try:
+            return ResultFileWriter(RECON_RESULTS_DIR / filename, header=header)
+        except Exception as e:
+            logger.warning(f"Failed to open result file: {e}")
+            return None
+
+    @staticmethod
+    def _matched_file_record(m: MatchedRecord) -> Dict[str, Any]:
+        """Result file form of a matched record."""
+        return {
+            "source_record": m.source_record,
+            "target_record": m.target_record,
+            "match_confidence": m.match_confidence,
+            "rule_used": m.rule_used,
+            "rule_name": m.rule_name
+        }
+
+    def _write_outcome(self, sink: Optional[ResultFileWriter], outcome: Dict[str, Any]):
+        """Write the records of a rule outcome that were not streamed while fetched."""
+        if sink is None:
+            return
+        sink.write_records("matched", (self._matched_file_record(m) for m in outcome["matched"]))
+        sink.write_records("unmatched_source", outcome["unmatched_source"])
+        sink.write_records("unmatched_target", outcome["unmatched_target"])
+
+    def _finish_result_file(self, writer: ResultFileWriter, response_data: Dict[str, Any]) -> str:
+        """
+        Write the footer with the execution totals and publish the result file.
+
+        Returns:
+            Path to the saved file
+        """
+        writer.set_footer(
+            matched_count=response_data["matched_count"],
+            unmatched_source_count=response_data["unmatched_source_count"],
+            unmatched_target_count=response_data["unmatched_target_count"],
+            execution_time_ms=response_data["execution_time_ms"],
+            inactive_count=response_data.get("inactive_count", 0),
+            generated_sql=response_data.get("generated_sql", [])
+        )
+        writer.close()
+
+        logger.info(f"Results stored to file: {writer.path}")
+        return str(writer.path)
+
+    def _connect_to_database(
+        self,
+        db_config: DatabaseConnectionInfo
+    ) -> Optional[Any]:
+        """
+        Borrow a connection from the shared JDBC connection pool.
+
+        Args:
+            db_config: Database connection configuration
+
+        Returns:
+            Pooled database connection (close() returns it to the pool) or None if failed
+        """
+        try:
+            return get_connection_manager().connect(db_config)
+        except Exception as e:
+            logger.error(f"Failed to connect to database: {e}")
+            return None
 
 
 # Singleton instance
@@ -0,0 +1,315 @@
+"""
+Streaming storage for reconciliation result files.
+
+Results are written as NDJSON (one JSON object per line), optionally gzip or
+zstd compressed:
+
+    {"type": "header", "format": "recon-ndjson", "version": 1, ...}
+    {"type": "record", "section": "matched", "record": {...}}
+    {"type": "record", "section": "unmatched_source", "record": {...}}
+    ...
+    {"type": "footer", "sections": {"matched": 1200, ...}, ...}
+
+Records are appended one at a time, so writing never holds the whole result
+document in memory, and the reader iterates records lazily so a page can be
+served without loading the file. Files are written under a temporary name and
+renamed on close, so a reader never sees a half-written file.
+"""
+
+import gzip
+import io
+import json
+import logging
+import os
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+RESULT_FILE_FORMAT = "recon-ndjson"
+RESULT_FILE_VERSION = 1
+RESULT_SECTIONS = ("matched", "unmatched_source", "unmatched_target")
+
+COMPRESSION_SUFFIXES = {
+    "none": ".ndjson",
+    "gzip": ".ndjson.gz",
+    "zstd": ".ndjson.zst",
+}
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize one line; values JSON cannot represent (Decimal, dates) become strings."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def _compression_for(path: Path) -> str:
+    name = path.name
+    if name.endswith(".gz"):
+        return "gzip"
+    if name.endswith(".zst"):
+        return "zstd"
+    return "none"
+
+
+def result_file_name(base_name: str, compression: str = "none") -> str:
+    """
+    Build a result file name with the extension for the given compression.
+
+    Raises:
+        ValueError: If the compression is unknown or its library is not installed
+    """
+    compression = (compression or "none").lower()
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(
+            f"Unknown result file compression '{compression}', "
+            f"expected one of {', '.join(COMPRESSION_SUFFIXES)}"
+        )
+    if compression == "zstd" and not ZSTD_AVAILABLE:
+        raise ValueError("zstd compression requires the zstandard package: pip install zstandard")
+    return f"{base_name}{COMPRESSION_SUFFIXES[compression]}"
+
+
+class ResultFileWriter:
+    """
+    Append-only NDJSON writer for reconciliation results.
+
+    Usage:
+        with ResultFileWriter(path, header={"ruleset_id": "RECON_1"}) as writer:
+            writer.write_records("matched", matched_dicts)
+            writer.set_footer(matched_count=1200)
+    """
+
+    def __init__(self, path: Path, header: Optional[Dict[str, Any]] = None, compression: Optional[str] = None):
+        """
+        Open a result file for writing.
+
+        Args:
+            path: Final file path (the extension selects compression unless given)
+            header: Metadata stored in the header line
+            compression: 'none', 'gzip' or 'zstd' (default: inferred from the path)
+        """
+        self.path = Path(path)
+        self.compression = (compression or _compression_for(self.path)).lower()
+        self._tmp_path = self.path.with_name(self.path.name + ".partial")
+        self._section_counts: Dict[str, int] = {}
+        self._footer: Dict[str, Any] = {}
+        self._closed = False
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._raw = open(self._tmp_path, "wb")
+        if self.compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=6)
+        elif self.compression == "zstd":
+            if not ZSTD_AVAILABLE:
+                self._raw.close()
+                os.unlink(self._tmp_path)
+                raise ValueError("zstd compression requires the zstandard package: pip install zstandard")
+            self._stream = zstandard.ZstdCompressor(level=3).stream_writer(self._raw)
+        else:
+            self._stream = io.BufferedWriter(self._raw, buffer_size=1 << 20)
+
+        self._write_line({
+            "type": "header",
+            "format": RESULT_FILE_FORMAT,
+            "version": RESULT_FILE_VERSION,
+            "compression": self.compression,
+            **(header or {})
+        })
+
+    def _write_line(self, obj: Dict[str, Any]):
+        self._stream.write(_dumps(obj) + b"\n")
+
+    def write_record(self, section: str, record: Dict[str, Any]):
+        """Append a single record to a section (safe to call from several threads)."""
+        line = _dumps({"type": "record", "section": section, "record": record}) + b"\n"
+        with self._lock:
+            self._stream.write(line)
+            self._section_counts[section] = self._section_counts.get(section, 0) + 1
+
+    def write_records(self, section: str, records) -> int:
+        """Append records to a section. Returns the number written."""
+        written = 0
+        for record in records:
+            self.write_record(section, record)
+            written += 1
+        return written
+
+    def set_footer(self, **fields):
+        """Add fields to the footer written on close."""
+        self._footer.update(fields)
+
+    def close(self):
+        """Write the footer and atomically move the file into place."""
+        if self._closed:
+            return
+        self._write_line({"type": "footer", "sections": dict(self._section_counts), **self._footer})
+        self._stream.close()
+        if not self._raw.closed:
+            self._raw.close()
+        os.replace(self._tmp_path, self.path)
+        self._closed = True
+
+    def abort(self):
+        """Discard a partially written file."""
+        if self._closed:
+            return
+        try:
+            self._stream.close()
+            if not self._raw.closed:
+                self._raw.close()
+        finally:
+            if self._tmp_path.exists():
+                self._tmp_path.unlink()
+            self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class ResultFileReader:
+    """
+    Lazy reader for result files written by ResultFileWriter.
+
+    Legacy single-document JSON result files (results/*.json) are also accepted,
+    but are necessarily loaded in full.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Result file not found: {self.path}")
+        self.compression = _compression_for(self.path)
+        self.legacy = self.path.suffix == ".json"
+        self._header: Optional[Dict[str, Any]] = None
+        self._footer: Optional[Dict[str, Any]] = None
+
+    def _open(self):
+        if self.compression == "gzip":
+            return gzip.open(self.path, "rb")
+        if self.compression == "zstd":
+            if not ZSTD_AVAILABLE:
+                raise ValueError("Reading zstd result files requires the zstandard package")
+            raw = open(self.path, "rb")
+            return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True))
+        return open(self.path, "rb")
+
+    def _iter_lines(self) -> Iterator[Dict[str, Any]]:
+        with self._open() as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+
+    def _load_legacy(self) -> Dict[str, Any]:
+        with open(self.path, "r") as f:
+            return json.load(f)
+
+    def header(self) -> Dict[str, Any]:
+        """Return the header line (reads only the first line)."""
+        if self._header is None:
+            if self.legacy:
+                document = self._load_legacy()
+                self._header = {
+                    key: value for key, value in document.items()
+                    if key not in ("matched_records",) + RESULT_SECTIONS[1:]
+                }
+            else:
+                self._header = next(self._iter_lines(), {})
+        return self._header
+
+    def footer(self) -> Dict[str, Any]:
+        """
+        Return the footer line.
+
+        Uncompressed files are read backwards from the end; compressed files have to
+        be decompressed once (records are discarded as they are read).
+        """
+        if self._footer is not None:
+            return self._footer
+
+        if self.legacy:
+            document = self._load_legacy()
+            self._footer = {
+                "sections": {
+                    "matched": len(document.get("matched_records", [])),
+                    "unmatched_source": len(document.get("unmatched_source", [])),
+                    "unmatched_target": len(document.get("unmatched_target", []))
+                }
+            }
+        elif self.compression == "none":
+            self._footer = self._read_last_line()
+        else:
+            footer = {}
+            for line in self._iter_lines():
+                if line.get("type") == "footer":
+                    footer = line
+            self._footer = footer
+        return self._footer
+
+    def _read_last_line(self) -> Dict[str, Any]:
+        with open(self.path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            block = 4096
+            data = b""
+            position = end
+            while position > 0:
+                step = min(block, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+                lines = data.rstrip(b"\n").split(b"\n")
+                if len(lines) > 1 or position == 0:
+                    last = json.loads(lines[-1])
+                    return last if last.get("type") == "footer" else {}
+        return {}
+
+    def iter_records(self, section: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate records lazily.
+
+        Args:
+            section: 'matched', 'unmatched_source' or 'unmatched_target' (None = all sections)
+
+        Yields:
+            Record dictionaries
+        """
+        if self.legacy:
+            document = self._load_legacy()
+            sections = [section] if section else list(RESULT_SECTIONS)
+            for name in sections:
+                key = "matched_records" if name == "matched" else name
+                yield from document.get(key, [])
+            return
+
+        for line in self._iter_lines():
+            if line.get("type") != "record":
+                continue
+            if section is None or line.get("section") == section:
+                yield line["record"]
+
+    def read_page(self, section: str, offset: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Return one page of records from a section without loading the rest of the file."""
+        return list(islice(self.iter_records(section), offset, offset + limit))
@@ -0,0 +1,155 @@
+"""
+Streaming row source over an executed cursor.
+
+Result consumers used to fetchall() and then build a list of dicts, so memory
+grew with the result size. RowStream reads the cursor in fixed-size column
+batches (see jdbc_fetch) and lets the consumer decide what to keep:
+
+    stream = RowStream(cursor, max_rows=RESULT_STREAM_MAX_ROWS)
+    records = stream.read_records()      # capped list of dicts
+    first = stream.take(10)              # stop early; the rest is never fetched
+    total = stream.count()               # count without keeping rows
+    stream.write_to(sink.write_rows)     # hand each batch to a sink
+
+At most one batch (plus whatever the consumer keeps) is in memory at a time.
+The cursor is closed when the stream is exhausted, stopped early or closed.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from kg_builder.config import JDBC_FETCH_SIZE
+from kg_builder.services.jdbc_fetch import ColumnBatch, fetch_batches
+
+logger = logging.getLogger(__name__)
+
+
+class RowStream:
+    """Batches of rows from an executed cursor, read on demand."""
+
+    def __init__(
+        self,
+        cursor: Any,
+        batch_size: int = JDBC_FETCH_SIZE,
+        max_rows: Optional[int] = None,
+        close_cursor: bool = True
+    ):
+        """
+        Wrap an executed cursor.
+
+        Args:
+            cursor: Cursor after execute()
+            batch_size: Rows per batch
+            max_rows: Stop after this many rows and mark the stream truncated
+                (None or 0: no cap)
+            close_cursor: Close the cursor when the stream ends
+        """
+        self.cursor = cursor
+        self.batch_size = max(1, batch_size)
+        self.max_rows = max_rows or None
+        self.close_cursor = close_cursor
+        self.columns: List[str] = [desc[0] for desc in (cursor.description or [])]
+        self.rows_read = 0
+        self.truncated = False
+        self._started = False
+        self._closed = False
+
+    def batches(self) -> Iterator[ColumnBatch]:
+        """Yield column batches until the result (or max_rows) is exhausted."""
+        if self._started:
+            raise RuntimeError("RowStream can only be read once")
+        self._started = True
+        # Read one row past the cap to know whether the result was truncated
+        limit = None if self.max_rows is None else self.max_rows + 1
+        try:
+            for batch in fetch_batches(self.cursor, self.batch_size, limit):
+                if self.max_rows is not None and self.rows_read + batch.num_rows > self.max_rows:
+                    keep = self.max_rows - self.rows_read
+                    self.truncated = True
+                    batch = ColumnBatch(batch.names, batch.types, [values[:keep] for values in batch.columns])
+                    if keep:
+                        self.rows_read += keep
+                        yield batch
+                    break
+                self.rows_read += batch.num_rows
+                yield batch
+        finally:
+            self.close()
+        if self.truncated:
+            logger.warning(f"Result truncated to {self.max_rows} rows")
+
+    def row_batches(self) -> Iterator[List[tuple]]:
+        """Yield batches as lists of row tuples."""
+        for batch in self.batches():
+            yield batch.rows()
+
+    def record_batches(self) -> Iterator[List[Dict[str, Any]]]:
+        """Yield batches as lists of dictionaries keyed by column name."""
+        for batch in self.batches():
+            yield batch.records()
+
+    def __iter__(self) -> Iterator[tuple]:
+        for rows in self.row_batches():
+            yield from rows
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Yield rows one at a time as dictionaries."""
+        for records in self.record_batches():
+            yield from records
+
+    def read_records(self) -> List[Dict[str, Any]]:
+        """All rows (up to max_rows) as a list of dictionaries."""
+        records: List[Dict[str, Any]] = []
+        for batch in self.record_batches():
+            records.extend(batch)
+        return records
+
+    def take(self, n: int) -> List[Dict[str, Any]]:
+        """First `n` rows as dictionaries; the rest of the result is not fetched."""
+        records: List[Dict[str, Any]] = []
+        if n <= 0:
+            self.close()
+            return records
+        batches = self.record_batches()
+        try:
+            for batch in batches:
+                records.extend(batch[:n - len(records)])
+                if len(records) >= n:
+                    break
+        finally:
+            batches.close()
+        return records
+
+    def count(self) -> int:
+        """Number of rows (up to max_rows) without keeping them."""
+        for _ in self.batches():
+            pass
+        return self.rows_read
+
+    def write_to(self, sink: Callable[[List[tuple]], Any]) -> int:
+        """
+        Hand each batch of row tuples to a sink (e.g. a file writer or executemany).
+
+        Returns:
+            Number of rows written
+        """
+        for rows in self.row_batches():
+            sink(rows)
+        return self.rows_read
+
+    def close(self):
+        """Stop reading and close the cursor (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.close_cursor:
+            try:
+                self.cursor.close()
+            except Exception as e:
+                logger.debug(f"Error closing cursor: {e}")
+
+    def __enter__(self) -> "RowStream":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
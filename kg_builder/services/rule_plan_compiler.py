@@ -0,0 +1,410 @@
+"""
+Rule plan compiler for reconciliation rulesets.
+
+Compiles a ReconciliationRuleSet into dialect-specific execution plans: normalized,
+pre-quoted table references, join conditions and the SQL of the standard
+reconciliation queries. Plans are cached by the content hash of the ruleset, so
+every executor (JDBC executor, landing query builder, SQL export, rule validator)
+shares one compiled version per ruleset, dialect and database pair.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from kg_builder.models import ReconciliationRule, ReconciliationRuleSet
+from kg_builder.config import RECON_PLAN_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Dialect aliases accepted by the connectors
+_DIALECT_ALIASES = {
+    "mssql": "sqlserver",
+    "postgres": "postgresql",
+}
+
+# Dialect that leaves identifiers unquoted (portable SQL exports)
+GENERIC_DIALECT = "generic"
+
+# Resolves a rule table against a database: (normalized schema, table) ->
+# (use the schema prefix?, column names of the table or None when unknown)
+TableResolver = Callable[[str, str], Tuple[bool, Optional[Tuple[str, ...]]]]
+
+
+def canonical_dialect(db_type: Optional[str]) -> str:
+    """Map a database type (or alias) to the dialect name used by the compiler."""
+    db_type = (db_type or GENERIC_DIALECT).lower()
+    return _DIALECT_ALIASES.get(db_type, db_type)
+
+
+def quote_identifier(identifier: str, db_type: str = "mysql") -> str:
+    """
+    Quote a schema, table or column name for the given database type.
+
+    Args:
+        identifier: Identifier to quote
+        db_type: Database type (mysql, oracle, postgresql, sqlserver, generic)
+
+    Returns:
+        Quoted identifier (unchanged for the generic dialect)
+    """
+    if not identifier:
+        return identifier
+
+    db_type = canonical_dialect(db_type)
+
+    if db_type == GENERIC_DIALECT:
+        return identifier
+    elif db_type in ("oracle", "postgresql"):
+        return f'"{identifier}"'
+    elif db_type == "sqlserver":
+        return f"[{identifier}]"
+    else:
+        # MySQL and unknown dialects use backticks
+        return f"`{identifier}`"
+
+
+def normalize_schema_name(schema_name: str, db_type: str = "sqlserver") -> str:
+    """
+    Normalize a rule schema name to the actual database schema.
+
+    For SQL Server, schemas that look like JSON schema file names are mapped to 'dbo'.
+
+    Args:
+        schema_name: Schema name from the reconciliation rule
+        db_type: Database type
+
+    Returns:
+        Normalized schema name
+    """
+    if schema_name and canonical_dialect(db_type) == "sqlserver":
+        if any(char in schema_name for char in ['-', '_']) or schema_name.islower():
+            logger.info(f"Normalizing SQL Server schema '{schema_name}' to 'dbo'")
+            return "dbo"
+    return schema_name
+
+
+def limit_clause(limit: int, db_type: str = "mysql", is_where_clause: bool = False) -> str:
+    """
+    Generate a database-specific row limit clause.
+
+    Args:
+        limit: Number of rows to limit
+        db_type: Database type
+        is_where_clause: Oracle only - return "AND ROWNUM <= n" instead of "WHERE ROWNUM <= n"
+
+    Returns:
+        "LIMIT n", "TOP n" (SELECT list) or a ROWNUM predicate
+    """
+    db_type = canonical_dialect(db_type)
+
+    if db_type == "oracle":
+        return f"AND ROWNUM <= {limit}" if is_where_clause else f"WHERE ROWNUM <= {limit}"
+    elif db_type == "sqlserver":
+        return f"TOP {limit}"
+    return f"LIMIT {limit}"
+
+
+def limited_select(
+    select_list: str,
+    from_clause: str,
+    limit: Optional[int],
+    db_type: str,
+    where: Optional[str] = None
+) -> str:
+    """
+    Build a SELECT whose row limit sits where the dialect expects it.
+
+    TOP goes into the SELECT list (SQL Server), ROWNUM joins the WHERE predicates
+    (Oracle) and LIMIT is appended (everything else).
+
+    Args:
+        select_list: Columns to select
+        from_clause: FROM clause contents (tables and joins)
+        limit: Maximum rows, or None for no limit
+        db_type: Database type
+        where: Optional WHERE predicate
+
+    Returns:
+        SQL string
+    """
+    db_type = canonical_dialect(db_type)
+    conditions = [where] if where else []
+    top = ""
+    tail = ""
+
+    if limit is not None:
+        if db_type == "sqlserver":
+            top = f"TOP {limit} "
+        elif db_type == "oracle":
+            conditions.append(f"ROWNUM <= {limit}")
+        else:
+            tail = f"\nLIMIT {limit}"
+
+    sql = f"SELECT {top}{select_list}\nFROM {from_clause}"
+    if conditions:
+        sql += "\nWHERE " + "\n  AND ".join(conditions)
+    return sql + tail
+
+
+@dataclass(frozen=True)
+class RulePlan:
+    """Compiled, dialect-specific form of one reconciliation rule."""
+    rule_id: str
+    rule_name: str
+    db_type: str
+    source_ref: str                    # Table reference used in queries (resolved when schema_resolved)
+    target_ref: str
+    source_table_ref: str              # Quoted bare table names (schema fallback)
+    target_table_ref: str
+    source_columns: Tuple[str, ...]    # Quoted join columns
+    target_columns: Tuple[str, ...]
+    join_condition: str                # Rule join condition (applies the transformation, if any)
+    key_join_condition: str            # Plain quoted column equality, ignoring transformations
+    schema_resolved: bool = False      # True when the refs were checked against the database
+    source_table_columns: Optional[Tuple[str, ...]] = None  # Catalog column names, when resolved
+    target_table_columns: Optional[Tuple[str, ...]] = None
+
+    def refs(self, side: str) -> List[str]:
+        """Candidate table references for a side, preferred reference first."""
+        if side == "source":
+            ref, bare = self.source_ref, self.source_table_ref
+        else:
+            ref, bare = self.target_ref, self.target_table_ref
+        return [ref] if self.schema_resolved or ref == bare else [ref, bare]
+
+    def has_column(self, side: str, column: str) -> Optional[bool]:
+        """Whether a side's table has the column, or None when the columns are unknown."""
+        columns = self.source_table_columns if side == "source" else self.target_table_columns
+        if columns is None:
+            return None
+        return column.lower() in {name.lower() for name in columns}
+
+    def without_schema(self) -> "RulePlan":
+        """Plan variant that references both tables without a schema prefix."""
+        return replace(
+            self,
+            source_ref=self.source_table_ref,
+            target_ref=self.target_table_ref,
+            schema_resolved=True
+        )
+
+    def matched_sql(self, limit: Optional[int] = None, select_list: str = "s.*, t.*") -> str:
+        """INNER JOIN of source and target on the rule's join condition."""
+        return limited_select(
+            select_list,
+            f"{self.source_ref} s\nINNER JOIN {self.target_ref} t\n    ON {self.join_condition}",
+            limit, self.db_type
+        )
+
+    def unmatched_source_sql(self, limit: Optional[int] = None, select_list: str = "s.*") -> str:
+        """Source rows without a matching target row (NOT EXISTS)."""
+        return limited_select(
+            select_list, f"{self.source_ref} s", limit, self.db_type,
+            where=f"NOT EXISTS (\n    SELECT 1\n    FROM {self.target_ref} t\n    WHERE {self.join_condition}\n)"
+        )
+
+    def unmatched_target_sql(self, limit: Optional[int] = None, select_list: str = "t.*") -> str:
+        """Target rows without a matching source row (NOT EXISTS)."""
+        return limited_select(
+            select_list, f"{self.target_ref} t", limit, self.db_type,
+            where=f"NOT EXISTS (\n    SELECT 1\n    FROM {self.source_ref} s\n    WHERE {self.join_condition}\n)"
+        )
+
+    def sample_sql(self, side: str, limit: Optional[int], key_columns_only: bool = True) -> str:
+        """Sample rows of one side (its join columns, or all columns)."""
+        columns = self.source_columns if side == "source" else self.target_columns
+        select_list = ", ".join(columns) if key_columns_only and columns else "*"
+        return limited_select(select_list, self.refs(side)[0], limit, self.db_type)
+
+    def probe_sql(self, side: str) -> str:
+        """Zero-row SELECT exposing the column metadata of one side."""
+        return f"SELECT * FROM {self.refs(side)[0]} WHERE 1=0"
+
+
+@dataclass(frozen=True)
+class RuleSetPlan:
+    """Compiled plans of a ruleset for one dialect."""
+    ruleset_id: str
+    version: str                       # Content hash of the ruleset the plans were compiled from
+    db_type: str
+    plans: Tuple[RulePlan, ...]        # Same order as ruleset.rules
+
+    def get(self, rule_id: str) -> Optional[RulePlan]:
+        """Plan of the given rule, or None."""
+        for plan in self.plans:
+            if plan.rule_id == rule_id:
+                return plan
+        return None
+
+
+class RulePlanCompiler:
+    """Compile rulesets into cached, dialect-specific rule plans."""
+
+    def __init__(self, cache_size: int = RECON_PLAN_CACHE_SIZE):
+        """
+        Initialize the compiler.
+
+        Args:
+            cache_size: Maximum number of compiled ruleset plans kept (LRU)
+        """
+        self.cache_size = max(1, cache_size)
+        self._cache: "OrderedDict[Tuple[str, str, str], RuleSetPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def content_hash(ruleset: ReconciliationRuleSet) -> str:
+        """Stable hash of the ruleset content; any rule edit yields a new version."""
+        payload = json.dumps(ruleset.model_dump(mode="json"), sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def compile(
+        self,
+        ruleset: ReconciliationRuleSet,
+        db_type: str,
+        table_resolver: Optional[TableResolver] = None,
+        scope: str = ""
+    ) -> RuleSetPlan:
+        """
+        Compile (or fetch from cache) the plans of a ruleset.
+
+        Args:
+            ruleset: Ruleset to compile
+            db_type: Dialect the plans are generated for
+            table_resolver: Optional resolver deciding, once per table, whether the
+                schema prefix is usable (see CatalogService.table_resolver)
+            scope: Identity of the database(s) the resolver probed; resolved plans
+                are only reused for the same scope
+
+        Returns:
+            RuleSetPlan with one RulePlan per rule
+        """
+        dialect = canonical_dialect(db_type)
+        version = self.content_hash(ruleset)
+        key = (version, dialect, scope if table_resolver else "")
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        resolved_tables: Dict[Tuple[str, str], Tuple[bool, Optional[Tuple[str, ...]]]] = {}
+
+        def resolve(schema: str, table: str) -> Tuple[bool, Optional[Tuple[str, ...]]]:
+            if (schema, table) not in resolved_tables:
+                resolved_tables[(schema, table)] = table_resolver(schema, table)
+            return resolved_tables[(schema, table)]
+
+        plans = tuple(
+            self.compile_rule(rule, dialect, resolve if table_resolver else None)
+            for rule in ruleset.rules
+        )
+        ruleset_plan = RuleSetPlan(
+            ruleset_id=ruleset.ruleset_id,
+            version=version,
+            db_type=dialect,
+            plans=plans
+        )
+        logger.debug(
+            f"Compiled {len(plans)} rule plans for ruleset '{ruleset.ruleset_id}' "
+            f"(version {version}, dialect {dialect})"
+        )
+
+        with self._lock:
+            self._cache[key] = ruleset_plan
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return ruleset_plan
+
+    @staticmethod
+    def compile_rule(
+        rule: ReconciliationRule,
+        db_type: str,
+        table_resolver: Optional[TableResolver] = None
+    ) -> RulePlan:
+        """
+        Compile a single rule (uncached).
+
+        Args:
+            rule: Rule to compile
+            db_type: Dialect the plan is generated for
+            table_resolver: Optional schema-prefix resolver
+
+        Returns:
+            RulePlan for the rule
+        """
+        dialect = canonical_dialect(db_type)
+
+        def table_refs(schema: str, table: str) -> Tuple[str, str, Optional[Tuple[str, ...]]]:
+            table_quoted = quote_identifier(table, dialect)
+            schema = normalize_schema_name(schema, dialect)
+            qualified = f"{quote_identifier(schema, dialect)}.{table_quoted}" if schema else table_quoted
+            if table_resolver:
+                use_schema, columns = table_resolver(schema, table)
+                return (qualified if use_schema else table_quoted), table_quoted, columns
+            return qualified, table_quoted, None
+
+        source_ref, source_table_ref, source_table_columns = table_refs(rule.source_schema, rule.source_table)
+        target_ref, target_table_ref, target_table_columns = table_refs(rule.target_schema, rule.target_table)
+
+        # Join columns are kept as written in the rule: transformations reference them verbatim
+        join_conditions = []
+        for src_col, tgt_col in zip(rule.source_columns, rule.target_columns):
+            if rule.transformation:
+                join_conditions.append(f"{rule.transformation} = t.{tgt_col}")
+            else:
+                join_conditions.append(f"s.{src_col} = t.{tgt_col}")
+
+        source_columns = tuple(quote_identifier(col, dialect) for col in rule.source_columns)
+        target_columns = tuple(quote_identifier(col, dialect) for col in rule.target_columns)
+        key_join_condition = " AND ".join(
+            f"s.{src_col} = t.{tgt_col}" for src_col, tgt_col in zip(source_columns, target_columns)
+        )
+
+        return RulePlan(
+            rule_id=rule.rule_id,
+            rule_name=rule.rule_name,
+            db_type=dialect,
+            source_ref=source_ref,
+            target_ref=target_ref,
+            source_table_ref=source_table_ref,
+            target_table_ref=target_table_ref,
+            source_columns=source_columns,
+            target_columns=target_columns,
+            join_condition=" AND ".join(join_conditions),
+            key_join_condition=key_join_condition,
+            schema_resolved=table_resolver is not None,
+            source_table_columns=source_table_columns,
+            target_table_columns=target_table_columns
+        )
+
+    def clear(self):
+        """Drop all cached plans."""
+        with self._lock:
+            self._cache.clear()
+
+    def cache_info(self) -> Dict[str, int]:
+        """Cache statistics."""
+        with self._lock:
+            return {"size": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+
+# Singleton instance
+_rule_plan_compiler: Optional[RulePlanCompiler] = None
+
+
+def get_rule_plan_compiler() -> RulePlanCompiler:
+    """Get or create the singleton rule plan compiler instance."""
+    global _rule_plan_compiler
+    if _rule_plan_compiler is None:
+        _rule_plan_compiler = RulePlanCompiler()
+    return _rule_plan_compiler
@@ -13,6 +13,7 @@ from datetime import datetime
 from kg_builder.models import ReconciliationRuleSet, ReconciliationRule
 from kg_builder.config import DATA_DIR
 from kg_builder.services.schema_parser import SchemaParser
+from kg_builder.services.rule_plan_compiler import GENERIC_DIALECT, get_rule_plan_compiler
 
 logger = logging.getLogger(__name__)
 
@@ -198,7 +199,8 @@ class ReconciliationRuleStorage:
     def export_ruleset_to_sql(
         self,
         ruleset_id: str,
-        query_type: str = "all"
+        query_type: str = "all",
+        db_type: Optional[str] = None
     ) -> Optional[str]:
         """
         Export a ruleset as SQL statements with specific columns from schema.
@@ -210,6 +212,8 @@ class ReconciliationRuleStorage:
                 - "matched": Only matched records query
                 - "unmatched_source": Only unmatched source records
                 - "unmatched_target": Only unmatched target records
+            db_type: Dialect to quote identifiers for (mysql, oracle, postgresql,
+                sqlserver). Defaults to unquoted, portable identifiers
 
         Returns:
             SQL string or None if ruleset not found
@@ -219,6 +223,9 @@ class ReconciliationRuleStorage:
         if not ruleset:
             return None
 
+        # Reuse the compiled (cached) plans for table references and join conditions
+        ruleset_plan = get_rule_plan_compiler().compile(ruleset, db_type or GENERIC_DIALECT)
+
         # Load schema information for all tables involved
         schema_parser = SchemaParser()
         schemas_cache = {}  # Cache loaded schemas
@@ -259,7 +266,7 @@ class ReconciliationRuleStorage:
         sql_statements.append(f"-- ============================================================================")
         sql_statements.append("")
 
-        for i, rule in enumerate(ruleset.rules, 1):
+        for i, (rule, plan) in enumerate(zip(ruleset.rules, ruleset_plan.plans), 1):
             sql_statements.append(f"-- ----------------------------------------------------------------------------")
             sql_statements.append(f"-- Rule {i}: {rule.rule_name}")
             sql_statements.append(f"-- Match Type: {rule.match_type}")
@@ -291,15 +298,9 @@ class ReconciliationRuleStorage:
                 target_all_cols = "t.*"
                 logger.warning(f"Schema not available, using t.* for {rule.target_schema}.{rule.target_table}")
 
-            # Generate JOIN condition
-            join_conditions = []
-            for src_col, tgt_col in zip(rule.source_columns, rule.target_columns):
-                if rule.transformation:
-                    join_conditions.append(f"{rule.transformation} = t.{tgt_col}")
-                else:
-                    join_conditions.append(f"s.{src_col} = t.{tgt_col}")
-
-            join_condition = " AND ".join(join_conditions)
+            join_condition = plan.join_condition
+            source_ref = plan.source_ref
+            target_ref = plan.target_ref
 
             # Generate queries based on query_type
             if query_type in ["all", "matched"]:
@@ -311,8 +312,8 @@ SELECT
     {rule.confidence_score} AS confidence_score,
     {source_all_cols},
     {target_all_cols}
-FROM {rule.source_schema}.{rule.source_table} s
-INNER JOIN {rule.target_schema}.{rule.target_table} t
+FROM {source_ref} s
+INNER JOIN {target_ref} t
     ON {join_condition};
 """)
                 sql_statements.append("")
@@ -324,10 +325,10 @@ SELECT
     '{rule.rule_id}' AS rule_id,
     '{rule.rule_name}' AS rule_name,
     {source_all_cols}
-FROM {rule.source_schema}.{rule.source_table} s
+FROM {source_ref} s
 WHERE NOT EXISTS (
     SELECT 1
-    FROM {rule.target_schema}.{rule.target_table} t
+    FROM {target_ref} t
     WHERE {join_condition}
 );
 """)
@@ -340,10 +341,10 @@ SELECT
     '{rule.rule_id}' AS rule_id,
     '{rule.rule_name}' AS rule_name,
     {target_all_cols}
-FROM {rule.target_schema}.{rule.target_table} t
+FROM {target_ref} t
 WHERE NOT EXISTS (
     SELECT 1
-    FROM {rule.source_schema}.{rule.source_table} s
+    FROM {source_ref} s
     WHERE {join_condition}
 );
 """)
@@ -356,34 +357,30 @@ WHERE NOT EXISTS (
             sql_statements.append("-- ============================================================================")
             sql_statements.append("")
 
-            for i, rule in enumerate(ruleset.rules, 1):
-                join_conditions = []
-                for src_col, tgt_col in zip(rule.source_columns, rule.target_columns):
-                    if rule.transformation:
-                        join_conditions.append(f"{rule.transformation} = t.{tgt_col}")
-                    else:
-                        join_conditions.append(f"s.{src_col} = t.{tgt_col}")
-                join_condition = " AND ".join(join_conditions)
+            for i, (rule, plan) in enumerate(zip(ruleset.rules, ruleset_plan.plans), 1):
+                join_condition = plan.join_condition
+                source_ref = plan.source_ref
+                target_ref = plan.target_ref
 
                 sql_statements.append(f"-- Statistics for Rule {i}: {rule.rule_name}")
                 sql_statements.append(f"""
 SELECT
     '{rule.rule_name}' AS rule_name,
-    (SELECT COUNT(*) FROM {rule.source_schema}.{rule.source_table}) AS total_source,
-    (SELECT COUNT(*) FROM {rule.target_schema}.{rule.target_table}) AS total_target,
+    (SELECT COUNT(*) FROM {source_ref}) AS total_source,
+    (SELECT COUNT(*) FROM {target_ref}) AS total_target,
     (SELECT COUNT(*)
-     FROM {rule.source_schema}.{rule.source_table} s
-     INNER JOIN {rule.target_schema}.{rule.target_table} t
+     FROM {source_ref} s
+     INNER JOIN {target_ref} t
          ON {join_condition}) AS matched_count,
     (SELECT COUNT(*)
-     FROM {rule.source_schema}.{rule.source_table} s
+     FROM {source_ref} s
      WHERE NOT EXISTS (
-         SELECT 1 FROM {rule.target_schema}.{rule.target_table} t
+         SELECT 1 FROM {target_ref} t
          WHERE {join_condition})) AS unmatched_source_count,
     (SELECT COUNT(*)
-     FROM {rule.target_schema}.{rule.target_table} t
+     FROM {target_ref} t
      WHERE NOT EXISTS (
-         SELECT 1 FROM {rule.source_schema}.{rule.source_table} s
+         SELECT 1 FROM {source_ref} s
          WHERE {join_condition})) AS unmatched_target_count
 FROM DUAL;
 """)
@@ -5,10 +5,8 @@ Uses JayDeBeApi to connect to databases via JDBC and validate rules with real da
 """
 
 import logging
-import jaydebeapi
 import time
 from typing import Dict, List, Any, Optional, Tuple
-from pathlib import Path
 
 from kg_builder.models import (
     ReconciliationRule,
@@ -16,7 +14,9 @@ from kg_builder.models import (
     ReconciliationMatchType,
     DatabaseConnectionInfo
 )
-from kg_builder.config import JDBC_DRIVERS_PATH
+from kg_builder.services.rule_plan_compiler import RulePlan, get_rule_plan_compiler
+from kg_builder.services.catalog_service import get_catalog_service
+from kg_builder.services.jdbc_connection_pool import get_connection_manager
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +26,6 @@ class RuleValidator:
 
     def __init__(self):
         """Initialize the rule validator."""
-        self.jdbc_drivers_path = Path(JDBC_DRIVERS_PATH) if JDBC_DRIVERS_PATH else None
 
     def validate_rule_with_data(
         self,
@@ -59,6 +58,8 @@ class RuleValidator:
 
         source_conn = None
         target_conn = None
+        compiler = get_rule_plan_compiler()
+        catalog = get_catalog_service()
 
         try:
             # Step 1: Connect to source database
@@ -69,11 +70,15 @@ class RuleValidator:
                 issues.append("Failed to connect to source database")
                 exists = False
             else:
-                # Step 2: Verify source table and columns exist
+                # Step 2: Verify source table and columns exist (the plan resolves
+                # the schema prefix and dialect quoting/limits once)
+                source_plan = compiler.compile_rule(
+                    rule, source_db_config.db_type,
+                    catalog.table_resolver(source_conn, source_db_config.connection_key(), source_db_config.db_type)
+                )
                 source_exists, source_issues = self._verify_table_columns(
                     source_conn,
-                    rule.source_schema,
-                    rule.source_table,
+                    source_plan,
                     rule.source_columns,
                     "source"
                 )
@@ -90,10 +95,13 @@ class RuleValidator:
                 exists = False
             else:
                 # Step 4: Verify target table and columns exist
+                target_plan = compiler.compile_rule(
+                    rule, target_db_config.db_type,
+                    catalog.table_resolver(target_conn, target_db_config.connection_key(), target_db_config.db_type)
+                )
                 target_exists, target_issues = self._verify_table_columns(
                     target_conn,
-                    rule.target_schema,
-                    rule.target_table,
+                    target_plan,
                     rule.target_columns,
                     "target"
                 )
@@ -107,6 +115,8 @@ class RuleValidator:
                 types_compatible, type_issues = self._check_type_compatibility(
                     source_conn,
                     target_conn,
+                    source_plan,
+                    target_plan,
                     rule
                 )
                 if not types_compatible:
@@ -116,6 +126,8 @@ class RuleValidator:
                 sample_match_rate, match_warnings = self._test_sample_data(
                     source_conn,
                     target_conn,
+                    source_plan,
+                    target_plan,
                     rule,
                     sample_size
                 )
@@ -125,6 +137,8 @@ class RuleValidator:
                 cardinality = self._detect_cardinality(
                     source_conn,
                     target_conn,
+                    source_plan,
+                    target_plan,
                     rule,
                     sample_size
                 )
@@ -133,6 +147,8 @@ class RuleValidator:
                 estimated_performance_ms = self._estimate_performance(
                     source_conn,
                     target_conn,
+                    source_plan,
+                    target_plan,
                     rule
                 )
 
@@ -184,120 +200,24 @@ class RuleValidator:
         db_config: DatabaseConnectionInfo
     ) -> Optional[Any]:
         """
-        Connect to a database using JayDeBeApi.
+        Borrow a connection from the shared JDBC connection pool.
 
         Args:
             db_config: Database connection configuration
 
         Returns:
-            Database connection or None if failed
+            Pooled database connection (close() returns it to the pool) or None if failed
         """
         try:
-            # Build JDBC URL based on database type
-            jdbc_url = self._build_jdbc_url(db_config)
-
-            # Get JDBC driver class
-            driver_class = self._get_driver_class(db_config.db_type)
-
-            # Get driver JAR path
-            driver_jar = self._get_driver_jar(db_config.db_type)
-
-            # Connect using JayDeBeApi
-            logger.debug(f"Connecting to {jdbc_url} with driver {driver_class}")
-
-            conn = jaydebeapi.connect(
-                driver_class,
-                jdbc_url,
-                [db_config.username, db_config.password],
-                driver_jar
-            )
-
-            logger.debug("Database connection established")
-            return conn
-
+            return get_connection_manager().connect(db_config)
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             return None
 
-    def _build_jdbc_url(self, db_config: DatabaseConnectionInfo) -> str:
-        """Build JDBC URL based on database type."""
-        db_type = db_config.db_type.lower()
-
-        if db_type == "oracle":
-            # Oracle: jdbc:oracle:thin:@host:port:sid or @host:port/service
-            if db_config.service_name:
-                return f"jdbc:oracle:thin:@{db_config.host}:{db_config.port}/{db_config.service_name}"
-            else:
-                return f"jdbc:oracle:thin:@{db_config.host}:{db_config.port}:{db_config.database}"
-
-        elif db_type == "sqlserver" or db_type == "mssql":
-            # SQL Server: jdbc:sqlserver://host:port;databaseName=dbname
-            return f"jdbc:sqlserver://{db_config.host}:{db_config.port};databaseName={db_config.database};encrypt=true;trustServerCertificate=true"
-
-        elif db_type == "postgresql" or db_type == "postgres":
-            # PostgreSQL: jdbc:postgresql://host:port/database
-            return f"jdbc:postgresql://{db_config.host}:{db_config.port}/{db_config.database}"
-
-        elif db_type == "mysql":
-            # MySQL: jdbc:mysql://host:port/database
-            return f"jdbc:mysql://{db_config.host}:{db_config.port}/{db_config.database}"
-
-        else:
-            raise ValueError(f"Unsupported database type: {db_config.db_type}")
-
-    def _get_driver_class(self, db_type: str) -> str:
-        """Get JDBC driver class name for database type."""
-        db_type = db_type.lower()
-
-        drivers = {
-            "oracle": "oracle.jdbc.OracleDriver",
-            "sqlserver": "com.microsoft.sqlserver.jdbc.SQLServerDriver",
-            "mssql": "com.microsoft.sqlserver.jdbc.SQLServerDriver",
-            "postgresql": "org.postgresql.Driver",
-            "postgres": "org.postgresql.Driver",
-            "mysql": "com.mysql.cj.jdbc.Driver"
-        }
-
-        if db_type not in drivers:
-            raise ValueError(f"Unknown database type: {db_type}")
-
-        return drivers[db_type]
-
-    def _get_driver_jar(self, db_type: str) -> str:
-        """Get path to JDBC driver JAR file."""
-        if not self.jdbc_drivers_path or not self.jdbc_drivers_path.exists():
-            raise ValueError(f"JDBC drivers path not configured or doesn't exist: {self.jdbc_drivers_path}")
-
-        db_type = db_type.lower()
-
-        # Map database types to JAR file patterns
-        jar_patterns = {
-            "oracle": "ojdbc*.jar",
-            "sqlserver": "mssql-jdbc*.jar",
-            "mssql": "mssql-jdbc*.jar",
-            "postgresql": "postgresql*.jar",
-            "postgres": "postgresql*.jar",
-            "mysql": "mysql-connector*.jar"
-        }
-
-        if db_type not in jar_patterns:
-            raise ValueError(f"Unknown database type: {db_type}")
-
-        # Find the JAR file
-        pattern = jar_patterns[db_type]
-        jar_files = list(self.jdbc_drivers_path.glob(pattern))
-
-        if not jar_files:
-            raise ValueError(f"JDBC driver not found for {db_type}. Expected pattern: {pattern} in {self.jdbc_drivers_path}")
-
-        # Use the first matching JAR
-        return str(jar_files[0])
-
     def _verify_table_columns(
         self,
         conn: Any,
-        schema: str,
-        table: str,
+        plan: RulePlan,
         columns: List[str],
         label: str
     ) -> Tuple[bool, List[str]]:
@@ -306,39 +226,39 @@ class RuleValidator:
 
         Args:
             conn: Database connection
-            schema: Schema name
-            table: Table name
+            plan: Compiled rule plan for this database
             columns: List of column names
-            label: Label for error messages (source/target)
+            label: Side of the rule to check (source/target), also used in messages
 
         Returns:
             Tuple of (exists, issues)
         """
         issues = []
         cursor = None
+        table_ref = plan.refs(label)[0]
+        known_columns = plan.source_table_columns if label == "source" else plan.target_table_columns
 
         try:
-            cursor = conn.cursor()
-
-            # Build a simple query to check table existence
-            # Use LIMIT/ROWNUM to make it fast
-            test_query = f"SELECT * FROM {schema}.{table} WHERE 1=0"
+            if known_columns is not None:
+                # Resolved from the catalog cache: no query needed
+                db_columns = [col.upper() for col in known_columns]
+            else:
+                cursor = conn.cursor()
 
-            try:
-                cursor.execute(test_query)
-                logger.debug(f"{label.capitalize()} table exists: {schema}.{table}")
-            except Exception as e:
-                issues.append(f"{label.capitalize()} table not found: {schema}.{table} - {str(e)}")
-                return False, issues
+                # Zero-row query: checks table existence and exposes column metadata
+                try:
+                    cursor.execute(plan.probe_sql(label))
+                    logger.debug(f"{label.capitalize()} table exists: {table_ref}")
+                except Exception as e:
+                    issues.append(f"{label.capitalize()} table not found: {table_ref} - {str(e)}")
+                    return False, issues
 
-            # Get column metadata
-            cursor.execute(f"SELECT * FROM {schema}.{table} WHERE ROWNUM <= 1")
-            db_columns = [desc[0].upper() for desc in cursor.description]
+                db_columns = [desc[0].upper() for desc in cursor.description]
 
             # Check if requested columns exist
             for col in columns:
                 if col.upper() not in db_columns:
-                    issues.append(f"{label.capitalize()} column not found: {col} in {schema}.{table}")
+                    issues.append(f"{label.capitalize()} column not found: {col} in {table_ref}")
 
             if issues:
                 return False, issues
@@ -361,6 +281,8 @@ class RuleValidator:
         self,
         source_conn: Any,
         target_conn: Any,
+        source_plan: RulePlan,
+        target_plan: RulePlan,
         rule: ReconciliationRule
     ) -> Tuple[bool, List[str]]:
         """
@@ -369,6 +291,8 @@ class RuleValidator:
         Args:
             source_conn: Source database connection
             target_conn: Target database connection
+            source_plan: Compiled rule plan for the source database
+            target_plan: Compiled rule plan for the target database
             rule: Reconciliation rule
 
         Returns:
@@ -379,17 +303,13 @@ class RuleValidator:
         try:
             # Get source column types
             source_cursor = source_conn.cursor()
-            source_cursor.execute(
-                f"SELECT * FROM {rule.source_schema}.{rule.source_table} WHERE ROWNUM <= 1"
-            )
+            source_cursor.execute(source_plan.probe_sql("source"))
             source_types = {desc[0].upper(): desc[1] for desc in source_cursor.description}
             source_cursor.close()
 
             # Get target column types
             target_cursor = target_conn.cursor()
-            target_cursor.execute(
-                f"SELECT * FROM {rule.target_schema}.{rule.target_table} WHERE ROWNUM <= 1"
-            )
+            target_cursor.execute(target_plan.probe_sql("target"))
             target_types = {desc[0].upper(): desc[1] for desc in target_cursor.description}
             target_cursor.close()
 
@@ -416,25 +336,22 @@ class RuleValidator:
 
     def _are_types_compatible(self, type1: Any, type2: Any) -> bool:
         """Check if two JDBC types are compatible for matching."""
-        # Convert JDBC type codes to type names
-        import jaydebeapi
-        import java.sql.Types as Types
-
+        # java.sql.Types codes as plain ints (no JVM needed, e.g. behind the JDBC gateway)
         # Numeric types are compatible with each other
         numeric_types = {
-            Types.INTEGER, Types.BIGINT, Types.SMALLINT, Types.TINYINT,
-            Types.DECIMAL, Types.NUMERIC, Types.FLOAT, Types.DOUBLE, Types.REAL
+            4, -5, 5, -6,  # INTEGER, BIGINT, SMALLINT, TINYINT
+            3, 2, 6, 8, 7  # DECIMAL, NUMERIC, FLOAT, DOUBLE, REAL
         }
 
         # String types are compatible with each other
         string_types = {
-            Types.CHAR, Types.VARCHAR, Types.LONGVARCHAR,
-            Types.NCHAR, Types.NVARCHAR, Types.LONGNVARCHAR
+            1, 12, -1,     # CHAR, VARCHAR, LONGVARCHAR
+            -15, -9, -16   # NCHAR, NVARCHAR, LONGNVARCHAR
         }
 
         # Date/time types are compatible with each other
         datetime_types = {
-            Types.DATE, Types.TIME, Types.TIMESTAMP
+            91, 92, 93     # DATE, TIME, TIMESTAMP
         }
 
         # Check if both are in the same category
@@ -452,6 +369,8 @@ class RuleValidator:
         self,
         source_conn: Any,
         target_conn: Any,
+        source_plan: RulePlan,
+        target_plan: RulePlan,
         rule: ReconciliationRule,
         sample_size: int
     ) -> Tuple[Optional[float], List[str]]:
@@ -461,6 +380,8 @@ class RuleValidator:
         Args:
             source_conn: Source database connection
             target_conn: Target database connection
+            source_plan: Compiled rule plan for the source database
+            target_plan: Compiled rule plan for the target database
             rule: Reconciliation rule
             sample_size: Number of records to sample
 
@@ -472,13 +393,7 @@ class RuleValidator:
         try:
             # Sample source records
             source_cursor = source_conn.cursor()
-            source_cols = ', '.join(rule.source_columns)
-            source_query = f"""
-                SELECT {source_cols}
-                FROM {rule.source_schema}.{rule.source_table}
-                WHERE ROWNUM <= {sample_size}
-            """
-            source_cursor.execute(source_query)
+            source_cursor.execute(source_plan.sample_sql("source", sample_size))
             source_records = source_cursor.fetchall()
             source_cursor.close()
 
@@ -488,13 +403,7 @@ class RuleValidator:
 
             # Sample target records
             target_cursor = target_conn.cursor()
-            target_cols = ', '.join(rule.target_columns)
-            target_query = f"""
-                SELECT {target_cols}
-                FROM {rule.target_schema}.{rule.target_table}
-                WHERE ROWNUM <= {sample_size}
-            """
-            target_cursor.execute(target_query)
+            target_cursor.execute(target_plan.sample_sql("target", sample_size))
             target_records = target_cursor.fetchall()
             target_cursor.close()
 
@@ -570,6 +479,8 @@ class RuleValidator:
         self,
         source_conn: Any,
         target_conn: Any,
+        source_plan: RulePlan,
+        target_plan: RulePlan,
         rule: ReconciliationRule,
         sample_size: int
     ) -> Optional[str]:
@@ -579,6 +490,8 @@ class RuleValidator:
         Args:
             source_conn: Source database connection
             target_conn: Target database connection
+            source_plan: Compiled rule plan for the source database
+            target_plan: Compiled rule plan for the target database
             rule: Reconciliation rule
             sample_size: Number of records to analyze
 
@@ -588,15 +501,13 @@ class RuleValidator:
         try:
             # Count distinct values on both sides
             source_cursor = source_conn.cursor()
-            source_cols = ', '.join(rule.source_columns)
+            source_cols = ', '.join(source_plan.source_columns)
 
             source_cursor.execute(f"""
                 SELECT COUNT(*) as total, COUNT(DISTINCT {source_cols}) as distinct_count
                 FROM (
-                    SELECT {source_cols}
-                    FROM {rule.source_schema}.{rule.source_table}
-                    WHERE ROWNUM <= {sample_size}
-                )
+                    {source_plan.sample_sql("source", sample_size)}
+                ) sample_rows
             """)
             source_result = source_cursor.fetchone()
             source_total = source_result[0]
@@ -604,15 +515,13 @@ class RuleValidator:
             source_cursor.close()
 
             target_cursor = target_conn.cursor()
-            target_cols = ', '.join(rule.target_columns)
+            target_cols = ', '.join(target_plan.target_columns)
 
             target_cursor.execute(f"""
                 SELECT COUNT(*) as total, COUNT(DISTINCT {target_cols}) as distinct_count
                 FROM (
-                    SELECT {target_cols}
-                    FROM {rule.target_schema}.{rule.target_table}
-                    WHERE ROWNUM <= {sample_size}
-                )
+                    {target_plan.sample_sql("target", sample_size)}
+                ) sample_rows
             """)
             target_result = target_cursor.fetchone()
             target_total = target_result[0]
@@ -640,6 +549,8 @@ class RuleValidator:
         self,
         source_conn: Any,
         target_conn: Any,
+        source_plan: RulePlan,
+        target_plan: RulePlan,
         rule: ReconciliationRule
     ) -> Optional[float]:
         """
@@ -648,6 +559,8 @@ class RuleValidator:
         Args:
             source_conn: Source database connection
             target_conn: Target database connection
+            source_plan: Compiled rule plan for the source database
+            target_plan: Compiled rule plan for the target database
             rule: Reconciliation rule
 
         Returns:
@@ -658,12 +571,7 @@ class RuleValidator:
             start_time = time.time()
 
             cursor = source_conn.cursor()
-            source_cols = ', '.join(rule.source_columns)
-            cursor.execute(f"""
-                SELECT {source_cols}
-                FROM {rule.source_schema}.{rule.source_table}
-                WHERE ROWNUM <= 10
-            """)
+            cursor.execute(source_plan.sample_sql("source", 10))
             cursor.fetchall()
             cursor.close()
 
@@ -2,17 +2,33 @@
 Staging Table Manager for Landing Database.
 
 Handles creation, tracking, indexing, and cleanup of staging tables.
+
+Extracted tables are also catalogued as snapshots keyed by (host, database,
+table, column set, filter) together with a fingerprint of the source table.
+An execution that finds a snapshot with the same key and fingerprint reuses
+it instead of extracting again. Snapshots are reference counted; a background
+sweep drops tables that are no longer referenced once they are stale or have
+been idle for the staging TTL.
+
+Backend-specific SQL (DDL, size and index introspection, quoting) comes from
+the landing connector, so the same manager works on MySQL and PostgreSQL.
 """
+import hashlib
+import json
 import logging
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from kg_builder.services.landing_db_connector import LandingDBConnector
-from kg_builder.models import StagingTableInfo, StagingTableMetadata
+from kg_builder.models import DatabaseConnectionInfo, StagingTableInfo, StagingTableMetadata
 from kg_builder import config
 
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_CATALOG_TABLE = "staging_snapshot_catalog"
+
 
 class StagingManager:
     """Manages staging tables in landing database."""
@@ -26,13 +42,16 @@ class StagingManager:
         """
         self.connector = connector
         self.schema = config.LANDING_DB_SCHEMA
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_stop = threading.Event()
         logger.info(f"Initialized StagingManager with schema: {self.schema}")
 
     def generate_staging_table_name(
         self,
         execution_id: str,
         source_or_target: str,
-        timestamp: Optional[datetime] = None
+        timestamp: Optional[datetime] = None,
+        table_index: int = 0
     ) -> str:
         """
         Generate unique staging table name.
@@ -41,6 +60,7 @@ class StagingManager:
             execution_id: Execution ID
             source_or_target: 'source' or 'target'
             timestamp: Optional timestamp (uses current if not provided)
+            table_index: Position of the table on its side (0 keeps the single-table name)
 
         Returns:
             Staging table name
@@ -49,7 +69,8 @@ class StagingManager:
             timestamp = datetime.utcnow()
 
         ts = timestamp.strftime("%Y%m%d_%H%M%S")
-        return f"recon_stage_{execution_id}_{source_or_target}_{ts}"
+        side = f"{source_or_target}{table_index}" if table_index else source_or_target
+        return f"recon_stage_{execution_id}_{side}_{ts}"
 
     def create_staging_table(
         self,
@@ -77,25 +98,8 @@ class StagingManager:
             Table name created
         """
         try:
-            # Build column definitions
-            column_defs = []
-            for col in columns:
-                col_name = col['name']
-                col_type = col.get('type', 'TEXT')
-                nullable = col.get('nullable', True)
-                null_clause = '' if nullable else 'NOT NULL'
-                column_defs.append(f"`{col_name}` {col_type} {null_clause}")
-
-            columns_sql = ',\n    '.join(column_defs)
-
             # Create table
-            create_table_sql = f"""
-            CREATE TABLE IF NOT EXISTS `{table_name}` (
-                `_staging_id` BIGINT AUTO_INCREMENT PRIMARY KEY,
-                `_created_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                {columns_sql}
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
-            """
+            create_table_sql = self.connector.staging_table_sql(table_name, columns)
 
             with self.connector.cursor() as cursor:
                 cursor.execute(create_table_sql)
@@ -122,45 +126,97 @@ class StagingManager:
     def create_indexes(
         self,
         table_name: str,
-        index_columns: List[str]
+        index_columns: List[str],
+        column_types: Optional[Dict[str, str]] = None
     ) -> List[str]:
         """
         Create indexes on staging table for join performance.
 
+        Call after the bulk load: on MySQL all indexes are added in one ALTER
+        TABLE, so the loaded table is sorted once instead of maintaining indexes
+        row by row, and TEXT/BLOB columns (no tight type) get a prefix index.
+        Other backends build each index with CREATE INDEX on its own connection,
+        up to the connector's index_build_workers at a time, then analyze the table.
+
         Args:
             table_name: Staging table name
             index_columns: Columns to index
+            column_types: Staging type per column (to pick prefix indexes)
 
         Returns:
             List of created index names
         """
-        created_indexes = []
+        if self.connector.db_type != "mysql":
+            return self._create_indexes_concurrently(table_name, index_columns)
+
+        column_types = {name.lower(): col_type.upper() for name, col_type in (column_types or {}).items()}
+        indexes = []
+        for col in index_columns:
+            index_name = f"idx_{table_name}_{col}"[:64]  # MySQL index name limit
+            col_type = column_types.get(col.lower(), '')
+            prefix = f"({config.LANDING_INDEX_PREFIX_LENGTH})" if col_type in ('TEXT', 'BLOB') else ''
+            indexes.append((index_name, f"ADD INDEX `{index_name}` (`{col}`{prefix})"))
+
+        if not indexes:
+            return []
 
         try:
-            for col in index_columns:
-                index_name = f"idx_{table_name}_{col}"[:64]  # MySQL index name limit
+            with self.connector.cursor() as cursor:
+                cursor.execute(f"ALTER TABLE `{table_name}` " + ", ".join(clause for _, clause in indexes))
+            created_indexes = [index_name for index_name, _ in indexes]
+            logger.info(f"Created {len(created_indexes)} indexes on {table_name}")
+            return created_indexes
+        except Exception as e:
+            logger.debug(f"Combined index build failed on {table_name}, adding indexes one by one: {e}")
 
-                create_index_sql = f"""
-                CREATE INDEX `{index_name}`
-                ON `{table_name}` (`{col}`)
-                """
+        # Fall back to one index at a time (some may already exist, e.g. on a reused snapshot)
+        created_indexes = []
+        for index_name, clause in indexes:
+            try:
+                with self.connector.cursor() as cursor:
+                    cursor.execute(f"ALTER TABLE `{table_name}` {clause}")
+                created_indexes.append(index_name)
+                logger.debug(f"Created index: {index_name}")
+            except Exception as e:
+                # Index might already exist
+                if "Duplicate key name" not in str(e):
+                    logger.warning(f"Failed to create index {index_name}: {e}")
 
-                try:
-                    with self.connector.cursor() as cursor:
-                        cursor.execute(create_index_sql)
-                    created_indexes.append(index_name)
-                    logger.debug(f"Created index: {index_name}")
-                except Exception as e:
-                    # Index might already exist
-                    if "Duplicate key name" not in str(e):
-                        logger.warning(f"Failed to create index {index_name}: {e}")
+        logger.info(f"Created {len(created_indexes)} indexes on {table_name}")
+        return created_indexes
 
-            logger.info(f"Created {len(created_indexes)} indexes on {table_name}")
-            return created_indexes
+    def _create_indexes_concurrently(self, table_name: str, index_columns: List[str]) -> List[str]:
+        """CREATE INDEX per column, several at a time (each worker uses its own connection)."""
+        quote = self.connector.quote
 
-        except Exception as e:
-            logger.error(f"Error creating indexes: {e}")
-            return created_indexes
+        def build(col: str) -> Optional[str]:
+            index_name = f"idx_{table_name}_{col}"[:63]  # PostgreSQL identifier limit
+            try:
+                with self.connector.cursor() as cursor:
+                    cursor.execute(
+                        f"CREATE INDEX IF NOT EXISTS {quote(index_name)} ON {quote(table_name)} ({quote(col)})"
+                    )
+                logger.debug(f"Created index: {index_name}")
+                return index_name
+            except Exception as e:
+                logger.warning(f"Failed to create index {index_name}: {e}")
+                return None
+            finally:
+                if workers > 1:
+                    # Landing connections are per thread
+                    self.connector.close()
+
+        workers = max(1, min(self.connector.index_build_workers, len(index_columns)))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="staging-index") as pool:
+                results = list(pool.map(build, index_columns))
+        else:
+            results = [build(col) for col in index_columns]
+        created_indexes = [index_name for index_name in results if index_name]
+
+        self.connector.analyze_table(table_name)
+        logger.info(f"Created {len(created_indexes)} indexes on {table_name}")
+        return created_indexes
 
     def get_staging_table_info(self, table_name: str) -> Optional[StagingTableInfo]:
         """
@@ -173,44 +229,27 @@ class StagingManager:
             StagingTableInfo or None if not found
         """
         try:
+            quoted_table = self.connector.quote(table_name)
+
             # Get row count
             row_count_result = self.connector.execute_one(
-                f"SELECT COUNT(*) as count FROM `{table_name}`"
+                f"SELECT COUNT(*) as count FROM {quoted_table}"
             )
             row_count = row_count_result.get('count', 0) if row_count_result else 0
 
             # Get table size
-            size_result = self.connector.execute_one(f"""
-                SELECT
-                    ROUND((data_length + index_length) / 1024 / 1024, 2) as size_mb
-                FROM information_schema.tables
-                WHERE table_schema = '{self.connector.db_config.database}'
-                AND table_name = '{table_name}'
-            """)
-            size_mb = size_result.get('size_mb', 0) if size_result else 0
+            size_mb = self.connector.table_size_mb(table_name)
 
             # Get indexes
             indexes = []
             try:
-                indexes_result = self.connector.execute(f"""
-                    SELECT DISTINCT index_name
-                    FROM information_schema.statistics
-                    WHERE table_schema = '{self.connector.db_config.database}'
-                    AND table_name = '{table_name}'
-                    AND index_name != 'PRIMARY'
-                """)
-                if indexes_result:
-                    # Handle both uppercase and lowercase column names
-                    for idx in indexes_result:
-                        idx_name = idx.get('index_name') or idx.get('INDEX_NAME') or idx.get('Index_name')
-                        if idx_name:
-                            indexes.append(idx_name)
+                indexes = self.connector.table_indexes(table_name)
             except Exception as e:
                 logger.debug(f"Could not fetch indexes: {e}")
 
             # Get created_at from metadata or table
             created_at_result = self.connector.execute_one(
-                f"SELECT MIN(_created_at) as created_at FROM `{table_name}`"
+                f"SELECT MIN(_created_at) as created_at FROM {quoted_table}"
             )
             created_at = created_at_result.get('created_at') if created_at_result else datetime.utcnow()
 
@@ -238,7 +277,7 @@ class StagingManager:
         """
         try:
             result = self.connector.execute_one(
-                f"SELECT COUNT(*) as count FROM `{table_name}`"
+                f"SELECT COUNT(*) as count FROM {self.connector.quote(table_name)}"
             )
             row_count = result.get('count', 0) if result else 0
 
@@ -272,7 +311,7 @@ class StagingManager:
         """
         try:
             with self.connector.cursor() as cursor:
-                cursor.execute(f"DROP TABLE IF EXISTS `{table_name}`")
+                cursor.execute(f"DROP TABLE IF EXISTS {self.connector.quote(table_name)}")
 
             logger.info(f"Dropped staging table: {table_name}")
 
@@ -294,42 +333,245 @@ class StagingManager:
             logger.error(f"Failed to drop staging table {table_name}: {e}")
             return False
 
-    def cleanup_expired_tables(self, ttl_hours: Optional[int] = None) -> int:
+    @staticmethod
+    def snapshot_key(
+        db_config: DatabaseConnectionInfo,
+        schema: str,
+        table: str,
+        columns: Any,
+        filter_clause: str = ""
+    ) -> str:
+        """
+        Catalog key of a table extraction: (host, database, table, column set, filter).
+
+        Args:
+            db_config: Source/target database configuration
+            schema: Schema of the extracted table
+            table: Extracted table
+            columns: '*' or the extracted columns
+            filter_clause: Filter applied to the extraction ('' for none)
+
+        Returns:
+            Hex digest identifying the extraction
+        """
+        column_set = '*' if not columns or columns == '*' or columns == ['*'] else sorted(columns)
+        identity = [
+            db_config.db_type.lower(), db_config.host.lower(), db_config.port,
+            (db_config.database or db_config.service_name or '').lower(),
+            f"{schema}.{table}".lower(), column_set, filter_clause
+        ]
+        return hashlib.sha256(json.dumps(identity).encode('utf-8')).hexdigest()[:40]
+
+    def acquire_snapshot(self, snapshot_key: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Take a reference on a ready snapshot with the same key and fingerprint.
+
+        Args:
+            snapshot_key: Key from snapshot_key()
+            fingerprint: Current fingerprint of the source table
+
+        Returns:
+            Catalog row ('table_name', 'row_count', ...) or None if there is no
+            reusable snapshot (or no catalog)
+        """
+        try:
+            row = self.connector.execute_one(f"""
+                SELECT table_name, row_count
+                FROM {SNAPSHOT_CATALOG_TABLE}
+                WHERE snapshot_key = %s AND fingerprint = %s AND status = 'ready'
+                ORDER BY created_at DESC
+                LIMIT 1
+            """, (snapshot_key, fingerprint))
+            if not row:
+                return None
+
+            with self.connector.cursor() as cursor:
+                cursor.execute(f"""
+                    UPDATE {SNAPSHOT_CATALOG_TABLE}
+                    SET ref_count = ref_count + 1, last_used_at = %s
+                    WHERE table_name = %s AND status = 'ready'
+                """, (datetime.utcnow(), row['table_name']))
+                if cursor.rowcount == 0:
+                    return None  # Swept in the meantime
+
+            logger.info(f"Reusing staging snapshot {row['table_name']} ({row['row_count']} rows)")
+            return row
+
+        except Exception as e:
+            logger.debug(f"Snapshot lookup failed: {e}")
+            return None
+
+    def register_snapshot(
+        self,
+        table_name: str,
+        snapshot_key: str,
+        fingerprint: str,
+        db_config: DatabaseConnectionInfo,
+        source_table: str,
+        columns: Any,
+        filter_clause: str,
+        row_count: int
+    ) -> bool:
+        """
+        Catalog a freshly loaded staging table as a snapshot, referenced once by the caller.
+
+        Older snapshots of the same key become stale and are dropped by the sweep
+        once nothing references them.
+
+        Returns:
+            True if the snapshot was catalogued
+        """
+        now = datetime.utcnow()
+        column_set = '*' if not columns or columns == '*' or columns == ['*'] else ','.join(sorted(columns))
+        try:
+            with self.connector.cursor() as cursor:
+                cursor.execute(f"""
+                    UPDATE {SNAPSHOT_CATALOG_TABLE}
+                    SET status = 'stale'
+                    WHERE snapshot_key = %s AND status = 'ready'
+                """, (snapshot_key,))
+                cursor.execute(f"""
+                    INSERT INTO {SNAPSHOT_CATALOG_TABLE}
+                    (snapshot_key, table_name, source_db_type, source_db_host, source_database,
+                     source_table, column_set, filter_clause, fingerprint, row_count,
+                     ref_count, created_at, last_used_at, status)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """, (
+                    snapshot_key, table_name, db_config.db_type, db_config.host,
+                    db_config.database or db_config.service_name or '', source_table,
+                    column_set, filter_clause, fingerprint, row_count, 1, now, now, 'ready'
+                ))
+            logger.debug(f"Catalogued staging snapshot {table_name} for {source_table}")
+            return True
+
+        except Exception as e:
+            # Catalog table might not exist yet; the table is then a plain staging table
+            logger.debug(f"Could not catalog staging snapshot: {e}")
+            return False
+
+    def release_snapshot(self, table_name: str):
+        """Drop one reference to a snapshot (it stays reusable until swept)."""
+        try:
+            with self.connector.cursor() as cursor:
+                cursor.execute(f"""
+                    UPDATE {SNAPSHOT_CATALOG_TABLE}
+                    SET ref_count = GREATEST(ref_count - 1, 0), last_used_at = %s
+                    WHERE table_name = %s
+                """, (datetime.utcnow(), table_name))
+        except Exception as e:
+            logger.debug(f"Could not release staging snapshot {table_name}: {e}")
+
+    def sweep_expired_tables(self, ttl_hours: Optional[int] = None) -> int:
         """
-        Clean up expired staging tables based on TTL.
+        Drop staging tables that nothing references any more.
+
+        Drops catalogued snapshots with no references that are stale or were last
+        used before the TTL, and uncatalogued staging tables created before the TTL.
+        Referenced snapshots are never dropped.
 
         Args:
             ttl_hours: Time to live in hours (uses config if not provided)
 
         Returns:
-            Number of tables cleaned up
+            Number of tables dropped
         """
         if ttl_hours is None:
             ttl_hours = config.LANDING_STAGING_TTL_HOURS
 
-        try:
-            # Find expired tables from metadata
-            cutoff_time = datetime.utcnow() - timedelta(hours=ttl_hours)
+        cutoff_time = datetime.utcnow() - timedelta(hours=ttl_hours)
+        dropped = 0
 
-            expired_tables = self.connector.execute("""
+        try:
+            snapshots = self.connector.execute(f"""
                 SELECT table_name
-                FROM staging_table_metadata
-                WHERE created_at < %s
-                AND status = 'active'
+                FROM {SNAPSHOT_CATALOG_TABLE}
+                WHERE ref_count = 0
+                AND (status = 'stale' OR (status = 'ready' AND last_used_at < %s))
+            """, (cutoff_time,))
+            for row in snapshots:
+                # Re-check the reference count in the same statement that retires the entry
+                with self.connector.cursor() as cursor:
+                    cursor.execute(f"""
+                        UPDATE {SNAPSHOT_CATALOG_TABLE}
+                        SET status = 'deleted'
+                        WHERE table_name = %s AND ref_count = 0 AND status != 'deleted'
+                    """, (row['table_name'],))
+                    retired = cursor.rowcount
+                if retired and self.drop_staging_table(row['table_name']):
+                    dropped += 1
+        except Exception as e:
+            logger.debug(f"Snapshot catalog not swept: {e}")
+
+        try:
+            expired_tables = self.connector.execute(f"""
+                SELECT m.table_name
+                FROM staging_table_metadata m
+                WHERE m.created_at < %s
+                AND m.status = 'active'
+                AND NOT EXISTS (
+                    SELECT 1 FROM {SNAPSHOT_CATALOG_TABLE} c
+                    WHERE c.table_name = m.table_name AND c.status != 'deleted'
+                )
             """, (cutoff_time,))
+        except Exception:
+            # No snapshot catalog: plain TTL cleanup
+            try:
+                expired_tables = self.connector.execute("""
+                    SELECT table_name
+                    FROM staging_table_metadata
+                    WHERE created_at < %s
+                    AND status = 'active'
+                """, (cutoff_time,))
+            except Exception as e:
+                logger.error(f"Failed to sweep expired tables: {e}")
+                expired_tables = []
 
-            cleaned_count = 0
-            for row in expired_tables:
-                table_name = row['table_name']
-                if self.drop_staging_table(table_name):
-                    cleaned_count += 1
+        for row in expired_tables:
+            if self.drop_staging_table(row['table_name']):
+                dropped += 1
 
-            logger.info(f"Cleaned up {cleaned_count} expired staging tables (TTL: {ttl_hours}h)")
-            return cleaned_count
+        logger.info(f"Swept {dropped} unreferenced staging tables (TTL: {ttl_hours}h)")
+        return dropped
 
-        except Exception as e:
-            logger.error(f"Failed to cleanup expired tables: {e}")
-            return 0
+    def start_sweeper(self, interval_seconds: Optional[float] = None) -> bool:
+        """
+        Run sweep_expired_tables() periodically on a daemon thread.
+
+        Args:
+            interval_seconds: Seconds between sweeps (uses config if not provided; 0 disables)
+
+        Returns:
+            True if a sweeper is running
+        """
+        if interval_seconds is None:
+            interval_seconds = config.LANDING_SNAPSHOT_SWEEP_INTERVAL_SECONDS
+        if interval_seconds <= 0:
+            return False
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return True
+
+        def sweep_loop():
+            while not self._sweeper_stop.wait(interval_seconds):
+                try:
+                    self.sweep_expired_tables()
+                except Exception as e:
+                    logger.warning(f"Staging sweep failed: {e}")
+                finally:
+                    # Landing connections are per thread
+                    self.connector.close()
+
+        self._sweeper_stop.clear()
+        self._sweeper = threading.Thread(target=sweep_loop, name="staging-sweeper", daemon=True)
+        self._sweeper.start()
+        logger.info(f"Started staging sweeper (every {interval_seconds}s)")
+        return True
+
+    def stop_sweeper(self):
+        """Stop the background sweeper."""
+        self._sweeper_stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+            self._sweeper = None
 
     def list_staging_tables(self, active_only: bool = True) -> List[StagingTableMetadata]:
         """
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for landing value conversion.
+
+Compares the old per-cell conversion (type string rebuilt and matched for every
+cell) with the precompiled per-column converters used by DataExtractor.
+
+Usage:
+    python scripts/benchmark_value_conversion.py [--rows 200000] [--columns 40] [--batch-size 10000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kg_builder.services.data_extractor import DataExtractor
+from kg_builder.services.jdbc_fetch import ColumnBatch
+
+# Type objects as reported in cursor.description by JayDeBeApi
+NUMBER = "DBAPITypeObject('BOOLEAN', 'BIGINT', 'BIT', 'INTEGER', 'SMALLINT', 'TINYINT')"
+STRING = "DBAPITypeObject('CHAR', 'NCHAR', 'NVARCHAR', 'VARCHAR', 'OTHER')"
+FLOAT = "DBAPITypeObject('FLOAT', 'REAL', 'DOUBLE')"
+DATETIME = "DBAPITypeObject('TIMESTAMP')"
+
+SAMPLES = {
+    NUMBER: lambda i: i,
+    STRING: lambda i: f"value-{i}",
+    FLOAT: lambda i: i * 1.5,
+    DATETIME: lambda i: "2024-01-01 00:00:00",
+}
+
+
+def legacy_convert_single_value(value, jdbc_type):
+    """Per-cell conversion as it was before converters were precompiled."""
+    if value is None:
+        return None
+
+    type_str = str(jdbc_type).upper()
+
+    if 'BOOL' in type_str or 'BIT' in type_str:
+        if isinstance(value, str):
+            if value.lower() in ('true', '1', 'yes', 't', 'y'):
+                return 1
+            elif value.lower() in ('false', '0', 'no', 'f', 'n'):
+                return 0
+        elif isinstance(value, bool):
+            return 1 if value else 0
+        elif isinstance(value, int):
+            return 1 if value else 0
+    elif 'INT' in type_str or 'NUMBER' in type_str:
+        if isinstance(value, str):
+            if value.lower() in ('true', 'false'):
+                return 1 if value.lower() == 'true' else 0
+            try:
+                return int(float(value))
+            except (ValueError, TypeError):
+                return None
+    elif 'CHAR' in type_str or 'TEXT' in type_str:
+        if isinstance(value, (bytes, bytearray)):
+            return value.decode('utf-8', errors='ignore')
+        return str(value) if value is not None else None
+
+    return value
+
+
+def legacy_convert(rows, column_types):
+    return [
+        tuple(legacy_convert_single_value(value, jdbc_type) for value, jdbc_type in zip(row, column_types))
+        for row in rows
+    ]
+
+
+def build_batches(num_rows, num_columns, batch_size):
+    rng = random.Random(42)
+    kinds = list(SAMPLES)
+    column_types = [kinds[i % len(kinds)] for i in range(num_columns)]
+    batches = []
+    for start in range(0, num_rows, batch_size):
+        size = min(batch_size, num_rows - start)
+        columns = [
+            [None if rng.random() < 0.05 else SAMPLES[jdbc_type](start + i) for i in range(size)]
+            for jdbc_type in column_types
+        ]
+        batches.append(ColumnBatch([f"c{i}" for i in range(num_columns)], column_types, columns))
+    return column_types, batches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--columns", type=int, default=40)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    column_types, batches = build_batches(args.rows, args.columns, args.batch_size)
+    row_batches = [batch.rows() for batch in batches]
+    extractor = DataExtractor(None, None)
+
+    started = time.perf_counter()
+    for rows in row_batches:
+        legacy_convert(rows, column_types)
+    legacy_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    converters = extractor._column_converters(column_types)
+    for batch in batches:
+        extractor._convert_columns(batch, converters)
+    precompiled_seconds = time.perf_counter() - started
+
+    print(f"{args.rows} rows x {args.columns} columns, batches of {args.batch_size}")
+    print(f"  per-cell (before):     {args.rows / legacy_seconds:>12,.0f} rows/sec")
+    print(f"  precompiled (after):   {args.rows / precompiled_seconds:>12,.0f} rows/sec")
+    print(f"  speedup:               {legacy_seconds / precompiled_seconds:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,10 @@ Initialize Landing Database.
 
 Creates the necessary database, schemas, and metadata tables for landing database operations.
 Run this script once before using the landing database feature.
+
+Supports MySQL (default) and PostgreSQL (LANDING_DB_TYPE=postgresql; the
+database itself must already exist, the staging schema is created). The
+embedded engine (LANDING_DB_TYPE=sqlite) needs no initialization.
 """
 import sys
 import os
@@ -80,6 +84,31 @@ def create_metadata_tables():
             """)
             logger.info("✓ Table 'staging_table_metadata' created/verified")
 
+            # Create staging_snapshot_catalog table (reusable, reference-counted staging tables)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS `staging_snapshot_catalog` (
+                    `id` BIGINT AUTO_INCREMENT PRIMARY KEY,
+                    `snapshot_key` VARCHAR(64) NOT NULL,
+                    `table_name` VARCHAR(255) NOT NULL UNIQUE,
+                    `source_db_type` VARCHAR(50) NOT NULL,
+                    `source_db_host` VARCHAR(255) NOT NULL,
+                    `source_database` VARCHAR(255) NOT NULL,
+                    `source_table` VARCHAR(255) NOT NULL,
+                    `column_set` TEXT NOT NULL,
+                    `filter_clause` VARCHAR(1000) NOT NULL DEFAULT '',
+                    `fingerprint` VARCHAR(2000) NOT NULL,
+                    `row_count` BIGINT DEFAULT 0,
+                    `ref_count` INT NOT NULL DEFAULT 0,
+                    `created_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    `last_used_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    `status` ENUM('ready', 'stale', 'deleted') DEFAULT 'ready',
+                    INDEX `idx_snapshot_key` (`snapshot_key`, `status`),
+                    INDEX `idx_last_used_at` (`last_used_at`),
+                    INDEX `idx_status` (`status`)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """)
+            logger.info("✓ Table 'staging_snapshot_catalog' created/verified")
+
             # Create execution_history table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS `execution_history` (
@@ -128,6 +157,100 @@ def create_metadata_tables():
         return False
 
 
+POSTGRES_METADATA_TABLES = [
+    ("staging_table_metadata", """
+        CREATE TABLE IF NOT EXISTS staging_table_metadata (
+            id BIGSERIAL PRIMARY KEY,
+            table_name VARCHAR(255) NOT NULL UNIQUE,
+            execution_id VARCHAR(100) NOT NULL,
+            ruleset_id VARCHAR(100) NOT NULL,
+            source_or_target VARCHAR(10) NOT NULL CHECK (source_or_target IN ('source', 'target')),
+            source_db_type VARCHAR(50) NOT NULL,
+            source_db_host VARCHAR(255) NOT NULL,
+            row_count BIGINT DEFAULT 0,
+            size_bytes BIGINT DEFAULT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            expires_at TIMESTAMP NOT NULL,
+            status VARCHAR(10) DEFAULT 'active' CHECK (status IN ('active', 'expired', 'deleted'))
+        )
+    """),
+    ("staging_snapshot_catalog", """
+        CREATE TABLE IF NOT EXISTS staging_snapshot_catalog (
+            id BIGSERIAL PRIMARY KEY,
+            snapshot_key VARCHAR(64) NOT NULL,
+            table_name VARCHAR(255) NOT NULL UNIQUE,
+            source_db_type VARCHAR(50) NOT NULL,
+            source_db_host VARCHAR(255) NOT NULL,
+            source_database VARCHAR(255) NOT NULL,
+            source_table VARCHAR(255) NOT NULL,
+            column_set TEXT NOT NULL,
+            filter_clause VARCHAR(1000) NOT NULL DEFAULT '',
+            fingerprint VARCHAR(2000) NOT NULL,
+            row_count BIGINT DEFAULT 0,
+            ref_count INT NOT NULL DEFAULT 0,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            last_used_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            status VARCHAR(10) DEFAULT 'ready' CHECK (status IN ('ready', 'stale', 'deleted'))
+        )
+    """),
+    ("execution_history", """
+        CREATE TABLE IF NOT EXISTS execution_history (
+            id BIGSERIAL PRIMARY KEY,
+            execution_id VARCHAR(100) NOT NULL UNIQUE,
+            ruleset_id VARCHAR(100) NOT NULL,
+            execution_type VARCHAR(50) DEFAULT 'landing_database',
+            source_db_type VARCHAR(50),
+            target_db_type VARCHAR(50),
+            matched_count BIGINT DEFAULT 0,
+            unmatched_source_count BIGINT DEFAULT 0,
+            unmatched_target_count BIGINT DEFAULT 0,
+            total_source_count BIGINT DEFAULT 0,
+            total_target_count BIGINT DEFAULT 0,
+            rcr NUMERIC(5,2) DEFAULT 0,
+            dqcs NUMERIC(5,3) DEFAULT 0,
+            rei NUMERIC(10,2) DEFAULT 0,
+            extraction_time_ms NUMERIC(15,2) DEFAULT 0,
+            reconciliation_time_ms NUMERIC(15,2) DEFAULT 0,
+            total_time_ms NUMERIC(15,2) DEFAULT 0,
+            mongodb_document_id VARCHAR(100),
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    """),
+]
+
+POSTGRES_METADATA_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_stm_execution_id ON staging_table_metadata (execution_id)",
+    "CREATE INDEX IF NOT EXISTS idx_stm_created_at ON staging_table_metadata (created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_stm_status ON staging_table_metadata (status)",
+    "CREATE INDEX IF NOT EXISTS idx_ssc_snapshot_key ON staging_snapshot_catalog (snapshot_key, status)",
+    "CREATE INDEX IF NOT EXISTS idx_ssc_last_used_at ON staging_snapshot_catalog (last_used_at)",
+    "CREATE INDEX IF NOT EXISTS idx_eh_ruleset_id ON execution_history (ruleset_id)",
+    "CREATE INDEX IF NOT EXISTS idx_eh_created_at ON execution_history (created_at)",
+]
+
+
+def create_postgres_metadata_tables():
+    """Create the staging schema and metadata tables in a PostgreSQL landing database."""
+    try:
+        from kg_builder.services.landing_db_connector import get_landing_connector
+
+        connector = get_landing_connector()
+        connector.create_schema_if_not_exists(config.LANDING_DB_SCHEMA)
+
+        with connector.cursor() as cursor:
+            for table_name, ddl in POSTGRES_METADATA_TABLES:
+                cursor.execute(ddl)
+                logger.info(f"✓ Table '{table_name}' created/verified")
+            for ddl in POSTGRES_METADATA_INDEXES:
+                cursor.execute(ddl)
+
+        return True
+
+    except Exception as e:
+        logger.error(f"✗ Failed to create metadata tables: {e}")
+        return False
+
+
 def test_connection():
     """Test connection to landing database."""
     try:
@@ -168,30 +291,46 @@ def main():
         logger.error("✗ Landing database is not enabled. Set LANDING_DB_ENABLED=true in .env")
         return False
 
+    if config.LANDING_DB_TYPE.lower() == "sqlite":
+        logger.info("✓ Embedded landing database (sqlite): nothing to initialize.")
+        logger.info(f"  Each execution uses its own file under {config.LANDING_SQLITE_DIR}, deleted on completion")
+        return True
+
     if not config.LANDING_DB_USERNAME or not config.LANDING_DB_PASSWORD:
         logger.error("✗ Landing database credentials not configured. Set LANDING_DB_USERNAME and LANDING_DB_PASSWORD in .env")
         return False
 
+    is_postgres = config.LANDING_DB_TYPE.lower() in ("postgresql", "postgres")
+
     logger.info(f"Configuration:")
+    logger.info(f"  Type: {config.LANDING_DB_TYPE}")
     logger.info(f"  Host: {config.LANDING_DB_HOST}:{config.LANDING_DB_PORT}")
     logger.info(f"  Database: {config.LANDING_DB_DATABASE}")
     logger.info(f"  Username: {config.LANDING_DB_USERNAME}")
     logger.info(f"  Schema: {config.LANDING_DB_SCHEMA}")
     logger.info(f"  Keep Staging: {config.LANDING_KEEP_STAGING}")
+    logger.info(f"  Snapshot Reuse: {config.LANDING_SNAPSHOT_REUSE}")
     logger.info(f"  TTL: {config.LANDING_STAGING_TTL_HOURS} hours")
     logger.info("")
 
-    # Step 1: Create database
-    logger.info("Step 1: Creating database...")
-    if not create_database():
-        return False
-    logger.info("")
+    if is_postgres:
+        # Steps 1-2: Schema and metadata tables (the database must exist)
+        logger.info("Steps 1-2: Creating schema and metadata tables...")
+        if not create_postgres_metadata_tables():
+            return False
+        logger.info("")
+    else:
+        # Step 1: Create database
+        logger.info("Step 1: Creating database...")
+        if not create_database():
+            return False
+        logger.info("")
 
-    # Step 2: Create metadata tables
-    logger.info("Step 2: Creating metadata tables...")
-    if not create_metadata_tables():
-        return False
-    logger.info("")
+        # Step 2: Create metadata tables
+        logger.info("Step 2: Creating metadata tables...")
+        if not create_metadata_tables():
+            return False
+        logger.info("")
 
     # Step 3: Test connection
     logger.info("Step 3: Testing connection...")
@@ -0,0 +1,30 @@
+"""
+Shared fixtures for the test suite.
+"""
+import pytest
+
+from kg_builder.models import ReconciliationRule
+
+
+@pytest.fixture
+def make_rule():
+    """Factory of valid reconciliation rules joining main.src.id to main.tgt.ref; any field can be overridden."""
+    def factory(**overrides) -> ReconciliationRule:
+        fields = dict(
+            rule_id="RULE_1",
+            rule_name="rule_1",
+            source_schema="main",
+            source_table="src",
+            source_columns=["id"],
+            target_schema="main",
+            target_table="tgt",
+            target_columns=["ref"],
+            match_type="exact",
+            confidence_score=0.9,
+            reasoning="test",
+            validation_status="VALID"
+        )
+        fields.update(overrides)
+        return ReconciliationRule(**fields)
+
+    return factory
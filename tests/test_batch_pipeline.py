@@ -0,0 +1,150 @@
+"""
+Tests for the bounded fetch -> convert -> load pipeline used by landing extraction.
+"""
+import csv
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from kg_builder import config
+from kg_builder.services.batch_pipeline import BatchPipeline
+from kg_builder.services.data_extractor import DataExtractor
+from kg_builder.services.landing_db_connector import LandingDBConnector
+
+
+def _batches(count, size=3):
+    for b in range(count):
+        yield [(b, i) for i in range(size)]
+
+
+class TestBatchPipeline:
+    """Test the bounded fetch/convert/load pipeline."""
+
+    def test_batches_arrive_in_order_and_transformed(self):
+        """Test that batches arrive transformed and in order."""
+        pipeline = BatchPipeline(_batches(10), transform=lambda batch: [row[0] * 100 + row[1] for row in batch])
+
+        result = [value for batch in pipeline for value in batch]
+
+        assert result == [b * 100 + i for b in range(10) for i in range(3)]
+        assert pipeline.batches == 10
+        assert pipeline.rows == 30
+
+    def test_slow_consumer_bounds_fetched_batches(self):
+        """Test that a slow consumer bounds the batches fetched ahead."""
+        fetched = []
+
+        def source():
+            for b in range(50):
+                fetched.append(b)
+                yield [b]
+
+        pipeline = BatchPipeline(source(), queue_depth=2)
+        iterator = iter(pipeline)
+        next(iterator)
+        time.sleep(0.3)
+
+        # Two bounded queues plus one batch held by each stage, never the whole source
+        assert len(fetched) <= 2 * 2 + 3
+        assert [batch[0] for batch in iterator] == list(range(1, 50))
+        assert pipeline.backpressure_ms > 0
+
+    def test_source_error_is_raised_in_consumer(self):
+        """Test that a fetch error is raised in the consumer."""
+        def source():
+            yield [1]
+            raise ValueError("fetch failed")
+
+        with pytest.raises(ValueError, match="fetch failed"):
+            list(BatchPipeline(source()))
+
+    def test_transform_error_is_raised_in_consumer(self):
+        """Test that a conversion error is raised in the consumer."""
+        def transform(batch):
+            raise TypeError("bad value")
+
+        with pytest.raises(TypeError, match="bad value"):
+            list(BatchPipeline(_batches(3), transform=transform))
+
+    def test_early_exit_stops_producer_threads(self):
+        """Test that leaving early stops the producer threads."""
+        pipeline = BatchPipeline(_batches(1000), queue_depth=1, name="early")
+
+        for _ in pipeline:
+            break
+
+        assert not [t for t in threading.enumerate() if t.name.startswith("early-")]
+
+    def test_pipeline_is_single_use(self):
+        """Test that a pipeline can only be consumed once."""
+        pipeline = BatchPipeline(_batches(1))
+        list(pipeline)
+        with pytest.raises(RuntimeError):
+            list(pipeline)
+
+
+class PipeReadingCursor:
+    """Plays the MySQL client: LOAD DATA reads the named pipe, INSERT records rows."""
+
+    def __init__(self, landing):
+        self.landing = landing
+        self.rowcount = 0
+
+    def execute(self, sql):
+        if self.landing.refuse_load:
+            raise RuntimeError("The used command is not allowed with this MySQL version")
+        path = re.search(r"LOCAL INFILE '([^']+)'", sql).group(1)
+        with open(path, newline="", encoding="utf-8") as stream:
+            rows = list(csv.reader(stream))
+        self.landing.loaded.extend(rows)
+        self.rowcount = len(rows)
+
+    def executemany(self, sql, rows):
+        self.landing.inserted.extend(rows)
+
+
+class PipeLanding:
+    db_type = "mysql"
+    quote = LandingDBConnector.quote
+
+    def __init__(self, refuse_load=False):
+        self.refuse_load = refuse_load
+        self.loaded = []
+        self.inserted = []
+
+    @contextmanager
+    def cursor(self, dictionary=True):
+        yield PipeReadingCursor(self)
+
+
+class TestPipeLoad:
+    """Test loading batches into MySQL through a named pipe."""
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes not available")
+    def test_load_data_streams_batches_through_named_pipe(self, monkeypatch):
+        """Test that LOAD DATA reads the batches through a named pipe."""
+        monkeypatch.setattr(config, "LANDING_USE_BULK_COPY", True)
+        landing = PipeLanding()
+        extractor = DataExtractor(landing, None)
+
+        count = extractor._bulk_load_to_landing("stg", ["a", "b"], BatchPipeline(iter([[(1, "x"), (2, None)], [(3, "y")]])))
+
+        assert count == 3
+        assert landing.loaded == [["1", "x"], ["2", "\\N"], ["3", "y"]]
+        assert landing.inserted == []
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes not available")
+    def test_refused_load_falls_back_to_batch_insert(self, monkeypatch):
+        """Test that a refused LOAD DATA falls back to batched inserts."""
+        monkeypatch.setattr(config, "LANDING_USE_BULK_COPY", True)
+        landing = PipeLanding(refuse_load=True)
+        extractor = DataExtractor(landing, None)
+
+        count = extractor._bulk_load_to_landing("stg", ["a"], BatchPipeline(iter([[(1,), (2,)], [(3,)]])))
+
+        assert count == 3
+        assert landing.inserted == [(1,), (2,), (3,)]
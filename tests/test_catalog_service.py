@@ -0,0 +1,140 @@
+"""
+Tests for the catalog metadata cache.
+"""
+import sqlite3
+
+import pytest
+
+from kg_builder.services.catalog_service import CatalogService
+
+
+class CatalogConnection:
+    """Minimal DB-API connection answering INFORMATION_SCHEMA queries from a fixed catalog."""
+
+    def __init__(self, rows, default_schema="dbo", table_rows=None):
+        self.rows = rows
+        self.default_schema = default_schema
+        self.table_rows = table_rows or {}
+        self.queries = []
+
+    def cursor(self):
+        return CatalogCursor(self)
+
+
+class CatalogCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.result = []
+
+    def execute(self, sql):
+        self.conn.queries.append(sql)
+        if "INFORMATION_SCHEMA.COLUMNS" in sql:
+            self.result = list(self.conn.rows)
+        elif "INFORMATION_SCHEMA.TABLES" in sql:
+            self.result = [
+                (rows,) for (schema, table), rows in self.conn.table_rows.items()
+                if f"'{schema}'" in sql and f"'{table}'" in sql
+            ]
+        else:
+            # Default-schema query (DATABASE(), SCHEMA_NAME(), ...)
+            self.result = [(self.conn.default_schema,)]
+
+    def fetchall(self):
+        return self.result
+
+    def fetchone(self):
+        return self.result[0] if self.result else None
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def catalog_conn():
+    return CatalogConnection([
+        ("sales", "orders", "order_id", "int"),
+        ("sales", "orders", "is_active", "bit"),
+        ("dbo", "customers", "customer_id", "int"),
+    ])
+
+
+class TestCatalogIntrospection:
+    """Test resolving ruleset tables from the database catalog."""
+
+    def test_bulk_introspection_uses_one_catalog_query(self, catalog_conn):
+        """Test that all tables are introspected with one catalog query."""
+        catalog = CatalogService(ttl_seconds=60)
+
+        orders, customers, missing = catalog.load_tables(
+            catalog_conn, "db1", "sqlserver",
+            [("Sales", "orders"), ("Crm-Schema", "customers"), ("Sales", "ghost")]
+        )
+
+        assert orders.exists and orders.use_schema
+        assert orders.columns == ["order_id", "is_active"]
+        assert orders.column_type("IS_ACTIVE") == "bit"
+        # File-name-like schema normalizes to dbo on SQL Server
+        assert customers.table_ref("sqlserver") == "[dbo].[customers]"
+        assert not missing.exists
+        catalog_queries = [q for q in catalog_conn.queries if "INFORMATION_SCHEMA" in q]
+        assert len(catalog_queries) == 1
+
+    def test_wrong_schema_falls_back_to_default_schema(self, catalog_conn):
+        """Test that a table missing from its schema resolves in the default schema."""
+        info = CatalogService(ttl_seconds=60).get_table(catalog_conn, "db1", "mysql", "crm", "customers")
+
+        assert info.exists
+        assert not info.use_schema
+        assert info.table_ref("mysql") == "`customers`"
+
+    def test_probe_fallback_without_catalog_views(self):
+        """Test the zero-row probe used when catalog views are unavailable."""
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE src (id INTEGER, is_active INTEGER)")
+        catalog = CatalogService(ttl_seconds=60)
+
+        info = catalog.get_table(conn, "sqlite", "mysql", "missing", "src")
+        resolver = catalog.table_resolver(conn, "sqlite", "mysql")
+
+        assert info.exists and not info.use_schema
+        assert info.has_column("is_active")
+        assert resolver("missing", "src") == (False, ("id", "is_active"))
+        assert resolver("main", "nope") == (True, None)
+
+
+class TestCatalogCache:
+    """Test the catalog metadata cache."""
+
+    def test_cache_ttl_and_invalidation(self, catalog_conn):
+        """Test that entries expire after the TTL and can be invalidated."""
+        catalog = CatalogService(ttl_seconds=60)
+        catalog.get_table(catalog_conn, "db1", "sqlserver", "Sales", "orders")
+        catalog.get_table(catalog_conn, "db1", "sqlserver", "Sales", "orders")
+        assert catalog.stats()["catalog_queries"] == 1
+        version = catalog.version("db1")
+
+        assert catalog.invalidate(scope="db1", table="ORDERS") == 1
+        assert catalog.version("db1") > version
+        catalog.get_table(catalog_conn, "db1", "sqlserver", "Sales", "orders")
+        assert catalog.stats()["catalog_queries"] == 2
+
+        expired = CatalogService(ttl_seconds=0)
+        expired.get_table(catalog_conn, "db1", "sqlserver", "Sales", "orders")
+        expired.get_table(catalog_conn, "db1", "sqlserver", "Sales", "orders")
+        assert expired.stats()["catalog_queries"] == 2
+
+    def test_row_estimate_reads_statistics_once(self):
+        """Test that table statistics are read once and then cached."""
+        conn = CatalogConnection(
+            [("shop", "orders", "order_id", "int"), ("shop", "customers", "customer_id", "int")],
+            default_schema="shop",
+            table_rows={("shop", "orders"): 125000}
+        )
+        catalog = CatalogService(ttl_seconds=60)
+
+        assert catalog.row_estimate(conn, "db1", "mysql", "shop", "orders") == 125000
+        assert catalog.row_estimate(conn, "db1", "mysql", "shop", "orders") == 125000
+        # Found through the default schema; no statistics row
+        assert catalog.row_estimate(conn, "db1", "mysql", "crm", "customers") is None
+        assert catalog.row_estimate(conn, "db1", "mysql", "shop", "ghost") is None
+        assert catalog.stats()["statistics_queries"] == 2
@@ -0,0 +1,206 @@
+"""
+Tests for the checksum-bucket (Merkle-style) diff.
+
+SQLite stands in for MySQL (and Oracle): their hash and formatting functions are
+registered as Python functions.
+"""
+import hashlib
+import sqlite3
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytest
+
+from kg_builder.services.checksum_diff import (
+    ChecksumDiffer,
+    ChecksumSide,
+    hex_prefix_to_int_expression,
+    row_hash_expression,
+    value_kind
+)
+
+
+def _mysql_like_connection():
+    conn = sqlite3.connect(":memory:")
+    conn.create_function("MD5", 1, lambda v: hashlib.md5(str(v).encode("utf-8")).hexdigest())
+    conn.create_function("CONV", 3, lambda v, f, t: str(int(v, f)))
+    conn.create_function("CONCAT_WS", -1, lambda sep, *parts: sep.join(str(p) for p in parts))
+    # MySQL rounds exact values to exact integers (SQLite's ROUND returns a float)
+    conn.create_function(
+        "ROUND", 1, lambda v: None if v is None else int(Decimal(str(v)).to_integral_value(ROUND_HALF_UP))
+    )
+    conn.create_function(
+        "DATE_FORMAT", 2,
+        lambda v, fmt: None if v is None else datetime.fromisoformat(v).strftime(
+            fmt.replace("%i", "%M").replace("%s", "%S")
+        )
+    )
+    return conn
+
+
+def _oracle_to_char(value, fmt=None):
+    if value is None:
+        return None
+    if fmt == "YYYY-MM-DD HH24:MI:SS":
+        return datetime.fromisoformat(value).strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _oracle_like_connection():
+    conn = sqlite3.connect(":memory:")
+    conn.create_function("NVL", 2, lambda v, d: d if v is None else v)
+    conn.create_function("TO_CHAR", -1, _oracle_to_char)
+    conn.create_function("STANDARD_HASH", 2, lambda v, alg: hashlib.md5(str(v).encode("utf-8")).digest())
+    conn.create_function("RAWTOHEX", 1, lambda v: v.hex().upper())
+    conn.create_function("TO_NUMBER", 2, lambda v, fmt: int(v, 16))
+    return conn
+
+
+@pytest.fixture
+def conn():
+    conn = _mysql_like_connection()
+    conn.execute("CREATE TABLE src (id INTEGER, amount TEXT, status TEXT)")
+    conn.execute("CREATE TABLE tgt (ref INTEGER, amt TEXT, state TEXT)")
+    rows = [(i, f"{i * 10}.00", "OPEN" if i % 3 else "CLOSED") for i in range(5000)]
+    conn.executemany("INSERT INTO src VALUES (?, ?, ?)", rows)
+    conn.executemany("INSERT INTO tgt VALUES (?, ?, ?)", rows)
+    yield conn
+    conn.close()
+
+
+def _sides(conn):
+    source = ChecksumSide(
+        conn=conn, db_type="mysql", table_refs=["src"],
+        key_columns=["`id`"], compare_columns=["`amount`", "`status`"],
+        key_names=["id"], compare_names=["amount", "status"]
+    )
+    target = ChecksumSide(
+        conn=conn, db_type="mysql", table_refs=["tgt"],
+        key_columns=["`ref`"], compare_columns=["`amt`", "`state`"],
+        key_names=["ref"], compare_names=["amt", "state"]
+    )
+    return source, target
+
+
+class TestChecksumDiff:
+    """Test the checksum-bucket diff between two tables."""
+
+    def test_identical_tables_transfer_only_first_level(self, conn):
+        """Test that identical tables only compare the top-level bucket checksums."""
+        differ = ChecksumDiffer(initial_bucket_chars=2, leaf_rows=50)
+        result = differ.diff(*_sides(conn))
+
+        assert result.identical
+        assert len(result.levels) == 1
+        assert result.leaf_rows_transferred == 0
+        assert result.summary_rows_transferred == 2 * result.levels[0]["buckets_compared"]
+
+    def test_drift_is_found_by_drilling_into_differing_buckets(self, conn):
+        """Test that differing rows are found by drilling into the differing buckets."""
+        conn.execute("UPDATE tgt SET amt = '999.99' WHERE ref = 42")
+        conn.execute("UPDATE tgt SET state = 'VOID' WHERE ref = 4321")
+        conn.execute("DELETE FROM tgt WHERE ref = 7")
+        conn.execute("INSERT INTO tgt VALUES (9000, '1.00', 'OPEN')")
+
+        differ = ChecksumDiffer(initial_bucket_chars=1, leaf_rows=50)
+        result = differ.diff(*_sides(conn))
+
+        assert not result.identical
+        assert result.mismatched_count == 2
+        assert result.source_only_count == 1
+        assert result.target_only_count == 1
+        assert len(result.levels) > 1
+        # Only a small fraction of the 10,000 rows crossed the wire
+        assert result.leaf_rows_transferred < 1000
+
+        by_key = {str(m["key"]["id"]): m for m in result.mismatched_sample}
+        assert by_key["42"]["differences"] == [
+            {"source_column": "amount", "target_column": "amt", "source_value": "420.00", "target_value": "999.99"}
+        ]
+        assert by_key["4321"]["differences"][0]["target_value"] == "VOID"
+        assert result.source_only_sample == [{"id": 7}]
+        assert result.target_only_sample == [{"ref": 9000}]
+
+    def test_mismatched_compare_column_counts_rejected(self, conn):
+        """Test that both sides must compare the same number of columns."""
+        source, target = _sides(conn)
+        target.compare_columns = target.compare_columns[:1]
+
+        with pytest.raises(ValueError):
+            ChecksumDiffer().diff(source, target)
+
+
+class TestHashExpressions:
+    """Test the row hash expressions of each dialect."""
+
+    @pytest.mark.parametrize("db_type, fragment", [
+        ("sqlserver", "HASHBYTES('MD5'"),
+        ("oracle", "STANDARD_HASH("),
+        ("postgresql", "MD5("),
+    ])
+    def test_dialect_hash_expressions(self, db_type, fragment):
+        """Test the hash expression generated for each dialect."""
+        expression = row_hash_expression(["a", "b"], db_type)
+        assert fragment in expression
+        assert hex_prefix_to_int_expression(expression, db_type)
+
+    def test_value_kinds_from_catalog_types(self):
+        """Test the value kinds derived from catalog column types."""
+        assert value_kind("decimal") == "number"
+        assert value_kind("NUMBER") == "number"
+        assert value_kind("datetime2") == "datetime"
+        assert value_kind("TIMESTAMP(6)") == "datetime"
+        assert value_kind("boolean") == "boolean"
+        assert value_kind("varchar") == "text"
+        assert value_kind(None) == "text"
+
+    def test_sqlserver_hashes_utf8_text(self):
+        """Test that SQL Server hashes text as UTF-8."""
+        expression = row_hash_expression(["a"], "sqlserver")
+        assert "_UTF8" in expression
+        assert "NVARCHAR(4000)" not in expression
+
+    def test_cross_dialect_diff_uses_canonical_rendering(self):
+        """Test that a diff across dialects renders values canonically."""
+        """Equal values rendered differently by MySQL and Oracle hash the same."""
+        mysql = _mysql_like_connection()
+        oracle = _oracle_like_connection()
+        mysql.execute("CREATE TABLE src (id INTEGER, amount TEXT, created TEXT, name TEXT)")
+        oracle.execute("CREATE TABLE tgt (id INTEGER, amount REAL, created TEXT, name TEXT)")
+        mysql.executemany("INSERT INTO src VALUES (?, ?, ?, ?)", [
+            (i, f"{i}.50", f"2024-01-{i % 28 + 1:02d} 00:00:00", f"M\u00fcller {i}") for i in range(500)
+        ])
+        oracle.executemany("INSERT INTO tgt VALUES (?, ?, ?, ?)", [
+            (i, i + 0.5, f"2024-01-{i % 28 + 1:02d}T00:00:00.000", f"M\u00fcller {i}") for i in range(500)
+        ])
+        oracle.execute("UPDATE tgt SET amount = 1.25 WHERE id = 17")
+
+        def sides(kinds):
+            source = ChecksumSide(
+                conn=mysql, db_type="mysql", table_refs=["src"],
+                key_columns=["`id`"], compare_columns=["`amount`", "`created`", "`name`"],
+                key_names=["id"], compare_names=["amount", "created", "name"],
+                key_kinds=kinds[:1], compare_kinds=kinds[1:]
+            )
+            target = ChecksumSide(
+                conn=oracle, db_type="oracle", table_refs=["tgt"],
+                key_columns=['"id"'], compare_columns=['"amount"', '"created"', '"name"'],
+                key_names=["id"], compare_names=["amount", "created", "name"],
+                key_kinds=kinds[:1], compare_kinds=kinds[1:]
+            )
+            return source, target
+
+        differ = ChecksumDiffer(initial_bucket_chars=1, leaf_rows=50)
+        result = differ.diff(*sides([value_kind(t) for t in ("INTEGER", "DECIMAL", "DATETIME", "VARCHAR")]))
+
+        assert result.mismatched_count == 1
+        assert result.source_only_count == 0
+        assert result.target_only_count == 0
+        assert result.mismatched_sample[0]["key"] == {"id": 17}
+        assert result.leaf_rows_transferred < 200
+
+        # Hashing the dialects' raw text renderings would report every row
+        raw = differ.diff(*sides(["text"] * 4))
+        assert raw.mismatched_count == 500
@@ -0,0 +1,177 @@
+"""
+Tests for the adaptive (execution_mode=auto) execution planner.
+"""
+import sqlite3
+
+import pytest
+
+from kg_builder.models import (
+    DatabaseConnectionInfo,
+    ReconciliationExecutionMode,
+    ReconciliationRuleSet
+)
+from kg_builder.services.execution_planner import ExecutionPlanner
+from kg_builder.services.reconciliation_executor import ReconciliationExecutor
+from kg_builder.services.rule_plan_compiler import RulePlanCompiler
+
+
+class StaticCatalog:
+    """Row estimates keyed by table name."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def row_estimate(self, conn, scope, db_type, schema, table):
+        return self.rows.get(table)
+
+
+def _planner(**overrides):
+    return ExecutionPlanner(catalog=StaticCatalog({}), memory_rows=2_000_000, **overrides)
+
+
+class TestStrategyChoice:
+    """Test the strategy picked for one rule from its row estimates."""
+
+    def test_small_cross_server_tables_use_hash_join(self, make_rule):
+        """Test that small tables on different servers are joined in-process."""
+        strategy = _planner().choose(make_rule(), 5000, 5000, co_located=False, landing_available=True)
+
+        assert strategy.execution_mode == ReconciliationExecutionMode.HASH_JOIN
+        assert set(strategy.estimated_costs_ms) == {"hash_join", "landing"}
+        assert strategy.estimated_ms == min(strategy.estimated_costs_ms.values())
+
+    def test_large_cross_server_tables_use_landing_when_available(self, make_rule):
+        """Test that large tables on different servers are staged in the landing database."""
+        planner = _planner()
+
+        with_landing = planner.choose(make_rule(), 20_000_000, 20_000_000, co_located=False, landing_available=True)
+        without_landing = planner.choose(make_rule(), 20_000_000, 20_000_000, co_located=False)
+
+        assert with_landing.execution_mode == ReconciliationExecutionMode.LANDING
+        assert without_landing.execution_mode == ReconciliationExecutionMode.HASH_JOIN
+
+    def test_co_located_tables_join_on_the_server(self, make_rule):
+        """Test that tables on the same server are joined in SQL."""
+        strategy = _planner().choose(make_rule(), 50_000_000, 50_000_000, co_located=True, landing_available=True)
+
+        assert strategy.execution_mode == ReconciliationExecutionMode.STANDARD
+
+    def test_sql_only_rule_and_missing_statistics(self, make_rule):
+        """Test transformation rules (SQL only) and tables without row estimates."""
+        planner = _planner(default_rows=123)
+
+        transformed = planner.choose(make_rule(transformation="UPPER(s.id) = t.ref"), 10, 10, co_located=False)
+        unknown = planner.choose(make_rule(), None, 10, co_located=False)
+
+        assert transformed.execution_mode == ReconciliationExecutionMode.STANDARD
+        assert transformed.estimated_costs_ms == {}
+        assert "assumed 123 rows" in unknown.reason
+        assert unknown.to_dict()["source_rows"] is None
+
+
+def _near_and_far_plans(make_rule):
+    rules = [make_rule(rule_id="NEAR"), make_rule(rule_id="FAR", target_table="remote")]
+    ruleset = ReconciliationRuleSet(
+        ruleset_id="RS_PLAN", ruleset_name="plan", schemas=["main"], rules=rules, generated_from_kg="kg"
+    )
+    # The source connection sees tgt but not remote
+    resolver = lambda schema, table: (True, None if table == "remote" else ("id", "ref"))
+    return rules, RulePlanCompiler().compile(ruleset, "mysql", resolver, scope="s").plans
+
+
+def _config(host):
+    return DatabaseConnectionInfo(
+        db_type="mysql", host=host, port=3306, database="d", username="u", password="p"
+    )
+
+
+class TestCoLocation:
+    """Test whether both sides of a rule are considered to live on the same server."""
+
+    def test_same_connection_is_co_located(self, make_rule):
+        """Test that rules on one connection are co-located."""
+        rules, plans = _near_and_far_plans(make_rule)
+        planner = ExecutionPlanner(catalog=StaticCatalog({"src": 100_000, "tgt": 100_000, "remote": 100_000}))
+
+        near, far = planner.plan_rules(rules, plans, None, None, _config("a"), _config("a"))
+
+        assert near.co_located and far.co_located
+        assert near.execution_mode == ReconciliationExecutionMode.STANDARD
+
+    def test_same_named_source_table_is_not_co_located_across_connections(self, make_rule):
+        """Test that same-named tables behind different connections are not co-located."""
+        # A replica exposes the same schema.table names as its primary
+        rules, plans = _near_and_far_plans(make_rule)
+        planner = ExecutionPlanner(catalog=StaticCatalog({"src": 100_000, "tgt": 100_000, "remote": 100_000}))
+
+        near, far = planner.plan_rules(rules, plans, None, None, _config("prod"), _config("replica"))
+
+        assert not near.co_located and near.execution_mode == ReconciliationExecutionMode.HASH_JOIN
+        assert not far.co_located
+
+    def test_cross_database_setting_uses_the_resolved_source_plan(self, make_rule):
+        """Test that with cross-database joins a target table visible from the source is co-located."""
+        rules, plans = _near_and_far_plans(make_rule)
+        planner = ExecutionPlanner(
+            catalog=StaticCatalog({"src": 100_000, "tgt": 100_000, "remote": 100_000}), cross_database=True
+        )
+
+        near, far = planner.plan_rules(rules, plans, None, None, _config("a"), _config("b"))
+
+        assert near.co_located and near.execution_mode == ReconciliationExecutionMode.STANDARD
+        assert not far.co_located and far.execution_mode == ReconciliationExecutionMode.HASH_JOIN
+
+
+@pytest.fixture
+def cross_server_executor(tmp_path, make_rule):
+    source_path, target_path = str(tmp_path / "source.db"), str(tmp_path / "target.db")
+    conn = sqlite3.connect(source_path)
+    conn.execute("CREATE TABLE src (id INTEGER)")
+    conn.executemany("INSERT INTO src VALUES (?)", [(i,) for i in range(30)])
+    conn.commit()
+    conn.close()
+    conn = sqlite3.connect(target_path)
+    conn.execute("CREATE TABLE tgt (ref INTEGER)")
+    conn.executemany("INSERT INTO tgt VALUES (?)", [(i,) for i in range(10, 50)])
+    conn.commit()
+    conn.close()
+
+    ruleset = ReconciliationRuleSet(
+        ruleset_id="RS_AUTO", ruleset_name="auto", schemas=["main"], rules=[make_rule()], generated_from_kg="kg"
+    )
+
+    class _Storage:
+        def load_ruleset(self, ruleset_id):
+            return ruleset
+
+    ex = ReconciliationExecutor.__new__(ReconciliationExecutor)
+    ex.storage = _Storage()
+    ex._connect_to_database = lambda config: sqlite3.connect(
+        source_path if config.host == "source-host" else target_path, check_same_thread=False
+    )
+    ex._open_result_file = lambda ruleset_id: None
+    return ex
+
+
+class TestAutoExecution:
+    """Test execute_ruleset with execution_mode=auto."""
+
+    def test_auto_mode_reports_plan_with_estimated_and_actual_cost(self, cross_server_executor):
+        """Test that the executed plan reports the chosen strategy with its estimated and actual cost."""
+        source, target = (
+            DatabaseConnectionInfo(
+                db_type="mysql", host=host, port=3306, database="recon", username="u", password="p"
+            )
+            for host in ("source-host", "target-host")
+        )
+
+        result = cross_server_executor.execute_ruleset(
+            "RS_AUTO", source, target, limit=100, execution_mode=ReconciliationExecutionMode.AUTO
+        )
+
+        assert (result.matched_count, result.unmatched_source_count, result.unmatched_target_count) == (20, 10, 20)
+        [entry] = result.execution_plan
+        assert entry["strategy"] == entry["executed_strategy"] == "hash_join"
+        assert not entry["co_located"]
+        assert entry["estimated_ms"] > 0
+        assert entry["actual_ms"] >= 0
@@ -0,0 +1,155 @@
+"""
+Tests for watermark-based incremental reconciliation.
+"""
+import sqlite3
+from decimal import Decimal
+
+import pytest
+from filelock import FileLock, Timeout
+
+from kg_builder.services.incremental_reconciler import IncrementalReconciler, ReconcileSide, encode_key
+
+
+def _full_counts(conn):
+    """Reference: the three standard reconciliation queries."""
+    matched = conn.execute("SELECT COUNT(*) FROM src s JOIN tgt t ON s.k = t.k").fetchone()[0]
+    unmatched_source = conn.execute(
+        "SELECT COUNT(*) FROM src s WHERE NOT EXISTS (SELECT 1 FROM tgt t WHERE s.k = t.k)"
+    ).fetchone()[0]
+    unmatched_target = conn.execute(
+        "SELECT COUNT(*) FROM tgt t WHERE NOT EXISTS (SELECT 1 FROM src s WHERE s.k = t.k)"
+    ).fetchone()[0]
+    return matched, unmatched_source, unmatched_target
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE src (id INTEGER, k TEXT, updated_at INTEGER)")
+    conn.execute("CREATE TABLE tgt (id INTEGER, k TEXT, updated_at INTEGER)")
+    conn.executemany("INSERT INTO src VALUES (?, ?, ?)", [(i, f"K{i % 40}", i) for i in range(100)])
+    conn.executemany("INSERT INTO tgt VALUES (?, ?, ?)", [(i, f"K{i}", i) for i in range(20, 60)])
+    conn.execute("INSERT INTO src VALUES (999, NULL, 0)")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def rule(make_rule):
+    return make_rule(rule_id="RULE_INC", rule_name="k_to_k", source_columns=["k"], target_columns=["k"],
+                     watermark_column="updated_at")
+
+
+@pytest.fixture
+def reconciler(tmp_path):
+    return IncrementalReconciler(snapshot_dir=tmp_path, key_batch_size=3, fetch_batch_size=7)
+
+
+def _run(reconciler, conn, rule):
+    def side(table):
+        return ReconcileSide(
+            conn=conn,
+            table_refs=[f"main.{table}", table],
+            key_columns=["k"],
+            key_names=["k"],
+            watermark_column="updated_at"
+        )
+    return reconciler.reconcile(rule, side("src"), side("tgt"), scope="test")
+
+
+def _counts(result):
+    return result.matched_count, result.unmatched_source_count, result.unmatched_target_count
+
+
+class TestIncrementalRefresh:
+    """Test incremental runs against a full recount."""
+
+    def test_first_run_is_full_refresh(self, reconciler, conn, rule):
+        """Test that the first run of a rule is a full refresh."""
+        result = _run(reconciler, conn, rule)
+
+        assert result.refresh == "full"
+        assert _counts(result) == _full_counts(conn)
+
+    def test_changes_are_applied_incrementally(self, reconciler, conn, rule):
+        """Test that rows changed since the watermark are applied incrementally."""
+        _run(reconciler, conn, rule)
+        conn.execute("INSERT INTO src VALUES (500, 'K55', 1000)")        # new match
+        conn.execute("INSERT INTO tgt VALUES (501, 'K99', 1000)")        # new target-only key
+        conn.execute("UPDATE src SET updated_at = 1000 WHERE id = 3")    # non-key update
+
+        result = _run(reconciler, conn, rule)
+
+        assert result.refresh == "incremental"
+        # Changed rows plus the rows sitting on the previous watermark (src id 99, tgt id 59)
+        assert result.changed_rows == [3, 2]
+        assert _counts(result) == _full_counts(conn)
+
+    def test_no_changes_reuses_snapshot(self, reconciler, conn, rule):
+        """Test that a run without changes reuses the snapshot."""
+        first = _run(reconciler, conn, rule)
+        second = _run(reconciler, conn, rule)
+
+        assert second.refresh == "incremental"
+        assert _counts(second) == _counts(first)
+
+    @pytest.mark.parametrize("change", [
+        "DELETE FROM tgt WHERE id = 25",
+        "UPDATE src SET k = 'K77', updated_at = 1000 WHERE id = 1",
+    ])
+    def test_deletes_and_key_changes_fall_back_to_full_refresh(self, reconciler, conn, rule, change):
+        """Test that deletes and key changes force a full refresh."""
+        _run(reconciler, conn, rule)
+        conn.execute(change)
+
+        result = _run(reconciler, conn, rule)
+
+        assert result.refresh == "full"
+        assert "row count" in result.refresh_reason
+        assert _counts(result) == _full_counts(conn)
+
+    def test_schema_change_forces_full_refresh(self, reconciler, conn, rule):
+        """Test that a schema change forces a full refresh."""
+        _run(reconciler, conn, rule)
+        conn.execute("ALTER TABLE tgt ADD COLUMN note TEXT")
+
+        result = _run(reconciler, conn, rule)
+
+        assert result.refresh == "full"
+        assert result.refresh_reason == "rule or table schema changed"
+
+
+class TestIncrementalSnapshots:
+    """Test the key snapshots kept between runs."""
+
+    def test_rules_without_watermark_are_not_supported(self, rule):
+        """Test that only rules with a watermark column run incrementally."""
+        assert IncrementalReconciler.supports(rule)
+        rule.watermark_column = None
+        assert not IncrementalReconciler.supports(rule)
+
+    def test_numeric_keys_from_different_drivers_share_a_snapshot_entry(self):
+        """Test that equal numeric keys of different types encode the same."""
+        assert encode_key((1, "a")) == encode_key((1.0, "a")) == encode_key((Decimal("1.00"), "a"))
+        assert encode_key((Decimal("1.50"),)) == encode_key((1.5,))
+        assert encode_key((1,)) != encode_key(("1",))
+
+    def test_snapshot_is_kept_on_disk(self, reconciler, conn, rule, tmp_path):
+        """Test that the snapshot is stored on disk."""
+        _run(reconciler, conn, rule)
+
+        [path] = tmp_path.glob("*.snapshot.db")
+        state = sqlite3.connect(str(path))
+        try:
+            assert state.execute("SELECT COUNT(*) FROM key_counts").fetchone()[0] == 60
+        finally:
+            state.close()
+
+    def test_concurrent_runs_of_the_same_rule_are_serialized(self, conn, rule, tmp_path):
+        """Test that concurrent runs of one rule wait for the snapshot lock."""
+        reconciler = IncrementalReconciler(snapshot_dir=tmp_path, lock_timeout_seconds=0.1)
+        path = reconciler._snapshot_path("test", rule)
+
+        with FileLock(str(path) + ".lock"):
+            with pytest.raises(Timeout):
+                _run(reconciler, conn, rule)
@@ -0,0 +1,278 @@
+"""
+Tests for the shared JDBC connection pool.
+
+SQLite connections stand in for JayDeBeApi connections (no JVM needed).
+"""
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from kg_builder.models import DatabaseConnectionInfo
+from kg_builder.services.jdbc_connection_pool import (
+    JDBCConnectionManager,
+    JDBCConnectionPool,
+    get_driver_jar
+)
+
+
+def _pool(**overrides):
+    opened = []
+
+    def factory():
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        opened.append(conn)
+        return conn
+
+    pool = JDBCConnectionPool("sqlite://test", factory, **overrides)
+    return pool, opened
+
+
+class TestConnectionPool:
+    """Test borrowing, returning and evicting pooled connections."""
+
+    def test_close_returns_connection_for_reuse(self):
+        """Test that close() returns the connection for reuse."""
+        pool, opened = _pool(max_size=4)
+
+        first = pool.acquire()
+        first.cursor().execute("CREATE TABLE t (id INTEGER)")
+        first.close()
+        first.close()  # Idempotent
+        second = pool.acquire()
+        second.cursor().execute("SELECT * FROM t")
+
+        assert second.raw is opened[0]
+        stats = pool.stats()
+        assert (stats["created"], stats["reused"], stats["open"], stats["in_use"]) == (1, 1, 1, 1)
+        with pytest.raises(RuntimeError):
+            first.cursor()
+
+    def test_exhausted_pool_waits_then_times_out(self):
+        """Test that borrowers wait for a connection and time out."""
+        pool, _ = _pool(max_size=1)
+        held = pool.acquire()
+
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.05)
+
+        threading.Timer(0.05, held.close).start()
+        waiter = pool.acquire(timeout=2)
+        assert waiter.raw is held.raw
+        assert pool.stats()["timeouts"] == 1
+
+    def test_invalid_connection_is_replaced_on_borrow(self):
+        """Test that an invalid idle connection is replaced on borrow."""
+        pool, opened = _pool(max_size=2)
+        conn = pool.acquire()
+        conn.close()
+        opened[0].close()  # Server dropped the connection while idle
+
+        fresh = pool.acquire()
+
+        assert fresh.raw is opened[1]
+        stats = pool.stats()
+        assert stats["validation_failures"] == 1
+        assert stats["open"] == 1
+
+    def test_idle_eviction_keeps_min_size(self):
+        """Test that idle eviction keeps min_size connections open."""
+        pool, _ = _pool(min_size=1, max_size=4, idle_timeout=0.01)
+        connections = [pool.acquire() for _ in range(3)]
+        for conn in connections:
+            conn.close()
+        time.sleep(0.02)
+
+        assert pool.evict_idle() == 2
+        assert pool.stats()["open"] == 1
+        assert pool.stats()["evicted"] == 2
+
+
+class _FakeJConn:
+    def __init__(self, fail_rollback=False):
+        self.autocommit = True
+        self.rollbacks = 0
+        self.fail_rollback = fail_rollback
+
+    def getAutoCommit(self):
+        return self.autocommit
+
+    def setAutoCommit(self, value):
+        self.autocommit = value
+
+    def rollback(self):
+        if self.fail_rollback:
+            raise RuntimeError("connection reset")
+        self.rollbacks += 1
+
+    def isValid(self, timeout):
+        return True
+
+
+class _FakeJdbcConnection:
+    def __init__(self, jconn):
+        self.jconn = jconn
+
+    def close(self):
+        pass
+
+
+class _AbortingJConn(_FakeJConn):
+    """Like PostgreSQL: after a failed statement, every statement fails until rollback."""
+
+    def __init__(self):
+        super().__init__()
+        self.autocommit = False
+        self.aborted = False
+
+    def rollback(self):
+        super().rollback()
+        self.aborted = False
+
+
+class _AbortingConnection(_FakeJdbcConnection):
+    def cursor(self):
+        return _AbortingCursor(self.jconn)
+
+    def rollback(self):
+        self.jconn.rollback()
+
+
+class _AbortingCursor:
+    def __init__(self, jconn):
+        self.jconn = jconn
+        self.executed = []
+
+    def execute(self, sql):
+        if self.jconn.aborted:
+            raise RuntimeError("current transaction is aborted, commands ignored until end of transaction block")
+        if "missing_schema" in sql:
+            self.jconn.aborted = True
+            raise RuntimeError('schema "missing_schema" does not exist')
+        self.executed.append(sql)
+
+
+class TestConnectionReset:
+    """Test the transaction state of pooled connections."""
+
+    def test_failed_statement_rolls_back_so_the_connection_can_be_reused(self):
+        """Test that a failed statement does not leave the connection unusable."""
+        jconn = _AbortingJConn()
+        pool = JDBCConnectionPool("jdbc://pg", lambda: _AbortingConnection(jconn), max_size=1)
+        conn = pool.acquire()
+
+        cursor = conn.cursor()
+        with pytest.raises(RuntimeError, match="does not exist"):
+            cursor.execute("SELECT * FROM missing_schema.t")
+        # Retry on the same cursor, then a later statement on a new one
+        cursor.execute("SELECT * FROM t")
+        conn.cursor().execute("SELECT 1")
+
+        assert cursor.executed == ["SELECT * FROM t"]
+        assert jconn.rollbacks == 1
+
+    def test_autocommit_connections_get_plain_cursors(self):
+        """Test that autocommit connections hand out the driver's cursors."""
+        jconn = _AbortingJConn()
+        jconn.autocommit = True
+        pool = JDBCConnectionPool("jdbc://test", lambda: _AbortingConnection(jconn), max_size=1)
+
+        assert isinstance(pool.acquire().cursor(), _AbortingCursor)
+
+    def test_release_rolls_back_and_restores_autocommit(self):
+        """Test that a returned connection is rolled back to its original autocommit mode."""
+        jconn = _FakeJConn()
+        pool = JDBCConnectionPool("jdbc://test", lambda: _FakeJdbcConnection(jconn), max_size=1)
+
+        conn = pool.acquire()
+        conn.jconn.setAutoCommit(False)  # Borrower left an open transaction
+        conn.close()
+
+        assert (jconn.rollbacks, jconn.autocommit) == (1, True)
+        assert pool.acquire().raw.jconn is jconn
+
+    def test_connection_that_cannot_be_reset_is_discarded(self):
+        """Test that a connection that cannot be reset is closed."""
+        jconn = _FakeJConn(fail_rollback=True)
+        pool = JDBCConnectionPool("jdbc://test", lambda: _FakeJdbcConnection(jconn), max_size=1)
+
+        conn = pool.acquire()
+        conn.jconn.setAutoCommit(False)
+        conn.close()
+
+        stats = pool.stats()
+        assert (stats["open"], stats["idle"], stats["reset_failures"]) == (0, 0, 1)
+
+    def test_postgresql_connections_turn_off_autocommit_for_cursor_streaming(self, monkeypatch):
+        """Test that PostgreSQL connections are opened with autocommit off."""
+        from kg_builder.services import jdbc_connection_pool
+
+        class JConn:
+            autocommit = True
+
+            def setAutoCommit(self, value):
+                self.autocommit = value
+
+        class Conn:
+            def __init__(self):
+                self.jconn = JConn()
+
+        monkeypatch.setattr(jdbc_connection_pool, "JAYDEBEAPI_AVAILABLE", True)
+        monkeypatch.setattr(jdbc_connection_pool, "get_driver_jar", lambda db_type: "driver.jar")
+        monkeypatch.setattr(jdbc_connection_pool, "jaydebeapi", type("J", (), {"connect": staticmethod(lambda *a: Conn())}))
+
+        def open_connection(db_type):
+            return jdbc_connection_pool._open_jdbc_connection(DatabaseConnectionInfo(
+                db_type=db_type, host="db", port=1, database="d", username="u", password="p"
+            ))
+
+        assert not open_connection("postgresql").jconn.autocommit
+        assert open_connection("mysql").jconn.autocommit
+
+
+class TestConnectionManager:
+    """Test the pools kept per connection identity."""
+
+    def test_manager_evicts_idle_connections_in_background(self):
+        """Test that the manager evicts idle connections in the background."""
+        manager = JDBCConnectionManager(eviction_interval=0.02)
+        config = DatabaseConnectionInfo(
+            db_type="mysql", host="db", port=3306, database="d", username="u", password="p"
+        )
+        pool = manager.pool_for(config)
+        pool.factory = lambda: sqlite3.connect(":memory:", check_same_thread=False)
+        pool.idle_timeout = 0.01
+        try:
+            pool.acquire().close()
+            deadline = time.time() + 2
+            while pool.stats()["open"] and time.time() < deadline:
+                time.sleep(0.01)
+
+            assert pool.stats()["evicted"] == 1
+        finally:
+            manager.close_all()
+
+    def test_manager_keys_pools_by_identity(self):
+        """Test that one pool is kept per connection identity."""
+        manager = JDBCConnectionManager()
+        config = DatabaseConnectionInfo(
+            db_type="mysql", host="db", port=3306, database="d", username="u", password="p"
+        )
+
+        pool = manager.pool_for(config)
+
+        assert manager.pool_for(config.model_copy()) is pool
+        assert manager.pool_for(config.model_copy(update={"password": "rotated"})) is not pool
+        assert [stats["pool"] for stats in manager.stats()] == [config.connection_key()] * 2
+
+    def test_driver_jar_is_globbed_once(self, tmp_path):
+        """Test that the driver JAR lookup is cached."""
+        jar = tmp_path / "postgresql-42.7.1.jar"
+        jar.write_bytes(b"")
+
+        assert get_driver_jar("postgres", str(tmp_path)) == str(jar)
+        jar.unlink()
+        assert get_driver_jar("postgres", str(tmp_path)) == str(jar)
+        with pytest.raises(ValueError):
+            get_driver_jar("mysql", str(tmp_path))
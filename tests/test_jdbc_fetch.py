@@ -0,0 +1,179 @@
+"""
+Tests for the columnar JDBC fetch layer.
+
+FakeResultSet mimics the java.sql.ResultSet calls made through JPype.
+"""
+import sqlite3
+
+import pytest
+
+from kg_builder.services.jdbc_fetch import fetch_batches, fetch_columns, fetch_records, fetch_rows
+
+INTEGER, DOUBLE, VARCHAR, DECIMAL, TIMESTAMP = 4, 8, 12, 3, 93
+
+
+class FakeMeta:
+    def __init__(self, columns):
+        self.columns = columns  # (name, sql_type, precision, scale)
+
+    def getColumnCount(self):
+        return len(self.columns)
+
+    def getColumnType(self, col):
+        return self.columns[col - 1][1]
+
+    def getPrecision(self, col):
+        return self.columns[col - 1][2]
+
+    def getScale(self, col):
+        return self.columns[col - 1][3]
+
+
+class FakeResultSet:
+    def __init__(self, rows):
+        self.rows = rows
+        self.position = -1
+        self.last = None
+        self.fetch_size = 0
+        self.calls = 0
+
+    def next(self):
+        self.position += 1
+        return self.position < len(self.rows)
+
+    def _get(self, col, default):
+        self.calls += 1
+        self.last = self.rows[self.position][col - 1]
+        return default if self.last is None else self.last
+
+    def getLong(self, col):
+        return self._get(col, 0)
+
+    def getDouble(self, col):
+        return self._get(col, 0.0)
+
+    def getString(self, col):
+        return self._get(col, None)
+
+    def getObject(self, col):
+        return self._get(col, None)
+
+    def getBigDecimal(self, col):
+        value = self._get(col, None)
+        return None if value is None else FakeBigDecimal(value)
+
+    def wasNull(self):
+        self.calls += 1
+        return self.last is None
+
+    def setFetchSize(self, size):
+        self.fetch_size = size
+
+
+class FakeBigDecimal:
+    def __init__(self, value):
+        self.value = value
+
+    def toPlainString(self):
+        return str(self.value)
+
+
+class FakeJdbcCursor:
+    """Shape of a JayDeBeApi cursor after execute()."""
+
+    def __init__(self, columns, rows):
+        self._meta = FakeMeta(columns)
+        self._rs = FakeResultSet(rows)
+        self._converters = {TIMESTAMP: lambda rs, col: f"ts:{rs.getObject(col)}"}
+        self.description = [(name, sql_type, None, None, None, None, None) for name, sql_type, _, _ in columns]
+
+
+COLUMNS = [
+    ("id", INTEGER, 10, 0),
+    ("amount", DECIMAL, 12, 2),
+    ("qty", DECIMAL, 12, 0),
+    ("name", VARCHAR, 50, 0),
+    ("ratio", DOUBLE, 15, 0),
+    ("changed", TIMESTAMP, 0, 0),
+]
+ROWS = [
+    (1, 10.5, 3, "a", 0.25, "2024-01-01"),
+    (0, None, 0, None, None, None),
+    (3, 0.0, 7, "c", 1.0, "2024-01-03"),
+]
+
+
+class TestColumnarFetch:
+    """Test fetching JDBC result sets column by column."""
+
+    def test_typed_getters_preserve_nulls_and_values(self):
+        """Test that the typed getters keep NULLs and values."""
+        batch = fetch_columns(FakeJdbcCursor(COLUMNS, ROWS))
+
+        assert batch.num_rows == 3
+        assert batch.column("ID") == [1, 0, 3]
+        assert batch.column("amount") == [10.5, None, 0.0]
+        assert batch.column("qty") == [3, 0, 7]
+        assert batch.column("name") == ["a", None, "c"]
+        assert batch.column("changed") == ["ts:2024-01-01", "ts:None", "ts:2024-01-03"]
+        assert batch.rows()[1] == (0, None, 0, None, None, "ts:None")
+
+    def test_wide_whole_number_decimals_are_exact(self):
+        """Test that whole-number DECIMALs wider than a long are read exactly."""
+        big = 12345678901234567890123456789012345678
+        cursor = FakeJdbcCursor([("id", DECIMAL, 38, 0)], [(big,), (None,), (0,)])
+
+        assert fetch_columns(cursor).column("id") == [big, None, 0]
+
+    def test_batches_respect_size_limit_and_fetch_size_hint(self):
+        """Test that batches respect the size limit and set the fetch size."""
+        cursor = FakeJdbcCursor(COLUMNS[:1], [(i,) for i in range(25)])
+
+        batches = list(fetch_batches(cursor, batch_size=10, max_rows=22))
+
+        assert [batch.num_rows for batch in batches] == [10, 10, 2]
+        assert cursor._rs.fetch_size == 10
+
+    def test_generic_cursor_is_transposed(self):
+        """Test that rows of a non-JDBC cursor are transposed into columns."""
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (id INTEGER, name TEXT)")
+        conn.executemany("INSERT INTO t VALUES (?, ?)", [(i, f"n{i}") for i in range(7)])
+
+        cursor = conn.execute("SELECT id, name FROM t ORDER BY id")
+        assert fetch_rows(cursor, batch_size=3) == [(i, f"n{i}") for i in range(7)]
+
+        cursor = conn.execute("SELECT id, name FROM t ORDER BY id")
+        assert fetch_records(cursor, max_rows=2) == [{"id": 0, "name": "n0"}, {"id": 1, "name": "n1"}]
+
+        cursor = conn.execute("SELECT id FROM t WHERE 1 = 0")
+        assert fetch_columns(cursor).columns == [[]]
+
+    def test_to_numpy_requires_numpy(self):
+        """Test that to_numpy needs numpy."""
+        batch = fetch_columns(FakeJdbcCursor(COLUMNS[:1], [(1,), (2,)]))
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            with pytest.raises(RuntimeError):
+                batch.to_numpy()
+        else:
+            assert batch.to_numpy()["id"].tolist() == [1, 2]
+
+
+class TestFetchSizeHints:
+    """Test the fetch size hints of the JDBC URLs."""
+
+    def test_connection_urls_carry_fetch_size_hints(self):
+        """Test that the connection URLs carry the fetch size hints."""
+        from kg_builder.config import JDBC_FETCH_SIZE
+        from kg_builder.models import DatabaseConnectionInfo
+        from kg_builder.services.jdbc_connection_pool import build_jdbc_url
+
+        def url(db_type):
+            return build_jdbc_url(DatabaseConnectionInfo(
+                db_type=db_type, host="db", port=1, database="d", username="u", password="p"
+            ))
+
+        assert url("postgresql").endswith(f"?defaultRowFetchSize={JDBC_FETCH_SIZE}")
+        assert f"useCursorFetch=true&defaultFetchSize={JDBC_FETCH_SIZE}" in url("mysql")
@@ -0,0 +1,135 @@
+"""
+Tests for the out-of-process JDBC gateway.
+
+The gateway runs in a background thread of the test process and lends SQLite
+connections instead of JayDeBeApi ones (no JVM needed).
+"""
+import datetime
+import sqlite3
+from decimal import Decimal
+
+import pytest
+
+from kg_builder.models import DatabaseConnectionInfo
+from kg_builder.services.jdbc_connection_pool import JDBCConnectionManager
+from kg_builder.services.jdbc_fetch import fetch_rows
+from kg_builder.services.jdbc_gateway import (
+    GatewayConnection,
+    JDBCGatewayError,
+    JDBCGatewayServer,
+    decode_column,
+    encode_column
+)
+
+CONFIG = DatabaseConnectionInfo(
+    db_type="mysql", host="db", port=3306, database="d", username="u", password="p"
+)
+
+
+class SqliteManager:
+    """Connection manager lending connections to one shared SQLite file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.connected = []
+
+    def connect(self, db_config, timeout):
+        self.connected.append(db_config)
+        return sqlite3.connect(self.path, check_same_thread=False)
+
+    def evict_idle(self):
+        return 0
+
+    def stats(self):
+        return [{"pool": config.connection_key(), "open": 1} for config in self.connected]
+
+    def close_all(self):
+        pass
+
+
+@pytest.fixture
+def gateway(tmp_path):
+    path = str(tmp_path / "data.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE t (id INTEGER, name TEXT, amount REAL, payload BLOB)")
+    conn.executemany(
+        "INSERT INTO t VALUES (?, ?, ?, ?)",
+        [(i, f"n{i}" if i % 3 else None, i / 4, bytes([i])) for i in range(25)]
+    )
+    conn.commit()
+    conn.close()
+
+    manager = SqliteManager(path)
+    server = JDBCGatewayServer(str(tmp_path / "gw.sock"), manager=manager, batch_size=10).start()
+    yield server
+    server.shutdown()
+
+
+class TestJDBCGateway:
+    """Test the out-of-process JDBC gateway."""
+
+    def test_rows_round_trip_in_batches(self, gateway):
+        """Test that query rows reach the client in batches."""
+        conn = GatewayConnection(CONFIG, gateway.socket_path, batch_size=10)
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, name, amount, payload FROM t WHERE id >= ? ORDER BY id", [5])
+
+        assert [desc[0] for desc in cursor.description] == ["id", "name", "amount", "payload"]
+        assert cursor.fetchone() == (5, "n5", 1.25, b"\x05")
+        assert len(cursor.fetchmany(3)) == 3
+        rest = cursor.fetchall()
+        assert [row[0] for row in rest] == list(range(9, 25))
+        assert rest[0][1] is None  # id 9: NULL name
+        assert cursor.fetchall() == []
+
+        cursor.execute("SELECT id FROM t ORDER BY id")
+        assert fetch_rows(cursor, batch_size=7) == [(i,) for i in range(25)]
+        conn.close()
+        conn.close()  # Idempotent
+        assert gateway.manager.connected == [CONFIG]
+
+    def test_writes_and_errors_are_forwarded(self, gateway):
+        """Test that writes and database errors are forwarded to the client."""
+        conn = GatewayConnection(CONFIG, gateway.socket_path)
+        cursor = conn.cursor()
+        cursor.executemany("INSERT INTO t (id, name) VALUES (?, ?)", [(100, "a"), (101, "b")])
+        conn.commit()
+
+        cursor.execute("SELECT COUNT(*) FROM t")
+        assert cursor.fetchall() == [(27,)]
+        with pytest.raises(JDBCGatewayError, match="OperationalError"):
+            cursor.execute("SELECT * FROM missing")
+        cursor.close()
+        conn.close()
+
+    def test_manager_routes_connections_and_stats_through_gateway(self, gateway, tmp_path):
+        """Test that the connection manager borrows connections and stats through the gateway."""
+        manager = JDBCConnectionManager(gateway_socket=gateway.socket_path)
+
+        conn = manager.connect(CONFIG)
+        cursor = conn.cursor()
+        cursor.execute("SELECT MAX(id) FROM t")
+
+        assert isinstance(conn, GatewayConnection)
+        assert cursor.fetchall() == [(24,)]
+        assert manager.stats() == [{"pool": CONFIG.connection_key(), "open": 1}]
+        conn.close()
+
+        with pytest.raises(JDBCGatewayError, match="not reachable"):
+            JDBCConnectionManager(gateway_socket=str(tmp_path / "none.sock")).connect(CONFIG)
+
+    def test_column_codecs(self):
+        """Test the column value codecs of the wire format."""
+        columns = [
+            [1, None, 2.5, "x", True],
+            [datetime.date(2024, 1, 2), None],
+            [Decimal("1.10"), Decimal("-3")],
+            [datetime.datetime(2024, 1, 2, 3, 4, 5), datetime.date(2024, 1, 2), b"\x00", None],
+        ]
+
+        encoded = [encode_column(values) for values in columns]
+
+        assert encoded[0] is columns[0]
+        assert encoded[1] == {"codec": "date", "values": ["2024-01-02", None]}
+        assert encoded[3]["codec"] == "mixed"
+        assert [decode_column(column) for column in encoded] == columns
@@ -0,0 +1,686 @@
+"""
+Tests for concurrent multi-table extraction in the landing pipeline.
+
+Extraction reads from SQLite; the landing connector and staging manager are
+replaced by in-memory recorders.
+"""
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from kg_builder import config
+from kg_builder.models import DatabaseConnectionInfo, ReconciliationRuleSet
+from kg_builder.services.data_extractor import (
+    DataExtractor,
+    SourceColumn,
+    TableExtraction,
+    _describe_columns,
+    _split_range
+)
+from kg_builder.services.landing_db_connector import LandingDBConnector
+from kg_builder.services.landing_query_builder import get_query_builder
+from kg_builder.services.landing_reconciliation_executor import LandingReconciliationExecutor
+from kg_builder.services.staging_manager import StagingManager
+
+
+def _config(host):
+    return DatabaseConnectionInfo(
+        db_type="mysql", host=host, port=3306, database="d", username="u", password="p"
+    )
+
+
+@pytest.fixture
+def rules(make_rule):
+    """Rules over three table pairs; orders is joined on two columns."""
+    return [
+        make_rule(rule_id="R1", source_table="orders", target_table="orders_copy"),
+        make_rule(rule_id="R2", source_table="orders", target_table="orders_copy",
+                  source_columns=["customer"], target_columns=["customer"]),
+        make_rule(rule_id="R3", source_table="items", target_table="items_copy"),
+        make_rule(rule_id="R4", source_table="returns", target_table="returns_copy"),
+    ]
+
+
+class RecordingLanding:
+    db_type = "mysql"
+    per_execution_database = False
+
+    def __init__(self):
+        self.closed = 0
+
+    def close(self):
+        self.closed += 1
+
+
+class RecordingStaging:
+    def __init__(self):
+        self.created = {}
+        self.indexes = {}
+        self.snapshots = {}
+
+    def generate_staging_table_name(self, execution_id, source_or_target, table_index=0):
+        return StagingManager.generate_staging_table_name(
+            None, execution_id, source_or_target, table_index=table_index
+        )
+
+    def create_staging_table(self, table_name, columns, **kwargs):
+        self.created[table_name] = [column["name"] for column in columns]
+
+    def create_indexes(self, table_name, index_columns, column_types=None):
+        self.indexes[table_name] = sorted(index_columns)
+
+    def update_row_count(self, table_name):
+        return 0
+
+    snapshot_key = staticmethod(StagingManager.snapshot_key)
+
+    def acquire_snapshot(self, snapshot_key, fingerprint):
+        snapshot = self.snapshots.get(snapshot_key)
+        if snapshot and snapshot["fingerprint"] == fingerprint:
+            snapshot["ref_count"] += 1
+            return snapshot
+        return None
+
+    def register_snapshot(self, table_name, snapshot_key, fingerprint, row_count, **kwargs):
+        self.snapshots[snapshot_key] = dict(
+            table_name=table_name, fingerprint=fingerprint, row_count=row_count, ref_count=1
+        )
+
+    def release_snapshot(self, table_name):
+        for snapshot in self.snapshots.values():
+            if snapshot["table_name"] == table_name:
+                snapshot["ref_count"] -= 1
+
+
+@pytest.fixture
+def extractor():
+    ex = DataExtractor(RecordingLanding(), RecordingStaging())
+    ex.loaded = {}
+
+    def load(staging_table_name, column_names, batches):
+        rows = [row for batch in batches for row in batch]
+        ex.loaded.setdefault(staging_table_name, []).extend(rows)
+        return len(rows)
+
+    ex._bulk_load_to_landing = load
+    return ex
+
+
+class TestRulesetExtraction:
+    """Test extracting every table of a ruleset into its own staging table."""
+
+    def test_every_table_on_both_sides_gets_its_own_staging_table(self, rules, extractor):
+        """Test that each source and target table is staged once, in ruleset order."""
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        for table in ("orders", "items", "returns", "orders_copy", "items_copy", "returns_copy"):
+            conn.execute(f"CREATE TABLE {table} (id INTEGER, ref INTEGER, customer TEXT)")
+            conn.executemany(f"INSERT INTO {table} VALUES (?, ?, ?)", [(i, i, "c") for i in range(len(table))])
+
+        class SharedConnection:
+            def cursor(self):
+                return conn.cursor()
+
+            def close(self):
+                pass
+
+        extractor._connect_to_database = lambda config: SharedConnection()
+
+        extractions = extractor.extract_ruleset_to_landing(
+            _config("source"), _config("target"), rules, "EXEC_1", "RS_1", max_workers=1
+        )
+
+        assert [(e.source_or_target, e.table) for e in extractions] == [
+            ("source", "orders"), ("source", "items"), ("source", "returns"),
+            ("target", "orders_copy"), ("target", "items_copy"), ("target", "returns_copy"),
+        ]
+        assert len({e.staging_table for e in extractions}) == 6
+        assert extractions[0].staging_table.startswith("recon_stage_EXEC_1_source_")
+        assert extractions[1].staging_table.startswith("recon_stage_EXEC_1_source1_")
+        assert [e.row_count for e in extractions] == [6, 5, 7, 11, 10, 12]
+        assert extractor.staging_manager.indexes[extractions[0].staging_table] == ["customer", "id"]
+        assert set(extractions[0].to_dict()) >= {"extract_time_ms", "load_time_ms", "extraction_time_ms"}
+        assert extractor.landing_connector.closed == 6
+
+    def test_extractions_run_concurrently_within_per_database_limits(self, rules, extractor):
+        """Test that tables are extracted concurrently without exceeding the per-database limit."""
+        active, peak, lock = {}, {}, threading.Lock()
+
+        def extract(db_config, table_info, execution_id, ruleset_id, source_or_target, limit, table_index,
+                    reuse_snapshots=None, slot=None):
+            with lock:
+                active[db_config.host] = active.get(db_config.host, 0) + 1
+                peak[db_config.host] = max(peak.get(db_config.host, 0), active[db_config.host])
+            time.sleep(0.05)
+            with lock:
+                active[db_config.host] -= 1
+            return TableExtraction(source_or_target, "main", table_info["table"], f"stage_{table_index}", 1, 0, 0, 0)
+
+        extractor.extract_table_to_landing = extract
+        start = time.time()
+
+        extractions = extractor.extract_ruleset_to_landing(
+            _config("source"), _config("target"), rules, "EXEC_2", "RS_2",
+            max_workers=8, max_connections_per_db=2
+        )
+
+        assert len(extractions) == 6
+        assert peak == {"source": 2, "target": 2}
+        assert time.time() - start < 0.25  # Serial would take 0.3s
+
+    def test_failed_table_is_reported_after_the_others_finish(self, rules, extractor):
+        """Test that a failing table is reported once the other extractions are done."""
+        def extract(db_config, table_info, execution_id, ruleset_id, source_or_target, limit, table_index,
+                    reuse_snapshots=None, slot=None):
+            if table_info["table"] == "items_copy":
+                raise ValueError("boom")
+            return TableExtraction(source_or_target, "main", table_info["table"], "stage", 1, 0, 0, 0)
+
+        extractor.extract_table_to_landing = extract
+
+        with pytest.raises(RuntimeError, match="target main.items_copy: boom"):
+            extractor.extract_ruleset_to_landing(_config("source"), _config("target"), rules, "E", "RS")
+
+
+class TestTablePairReconciliation:
+    """Test reconciling several table pairs of one ruleset."""
+
+    def test_table_pairs_are_reconciled_separately_and_combined(self, rules):
+        """Test that each table pair gets its own KPI query and the results are combined."""
+        executed = []
+
+        class PairQueries:
+            def build_reconciliation_with_kpis_query(self, source_staging_table, target_staging_table, ruleset):
+                executed.append((source_staging_table, target_staging_table, [r.rule_id for r in ruleset.rules]))
+                return source_staging_table
+
+        results = {
+            "s_orders": dict(matched_count=90, unmatched_source_count=10, unmatched_target_count=0,
+                             total_source_count=100, total_target_count=90, rcr=90, rcr_status="HEALTHY",
+                             dqcs=0.9, dqcs_status="GOOD", rei=90),
+            "s_items": dict(matched_count=10, unmatched_source_count=90, unmatched_target_count=5,
+                            total_source_count=100, total_target_count=15, rcr=10, rcr_status="CRITICAL",
+                            dqcs=0.5, dqcs_status="POOR", rei=10),
+        }
+
+        class PairConnector:
+            def execute(self, query):
+                return [dict(results[query], rule_id=query, total_source_count=100, rule_matched_source_count=10)]
+
+        executor = LandingReconciliationExecutor.__new__(LandingReconciliationExecutor)
+        executor.query_builder = PairQueries()
+        executor.landing_connector = PairConnector()
+        ruleset = ReconciliationRuleSet(
+            ruleset_id="RS", ruleset_name="rs", schemas=["main"], rules=rules[:3], generated_from_kg="kg"
+        )
+        staging = {
+            ("source", "main.orders"): "s_orders", ("target", "main.orders_copy"): "t_orders",
+            ("source", "main.items"): "s_items", ("target", "main.items_copy"): "t_items",
+        }
+
+        combined = executor._reconcile_table_pairs(staging, ruleset)
+
+        assert executed == [("s_orders", "t_orders", ["R1", "R2"]), ("s_items", "t_items", ["R3"])]
+        assert combined["matched_count"] == 100 and combined["total_source_count"] == 200
+        assert (combined["rcr"], combined["rcr_status"]) == (50.0, "CRITICAL")
+        assert (combined["dqcs"], combined["dqcs_status"]) == (0.86, "GOOD")
+        assert [(rule["rule_id"], rule["rcr"]) for rule in combined["rule_kpis"]] == [("s_orders", 10.0), ("s_items", 10.0)]
+
+
+NUMBER = "DBAPITypeObject('BOOLEAN', 'BIGINT', 'BIT', 'INTEGER', 'SMALLINT', 'TINYINT')"
+STRING = "DBAPITypeObject('CHAR', 'NCHAR', 'NVARCHAR', 'VARCHAR', 'OTHER')"
+DATETIME = "DBAPITypeObject('TIMESTAMP')"
+
+
+class TestValueConversion:
+    """Test the per-column value converters of the extraction."""
+
+    def test_column_converters_resolved_once_per_column(self, extractor):
+        """Test that converters are picked per column type."""
+        rows = [(12345, "true", b"abc", "2024-01-01"), (None, "1.0", 7, None), (True, "x", None, "2024-01-02")]
+
+        converted = extractor._convert_data_values(rows, [NUMBER, NUMBER, STRING, DATETIME])
+
+        assert converted == [
+            (12345, 1, "abc", "2024-01-01"),
+            (None, 1, "7", None),
+            (1, None, None, "2024-01-02"),
+        ]
+
+    def test_boolean_type_maps_values_to_flags(self, extractor):
+        """Test that boolean values are loaded as 0/1 flags."""
+        assert extractor._convert_data_values([("yes",), (0,), (5,), ("maybe",)], ["BOOLEAN"]) == [
+            (1,), (0,), (1,), ("maybe",)
+        ]
+
+    def test_gateway_type_codes_resolve_to_converters(self, extractor):
+        """Test that java.sql.Types codes from the JDBC gateway resolve to converters."""
+        # The JDBC gateway reports java.sql.Types codes: BOOLEAN, INTEGER, VARCHAR, TIMESTAMP
+        rows = [(True, "3", 7, "2024-01-01"), (False, True, None, None)]
+
+        assert extractor._convert_data_values(rows, [16, 4, 12, 93]) == [
+            (1, 3, "7", "2024-01-01"),
+            (0, 1, None, None),
+        ]
+
+    def test_pass_through_columns_are_not_copied(self, extractor):
+        """Test that columns needing no conversion are passed through."""
+        from kg_builder.services.jdbc_fetch import ColumnBatch
+
+        converters = extractor._column_converters([DATETIME, STRING])
+        assert converters[0] is None
+
+        dates = ["2024-01-01", None]
+        batch = ColumnBatch(["d", "s"], [DATETIME, STRING], [dates, [1, None]])
+        assert extractor._convert_columns(batch, converters) == [("2024-01-01", "1"), (None, None)]
+
+
+class TestPartitionedExtraction:
+    """Test reading large tables as parallel key ranges."""
+
+    def test_large_table_is_read_as_parallel_key_ranges(self, extractor, monkeypatch):
+        """Test that a large table is split into key ranges read on separate connections."""
+        monkeypatch.setattr(config, "LANDING_PARTITION_MIN_ROWS", 50)
+        monkeypatch.setattr(config, "LANDING_PARTITIONS", 4)
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.execute("CREATE TABLE orders (id INTEGER, customer TEXT)")
+        conn.executemany("INSERT INTO orders VALUES (?, ?)", [(i, "c") for i in range(1, 101)] + [(None, "n")])
+        opened = []
+
+        class Connection:
+            def __init__(self):
+                opened.append(self)
+
+            def cursor(self):
+                return conn.cursor()
+
+            def close(self):
+                pass
+
+        extractor._connect_to_database = lambda config: Connection()
+        table_info = {"schema": "main", "table": "orders", "columns": "*", "join_columns": ["id"]}
+
+        extraction = extractor.extract_table_to_landing(_config("source"), table_info, "E", "RS", "source")
+
+        assert extraction.row_count == 101
+        assert sorted(extractor.loaded[extraction.staging_table], key=lambda row: row[0] or 0) == \
+            sorted(conn.execute("SELECT * FROM orders").fetchall(), key=lambda row: row[0] or 0)
+        assert [p["partition"] for p in extraction.partitions] == [0, 1, 2, 3]
+        assert [p["row_count"] for p in extraction.partitions] == [26, 25, 25, 25]
+        assert "IS NULL" in extraction.partitions[0]["predicate"]
+        # The table connection plus at most one per remaining partition (readers that
+        # find no partition left never connect)
+        assert 1 <= len(opened) <= 4
+
+    def test_partition_connections_stay_within_the_per_database_cap(self, extractor, monkeypatch):
+        """Test that partition readers only open connections the per-database cap allows."""
+        monkeypatch.setattr(config, "LANDING_PARTITION_MIN_ROWS", 50)
+        monkeypatch.setattr(config, "LANDING_PARTITIONS", 4)
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.execute("CREATE TABLE orders (id INTEGER, customer TEXT)")
+        conn.executemany("INSERT INTO orders VALUES (?, ?)", [(i, "c") for i in range(1, 101)])
+        opened = []
+
+        class Connection:
+            def __init__(self):
+                opened.append(self)
+
+            def cursor(self):
+                return conn.cursor()
+
+            def close(self):
+                pass
+
+        extractor._connect_to_database = lambda config: Connection()
+        table_info = {"schema": "main", "table": "orders", "columns": "*", "join_columns": ["id"]}
+        slot = threading.BoundedSemaphore(2)
+        slot.acquire()  # held by this table's extraction
+        slot.acquire()  # held by another table on the same database
+
+        extraction = extractor.extract_table_to_landing(_config("source"), table_info, "E", "RS", "source", slot=slot)
+
+        assert extraction.row_count == 100
+        assert [p["partition"] for p in extraction.partitions] == [0, 1, 2, 3]
+        assert len(opened) == 1
+        slot.release()
+        slot.release()
+
+    def test_small_or_limited_tables_are_not_partitioned(self, extractor, monkeypatch):
+        """Test that small or limited tables are read in one query."""
+        monkeypatch.setattr(config, "LANDING_PARTITION_MIN_ROWS", 50)
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.execute("CREATE TABLE orders (id INTEGER)")
+        conn.executemany("INSERT INTO orders VALUES (?)", [(i,) for i in range(10)])
+        table_info = {"schema": "main", "table": "orders", "columns": "*", "join_columns": ["id"]}
+
+        assert extractor._plan_partitions(conn, _config("s"), table_info, None) == []
+        assert extractor._plan_partitions(conn, _config("s"), table_info, 5) == []
+
+    def test_split_range_for_numbers_and_dates(self):
+        """Test the range boundaries computed for numbers and dates."""
+        assert _split_range(1, 100, 4) == [26, 51, 76]
+        assert _split_range(0.0, 1.0, 2) == [0.5]
+        assert [str(b) for b in _split_range("2024-01-01", "2024-01-05 00:00:00", 4)] == [
+            "2024-01-02 00:00:00", "2024-01-03 00:00:00", "2024-01-04 00:00:00"
+        ]
+        assert _split_range(5, 5, 4) == []
+        assert _split_range("abc", "xyz", 4) == []
+        assert _split_range(None, 10, 4) == []
+
+
+def _fingerprinted_orders():
+    import hashlib
+
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.create_function("MD5", 1, lambda text: hashlib.md5(str(text).encode()).hexdigest())
+    conn.create_function("CONCAT_WS", -1, lambda sep, *parts: sep.join(str(p) for p in parts))
+    conn.create_function("CONV", 3, lambda value, base, to: str(int(value, base)))
+    conn.execute("CREATE TABLE orders (id INTEGER, status TEXT, updated_at TEXT)")
+    conn.executemany("INSERT INTO orders VALUES (?, ?, ?)", [(i, "OPEN", f"2024-01-0{i}") for i in range(1, 4)])
+    return conn
+
+
+class TestStagingSnapshots:
+    """Test reusing staging tables of unchanged source tables."""
+
+    def test_unchanged_source_table_reuses_its_staging_snapshot(self, extractor):
+        """Test that an unchanged table reuses its snapshot and a changed one is extracted again."""
+        conn = _fingerprinted_orders()
+
+        class Connection:
+            def cursor(self):
+                return conn.cursor()
+
+            def close(self):
+                pass
+
+        extractor._connect_to_database = lambda config: Connection()
+        table_info = {"schema": "main", "table": "orders", "columns": "*", "join_columns": ["id"]}
+
+        first = extractor.extract_table_to_landing(_config("source"), table_info, "E1", "RS", "source")
+        second = extractor.extract_table_to_landing(_config("source"), table_info, "E2", "RS", "source")
+
+        assert not first.reused and second.reused
+        assert second.staging_table == first.staging_table and second.row_count == 3
+        assert len(extractor.staging_manager.created) == 1
+
+        conn.execute("UPDATE orders SET updated_at = '2024-02-01' WHERE id = 1")
+        third = extractor.extract_table_to_landing(_config("source"), table_info, "E3", "RS", "source")
+
+        assert not third.reused and third.staging_table != first.staging_table
+        assert len(extractor.staging_manager.created) == 2
+
+        # An update that leaves the change-tracking column alone is caught by the row checksum
+        conn.execute("UPDATE orders SET status = 'CLOSED' WHERE id = 2")
+        fourth = extractor.extract_table_to_landing(_config("source"), table_info, "E4", "RS", "source")
+
+        assert not fourth.reused
+
+    def test_snapshots_are_not_reused_when_disabled_per_request(self, extractor):
+        """Test that a request can disable snapshot reuse."""
+        conn = _fingerprinted_orders()
+
+        class Connection:
+            def cursor(self):
+                return conn.cursor()
+
+            def close(self):
+                pass
+
+        extractor._connect_to_database = lambda config: Connection()
+        table_info = {"schema": "main", "table": "orders", "columns": "*", "join_columns": ["id"]}
+
+        extractor.extract_table_to_landing(_config("source"), table_info, "E1", "RS", "source")
+        second = extractor.extract_table_to_landing(
+            _config("source"), table_info, "E2", "RS", "source", reuse_snapshots=False
+        )
+
+        assert not second.reused
+        assert all(snapshot["table_name"] != second.staging_table
+                   for snapshot in extractor.staging_manager.snapshots.values())
+
+    def test_snapshot_key_covers_host_table_columns_and_filter(self):
+        """Test that the snapshot key covers the host, table, columns and filter."""
+        key = StagingManager.snapshot_key(_config("h"), "main", "orders", "*")
+
+        assert key == StagingManager.snapshot_key(_config("h"), "MAIN", "orders", ["*"])
+        assert key != StagingManager.snapshot_key(_config("other"), "main", "orders", "*")
+        assert key != StagingManager.snapshot_key(_config("h"), "main", "orders", ["id"])
+        assert key != StagingManager.snapshot_key(_config("h"), "main", "orders", "*", "LIMIT 10")
+        assert StagingManager.snapshot_key(_config("h"), "main", "t", ["b", "a"]) == \
+            StagingManager.snapshot_key(_config("h"), "main", "t", ["a", "b"])
+
+
+class CatalogConnector:
+    """Landing connector over a dict catalog: table name -> (ref_count, status)."""
+
+    db_type = "mysql"
+    quote = LandingDBConnector.quote
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.dropped = []
+
+    def execute(self, query, params=None):
+        if "staging_snapshot_catalog" in query and "ref_count = 0" in query:
+            return [{"table_name": name} for name, (refs, status) in self.catalog.items()
+                    if refs == 0 and status in ("stale", "ready")]
+        return []
+
+    @contextmanager
+    def cursor(self):
+        connector = self
+
+        class Cursor:
+            rowcount = 0
+
+            def execute(self, query, params=()):
+                if query.startswith("DROP TABLE"):
+                    connector.dropped.append(query.split("`")[1])
+                elif "SET status = 'deleted'" in query and "ref_count = 0" in query:
+                    refs, status = connector.catalog[params[0]]
+                    self.rowcount = 1 if refs == 0 and status != "deleted" else 0
+                    if self.rowcount:
+                        connector.catalog[params[0]] = (refs, "deleted")
+
+        yield Cursor()
+
+    def close(self):
+        pass
+
+
+class TestSnapshotSweep:
+    """Test dropping expired staging snapshots."""
+
+    def test_sweep_drops_only_unreferenced_snapshots(self):
+        """Test that the sweep keeps snapshots still in use."""
+        connector = CatalogConnector({"stale_free": (0, "stale"), "in_use": (2, "stale"), "idle": (0, "ready")})
+        manager = StagingManager(connector)
+
+        assert manager.sweep_expired_tables() == 2
+        assert sorted(connector.dropped) == ["idle", "stale_free"]
+        assert connector.catalog["in_use"] == (2, "stale")
+
+
+def _hashing_sqlite():
+    import hashlib
+
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.create_function("MD5", 1, lambda text: hashlib.md5(text.encode()).hexdigest())
+    conn.create_function("CONCAT_WS", -1, lambda sep, *parts: sep.join(parts))
+    conn.execute("CREATE TABLE orders (id INTEGER, customer TEXT, amount TEXT, note TEXT)")
+    conn.executemany("INSERT INTO orders VALUES (?, ?, ?, ?)", [(1, "a", "10", None), (2, "b", "20", "x")])
+
+    class Connection:
+        def cursor(self):
+            return conn.cursor()
+
+        def close(self):
+            pass
+
+    return conn, Connection
+
+
+class TestKeyOnlyExtraction:
+    """Test key-only extraction and the drill-down to full rows."""
+
+    def test_key_only_extraction_loads_join_columns_and_row_hash(self, rules, extractor, monkeypatch):
+        """Test that key-only extraction loads the join columns and a row hash."""
+        import hashlib
+
+        monkeypatch.setattr(config, "LANDING_SNAPSHOT_REUSE", False)
+        conn, Connection = _hashing_sqlite()
+        extractor._connect_to_database = lambda config: Connection()
+        table_info = extractor._get_tables_from_rules(rules[:1], "source", key_only=True)[0]
+
+        extraction = extractor.extract_table_to_landing(_config("source"), table_info, "E", "RS", "source")
+
+        assert extraction.key_only
+        assert extractor.staging_manager.created[extraction.staging_table] == ["id", "recon_row_hash"]
+        assert extractor.loaded[extraction.staging_table] == [
+            (1, hashlib.md5("a|10|<NULL>".encode()).hexdigest()),
+            (2, hashlib.md5("b|20|x".encode()).hexdigest()),
+        ]
+
+    def test_unmatched_keys_are_drilled_down_to_full_source_rows(self, rules, extractor):
+        """Test that unmatched keys are fetched back as full source rows."""
+        conn, Connection = _hashing_sqlite()
+        extractor._connect_to_database = lambda config: Connection()
+
+        class UnmatchedKeys:
+            def execute(self, query):
+                return [{"ID": 2, "recon_row_hash": "h"}]
+
+        executor = LandingReconciliationExecutor.__new__(LandingReconciliationExecutor)
+        executor.landing_connector = UnmatchedKeys()
+        executor.data_extractor = extractor
+        executor.query_builder = get_query_builder("mysql")
+
+        rows = executor.fetch_unmatched_rows(_config("source"), "s_stage", "t_stage", rules[:1])
+
+        assert rows == [{"id": 2, "customer": "b", "amount": "20", "note": "x"}]
+        assert extractor.fetch_rows_by_keys(_config("source"), "main", "orders", ["id"], [(None,)]) == []
+
+    @pytest.mark.parametrize("db_type, quoted", [("sqlserver", "[id]"), ("postgresql", '"id"'), ("mysql", "`id`")])
+    def test_key_only_queries_quote_identifiers_for_the_dialect(self, extractor, db_type, quoted):
+        """Test that key-only queries quote identifiers for each dialect."""
+        executed = []
+
+        class Cursor:
+            description = [("id", "INTEGER", None, None, None, None, None)]
+
+            def execute(self, query, params=None):
+                executed.append(query)
+
+            def fetchmany(self, size):
+                return []
+
+            def close(self):
+                pass
+
+        class Connection:
+            def cursor(self):
+                return Cursor()
+
+            def close(self):
+                pass
+
+        db_config = _config("source").model_copy(update={"db_type": db_type})
+        extractor._connect_to_database = lambda config: Connection()
+
+        extractor.fetch_rows_by_keys(db_config, "main", "orders", ["id"], [(1,)])
+        extractor._open_extraction_cursor(Connection(), db_config, "main", "orders", ["id"], None,
+                                          row_hash_columns=["amount"])
+
+        drilldown, extraction = executed
+        assert f"{quoted} = ?" in drilldown
+        assert extraction.startswith(f"SELECT {quoted}, ")
+        if db_type != "mysql":
+            assert "`" not in drilldown + extraction
+
+
+class TestStagingTypes:
+    """Test the staging column types and indexes."""
+
+    @pytest.mark.parametrize("column, is_join, sampled, expected", [
+        (SourceColumn("k", "VARCHAR", 20, 0, 20), True, None, "VARCHAR(20)"),
+        (SourceColumn("k", "VARCHAR", 4000, 0, 4000), True, 40, "VARCHAR(768)"),
+        (SourceColumn("k", "VARCHAR", 4000, 0, 4000), True, None, "TEXT"),
+        (SourceColumn("k", "CLOB"), True, 600, "TEXT"),
+        (SourceColumn("k", "VARCHAR", 20, 0, 20), False, None, "TEXT"),
+        (SourceColumn("k", "DECIMAL", 10, 0), True, None, "BIGINT"),
+        (SourceColumn("k", "NUMERIC", 12, 2), False, None, "DECIMAL(12,2)"),
+        (SourceColumn("k", "NUMERIC", 0, -127), False, None, "DECIMAL(38,10)"),
+        (SourceColumn("k", "NUMBER"), True, None, "BIGINT"),
+        (SourceColumn("k", "BOOLEAN", 1), False, None, "TINYINT(1)"),
+        (SourceColumn("k", "TIMESTAMP", 26, 6), False, None, "DATETIME(6)"),
+        (SourceColumn("k", "DATE", 10, 0), True, None, "DATE"),
+        (SourceColumn("recon_row_hash", "VARCHAR", 32), False, None, "CHAR(32)"),
+    ])
+    def test_staging_types_are_tight_for_join_columns(self, extractor, column, is_join, sampled, expected):
+        """Test that join columns get the tightest staging type."""
+        assert extractor._map_jdbc_type_to_mysql(column, is_join, sampled) == expected
+
+    def test_exact_jdbc_types_come_from_result_set_metadata(self):
+        """Test that column types come from the result set metadata."""
+        class Meta:
+            def getColumnType(self, col):
+                return {1: 4, 2: 16}[col]
+
+        class Cursor:
+            _meta = Meta()
+            description = [("id", "NUMBER", 11, 11, 10, 0, 1), ("flag", "NUMBER", 1, 1, 1, 0, 1)]
+
+        assert [(c.name, c.type_name, c.precision) for c in _describe_columns(Cursor())] == [
+            ("id", "INTEGER", 10), ("flag", "BOOLEAN", 1)
+        ]
+
+    def test_wide_join_columns_are_sampled_for_max_length(self, extractor):
+        """Test that wide join columns are sampled on the table connection."""
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.execute("CREATE TABLE orders (code TEXT, note TEXT)")
+        conn.executemany("INSERT INTO orders VALUES (?, ?)", [("A-1", "x" * 900), ("B-1234", "y")])
+
+        class Meta:
+            def getColumnType(self, col):
+                return 2005  # CLOB
+
+        class Cursor:
+            def __init__(self):
+                self._cursor = conn.cursor()
+                self._meta = Meta()
+
+            def __getattr__(self, name):
+                return getattr(self._cursor, name)
+
+        class Connection:
+            def cursor(self):
+                return Cursor()
+
+        extractor._connect_to_database = lambda config: pytest.fail("sampling must reuse the table connection")
+
+        assert extractor._sample_key_lengths(Connection(), _config("s"), "main", "orders", ["code"]) == {"code": 6}
+        assert extractor._sample_key_lengths(Connection(), _config("s"), "main", "orders", []) == {}
+
+    def test_indexes_are_added_in_one_pass_with_prefixes_for_text(self):
+        """Test that all indexes are added in one statement, with prefixes on text columns."""
+        executed = []
+
+        class Connector:
+            db_type = "mysql"
+
+            @contextmanager
+            def cursor(self):
+                class Cursor:
+                    def execute(self, sql, params=()):
+                        executed.append(sql)
+                yield Cursor()
+
+        created = StagingManager(Connector()).create_indexes(
+            "stage", ["id", "note"], column_types={"id": "BIGINT", "note": "TEXT"}
+        )
+
+        assert created == ["idx_stage_id", "idx_stage_note"]
+        assert executed == ["ALTER TABLE `stage` ADD INDEX `idx_stage_id` (`id`), ADD INDEX `idx_stage_note` (`note`(255))"]
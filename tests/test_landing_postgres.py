@@ -0,0 +1,184 @@
+"""
+Tests for the PostgreSQL landing backend.
+
+The live test runs against a local PostgreSQL when LANDING_TEST_PG_HOST is set
+(LANDING_TEST_PG_PORT / _DATABASE / _USERNAME / _PASSWORD, defaults for a local
+superuser) and psycopg2 is installed.
+"""
+import csv
+import io
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+
+import pytest
+
+from kg_builder.models import DatabaseConnectionInfo
+from kg_builder.services.landing_db_connector import LandingDBConnector, create_landing_connector
+from kg_builder.services.landing_postgres_connector import (
+    PSYCOPG2_AVAILABLE,
+    CsvCopyStream,
+    PostgresLandingConnector,
+    postgres_staging_type
+)
+from kg_builder.services.staging_manager import StagingManager
+
+
+def _config(db_type, **overrides):
+    fields = dict(db_type=db_type, host="localhost", port=5432, database="landing",
+                  username="u", password="p", schema="staging")
+    fields.update(overrides)
+    return DatabaseConnectionInfo(**fields)
+
+
+class TestPostgresLandingConnector:
+    """Test the PostgreSQL landing connector."""
+
+    def test_factory_picks_connector_for_landing_type(self):
+        """Test that the factory picks the connector of the landing type."""
+        assert type(create_landing_connector(_config("mysql"))) is LandingDBConnector
+        assert type(create_landing_connector(_config("postgres"))) is PostgresLandingConnector
+        with pytest.raises(ValueError):
+            create_landing_connector(_config("oracle"))
+        with pytest.raises(ValueError):
+            LandingDBConnector(_config("postgresql"))
+
+    @pytest.mark.parametrize("mysql_type, expected", [
+        ("TINYINT(1)", "SMALLINT"),
+        ("INT", "INTEGER"),
+        ("BIGINT", "BIGINT"),
+        ("DECIMAL(18,2)", "NUMERIC(18,2)"),
+        ("DOUBLE", "DOUBLE PRECISION"),
+        ("DATETIME(3)", "TIMESTAMP(3)"),
+        ("DATETIME", "TIMESTAMP"),
+        ("VARCHAR(40)", "VARCHAR(40)"),
+        ("VARBINARY(16)", "BYTEA"),
+        ("BLOB", "BYTEA"),
+        ("CHAR(32)", "CHAR(32)"),
+        ("TEXT", "TEXT"),
+    ])
+    def test_staging_types_are_translated(self, mysql_type, expected):
+        """Test the translation of staging types to PostgreSQL."""
+        assert postgres_staging_type(mysql_type) == expected
+
+    def test_staging_tables_are_unlogged_with_serial_key(self):
+        """Test that staging tables are UNLOGGED with a serial key."""
+        connector = PostgresLandingConnector(_config("postgresql"))
+
+        sql = connector.staging_table_sql("stage", [{"name": "Id", "type": "BIGINT"}, {"name": "ts", "type": "DATETIME"}])
+
+        assert 'CREATE UNLOGGED TABLE IF NOT EXISTS "stage"' in sql
+        assert '"_staging_id" BIGSERIAL PRIMARY KEY' in sql
+        assert '"Id" BIGINT' in sql and '"ts" TIMESTAMP' in sql
+        assert "`" not in sql and "ENGINE" not in sql
+
+    def test_postgres_indexes_are_built_concurrently_and_analyzed(self):
+        """Test that indexes are built concurrently and the table analyzed."""
+        executed = []
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+        both_started = threading.Barrier(2, timeout=5)
+
+        class Connector:
+            db_type = "postgresql"
+            index_build_workers = 4
+            quote = PostgresLandingConnector.quote
+
+            @contextmanager
+            def cursor(self):
+                class Cursor:
+                    def execute(self, sql, params=()):
+                        with lock:
+                            executed.append(sql)
+                            in_flight.append(sql)
+                            peak.append(len(in_flight))
+                        both_started.wait()
+                        with lock:
+                            in_flight.remove(sql)
+                yield Cursor()
+
+            def analyze_table(self, table_name):
+                executed.append(f"ANALYZE {table_name}")
+
+            def close(self):
+                pass
+
+        created = StagingManager(Connector()).create_indexes("stage", ["id", "code"])
+
+        assert created == ["idx_stage_id", "idx_stage_code"]
+        assert sorted(executed[:2]) == [
+            'CREATE INDEX IF NOT EXISTS "idx_stage_code" ON "stage" ("code")',
+            'CREATE INDEX IF NOT EXISTS "idx_stage_id" ON "stage" ("id")',
+        ]
+        assert executed[2] == "ANALYZE stage"
+        assert max(peak) == 2
+
+    @pytest.mark.skipif(
+        not (PSYCOPG2_AVAILABLE and os.getenv("LANDING_TEST_PG_HOST")),
+        reason="needs psycopg2 and a local PostgreSQL (LANDING_TEST_PG_HOST)"
+    )
+    def test_staging_round_trip_on_postgres(self):
+        """Test a staging table round trip on a real PostgreSQL server."""
+        connector = PostgresLandingConnector(DatabaseConnectionInfo(
+            db_type="postgresql",
+            host=os.getenv("LANDING_TEST_PG_HOST"),
+            port=int(os.getenv("LANDING_TEST_PG_PORT", "5432")),
+            database=os.getenv("LANDING_TEST_PG_DATABASE", "postgres"),
+            username=os.getenv("LANDING_TEST_PG_USERNAME", "postgres"),
+            password=os.getenv("LANDING_TEST_PG_PASSWORD", "postgres"),
+            schema="public"
+        ))
+        staging = StagingManager(connector)
+        table = f"recon_stage_test_{uuid.uuid4().hex[:8]}"
+        columns = [{"name": "Id", "type": "BIGINT"}, {"name": "code", "type": "VARCHAR(10)"},
+                   {"name": "payload", "type": "BLOB"}]
+        try:
+            with connector.cursor() as cursor:
+                cursor.execute(connector.staging_table_sql(table, columns))
+
+            loaded = connector.copy_rows(table, ["Id", "code", "payload"], [
+                [(1, "a", None), (2, "", b"\x00\x01")], [(3, None, None)]
+            ])
+            indexes = staging.create_indexes(table, ["Id", "code"])
+
+            assert loaded == 3
+            assert sorted(indexes) == sorted(connector.table_indexes(table))
+            rows = connector.execute(f'SELECT "Id", code, payload FROM "{table}" ORDER BY "Id"')
+            assert [(row["Id"], row["code"]) for row in rows] == [(1, "a"), (2, ""), (3, None)]
+            assert bytes(rows[1]["payload"]) == b"\x00\x01"
+            assert staging.get_staging_table_info(table).row_count == 3
+        finally:
+            staging.drop_staging_table(table)
+            connector.close()
+
+
+class TestCopyStream:
+    """Test the COPY FROM STDIN stream."""
+
+    def test_copy_stream_renders_batches_lazily(self):
+        """Test that batches are rendered as the server reads them."""
+        pulled = []
+
+        def batches():
+            for batch in ([(1, "a,b", None), (2, "", b"\x01\xff")], [(3, 'say "hi"', True)]):
+                pulled.append(batch)
+                yield batch
+
+        stream = CsvCopyStream(batches())
+        first = stream.read(4)
+
+        assert len(pulled) == 1
+        text = first + stream.read()
+        assert list(csv.reader(io.StringIO(text))) == [
+            ["1", "a,b", "\\N"], ["2", "", "\\x01ff"], ["3", 'say "hi"', "t"]
+        ]
+        assert stream.rows == 3
+        assert stream.read(10) == ""
+
+    def test_copy_stream_readline(self):
+        """Test reading the COPY stream line by line."""
+        stream = CsvCopyStream([[(1, "x")], [(2, "y")]])
+
+        assert [stream.readline(), stream.readline(), stream.readline()] == ["1,x\n", "2,y\n", ""]
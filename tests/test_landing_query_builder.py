@@ -0,0 +1,131 @@
+"""
+Tests for the per-rule reconciliation queries of the landing query builder.
+
+The PostgreSQL dialect (double-quoted identifiers) also runs on SQLite, so the
+generated SQL is executed against small staging tables.
+"""
+import sqlite3
+
+import pytest
+
+from kg_builder.models import ReconciliationRuleSet
+from kg_builder.services.landing_query_builder import LandingQueryBuilder
+
+
+@pytest.fixture
+def rules(make_rule):
+    """Rules on the id and, less confidently, on the code."""
+    return [
+        make_rule(rule_id="R_ID", rule_name="R_ID_name", confidence_score=0.95),
+        make_rule(rule_id="R_CODE", rule_name="R_CODE_name", source_columns=["code"], target_columns=["code"],
+                  confidence_score=0.75)
+    ]
+
+
+def _ruleset(rules):
+    return ReconciliationRuleSet(
+        ruleset_id="RS", ruleset_name="rs", schemas=["main"], rules=list(rules), generated_from_kg="kg"
+    )
+
+
+@pytest.fixture
+def landing():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        CREATE TABLE stg_src (_staging_id INTEGER PRIMARY KEY, id INTEGER, code TEXT);
+        CREATE TABLE stg_tgt (_staging_id INTEGER PRIMARY KEY, ref INTEGER, code TEXT);
+        -- source 1: both rules, 2: id only, 3: code only, 4: none, 5: id only (two target rows)
+        INSERT INTO stg_src (id, code) VALUES (1, 'a'), (2, 'b'), (3, 'c'), (4, 'd'), (5, 'e');
+        INSERT INTO stg_tgt (ref, code) VALUES (1, 'a'), (2, 'x'), (30, 'c'), (40, 'y'), (5, 'z'), (5, 'w');
+    """)
+    yield conn
+    conn.close()
+
+
+class TestLandingKPIQuery:
+    """Test the combined per-rule KPI query."""
+
+    def test_kpis_combine_rules_without_or_joins(self, landing, rules):
+        """Test that every rule is its own equi-join and the KPIs count each row once."""
+        sql = LandingQueryBuilder("postgresql").build_reconciliation_with_kpis_query(
+            "stg_src", "stg_tgt", _ruleset(rules)
+        )
+
+        rows = [dict(row) for row in landing.execute(sql)]
+
+        assert " OR " not in sql
+        assert [row["rule_id"] for row in rows] == ["R_ID", "R_CODE"]
+        kpis = rows[0]
+        assert (kpis["matched_count"], kpis["unmatched_source_count"]) == (4, 1)
+        assert (kpis["total_target_count"], kpis["unmatched_target_count"]) == (6, 1)
+        assert (kpis["rcr"], kpis["rcr_status"]) == (80.0, "WARNING")
+        # Best rule per matched row: three at 0.95, one at 0.75
+        assert (kpis["high_confidence_count"], kpis["low_confidence_count"]) == (3, 1)
+        assert kpis["dqcs"] == pytest.approx(0.9)
+        assert [(row["rule_matched_source_count"], row["rule_matched_target_count"]) for row in rows] == [(3, 4), (2, 2)]
+        assert [float(row["rule_confidence"]) for row in rows] == [0.95, 0.75]
+
+    def test_kpis_with_no_matches(self, landing, make_rule):
+        """Test the KPIs of a rule that matches nothing."""
+        rule = make_rule(rule_id="R_NONE", source_columns=["code"])
+        sql = LandingQueryBuilder("postgresql").build_reconciliation_with_kpis_query(
+            "stg_src", "stg_tgt", _ruleset([rule])
+        )
+
+        (row,) = [dict(row) for row in landing.execute(sql)]
+
+        assert (row["matched_count"], row["unmatched_source_count"], row["unmatched_target_count"]) == (0, 5, 6)
+        assert (row["dqcs"], row["dqcs_status"], row["rule_matched_source_count"]) == (0, "POOR", 0)
+
+
+class TestLandingRecordQueries:
+    """Test the matched and unmatched record queries."""
+
+    def test_unmatched_queries_anti_join_every_rule(self, landing, rules):
+        """Test that unmatched rows are those no rule matches."""
+        builder = LandingQueryBuilder("postgresql")
+
+        source = landing.execute(builder.build_unmatched_source_query("stg_src", "stg_tgt", rules)).fetchall()
+        target = landing.execute(builder.build_unmatched_target_query("stg_src", "stg_tgt", rules)).fetchall()
+
+        assert [row["id"] for row in source] == [4]
+        assert [row["ref"] for row in target] == [40]
+
+    def test_matched_records_query_has_one_equi_join_per_rule(self, rules):
+        """Test that the matched records query joins once per rule without OR conditions."""
+        sql = LandingQueryBuilder("mysql").build_matched_records_query("stg_src", "stg_tgt", rules, limit=10)
+
+        assert sql.count("INNER JOIN `stg_tgt` t") == 2
+        assert "ON s.`id` = t.`ref`" in sql and "ON s.`code` = t.`code`" in sql
+        assert " OR " not in sql
+
+
+class TestWaterfallQueries:
+    """Test the waterfall strategy, which matches each rule on the rows left by the previous ones."""
+
+    def test_waterfall_matches_rules_on_residual_rows(self, landing, rules):
+        """Test that each rule only matches the rows no earlier rule took."""
+        queries = LandingQueryBuilder("postgresql").build_waterfall_queries("stg_src", "stg_tgt", _ruleset(rules), "t1")
+
+        for statement in queries.setup + [sql for step in queries.steps for sql in step.statements]:
+            landing.execute(statement)
+        left = dict(landing.execute(queries.residual_counts).fetchone())
+        counts = {(row["rule_order"], row["side"]): row["match_count"]
+                  for row in landing.execute(queries.attribution_counts)}
+
+        assert [(step.rule_id, step.confidence) for step in queries.steps] == [("R_ID", 0.95), ("R_CODE", 0.75)]
+        # R_ID takes sources 1, 2, 5 and targets 1, 2, 5, 5; R_CODE only sees the rest (source 3 / target 30)
+        assert counts == {(0, "source"): 3, (0, "target"): 4, (1, "source"): 1, (1, "target"): 1}
+        assert left == {"source_left": 1, "target_left": 1}
+
+    def test_waterfall_temp_tables_are_dropped_per_dialect(self, rules):
+        """Test the temp table teardown statements of MySQL and PostgreSQL."""
+        mysql = LandingQueryBuilder("mysql").build_waterfall_queries("stg_src", "stg_tgt", _ruleset(rules), "t1")
+        postgres = LandingQueryBuilder("postgresql").build_waterfall_queries(
+            "stg_src", "stg_tgt", _ruleset(rules), "t1"
+        )
+
+        assert mysql.teardown[0] == "DROP TEMPORARY TABLE IF EXISTS `recon_wf_src_t1`"
+        assert postgres.teardown[0] == 'DROP TABLE IF EXISTS "recon_wf_src_t1"'
+        assert len(mysql.teardown) == 3 and " OR " not in " ".join(mysql.steps[0].statements)
@@ -0,0 +1,212 @@
+"""
+Tests for the embedded (SQLite) landing engine.
+"""
+import os
+
+import pytest
+
+from kg_builder import config
+from kg_builder.models import (
+    DatabaseConnectionInfo,
+    LandingExecutionRequest,
+    ReconciliationRuleSet
+)
+from kg_builder.services.data_extractor import DataExtractor, TableExtraction
+from kg_builder.services.landing_db_connector import create_landing_connector
+from kg_builder.services.landing_query_builder import LandingQueryBuilder
+from kg_builder.services.landing_reconciliation_executor import LandingReconciliationExecutor
+from kg_builder.services.landing_sqlite_connector import SQLiteLandingConnector, _qmark
+from kg_builder.services.staging_manager import StagingManager
+
+
+def _config(db_type="sqlite"):
+    return DatabaseConnectionInfo(db_type=db_type, host="localhost", port=0, database="landing",
+                                  username="", password="")
+
+
+SOURCE_ROWS = [(1, "a"), (2, "b"), (3, "c"), (4, "d")]
+TARGET_ROWS = [(1, "x"), (30, "c"), (40, "y")]
+
+
+@pytest.fixture
+def rules(make_rule):
+    """Rules from orders to orders_copy: on the id and, less confidently, on the code."""
+    pair = dict(source_table="orders", target_table="orders_copy")
+    return [
+        make_rule(rule_id="R_ID", rule_name="r_id", target_columns=["order_id"], confidence_score=0.95, **pair),
+        make_rule(rule_id="R_CODE", rule_name="r_code", source_columns=["code"], target_columns=["code"],
+                  confidence_score=0.75, **pair)
+    ]
+
+
+@pytest.fixture
+def landing_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "LANDING_SQLITE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _load(extractor, table, columns, rows):
+    extractor.staging_manager.create_staging_table(
+        table, [{"name": col, "type": col_type} for col, col_type in columns],
+        "E", "RS", "source", "sqlite", "local"
+    )
+    count = extractor._bulk_load_to_landing(table, [col for col, _ in columns], [rows])
+    extractor.staging_manager.create_indexes(table, [col for col, _ in columns])
+    return count
+
+
+def _executor(monkeypatch, ruleset_rules, source_rows=SOURCE_ROWS, target_rows=TARGET_ROWS, seen=None):
+    def extract(self, source_db_config, target_db_config, rules, execution_id, ruleset_id, limit=None,
+                key_only=False, reuse_snapshots=None):
+        if seen is not None:
+            seen.append(self.landing_connector.database_path)
+        extractions = []
+        for side, table, columns, rows in (
+            ("source", "orders", [("id", "BIGINT"), ("code", "VARCHAR(10)")], source_rows),
+            ("target", "orders_copy", [("order_id", "BIGINT"), ("code", "VARCHAR(10)")], target_rows),
+        ):
+            staging_table = f"recon_stage_{execution_id}_{side}"
+            count = _load(self, staging_table, columns, rows)
+            extractions.append(TableExtraction(side, "main", table, staging_table, count, 0, 0, 0))
+        return extractions
+
+    class Rules:
+        def load_ruleset(self, ruleset_id):
+            return ReconciliationRuleSet(ruleset_id=ruleset_id, ruleset_name="rs", schemas=["main"],
+                                         rules=ruleset_rules, generated_from_kg="kg")
+
+    monkeypatch.setattr(DataExtractor, "extract_ruleset_to_landing", extract)
+    executor = LandingReconciliationExecutor(landing_connector=SQLiteLandingConnector(_config()))
+    executor.rule_storage = Rules()
+    return executor
+
+
+def _request(**fields):
+    return LandingExecutionRequest(ruleset_id="RS", source_db_config=_config("mysql"),
+                                   target_db_config=_config("mysql"), store_in_mongodb=False, **fields)
+
+
+class TestSQLiteLandingConnector:
+    """Test the embedded landing connector and its per-execution database files."""
+
+    def test_qmark_translation(self):
+        """Test that pyformat placeholders and escaped percents are translated to qmark style."""
+        assert _qmark("SELECT '%%' WHERE a = %s AND b = %s") == "SELECT '%' WHERE a = ? AND b = ?"
+
+    def test_factory_creates_embedded_connector(self):
+        """Test that LANDING_DB_TYPE=sqlite creates a per-execution connector."""
+        connector = create_landing_connector(_config())
+
+        assert isinstance(connector, SQLiteLandingConnector)
+        assert connector.per_execution_database
+        assert connector.health_check()
+
+    def test_execution_database_is_tuned_and_deleted(self, landing_dir):
+        """Test that an execution database runs in WAL mode, gets its indexes and is deleted on discard."""
+        landing = SQLiteLandingConnector(_config()).for_execution("EXEC_1")
+        extractor = DataExtractor(landing, StagingManager(landing))
+
+        loaded = _load(extractor, "recon_stage_src", [("id", "BIGINT"), ("code", "VARCHAR(10)")], SOURCE_ROWS)
+
+        assert loaded == 4
+        assert landing.execute_one("PRAGMA journal_mode")["journal_mode"] == "wal"
+        assert landing.table_indexes("recon_stage_src") == ["idx_recon_stage_src_id", "idx_recon_stage_src_code"]
+        info = extractor.staging_manager.get_staging_table_info("recon_stage_src")
+        assert info.row_count == 4 and len(info.indexes) == 2
+
+        landing.discard()
+
+        assert not os.listdir(landing_dir)
+
+
+class TestSQLiteReconciliationQueries:
+    """Test the landing reconciliation queries on SQLite staging tables."""
+
+    def test_reconciliation_queries_run_on_staging_tables(self, landing_dir, rules):
+        """Test the KPI and matched-records queries against loaded staging tables."""
+        landing = SQLiteLandingConnector(_config()).for_execution("EXEC_2")
+        extractor = DataExtractor(landing, StagingManager(landing))
+        _load(extractor, "s", [("id", "BIGINT"), ("code", "VARCHAR(10)")], SOURCE_ROWS)
+        _load(extractor, "t", [("order_id", "BIGINT"), ("code", "VARCHAR(10)")], TARGET_ROWS)
+        builder = LandingQueryBuilder("sqlite")
+        ruleset = ReconciliationRuleSet(ruleset_id="RS", ruleset_name="rs", schemas=["main"], rules=rules,
+                                        generated_from_kg="kg")
+        try:
+            kpis = landing.execute(builder.build_reconciliation_with_kpis_query("s", "t", ruleset))
+            matched = landing.execute(builder.build_matched_records_query("s", "t", rules, limit=10))
+
+            assert [(row["rule_id"], row["rule_matched_source_count"]) for row in kpis] == [("R_ID", 1), ("R_CODE", 1)]
+            assert (kpis[0]["matched_count"], kpis[0]["unmatched_target_count"]) == (2, 1)
+            assert sorted(row["matched_rule_id"] for row in matched) == ["R_CODE", "R_ID"]
+        finally:
+            landing.discard()
+
+    @pytest.mark.parametrize("match_strategy", ["independent", "waterfall"])
+    def test_source_table_in_two_pairs_is_counted_once(self, landing_dir, rules, match_strategy):
+        """Test that a source table reconciled against two target tables counts each of its rows once."""
+        landing = SQLiteLandingConnector(_config()).for_execution("EXEC_3")
+        extractor = DataExtractor(landing, StagingManager(landing))
+        _load(extractor, "s", [("id", "BIGINT"), ("code", "VARCHAR(10)")], SOURCE_ROWS)
+        _load(extractor, "t1", [("order_id", "BIGINT"), ("code", "VARCHAR(10)")], [(1, "x"), (2, "y")])
+        _load(extractor, "t2", [("order_id", "BIGINT"), ("code", "VARCHAR(10)")], [(20, "b"), (30, "c")])
+        archive_rule = rules[1].model_copy(update={"rule_id": "R_ARCHIVE", "target_table": "orders_archive"})
+        ruleset = ReconciliationRuleSet(ruleset_id="RS", ruleset_name="rs", schemas=["main"],
+                                        rules=[rules[0], archive_rule], generated_from_kg="kg")
+        staging = {("source", "main.orders"): "s", ("target", "main.orders_copy"): "t1",
+                   ("target", "main.orders_archive"): "t2"}
+        executor = LandingReconciliationExecutor(landing_connector=landing)
+        try:
+            # Source 1 matches t1, 2 matches both, 3 matches t2, 4 matches neither
+            kpis = executor._reconcile_table_pairs(staging, ruleset, match_strategy)
+
+            assert (kpis["total_source_count"], kpis["matched_count"], kpis["unmatched_source_count"]) == (4, 3, 1)
+            assert (kpis["total_target_count"], kpis["unmatched_target_count"]) == (4, 0)
+            assert (kpis["rcr"], kpis["high_confidence_count"], kpis["low_confidence_count"]) == (75.0, 2, 1)
+            assert kpis["dqcs"] == pytest.approx(round((2 * 0.95 + 0.75) / 3, 3))
+            assert landing.execute_one("SELECT COUNT(*) AS n FROM sqlite_temp_master")["n"] == 0
+        finally:
+            landing.discard()
+
+
+class TestEmbeddedLandingExecution:
+    """Test landing executions on the embedded engine, one database file per execution."""
+
+    def test_executor_runs_each_execution_in_its_own_file(self, landing_dir, monkeypatch, rules):
+        """Test that each execution gets its own database file, deleted when it ends."""
+        seen = []
+        executor = _executor(monkeypatch, rules, seen=seen)
+        request = _request()
+
+        first = executor.execute(request)
+        second = executor.execute(request)
+
+        assert len(set(seen)) == 2 and all(path.startswith(str(landing_dir)) for path in seen)
+        assert not os.listdir(landing_dir)
+        assert (first.matched_count, first.unmatched_source_count, first.unmatched_target_count) == (2, 2, 1)
+        assert [rule["matched_source_count"] for rule in first.rule_kpis] == [1, 1]
+        assert first.rcr == second.rcr == 50.0
+        assert not first.staging_retained
+
+    def test_waterfall_attributes_each_row_to_one_rule(self, landing_dir, monkeypatch, rules):
+        """Test that the waterfall strategy credits a row matched by several rules to the first one."""
+        # Row 5 matches under both rules: counted by each rule independently, only by R_ID in the waterfall
+        executor = _executor(monkeypatch, rules, SOURCE_ROWS + [(5, "e")], TARGET_ROWS + [(5, "e")])
+
+        independent = executor.execute(_request())
+        waterfall = executor.execute(_request(match_strategy="waterfall"))
+
+        assert [rule["matched_source_count"] for rule in independent.rule_kpis] == [2, 2]
+        assert waterfall.match_strategy == "waterfall"
+        assert [(rule["rule_id"], rule["matched_source_count"], rule["matched_target_count"])
+                for rule in waterfall.rule_kpis] == [("R_ID", 2, 2), ("R_CODE", 1, 1)]
+        assert [(rule["residual_source_count"], rule["residual_target_count"])
+                for rule in waterfall.rule_kpis] == [(3, 2), (2, 1)]
+        assert sum(rule["matched_source_count"] for rule in waterfall.rule_kpis) == waterfall.matched_count == 3
+        assert (waterfall.unmatched_source_count, waterfall.unmatched_target_count, waterfall.rcr) == (2, 1, 60.0)
+        assert waterfall.dqcs == pytest.approx(round((2 * 0.95 + 0.75) / 3, 3))
+        assert not os.listdir(landing_dir)
+
+    def test_unknown_match_strategy_is_rejected(self, landing_dir, monkeypatch, rules):
+        """Test that an unknown match strategy raises a ValueError."""
+        with pytest.raises(ValueError, match="match strategy"):
+            _executor(monkeypatch, rules).execute(_request(match_strategy="fuzzy"))
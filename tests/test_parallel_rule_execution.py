@@ -0,0 +1,224 @@
+"""
+Tests for parallel per-rule execution in ReconciliationExecutor.
+"""
+import sqlite3
+import threading
+from dataclasses import replace
+
+import pytest
+
+from kg_builder.models import (
+    DatabaseConnectionInfo,
+    ReconciliationRuleSet
+)
+from kg_builder.services.hash_join_reconciler import PartitionedHashJoin
+from kg_builder.services.reconciliation_executor import ReconciliationExecutor
+from kg_builder.services.rule_plan_compiler import get_rule_plan_compiler
+from kg_builder.services.result_file_store import ResultFileReader, ResultFileWriter
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "recon.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE src (id INTEGER, code TEXT)")
+    conn.execute("CREATE TABLE tgt (ref INTEGER, code TEXT)")
+    conn.executemany("INSERT INTO src VALUES (?, ?)", [(i, f"C{i % 7}") for i in range(40)])
+    conn.executemany("INSERT INTO tgt VALUES (?, ?)", [(i, f"C{i % 5}") for i in range(20, 60)])
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def executor(db_path, make_rule):
+    rules = [
+        make_rule(rule_id=f"RULE_{i}", rule_name=f"rule_{i}", source_columns=[source], target_columns=[target])
+        for i, (source, target) in enumerate([("id", "ref"), ("code", "code")] * 3)
+    ]
+    ruleset = ReconciliationRuleSet(
+        ruleset_id="RS_TEST",
+        ruleset_name="test",
+        schemas=["main"],
+        rules=rules,
+        generated_from_kg="kg"
+    )
+
+    class _Storage:
+        def load_ruleset(self, ruleset_id):
+            return ruleset
+
+    ex = ReconciliationExecutor.__new__(ReconciliationExecutor)
+    ex.storage = _Storage()
+    ex.connection_threads = []
+    ex.opened = []
+
+    def connect(config):
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        ex.connection_threads.append(threading.current_thread().name)
+        ex.opened.append(conn)
+        return conn
+
+    ex._connect_to_database = connect
+    ex._open_result_file = lambda ruleset_id: None
+    return ex
+
+
+@pytest.fixture
+def db_config():
+    return DatabaseConnectionInfo(
+        db_type="mysql", host="localhost", port=3306, database="recon", username="u", password="p"
+    )
+
+
+class TestParallelExecution:
+    """Test executing the rules of a ruleset on a worker pool."""
+
+    def test_parallel_results_match_serial_in_rule_order(self, executor, db_config):
+        """Test that parallel execution returns the serial results in rule order."""
+        serial = executor.execute_ruleset("RS_TEST", db_config, db_config, limit=1000)
+        parallel = executor.execute_ruleset(
+            "RS_TEST", db_config, db_config, limit=1000, parallel=True, max_workers=3
+        )
+
+        assert parallel.matched_count == serial.matched_count
+        assert parallel.unmatched_source_count == serial.unmatched_source_count
+        assert parallel.unmatched_target_count == serial.unmatched_target_count
+        assert [m.rule_used for m in parallel.matched_records] == [m.rule_used for m in serial.matched_records]
+        assert [q["rule_id"] for q in parallel.generated_sql] == [q["rule_id"] for q in serial.generated_sql]
+
+    def test_each_rule_reports_its_own_timing(self, executor, db_config):
+        """Test that every SQL entry reports its rule's timing and worker."""
+        result = executor.execute_ruleset(
+            "RS_TEST", db_config, db_config, limit=1000, parallel=True, max_workers=2
+        )
+
+        assert len(result.generated_sql) == 6 * 3
+        for sql_info in result.generated_sql:
+            assert sql_info["execution_time_ms"] >= 0
+            assert sql_info["rule_execution_time_ms"] >= sql_info["execution_time_ms"]
+            assert sql_info["worker"].startswith("recon-rule")
+
+    def test_workers_use_and_close_their_own_connections(self, executor, db_config):
+        """Test that each worker opens its own connections and closes them."""
+        executor.execute_ruleset("RS_TEST", db_config, db_config, limit=10, parallel=True, max_workers=2)
+
+        worker_threads = [name for name in executor.connection_threads if name.startswith("recon-rule")]
+        # Two connections (source + target) per worker, opened at most once per worker
+        assert 0 < len(worker_threads) <= 4
+        for conn in executor.opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+    def test_main_connections_are_returned_before_workers_borrow(self, executor, db_config):
+        """Test that the main connections are returned before the workers borrow theirs."""
+        events = []
+        connect = executor._connect_to_database
+
+        class Tracked:
+            def __init__(self, conn):
+                self._conn = conn
+                events.append(("open", threading.current_thread().name))
+
+            def close(self):
+                events.append(("close", threading.current_thread().name))
+                self._conn.close()
+
+            def __getattr__(self, name):
+                return getattr(self._conn, name)
+
+        executor._connect_to_database = lambda config: Tracked(connect(config))
+
+        executor.execute_ruleset("RS_TEST", db_config, db_config, limit=10, parallel=True, max_workers=2)
+
+        first_worker_open = next(i for i, (event, thread) in enumerate(events) if thread.startswith("recon-rule"))
+        assert events[:first_worker_open] == [
+            ("open", "MainThread"), ("open", "MainThread"), ("close", "MainThread"), ("close", "MainThread")
+        ]
+
+
+class TestResultFile:
+    """Test streaming the records of an execution to its result file."""
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_records_are_written_to_the_result_file_while_rules_run(self, executor, db_config, tmp_path, parallel):
+        """Test that each rule's records are in the file when the rule returns."""
+        streamed = []
+        executor._open_result_file = lambda ruleset_id: ResultFileWriter(
+            tmp_path / "result.ndjson", header={"ruleset_id": ruleset_id}
+        )
+        execute_rule = executor._execute_rule
+
+        def tracked(*args, **kwargs):
+            outcome = execute_rule(*args, **kwargs)
+            # The rule's records are already in the file when it returns
+            streamed.append(kwargs["sink"]._section_counts.get("matched", 0) >= len(outcome["matched"]))
+            return outcome
+
+        executor._execute_rule = tracked
+        result = executor.execute_ruleset(
+            "RS_TEST", db_config, db_config, limit=1000, parallel=parallel, max_workers=3
+        )
+
+        assert streamed and all(streamed)
+        reader = ResultFileReader(tmp_path / "result.ndjson")
+        assert result.result_file_path == str(tmp_path / "result.ndjson")
+        assert reader.footer()["sections"] == {
+            "matched": result.matched_count,
+            "unmatched_source": result.unmatched_source_count,
+            "unmatched_target": result.unmatched_target_count
+        }
+        assert len(list(reader.iter_records("matched"))) == result.matched_count
+
+
+class TestTargetQueries:
+    """Test the queries that read the target side on its own connection."""
+
+    def test_unmatched_target_query_uses_the_target_plan(self, make_rule, executor, db_path):
+        """Test that the unmatched-target query uses the plan resolved against the target."""
+        # The source connection sees the tables under an attached schema, the target one without
+        source_conn = sqlite3.connect(":memory:")
+        source_conn.execute(f"ATTACH DATABASE '{db_path}' AS recon")
+        target_conn = sqlite3.connect(db_path)
+        rule = make_rule()
+        compiled = get_rule_plan_compiler().compile_rule(rule, "mysql")
+        source_plan = replace(compiled, source_ref="recon.src", target_ref="recon.tgt", schema_resolved=True)
+        target_plan = replace(compiled, source_ref="src", target_ref="tgt", schema_resolved=True)
+
+        outcome = executor._execute_rule(
+            source_conn, target_conn, rule, 1000, "mysql", "mysql",
+            plan=source_plan, target_plan=target_plan
+        )
+
+        assert outcome["unmatched_target_count"] == 20
+        assert [q["target_sql"] for q in outcome["sql_info"] if q["query_type"] == "unmatched_target"] == [
+            target_plan.unmatched_target_sql(1000)
+        ]
+
+
+class TestHashJoinStreaming:
+    """Test streaming the sides of a rule into the in-process hash join."""
+
+    def test_unresolved_plan_retries_stream_without_schema(self, make_rule, db_path):
+        """Test that a side whose schema-prefixed query fails is streamed without schema."""
+        conn = sqlite3.connect(db_path)
+        rule = make_rule(source_schema="missing")
+
+        with PartitionedHashJoin() as join:
+            query, columns = ReconciliationExecutor.__new__(ReconciliationExecutor)._stream_side_into_join(
+                conn, join, "source", rule, "mysql"
+            )
+
+        assert query == "SELECT * FROM `src`"
+        assert columns == ["id", "code"]
+
+    def test_resolved_plan_is_not_retried(self, make_rule, db_path):
+        """Test that a failing query of a schema-resolved plan is raised as is."""
+        conn = sqlite3.connect(db_path)
+        rule = make_rule(source_schema="missing")
+        plan = replace(get_rule_plan_compiler().compile_rule(rule, "mysql"), schema_resolved=True)
+
+        with PartitionedHashJoin() as join, pytest.raises(sqlite3.OperationalError):
+            ReconciliationExecutor.__new__(ReconciliationExecutor)._stream_side_into_join(
+                conn, join, "source", rule, "mysql", plan
+            )
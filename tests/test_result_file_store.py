@@ -0,0 +1,78 @@
+"""
+Tests for the streaming NDJSON reconciliation result files.
+"""
+import json
+from decimal import Decimal
+
+import pytest
+
+from kg_builder.services.result_file_store import (
+    ResultFileReader,
+    ResultFileWriter,
+    result_file_name
+)
+
+
+def _write(path, matched=250, unmatched=40):
+    with ResultFileWriter(path, header={"ruleset_id": "RECON_TEST"}) as writer:
+        writer.write_records("matched", ({"id": i, "amount": Decimal("1.50")} for i in range(matched)))
+        writer.write_records("unmatched_source", ({"id": i} for i in range(unmatched)))
+        writer.set_footer(matched_count=matched, generated_sql=[{"rule_id": "R1"}])
+    return path
+
+
+class TestResultFileStore:
+    """Test writing and reading NDJSON result files."""
+
+    @pytest.mark.parametrize("compression", ["none", "gzip"])
+    def test_round_trip(self, tmp_path, compression):
+        """Test that records and footer read back as written."""
+        path = _write(tmp_path / result_file_name("result", compression))
+        reader = ResultFileReader(path)
+
+        assert reader.header()["ruleset_id"] == "RECON_TEST"
+        assert reader.header()["compression"] == compression
+        assert reader.footer()["sections"] == {"matched": 250, "unmatched_source": 40}
+        assert reader.footer()["matched_count"] == 250
+        assert sum(1 for _ in reader.iter_records("matched")) == 250
+        assert list(reader.iter_records("unmatched_target")) == []
+        assert reader.read_page("matched", offset=0, limit=1)[0] == {"id": 0, "amount": "1.50"}
+
+    def test_paging(self, tmp_path):
+        """Test reading a page of records of one section."""
+        reader = ResultFileReader(_write(tmp_path / "result.ndjson"))
+
+        page = reader.read_page("matched", offset=240, limit=20)
+
+        assert [r["id"] for r in page] == list(range(240, 250))
+        assert reader.read_page("unmatched_source", offset=5, limit=2) == [{"id": 5}, {"id": 6}]
+
+    def test_failed_write_leaves_no_file(self, tmp_path):
+        """Test that a failed write leaves no file behind."""
+        path = tmp_path / "result.ndjson"
+        with pytest.raises(RuntimeError):
+            with ResultFileWriter(path) as writer:
+                writer.write_record("matched", {"id": 1})
+                raise RuntimeError("query failed")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_legacy_json_file_is_readable(self, tmp_path):
+        """Test that legacy JSON result files can still be read."""
+        path = tmp_path / "reconciliation_result_OLD.json"
+        path.write_text(json.dumps({
+            "ruleset_id": "OLD",
+            "matched_records": [{"id": 1}, {"id": 2}],
+            "unmatched_source": [{"id": 3}],
+            "unmatched_target": []
+        }))
+        reader = ResultFileReader(path)
+
+        assert reader.header()["ruleset_id"] == "OLD"
+        assert reader.footer()["sections"]["matched"] == 2
+        assert reader.read_page("matched", offset=1, limit=5) == [{"id": 2}]
+
+    def test_unknown_compression_rejected(self):
+        """Test that an unknown compression is rejected."""
+        with pytest.raises(ValueError):
+            result_file_name("result", "brotli")
@@ -0,0 +1,109 @@
+"""
+Tests for the streaming row source.
+"""
+import sqlite3
+
+import pytest
+
+from kg_builder.services.row_stream import RowStream
+
+
+class CountingCursor:
+    """sqlite3 cursor wrapper counting fetched rows and close() calls."""
+
+    def __init__(self, conn, sql):
+        self._cursor = conn.execute(sql)
+        self.description = self._cursor.description
+        self.fetched = 0
+        self.closed = 0
+
+    def fetchmany(self, size):
+        rows = self._cursor.fetchmany(size)
+        self.fetched += len(rows)
+        return rows
+
+    def close(self):
+        self.closed += 1
+        self._cursor.close()
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (id INTEGER, name TEXT)")
+    conn.executemany("INSERT INTO t VALUES (?, ?)", [(i, f"n{i}") for i in range(95)])
+    return conn
+
+
+def _cursor(conn):
+    return CountingCursor(conn, "SELECT id, name FROM t ORDER BY id")
+
+
+class TestRowStream:
+    """Test streaming query results in fixed-size batches."""
+
+    def test_records_are_read_batch_by_batch(self, conn):
+        """Test that records are fetched one batch at a time."""
+        cursor = _cursor(conn)
+        stream = RowStream(cursor, batch_size=10)
+
+        batches = stream.record_batches()
+        first = next(batches)
+
+        assert stream.columns == ["id", "name"]
+        assert first[0] == {"id": 0, "name": "n0"}
+        assert cursor.fetched == 10
+        assert sum(len(batch) for batch in batches) == 85
+        assert stream.rows_read == 95 and not stream.truncated
+        assert cursor.closed == 1
+
+    def test_take_stops_early(self, conn):
+        """Test that take() stops fetching once it has enough rows."""
+        cursor = _cursor(conn)
+
+        records = RowStream(cursor, batch_size=10).take(12)
+
+        assert [record["id"] for record in records] == list(range(12))
+        assert cursor.fetched == 20
+        assert cursor.closed == 1
+
+    def test_max_rows_caps_and_flags_truncation(self, conn):
+        """Test that max_rows caps the rows and flags the truncation."""
+        stream = RowStream(_cursor(conn), batch_size=30, max_rows=40)
+        assert len(stream.read_records()) == 40
+        assert stream.truncated
+
+        stream = RowStream(_cursor(conn), batch_size=30, max_rows=95)
+        assert stream.count() == 95
+        assert not stream.truncated
+
+    def test_write_to_sink_and_single_use(self, conn):
+        """Test writing to a sink and that a stream is read once."""
+        written = []
+        stream = RowStream(_cursor(conn), batch_size=50)
+
+        assert stream.write_to(lambda rows: written.append(len(rows))) == 95
+        assert written == [50, 45]
+        with pytest.raises(RuntimeError):
+            list(stream)
+
+    def test_query_results_report_truncation(self, conn, monkeypatch):
+        """Test that query results report when they were truncated."""
+        import kg_builder.services.nl_query_executor as nl_module
+        from kg_builder.services.nl_query_executor import NLQueryExecutor
+        from kg_builder.services.nl_query_parser import QueryIntent
+
+        class Generator:
+            def generate(self, intent):
+                return "SELECT id, name FROM t ORDER BY id"
+
+        executor = NLQueryExecutor.__new__(NLQueryExecutor)
+        executor.db_type = "mysql"
+        executor.generator = Generator()
+        monkeypatch.setattr(nl_module, "RESULT_STREAM_MAX_ROWS", 40)
+
+        capped = executor.execute(QueryIntent(definition="all rows", query_type="data_query"), conn, limit=1000)
+        complete = executor.execute(QueryIntent(definition="all rows", query_type="data_query"), conn, limit=10)
+
+        assert (capped.record_count, capped.truncated, capped.to_dict()["truncated"]) == (40, True, True)
+        assert (complete.record_count, complete.truncated) == (10, False)
@@ -0,0 +1,95 @@
+"""
+Tests for compiled, cached rule execution plans.
+"""
+import pytest
+
+from kg_builder.models import ReconciliationRuleSet
+from kg_builder.services.landing_query_builder import LandingQueryBuilder
+from kg_builder.services.rule_plan_compiler import RulePlanCompiler
+
+
+def _ruleset(*rules):
+    return ReconciliationRuleSet(
+        ruleset_id="RECON_TEST",
+        ruleset_name="test",
+        schemas=["main"],
+        rules=list(rules),
+        generated_from_kg="kg"
+    )
+
+
+class TestRulePlanCache:
+    """Test caching of compiled ruleset plans."""
+
+    def test_plans_are_cached_by_content_hash(self, make_rule):
+        """Test that plans are reused until the ruleset content changes."""
+        compiler = RulePlanCompiler()
+        ruleset = _ruleset(make_rule())
+
+        first = compiler.compile(ruleset, "mysql")
+        again = compiler.compile(ruleset.model_copy(deep=True), "mysql")
+        ruleset.rules[0].target_columns = ["code"]
+        edited = compiler.compile(ruleset, "mysql")
+
+        assert again is first
+        assert edited.version != first.version
+        assert "t.code" in edited.plans[0].join_condition
+        assert compiler.cache_info() == {"size": 2, "hits": 1, "misses": 2}
+
+
+class TestDialectSQL:
+    """Test the SQL generated for each dialect."""
+
+    @pytest.mark.parametrize("db_type, expected", [
+        ("mysql", "SELECT s.*\nFROM `main`.`src` s\nWHERE NOT EXISTS"),
+        ("postgres", 'FROM "main"."src" s'),
+        ("mssql", "SELECT TOP 10 s.*\nFROM [dbo].[src] s"),
+    ])
+    def test_identifiers_quoted_and_normalized_per_dialect(self, make_rule, db_type, expected):
+        """Test identifier quoting and dialect name normalization."""
+        plan = RulePlanCompiler().compile(_ruleset(make_rule()), db_type).plans[0]
+
+        assert expected in plan.unmatched_source_sql(10)
+
+    def test_oracle_limit_joins_existing_where_clause(self, make_rule):
+        """Test that the Oracle row limit extends the existing WHERE clause."""
+        plan = RulePlanCompiler().compile(_ruleset(make_rule()), "oracle").plans[0]
+        sql = plan.unmatched_target_sql(5)
+
+        assert sql.count("WHERE NOT EXISTS") == 1
+        assert sql.endswith("AND ROWNUM <= 5")
+
+    def test_landing_builder_quotes_for_its_dialect(self, make_rule):
+        """Test that the landing query builder quotes identifiers for its dialect."""
+        builder = LandingQueryBuilder("postgresql")
+        sql = builder.build_unmatched_target_query("stg_src", "stg_tgt", [make_rule()], limit=7)
+
+        assert 'FROM "stg_tgt" t' in sql
+        assert 's."id" = t."ref"' in sql
+        assert "`" not in sql
+
+
+class TestSchemaResolution:
+    """Test resolving table references at compile time."""
+
+    def test_schema_fallback_resolved_once_at_compile_time(self, make_rule):
+        """Test that missing schemas fall back to bare table names, looked up once per table."""
+        lookups = []
+
+        def resolver(schema, table):
+            lookups.append((schema, table))
+            return schema != "missing", ("id", "is_active") if table == "src" else ("ref",)
+
+        compiler = RulePlanCompiler()
+        ruleset = _ruleset(
+            make_rule(source_schema="missing"),
+            make_rule(rule_id="RULE_2", source_schema="missing", target_schema="missing")
+        )
+        plans = compiler.compile(ruleset, "mysql", resolver, scope="db").plans
+        compiler.compile(ruleset, "mysql", resolver, scope="db")
+
+        assert plans[0].source_ref == "`src`"
+        assert plans[0].target_ref == "`main`.`tgt`"
+        assert plans[1].refs("target") == ["`tgt`"]
+        assert plans[0].has_column("source", "IS_ACTIVE")
+        assert sorted(lookups) == [("main", "tgt"), ("missing", "src"), ("missing", "tgt")]
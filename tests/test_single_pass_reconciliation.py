@@ -0,0 +1,99 @@
+"""
+Tests for the single-pass (FULL OUTER JOIN) classification query.
+"""
+import sqlite3
+
+import pytest
+
+from kg_builder.services.reconciliation_executor import ReconciliationExecutor
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE src (id INTEGER, name TEXT, is_active INTEGER)")
+    conn.execute("CREATE TABLE tgt (ref INTEGER, label TEXT)")
+    conn.executemany(
+        "INSERT INTO src VALUES (?, ?, ?)",
+        [(i, f"n{i}", i % 4 != 0) for i in range(30)] + [(None, "no_key", 1)]
+    )
+    # 20..29 match once, 25 matches twice, 30..44 are target-only
+    conn.executemany("INSERT INTO tgt VALUES (?, ?)", [(i, f"l{i}") for i in range(20, 45)] + [(25, "dup")])
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def rule(make_rule):
+    return make_rule(rule_name="id_to_ref", confidence_score=0.95)
+
+
+@pytest.fixture
+def executor():
+    return ReconciliationExecutor.__new__(ReconciliationExecutor)
+
+
+class TestSinglePassQuery:
+    """Test classifying all rows of a rule with one FULL OUTER JOIN query."""
+
+    @pytest.mark.parametrize("db_type", ["postgresql", "mysql"])
+    def test_counts_match_three_query_plan(self, executor, conn, rule, db_type):
+        """Test that the counts equal those of the matched/unmatched queries."""
+        outcome = executor._execute_single_pass_rule(conn, rule, limit=5, db_type=db_type, count_inactive=True)
+
+        # 11 pairs (25 matches twice), 21 source rows without a match (incl. NULL key), 15 target-only
+        assert outcome["matched_count"] == 11
+        assert outcome["unmatched_source_count"] == 21
+        assert outcome["unmatched_target_count"] == 15
+        assert outcome["inactive_count"] == 8
+        assert outcome["sql_info"]["query_type"] == "single_pass"
+
+    def test_limit_bounds_records_per_status(self, executor, conn, rule):
+        """Test that the limit bounds the records returned per status."""
+        outcome = executor._execute_single_pass_rule(conn, rule, limit=3, db_type="postgresql")
+
+        assert len(outcome["matched"]) == 3
+        assert len(outcome["unmatched_source"]) == 3
+        assert len(outcome["unmatched_target"]) == 3
+        assert outcome["inactive_count"] is None
+
+    def test_records_are_split_by_side(self, executor, conn, rule):
+        """Test that each record is split into its source and target columns."""
+        outcome = executor._execute_single_pass_rule(conn, rule, limit=50, db_type="postgresql")
+
+        matched = outcome["matched"][0]
+        assert set(matched.source_record) == {"id", "name", "is_active"}
+        assert set(matched.target_record) == {"ref", "label"}
+        assert matched.source_record["id"] == matched.target_record["ref"]
+        assert set(outcome["unmatched_target"][0]) == {"ref", "label", "rule_id", "rule_name"}
+
+    def test_missing_is_active_column_reports_zero(self, executor, conn, rule):
+        """Test that a source table without is_active reports no inactive rows."""
+        rule.source_table = "tgt"
+        rule.source_columns = ["ref"]
+        outcome = executor._execute_single_pass_rule(conn, rule, limit=5, db_type="mysql", count_inactive=True)
+
+        assert outcome["inactive_count"] == 0
+
+
+class TestExactCounts:
+    """Test the exact totals reported when the returned records are capped."""
+
+    @pytest.mark.parametrize("db_type", ["postgresql", "mysql"])
+    def test_aggregate_counts_without_rows(self, executor, conn, rule, db_type):
+        """Test the aggregate count query."""
+        counts, sql_info = executor._execute_count_query(conn, rule, db_type)
+
+        assert counts == {"matched_count": 11, "unmatched_source_count": 21, "unmatched_target_count": 15}
+        assert sql_info["query_type"] == "counts"
+
+    @pytest.mark.parametrize("limit", [2, 5, 1000])
+    def test_standard_counts_do_not_depend_on_limit(self, executor, conn, rule, limit):
+        """Test that standard execution reports the same totals for any limit."""
+        outcome = executor._execute_rule(conn, conn, rule, limit, "mysql", "mysql")
+
+        assert outcome["matched_count"] == 11
+        assert outcome["unmatched_source_count"] == 21
+        assert outcome["unmatched_target_count"] == 15
+        assert len(outcome["matched"]) == min(limit, 11)
+        assert len(outcome["unmatched_target"]) == min(limit, 15)